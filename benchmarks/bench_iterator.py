@@ -0,0 +1,77 @@
+"""
+Paging throughput of `XpanseResultIterator` over an in-memory transport, in page-token and
+limit-offset modes, and `dump()` over large result sets.
+"""
+import pytest
+
+from benchmarks.pages import ALERTS_DATA_KEY, ASSETS_DATA_KEY, light_results
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.api.incident_management.v2.alerts import AlertsEndpoint
+from xpanse.testing.data import generate
+from xpanse.transport import PagedReplies
+
+PAGES = 50
+"""Pages Listed by the Paging Benchmarks"""
+
+
+def _record_throughput(benchmark, results: int, pages: int):
+    benchmark.extra_info["results"] = results
+    benchmark.extra_info["pages"] = pages
+
+
+@pytest.mark.benchmark(group="paging")
+def bench_page_token(benchmark, client_for):
+    assets = generate(ASSETS_DATA_KEY, PAGES * 100)
+    client = client_for({AssetsEndpoint.LIST_ENDPOINT: PagedReplies(ASSETS_DATA_KEY, assets)})
+    _record_throughput(benchmark, len(assets), PAGES)
+
+    dumped = benchmark(lambda: client.assets.list().dump())
+
+    assert len(dumped) == len(assets)
+
+
+@pytest.mark.benchmark(group="paging")
+def bench_page_token_records(benchmark, client_for):
+    assets = generate(ASSETS_DATA_KEY, PAGES * 100)
+    client = client_for({AssetsEndpoint.LIST_ENDPOINT: PagedReplies(ASSETS_DATA_KEY, assets)})
+    _record_throughput(benchmark, len(assets), PAGES)
+
+    dumped = benchmark(lambda: client.assets.list().as_records().dump())
+
+    assert len(dumped) == len(assets)
+
+
+@pytest.mark.benchmark(group="paging")
+def bench_limit_offset(benchmark, client_for):
+    incidents = generate("incidents", PAGES * 100)
+    client = client_for({IncidentsEndpoint.LIST_ENDPOINT: PagedReplies("incidents", incidents)})
+    _record_throughput(benchmark, len(incidents), PAGES)
+
+    dumped = benchmark(lambda: client.incidents.list().dump())
+
+    assert len(dumped) == len(incidents)
+
+
+@pytest.mark.benchmark(group="paging")
+def bench_stream_page_token(benchmark, client_for):
+    alerts = generate(ALERTS_DATA_KEY, PAGES * 100)
+    client = client_for({AlertsEndpoint.ENDPOINT: PagedReplies(ALERTS_DATA_KEY, alerts)})
+    _record_throughput(benchmark, len(alerts), PAGES)
+
+    count = benchmark(lambda: sum(1 for _ in client.alerts.list(stream=True).iter_items()))
+
+    assert count == len(alerts)
+
+
+@pytest.mark.benchmark(group="dump")
+@pytest.mark.parametrize("page_size", [100, 1_000])
+def bench_dump(benchmark, client_for, records, page_size):
+    results = light_results(records)
+    client = client_for({AlertsEndpoint.ENDPOINT: PagedReplies(ALERTS_DATA_KEY, results, page_size=page_size)})
+    _record_throughput(benchmark, records, -(-records // page_size))
+
+    # Large dumps take seconds, a few rounds are enough
+    dumped = benchmark.pedantic(lambda: client.alerts.list().dump(), rounds=3, iterations=1)
+
+    assert len(dumped) == records
@@ -0,0 +1,45 @@
+"""
+Per-request overhead: payload building, query parameter normalization and request signing.
+"""
+import pytest
+
+from xpanse.client import XpanseClient
+from xpanse.const import FilterOperator
+from xpanse.utils import build_request_payload, normalize_param_names
+
+FILTERS = [
+    {"field": "asm_id_list", "operator": FilterOperator.IN.value, "value": [f"{i:032x}" for i in range(50)]},
+    {"field": "has_xdr_agent", "operator": FilterOperator.EQ.value, "value": "NO"},
+]
+REQUEST_DATA = {"sort": {"field": "name", "keyword": "asc"}, "use_page_token": True}
+
+
+@pytest.mark.benchmark(group="payload")
+def bench_build_request_payload(benchmark):
+    benchmark(
+        lambda: build_request_payload(
+            request_data=dict(REQUEST_DATA),
+            filters=list(FILTERS),
+            extra_request_data={"search_from": 0, "search_to": 100},
+        )
+    )
+
+
+@pytest.mark.benchmark(group="payload")
+def bench_normalize_param_names(benchmark):
+    params = {f"field_{i}_neq": i for i in range(20)}
+    benchmark(lambda: normalize_param_names({"params": dict(params)}))
+
+
+@pytest.mark.benchmark(group="auth")
+@pytest.mark.parametrize("advanced", [True, False], ids=["advanced", "standard"])
+def bench_get_auth_headers(benchmark, advanced):
+    client = XpanseClient(
+        url="test.crtx.paloaltonetworks.com",
+        api_key_id=1,
+        api_key="key",
+        use_advanced_auth=advanced,
+        validate="never",
+    )
+    benchmark(client._get_auth_headers)
+    client.close()
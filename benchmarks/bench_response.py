@@ -0,0 +1,24 @@
+"""
+Parsing of realistic Asset and Alert pages by `XpanseResponse.data`, with each installed codec.
+"""
+import pytest
+
+from benchmarks.pages import ALERTS_DATA_KEY, ASSETS_DATA_KEY, page
+from xpanse.codec import available_codecs
+from xpanse.response import XpanseResponse
+from xpanse.transport import json_response
+
+CODECS = available_codecs()
+
+
+@pytest.mark.benchmark(group="response")
+@pytest.mark.parametrize("codec", sorted(CODECS))
+@pytest.mark.parametrize("data_key", [ASSETS_DATA_KEY, ALERTS_DATA_KEY])
+def bench_response_data(benchmark, data_key, codec):
+    body = page(data_key, size=500)
+    raw = json_response(body)
+    benchmark.extra_info["page_bytes"] = len(raw.content)
+
+    data = benchmark(lambda: XpanseResponse(raw, data_key=data_key, codec=CODECS[codec]).data)
+
+    assert len(data) == 500
@@ -0,0 +1,68 @@
+"""
+Shared fixtures of the pytest-benchmark suite. Every run is saved under `benchmarks/results/`, so
+that a release can be compared with the previous ones:
+
+    pytest benchmarks
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+    pytest benchmarks --records 10000,100000,1000000
+"""
+import os
+import sys
+from typing import Any, Dict
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xpanse.client import XpanseClient  # noqa: E402
+from xpanse.transport import InMemoryTransport  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+"""Saved Runs, Grouped by Machine"""
+
+_DEFAULT_STORAGE = "file://./.benchmarks"
+"""pytest-benchmark Storage Used When `--benchmark-storage` is Not Set"""
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--records",
+        default="10000,100000",
+        help="comma-separated result counts of the dump benchmarks (default 10000,100000)",
+    )
+
+
+def pytest_configure(config):
+    # Runs before the pytest-benchmark configuration, which is registered with trylast
+    if config.getoption("benchmark_storage", None) == _DEFAULT_STORAGE:
+        config.option.benchmark_storage = f"file://{RESULTS_DIR}"
+
+
+def pytest_generate_tests(metafunc):
+    if "records" in metafunc.fixturenames:
+        counts = [int(c) for c in metafunc.config.getoption("records").split(",")]
+        metafunc.parametrize("records", counts, ids=[f"{c:_}" for c in counts])
+
+
+@pytest.fixture
+def client_for():
+    """
+    Creates clients served by an `InMemoryTransport` without latency, and closes them.
+    """
+    clients = []
+
+    def _client_for(routes: Dict[str, Any], **kwargs: Any) -> XpanseClient:
+        client = XpanseClient(
+            url="test.crtx.paloaltonetworks.com",
+            api_key_id=1,
+            api_key="key",
+            validate="never",
+            transport=InMemoryTransport(routes),
+            **kwargs,
+        )
+        clients.append(client)
+        return client
+
+    yield _client_for
+    for client in clients:
+        client.close()
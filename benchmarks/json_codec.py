@@ -0,0 +1,42 @@
+"""
+Compares the installed JSON codecs on realistic Asset and Alert pages.
+
+    python benchmarks/json_codec.py --size 500 --repeat 20
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.pages import ALERTS_DATA_KEY, ASSETS_DATA_KEY, page  # noqa: E402
+from xpanse.codec import available_codecs  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=500, help="results per page")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per codec")
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    baseline = codecs["json"]
+
+    for data_key in [ASSETS_DATA_KEY, ALERTS_DATA_KEY]:
+        body = baseline.dumps(page(data_key, size=args.size))
+        print(f"\n{data_key}: {args.size} results, {len(body) / 1024:.0f} KiB per page")
+        print(f"{'codec':<10}{'decode ms':>12}{'encode ms':>12}{'speedup':>10}")
+
+        decoded = baseline.loads(body)
+        baseline_decode = None
+        # Time the stdlib codec first, as the baseline of the speedups
+        for name, codec in sorted(codecs.items(), key=lambda item: item[0] != "json"):
+            decode = min(timeit.repeat(lambda: codec.loads(body), number=1, repeat=args.repeat))
+            encode = min(timeit.repeat(lambda: codec.dumps(decoded), number=1, repeat=args.repeat))
+            baseline_decode = baseline_decode or decode
+            print(f"{name:<10}{decode * 1000:>12.2f}{encode * 1000:>12.2f}{baseline_decode / decode:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Synthetic Public API pages shaped like real Asset and Alert replies, used by the benchmarks.
+"""
+import random
+from typing import Any, Dict, List
+
+from xpanse.const import PublicApiFields
+from xpanse.testing.data import EPOCH_MS, alert, asset
+
+ASSETS_DATA_KEY = "assets_internet_exposure"
+ALERTS_DATA_KEY = "alerts"
+
+
+def page(data_key: str, size: int = 100, seed: int = 0) -> Dict[str, Any]:
+    """
+    Returns a decoded page of `size` Assets or Alerts.
+    """
+    rng = random.Random(seed)
+    factory = asset if data_key == ASSETS_DATA_KEY else alert
+    results: List[Dict[str, Any]] = [factory(rng, i) for i in range(size)]
+    return {
+        PublicApiFields.REPLY: {
+            PublicApiFields.TOTAL_COUNT: 50_000,
+            PublicApiFields.RESULTS_COUNT: size,
+            data_key: results,
+            PublicApiFields.NEXT_PAGE_TOKEN: f"{rng.getrandbits(256):064x}",
+        }
+    }
+
+
+def light_results(count: int) -> List[Dict[str, Any]]:
+    """
+    Returns `count` small results, so that the dump benchmarks measure the per-page overhead
+    rather than JSON decoding.
+    """
+    return [
+        {"incident_id": str(i), "creation_time": EPOCH_MS + i} for i in range(count)
+    ]
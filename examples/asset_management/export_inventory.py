@@ -0,0 +1,54 @@
+import click
+
+from xpanse.client import XpanseClient
+from xpanse.const import ExportCompression, ExportFormat
+
+ALLOWED_FORMATS = [f.value for f in ExportFormat]
+ALLOWED_COMPRESSIONS = [c.value for c in ExportCompression]
+
+
+@click.command()
+@click.option(
+    "--output-dir",
+    "output_dir",
+    default=".",
+    type=click.Path(file_okay=False, exists=True),
+    help="Directory the inventory files are written to.",
+)
+@click.option(
+    "--format",
+    "export_format",
+    default=ExportFormat.NDJSON.value,
+    type=click.Choice(ALLOWED_FORMATS),
+    help="File format of the inventory files.",
+)
+@click.option(
+    "--compression",
+    "compression",
+    default=ExportCompression.GZIP.value,
+    type=click.Choice(ALLOWED_COMPRESSIONS),
+    help="Compression of the inventory files.",
+)
+def cli(output_dir, export_format, compression):
+    # Initialize the Xpanse Client
+    # Set CORTEX_FQDN, CORTEX_API_KEY, and CORTEX_API_KEY_ID environment variables
+    client = XpanseClient()
+
+    extension = {"none": "", "gzip": ".gz", "zstd": ".zst"}[compression]
+    inventories = {
+        "assets": client.assets.list(),
+        "services": client.services.list(),
+        "owned_ip_ranges": client.owned_ip_ranges.list(),
+    }
+
+    # Each inventory is written page by page, so memory stays flat however large the tenant
+    for name, iterator in inventories.items():
+        path = f"{output_dir}/{name}.{export_format}{extension}"
+        result = iterator.export(path, format=export_format, compression=compression)
+        print(
+            f"Exported {result.records} {name} to {path} ({result.bytes_written} bytes) in {result.elapsed:.1f}s."
+        )
+
+
+if __name__ == "__main__":
+    cli()
@@ -35,6 +35,15 @@ setup(
     keywords="xpanse iom",
     packages=["docs", "examples", *find_packages(exclude=["tests"])],
     install_requires=["requests>=2.25.1", "deprecated>=1.2.0", "typing_extensions>=4.5.0"],
+    extras_require={
+        "async": ["httpx>=0.24.0"],
+        "arrow": ["pyarrow>=7.0.0"],
+        "fast-json": ["orjson>=3.6.0"],
+        "brotli": ["brotli>=1.0.9"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "otel": ["opentelemetry-api>=1.0.0"],
+        "zstd": ["zstandard>=0.15.0"],
+    },
     include_package_data=True,
     python_requires=">=3.7",
 )
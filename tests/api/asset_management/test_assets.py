@@ -34,6 +34,19 @@ def test_AssetsApi_list(api):
     assert actual_data == expected_data
 
 
+@pytest.mark.vcr()
+def test_AssetsApi_iter_items(api):
+    _api = api.assets
+
+    api.post = MagicMock(return_value=MockResponse(_api.LIST_DATA_KEY, ["asset1", "asset2"]))
+
+    items = _api.iter_items(asset_types=[AssetType.DOMAIN])
+    assert list(items) == ["asset1", "asset2"]
+
+    request_data = api.post.call_args.kwargs[DEFAULT_REQUEST_PAYLOAD_FIELD][PublicApiFields.REQUEST_DATA]
+    assert request_data[PublicApiFields.FILTERS] == [{"field": "type", "operator": "in", "value": ["domain"]}]
+
+
 @pytest.mark.vcr()
 def test_AssetsApi_get(api):
     _api = api.assets
@@ -36,6 +36,18 @@ def test_IncidentsApi_list(api):
     assert not iterator.has_next()
 
 
+@pytest.mark.vcr()
+def test_IncidentsApi_list_concurrency(api):
+    _api = api.incidents
+
+    api.post = MagicMock(return_value=MockResponse(_api.DATA_KEY, ["incident"], total_count=250))
+
+    iterator = _api.list(concurrency=2)
+    assert iterator._concurrency == 2
+    assert iterator.dump() == ["incident", "incident", "incident"]
+    assert api.post.call_count == 3
+
+
 @pytest.mark.vcr()
 def test_IncidentsApi_get(api):
     _api = api.incidents
@@ -1,8 +1,10 @@
 import os
+from typing import Any, Dict, Union
 
 import pytest
 
 from xpanse.client import XpanseClient
+from xpanse.transport import InMemoryTransport, Transport
 
 
 @pytest.fixture(scope="module")
@@ -22,3 +24,28 @@ def api():
         api_key_id=os.getenv("TEST_CORTEX_API_KEY_ID", 1),
         api_key=os.getenv("TEST_CORTEX_API_KEY", "wwwwwwwwwwwwwwwwwwwwwwwwwwwww"),
     )
+
+
+@pytest.fixture
+def client_for():
+    """
+    Creates clients served by a transport, or by an `InMemoryTransport` of the given routes, and
+    closes them. The API Keys are not validated unless `validate` is given.
+    """
+    clients = []
+
+    def _client_for(routes: Union[Dict[str, Any], Transport], validate: str = "never", **kwargs: Any) -> XpanseClient:
+        client = XpanseClient(
+            url="test.crtx.paloaltonetworks.com",
+            api_key_id=1,
+            api_key="key",
+            validate=validate,
+            transport=routes if isinstance(routes, Transport) else InMemoryTransport(routes),
+            **kwargs,
+        )
+        clients.append(client)
+        return client
+
+    yield _client_for
+    for client in clients:
+        client.close()
@@ -0,0 +1,344 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from xpanse.async_client import AsyncXpanseClient
+from xpanse.compression import CompressionConfig
+from xpanse.const import PublicApiFields
+from xpanse.error import InvalidApiCredentials
+from xpanse.iterator import AsyncXpanseResultIterator
+from xpanse.response import XpanseResponse
+from xpanse.retry import RetryPolicy
+
+
+def _client(handler, **kwargs):
+    client = AsyncXpanseClient(url="test.crtx.paloaltonetworks.com", api_key_id=1, api_key="key", **kwargs)
+    client._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _reply(key, val, next_page_token=None, total_count=1_000):
+    return httpx.Response(200, json={
+        PublicApiFields.REPLY: {
+            PublicApiFields.TOTAL_COUNT: total_count,
+            key: val,
+            PublicApiFields.NEXT_PAGE_TOKEN: next_page_token,
+        }
+    })
+
+
+def test_AsyncXpanseClient_missing_api_key():
+    with pytest.raises(ValueError) as e:
+        AsyncXpanseClient(url="test.crtx.paloaltonetworks.com", api_key_id=1)
+    assert "An 'api_key' must be provided." in str(e.value)
+
+
+def test_AsyncXpanseClient_validate():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=True)
+
+    async def run():
+        async with _client(handler) as client:
+            return client
+
+    asyncio.run(run())
+    assert seen[0].url == "https://api-test.crtx.paloaltonetworks.com/api_keys/validate/"
+    assert seen[0].headers["x-xdr-auth-id"] == "1"
+    assert len(seen[0].headers["x-xdr-nonce"]) == 64
+
+
+def test_AsyncXpanseClient_invalid_standard_auth():
+    def handler(request):
+        assert request.headers["Authorization"] == "key"
+        return httpx.Response(401, json={})
+
+    async def run():
+        async with _client(handler, use_advanced_auth=False):
+            pass
+
+    with pytest.raises(InvalidApiCredentials) as e:
+        asyncio.run(run())
+    assert "using 'Standard' authentication." in str(e.value)
+
+
+def test_AsyncXpanseClient_signs_each_request():
+    nonces = []
+
+    def handler(request):
+        nonces.append(request.headers["x-xdr-nonce"])
+        return httpx.Response(200, json=True)
+
+    async def run():
+        client = _client(handler)
+        await asyncio.gather(*[client.post("api_keys/validate/") for _ in range(5)])
+        await client.close()
+
+    asyncio.run(run())
+    assert len(set(nonces)) == 5
+
+
+def test_AsyncXpanseClient_retry_error_codes():
+    statuses = [503, 429, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json=True, headers={"Retry-After": "0"})
+
+    async def run():
+        client = _client(handler)
+        return await client.post("api_keys/validate/")
+
+    resp = asyncio.run(run())
+    assert resp.status_code == 200
+    assert statuses == []
+
+
+def test_AsyncXpanseClient_retry_transport_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("refused")
+
+    async def run():
+        client = _client(handler, retry_policy=RetryPolicy(max_retries=2, backoff_base=0))
+        return await client.post("api_keys/validate/")
+
+    assert asyncio.run(run()) is None
+    assert len(calls) == 3
+
+
+def test_AsyncXpanseClient_retry_exhausted_returns_response():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json=True, headers={"Retry-After": "0"})
+
+    async def run():
+        client = _client(handler, retry_policy=RetryPolicy(max_retries=1, backoff_base=0, use_budget=False))
+        return await client.post("api_keys/validate/")
+
+    assert asyncio.run(run()).status_code == 503
+    assert len(calls) == 2
+
+
+def test_AsyncXpanseClient_list_page_token():
+    bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        bodies.append(body[PublicApiFields.REQUEST_DATA])
+        if PublicApiFields.NEXT_PAGE_TOKEN in body[PublicApiFields.REQUEST_DATA]:
+            return _reply("assets_internet_exposure", [3])
+        return _reply("assets_internet_exposure", [1, 2], next_page_token="token")
+
+    async def run():
+        client = _client(handler)
+        iterator = client.assets.list()
+        assert isinstance(iterator, AsyncXpanseResultIterator)
+        return [page async for page in iterator]
+
+    assert asyncio.run(run()) == [[1, 2], [3]]
+    assert bodies[0][PublicApiFields.USE_PAGE_TOKEN] is True
+    assert bodies[1][PublicApiFields.NEXT_PAGE_TOKEN] == "token"
+
+
+def test_AsyncXpanseClient_list_limit_offset_dump():
+    def handler(request):
+        request_data = json.loads(request.content)[PublicApiFields.REQUEST_DATA]
+        return _reply("incidents", [request_data[PublicApiFields.SEARCH_FROM]], total_count=250)
+
+    async def run():
+        client = _client(handler)
+        return await client.incidents.list().dump()
+
+    assert asyncio.run(run()) == [0, 100, 200]
+
+
+def test_AsyncXpanseClient_get():
+    def handler(request):
+        request_data = json.loads(request.content)[PublicApiFields.REQUEST_DATA]
+        assert request_data[PublicApiFields.FILTERS][0]["value"] == ["1", "2"]
+        return _reply("incidents", [{"incident_id": "1"}, {"incident_id": "2"}])
+
+    async def run():
+        client = _client(handler)
+        return await client.incidents.get(incident_ids=["1", "2"])
+
+    response = asyncio.run(run())
+    assert isinstance(response, XpanseResponse)
+    assert response.response.status_code == 200
+    assert response.data == [{"incident_id": "1"}, {"incident_id": "2"}]
+
+
+def test_AsyncXpanseClient_list_concurrency():
+    def handler(request):
+        request_data = json.loads(request.content)[PublicApiFields.REQUEST_DATA]
+        return _reply("attack_surface_rules", [request_data[PublicApiFields.SEARCH_FROM]], total_count=1_000)
+
+    async def run():
+        client = _client(handler)
+        return await client.attack_surface_rules.list(concurrency=4).dump()
+
+    assert asyncio.run(run()) == list(range(0, 1_000, 100))
+
+
+def test_AsyncXpanseClient_list_prefetch():
+    def handler(request):
+        token = json.loads(request.content)[PublicApiFields.REQUEST_DATA].get(PublicApiFields.NEXT_PAGE_TOKEN)
+        page = 0 if token is None else int(token)
+        return _reply("alerts", [page], next_page_token=str(page + 1) if page < 3 else None)
+
+    async def run():
+        client = _client(handler)
+        return await client.alerts.list(prefetch=2).dump()
+
+    assert asyncio.run(run()) == [0, 1, 2, 3]
+
+
+def test_AsyncXpanseClient_iter_items():
+    def handler(request):
+        request_data = json.loads(request.content)[PublicApiFields.REQUEST_DATA]
+        search_from = request_data[PublicApiFields.SEARCH_FROM]
+        return _reply("incidents", [search_from, search_from + 1], total_count=150)
+
+    async def run():
+        client = _client(handler)
+        # Only the endpoints with a `list` method stream items
+        assert not hasattr(client.tags, "iter_items")
+        return [item async for item in client.incidents.iter_items()]
+
+    assert asyncio.run(run()) == [0, 1, 100, 101]
+
+
+def test_AsyncXpanseClient_validate_lazy():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        return httpx.Response(401, json={})
+
+    async def run():
+        async with _client(handler, validate="lazy") as client:
+            assert seen == []
+            await client.incidents.count()
+
+    with pytest.raises(InvalidApiCredentials):
+        asyncio.run(run())
+    assert seen == ["/public_api/v1/incidents/get_incidents/"]
+
+
+def test_AsyncXpanseClient_compression():
+    body = json.dumps({"reply": {"assets": ["x" * 10] * 100}}).encode("utf-8")
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, stream=httpx.ByteStream(gzip.compress(body)), headers={"Content-Encoding": "gzip"})
+
+    async def run():
+        client = _client(handler, validate="never", compression=CompressionConfig(request_threshold=64))
+        resp = await client.post("fake/route", json={"request_data": {"asm_id_list": ["a" * 32] * 50}})
+        await client.close()
+        return client, resp
+
+    client, resp = asyncio.run(run())
+    assert resp.content == body
+    assert seen[0].headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(seen[0].content))["request_data"]["asm_id_list"] == ["a" * 32] * 50
+    assert client.compression_stats.responses == 1
+    assert client.compression_stats.response_ratio > 1
+    assert client.compression_stats.request_ratio > 1
+
+
+def test_AsyncXpanseClient_metrics():
+    def handler(request):
+        if request.url.path.endswith("validate/"):
+            return httpx.Response(200, json=True)
+        # A streamed body, so that httpx counts the downloaded bytes
+        body = json.dumps({PublicApiFields.REPLY: {PublicApiFields.TOTAL_COUNT: 1,
+                                                   "assets_internet_exposure": [{"name": "a"}]}})
+        return httpx.Response(200, stream=httpx.ByteStream(body.encode()))
+
+    async def run():
+        async with _client(handler) as client:
+            await client.assets.list().dump()
+            return client.metrics.snapshot()
+
+    snapshot = asyncio.run(run())
+
+    assets = snapshot["public_api/v1/assets/get_assets_internet_exposure/"]
+    assert assets["statuses"] == {"200": 1}
+    assert assets["response_bytes"] > 0
+    assert (assets["iterators"], assets["pages"], assets["results"]) == (1, 1, 1)
+
+
+def test_AsyncXpanseClient_list_resume():
+    def handler(request):
+        request_data = json.loads(request.content)[PublicApiFields.REQUEST_DATA]
+        return _reply("incidents", [request_data[PublicApiFields.SEARCH_FROM]], total_count=350)
+
+    async def run():
+        client = _client(handler)
+        iterator = client.incidents.list()
+        first = await iterator.next()
+        state = iterator.checkpoint()
+        iterator.close()
+        return first + await client.incidents.list(concurrency=2).resume(state).dump()
+
+    assert asyncio.run(run()) == [0, 100, 200, 300]
+
+
+def test_AsyncXpanseClient_list_export(tmp_path):
+    def handler(request):
+        request_data = json.loads(request.content)[PublicApiFields.REQUEST_DATA]
+        return _reply("incidents", [{"incident_id": request_data[PublicApiFields.SEARCH_FROM]}], total_count=250)
+
+    async def run():
+        client = _client(handler)
+        return await client.incidents.list().export(str(tmp_path / "incidents.ndjson.gz"), compression="gzip")
+
+    result = asyncio.run(run())
+    assert (result.records, result.pages) == (3, 3)
+    with gzip.open(tmp_path / "incidents.ndjson.gz") as file:
+        assert file.read() == b'{"incident_id":0}\n{"incident_id":100}\n{"incident_id":200}\n'
+
+
+def test_AsyncXpanseClient_list_to_arrow():
+    pytest.importorskip("pyarrow")
+
+    def handler(request):
+        request_data = json.loads(request.content)[PublicApiFields.REQUEST_DATA]
+        return _reply("incidents", [{"incident_id": str(request_data[PublicApiFields.SEARCH_FROM]),
+                                     "severity": "high"}], total_count=250)
+
+    async def run():
+        client = _client(handler)
+        return await client.incidents.list().to_arrow()
+
+    table = asyncio.run(run())
+    assert table.column("incident_id").to_pylist() == ["0", "100", "200"]
+    assert table.column("severity").type.value_type == "string"
+
+
+def test_AsyncXpanseClient_list_as_records():
+    from xpanse.records import IncidentRecord
+
+    def handler(request):
+        request_data = json.loads(request.content)[PublicApiFields.REQUEST_DATA]
+        return _reply("incidents", [{"incident_id": str(request_data[PublicApiFields.SEARCH_FROM])}], total_count=250)
+
+    async def run():
+        client = _client(handler)
+        return [record async for record in client.incidents.list().as_records().iter_items()]
+
+    records = asyncio.run(run())
+    assert [type(record) for record in records] == [IncidentRecord] * 3
+    assert [record.incident_id for record in records] == ["0", "100", "200"]
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.error import UnexpectedResponseError
+from xpanse.transport import PagedReplies, json_response
+
+# Sorted by first_observed, with runs of equal values across the page boundaries
+ASSETS = [{"name": f"host-{i}.example.com", "first_observed": i // 3} for i in range(250)]
+INCIDENTS = [{"incident_id": str(i)} for i in range(350)]
+SORT = {"sort": {"field": "first_observed", "keyword": "asc"}}
+
+
+class ExpiringAssets:
+    """
+    Serves the assets by page token, rejecting every page token once `expired` is set, and applying
+    the `gte` filter used to re-seek.
+    """
+
+    def __init__(self):
+        self.expired = False
+        self.seeks = []
+
+    def __call__(self, request):
+        request_data = request.request_data
+        if self.expired and "next_page_token" in request_data and not request_data.get("filters"):
+            return json_response({"reply": {"err_code": 400, "err_msg": "Invalid page token"}}, status_code=400)
+        results = ASSETS
+        for seek in request_data.get("filters", []):
+            self.seeks.append(seek)
+            results = [asset for asset in results if asset[seek["field"]] >= seek["value"]]
+        return PagedReplies(AssetsEndpoint.LIST_DATA_KEY, results)(request)
+
+
+def test_XpanseResultIterator_resume_limit_offset(client_for):
+    client = client_for({IncidentsEndpoint.LIST_ENDPOINT: PagedReplies("incidents", INCIDENTS)})
+    iterator = client.incidents.list(concurrency=3)
+    first = iterator.next() + iterator.next()
+    state = json.loads(json.dumps(iterator.checkpoint()))
+    iterator.close()
+
+    assert (state["pages"], state["results"], state["search_from"]) == (2, 200, 200)
+    rest = client.incidents.list(concurrency=3).resume(state).dump()
+    assert first + rest == INCIDENTS
+
+
+def test_XpanseResultIterator_resume_page_token(client_for):
+    client = client_for({AssetsEndpoint.LIST_ENDPOINT: PagedReplies(AssetsEndpoint.LIST_DATA_KEY, ASSETS)})
+    iterator = client.assets.list(request_data=SORT)
+    first = iterator.next()
+    state = iterator.checkpoint()
+
+    assert state["next_page_token"] == "100"
+    assert first + client.assets.list(request_data=SORT, prefetch=2).resume(state).dump() == ASSETS
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_XpanseResultIterator_resume_expired_token_reseeks_by_sort_key(stream, client_for):
+    route = ExpiringAssets()
+    client = client_for({AssetsEndpoint.LIST_ENDPOINT: route})
+    iterator = client.assets.list(request_data=SORT, stream=stream)
+    first = iterator.next()
+    state = iterator.checkpoint()
+    route.expired = True
+
+    assert state["sort_value"] == 33 and len(state["boundary_keys"]) == 1
+    rest = client.assets.list(request_data=SORT, stream=stream).resume(state).dump()
+
+    assert route.seeks[0] == {"field": "first_observed", "operator": "gte", "value": 33}
+    assert first + rest == ASSETS
+
+
+def test_XpanseResultIterator_expired_token_without_sort(client_for):
+    route = ExpiringAssets()
+    client = client_for({AssetsEndpoint.LIST_ENDPOINT: route})
+    iterator = client.assets.list()
+    iterator.next()
+    state = iterator.checkpoint()
+    route.expired = True
+
+    with pytest.raises(UnexpectedResponseError):
+        client.assets.list().resume(state).dump()
+
+
+def test_XpanseResultIterator_resume_rejects_other_requests(client_for):
+    client = client_for({AssetsEndpoint.LIST_ENDPOINT: PagedReplies(AssetsEndpoint.LIST_DATA_KEY, ASSETS)})
+    iterator = client.assets.list(request_data=SORT)
+    iterator.next()
+    state = iterator.checkpoint()
+
+    with pytest.raises(ValueError, match="different request"):
+        client.assets.list().resume(state)
+    with pytest.raises(ValueError, match="different request"):
+        client.incidents.list(request_data=SORT).resume(state)
+    with pytest.raises(ValueError, match="before the first page"):
+        iterator.resume(state)
+    with pytest.raises(ValueError, match="version"):
+        client.assets.list(request_data=SORT).resume({**state, "version": 0})
+
+
+def test_XpanseResultIterator_checkpoint_path(tmp_path, client_for):
+    path = str(tmp_path / "assets.checkpoint")
+    client = client_for({AssetsEndpoint.LIST_ENDPOINT: PagedReplies(AssetsEndpoint.LIST_DATA_KEY, ASSETS)})
+
+    items = client.assets.iter_items(request_data=SORT, checkpoint_path=path)
+    seen = [next(items) for _ in range(150)]
+    # Saved before the second page was requested, so the interrupted page is read again
+    with open(path) as checkpoint_file:
+        assert json.load(checkpoint_file)["pages"] == 1
+    del items
+
+    rest = list(client.assets.iter_items(request_data=SORT, checkpoint_path=path))
+    assert seen[:100] + rest == ASSETS
+    assert not (tmp_path / "assets.checkpoint").exists()
+    assert not list(tmp_path.iterdir())
+
@@ -1,8 +1,21 @@
+import gzip
+import hashlib
+import json
 import pytest
 import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from unittest.mock import MagicMock
+
+import requests
 
 from xpanse.client import XpanseClient
+from xpanse.compression import CompressionConfig
 from xpanse.error import InvalidApiCredentials
+from xpanse.pool import PoolAdapter, PoolConfig
+from xpanse.retry import RetryPolicy
+from xpanse.validation import ValidationCache
+from xpanse.const import ValidationMode
 
 
 @pytest.mark.vcr()
@@ -71,3 +84,259 @@ def test_XpanseClient_valid_advanced_auth_via_env():
     os.environ["CORTEX_API_KEY_ID"] = "1"
     os.environ["CORTEX_API_KEY"] = "wwwwwwwwwwwwwwwwwwwwwwww"
     XpanseClient()
+
+
+def _response(status_code, headers=None):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.headers.update(headers or {})
+    resp._content = b"{}"
+    return resp
+
+
+@pytest.mark.vcr()
+def test_XpanseClient_retry_policy(api):
+    api._transport.session.request = MagicMock(side_effect=[
+        _response(429, {"Retry-After": "2"}),
+        _response(503),
+        _response(200),
+    ])
+
+    with mock.patch("xpanse.client.time.sleep") as sleep:
+        resp = api.post("fake/route")
+
+    assert resp.status_code == 200
+    assert api._transport.session.request.call_count == 3
+    assert sleep.call_args_list[0] == mock.call(2.0)
+    assert 0 <= sleep.call_args_list[1].args[0] <= 1
+
+
+@pytest.mark.vcr()
+def test_XpanseClient_retry_connection_error(api):
+    api._retry_policy = RetryPolicy(max_retries=2, use_budget=False)
+    api._transport.session.request = MagicMock(side_effect=requests.exceptions.ConnectionError("refused"))
+
+    with mock.patch("xpanse.client.time.sleep") as sleep:
+        assert api.post("fake/route") is None
+
+    assert api._transport.session.request.call_count == 3
+    assert sleep.call_count == 2
+
+
+def _unvalidated_client(**kwargs):
+    with mock.patch.object(XpanseClient, "_validate_auth", return_value=True):
+        client = XpanseClient(url="test.crtx.paloaltonetworks.com", api_key_id=1, api_key="key", **kwargs)
+    client._transport.session = MagicMock()
+    return client
+
+
+def test_XpanseClient_retry_exhausted_returns_response():
+    client = _unvalidated_client(retry_policy=RetryPolicy(max_retries=1, use_budget=False))
+    client._transport.session.request = MagicMock(return_value=_response(502))
+
+    with mock.patch("xpanse.client.time.sleep"):
+        resp = client.post("fake/route")
+
+    assert resp.status_code == 502
+    assert client._transport.session.request.call_count == 2
+
+
+def test_XpanseClient_rate_limiter():
+    client = _unvalidated_client(retry_policy=RetryPolicy(use_budget=False), rate_limiter=MagicMock())
+    client._transport.session.request = MagicMock(side_effect=[_response(429, {"Retry-After": "0"}), _response(200)])
+
+    with mock.patch("xpanse.client.time.sleep"):
+        client.post("fake/route")
+
+    # Retries are paced as well
+    assert client._rate_limiter.acquire.call_args_list == [mock.call("fake/route")] * 2
+
+
+def test_XpanseClient_signs_each_request():
+    client = _unvalidated_client()
+    client._transport.session.request = MagicMock(return_value=_response(200))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: client.post("fake/route", headers={"X-Custom": "1"}), range(20)))
+
+    sent = [call.kwargs["headers"] for call in client._transport.session.request.call_args_list]
+    assert len({headers["x-xdr-nonce"] for headers in sent}) == 20
+    assert all(headers["X-Custom"] == "1" for headers in sent)
+    # Every nonce is signed with its own hash
+    for headers in sent:
+        auth_key = f"key{headers['x-xdr-nonce']}{headers['x-xdr-timestamp']}".encode("utf-8")
+        assert headers["Authorization"] == hashlib.sha256(auth_key).hexdigest()
+
+
+def test_XpanseClient_session_has_no_auth_headers():
+    client = _unvalidated_client()
+    client._create_transport()
+    assert "Authorization" not in client._transport.session.headers
+    assert "x-xdr-nonce" not in client._transport.session.headers
+
+
+def test_XpanseClient_pool_config():
+    client = _unvalidated_client(pool_config=PoolConfig(pool_maxsize=32, pool_block=True))
+    client._create_transport()
+
+    adapter = client._transport.session.get_adapter(client._url)
+    assert isinstance(adapter, PoolAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+
+
+def _client_without_requests(api_key="key", **kwargs):
+    return XpanseClient(url="test.crtx.paloaltonetworks.com", api_key_id=1, api_key=api_key, **kwargs)
+
+
+def test_XpanseClient_validate_lazy():
+    with mock.patch.object(XpanseClient, "_send", return_value=_response(200)) as send:
+        client = _client_without_requests(validate="lazy")
+        send.assert_not_called()
+
+        client.post("fake/route")
+        client.post("fake/route")
+
+    # Validation is not repeated once a request succeeds
+    assert [call.args[1] for call in send.call_args_list] == ["fake/route", "fake/route"]
+    assert not client._pending_validation
+
+
+def test_XpanseClient_validate_lazy_invalid():
+    with mock.patch.object(XpanseClient, "_send", return_value=_response(401)):
+        client = _client_without_requests(validate=ValidationMode.LAZY)
+
+        with pytest.raises(InvalidApiCredentials):
+            client.post("fake/route")
+
+
+def test_XpanseClient_validate_never():
+    with mock.patch.object(XpanseClient, "_send", return_value=_response(401)) as send:
+        client = _client_without_requests(validate="never")
+        # A 401 is returned as is when the keys are not validated
+        assert client.post("fake/route").status_code == 401
+
+    assert send.call_count == 1
+
+
+def test_XpanseClient_validate_invalid_mode():
+    with pytest.raises(ValueError):
+        _client_without_requests(validate="sometimes")
+
+
+def test_XpanseClient_validation_cache(tmp_path):
+    cache = ValidationCache(path=str(tmp_path / "validation.json"))
+
+    with mock.patch.object(XpanseClient, "_validate_auth", return_value=True) as validate_auth:
+        _client_without_requests(validation_cache=cache)
+        _client_without_requests(validation_cache=cache)
+        _client_without_requests(validation_cache=cache, api_key="rotated")
+
+    assert validate_auth.call_count == 2
+
+
+def test_XpanseClient_validation_cache_lazy(tmp_path):
+    cache = ValidationCache(path=str(tmp_path / "validation.json"))
+
+    with mock.patch.object(XpanseClient, "_send", return_value=_response(200)):
+        client = _client_without_requests(validate="lazy", validation_cache=cache)
+        client.post("fake/route")
+
+        assert not _client_without_requests(validate="lazy", validation_cache=cache)._pending_validation
+
+
+def test_XpanseClient_json_codec():
+    client = _unvalidated_client(json_codec="json")
+    client._transport.session.request = MagicMock(return_value=_response(200))
+
+    client.post("fake/route", json={"request_data": {"search_from": 0}})
+
+    kwargs = client._transport.session.request.call_args.kwargs
+    assert "json" not in kwargs
+    assert kwargs["data"] == b'{"request_data":{"search_from":0}}'
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_XpanseClient_json_codec_no_body():
+    client = _unvalidated_client()
+    client._transport.session.request = MagicMock(return_value=_response(200))
+
+    client.get("fake/route")
+
+    kwargs = client._transport.session.request.call_args.kwargs
+    assert "data" not in kwargs
+    assert "Content-Type" not in kwargs["headers"]
+
+
+def test_XpanseClient_compression_request_body():
+    client = _unvalidated_client(compression=CompressionConfig(request_threshold=64))
+    client._transport.session.request = MagicMock(return_value=_response(200))
+
+    asm_ids = [f"{i:032x}" for i in range(100)]
+    client.post("fake/route", json={"request_data": {"asm_id_list": asm_ids}})
+
+    kwargs = client._transport.session.request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"]))["request_data"]["asm_id_list"] == asm_ids
+    assert client.compression_stats.compressed_requests == 1
+    assert client.compression_stats.request_ratio > 1
+
+
+def test_XpanseClient_compression_small_request_body():
+    client = _unvalidated_client(compression=CompressionConfig(request_threshold=64))
+    client._transport.session.request = MagicMock(return_value=_response(200))
+
+    client.post("fake/route", json={"request_data": {}})
+
+    kwargs = client._transport.session.request.call_args.kwargs
+    assert kwargs["data"] == b'{"request_data":{}}'
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert client.compression_stats.compressed_requests == 0
+
+
+def test_XpanseClient_compression_accept_encoding():
+    with mock.patch.object(XpanseClient, "_validate_auth", return_value=True):
+        client = XpanseClient(url="test.crtx.paloaltonetworks.com", api_key_id=1, api_key="key")
+        identity = XpanseClient(url="test.crtx.paloaltonetworks.com", api_key_id=1, api_key="key",
+                                compression=CompressionConfig(accept_encoding=False))
+
+    assert client._transport.session.headers["Accept-Encoding"].startswith("gzip, deflate")
+    assert identity._transport.session.headers["Accept-Encoding"] == "identity"
+
+
+def test_XpanseClient_http2_session():
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    client = _client_without_requests(validate="never", http2=True, pool_config=PoolConfig(pool_maxsize=4))
+
+    assert isinstance(client._transport.session, httpx.Client)
+    pool = client._transport.session._transport._pool
+    assert pool._http2
+    assert pool._max_keepalive_connections == 4
+    client.close()
+
+
+def test_XpanseClient_http2_requests():
+    httpx = pytest.importorskip("httpx")
+    seen = []
+    statuses = [503, 200]
+
+    def handler(request):
+        seen.append(request)
+        if len(seen) == 1:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(statuses.pop(0), json={"reply": {"data": [1, 2]}}, headers={"Retry-After": "0"})
+
+    with mock.patch("xpanse.transport.build_httpx_client", return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+        client = _client_without_requests(validate="never", http2=True,
+                                          retry_policy=RetryPolicy(use_budget=False))
+
+    with mock.patch("xpanse.client.time.sleep"):
+        resp = client.post("fake/route", json={"request_data": {}}, stream=True)
+
+    assert isinstance(resp, requests.Response)
+    assert resp.status_code == 200
+    assert b"".join(resp.iter_content(4)) == b'{"reply":{"data":[1,2]}}'
+    assert len(seen) == 3
+    assert seen[-1].content == b'{"request_data":{}}'
+    assert seen[-1].headers["x-xdr-auth-id"] == "1"
+    assert client.compression_stats.responses == 2
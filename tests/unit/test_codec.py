@@ -0,0 +1,80 @@
+import json
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from xpanse.codec import (
+    JsonCodec,
+    available_codecs,
+    codec_of,
+    decode_response,
+    get_codec,
+)
+from xpanse.response import XpanseResponse
+
+PAYLOAD = {"request_data": {"filters": [{"field": "name", "operator": "in", "value": ["é", 1, 2.5, None, True]}]}}
+
+
+@pytest.mark.parametrize("name", list(available_codecs()))
+def test_JsonCodec_round_trip(name):
+    codec = get_codec(name)
+    encoded = codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode("utf-8")) == PAYLOAD
+
+
+def test_get_codec_auto_prefers_fastest():
+    assert get_codec().name == next(iter(available_codecs()))
+    assert get_codec("auto").name == get_codec().name
+    assert "json" in available_codecs()
+
+
+def test_get_codec_instance():
+    codec = JsonCodec()
+    assert get_codec(codec) is codec
+
+
+def test_get_codec_errors():
+    with pytest.raises(ValueError) as e:
+        get_codec("yaml")
+    assert "Unknown JSON codec 'yaml'" in str(e.value)
+
+    with mock.patch.dict("xpanse.codec._MODULES", {"ujson": None}):
+        with pytest.raises(ValueError) as e:
+            get_codec("ujson")
+    assert "pip install ujson" in str(e.value)
+
+
+def test_codec_of():
+    api = MagicMock()
+    assert codec_of(api) is None
+
+    api._json_codec = JsonCodec()
+    assert codec_of(api) is api._json_codec
+
+
+def test_decode_response():
+    response = requests.Response()
+    response._content = json.dumps({"reply": {"total_count": 5}}).encode("utf-8")
+
+    codec = MagicMock(spec=JsonCodec)
+    codec.loads = MagicMock(return_value={"reply": {"total_count": 5}})
+
+    assert decode_response(response) == {"reply": {"total_count": 5}}
+    assert decode_response(response, codec) == {"reply": {"total_count": 5}}
+    codec.loads.assert_called_once_with(response.content)
+
+    # Objects that are not requests responses are decoded with their own json() method
+    other = MagicMock()
+    other.json = MagicMock(return_value=[])
+    assert decode_response(other, codec) == []
+
+
+def test_XpanseResponse_codec():
+    response = requests.Response()
+    response._content = b'{"reply": {"total_count": 5}}'
+    assert XpanseResponse(response, data_key="total_count", codec=get_codec("json")).data == 5
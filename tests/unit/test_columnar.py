@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.columnar import ArrowBatchBuilder, ParquetBatchWriter
+from xpanse.export import ExportWriter
+from xpanse.schemas import SCHEMAS, field_names, schema_of
+from xpanse.testing.data import GENERATORS, generate
+from xpanse.transport import PagedReplies
+
+INCIDENTS = generate("incidents", 250)
+
+
+def _routes():
+    return {IncidentsEndpoint.LIST_ENDPOINT: PagedReplies("incidents", INCIDENTS)}
+
+
+@pytest.mark.parametrize("data_key", sorted(GENERATORS))
+def test_schemas_match_generated_results(data_key):
+    assert field_names(data_key) == list(generate(data_key, 1)[0])
+
+    builder = ArrowBatchBuilder(data_key)
+    batch = builder.batch(generate(data_key, 50))
+    assert batch.num_rows == 50
+    assert batch.schema == builder.schema
+
+
+def test_schema_of_unknown():
+    with pytest.raises(ValueError):
+        schema_of("unknown")
+    assert set(SCHEMAS) == set(GENERATORS)
+
+
+def test_ArrowBatchBuilder_types():
+    builder = ArrowBatchBuilder("alerts")
+    batch = builder.batch(generate("alerts", 10) + [{"alert_id": "missing", "port_number": 443}])
+
+    assert pa.types.is_dictionary(batch.schema.field("severity").type)
+    assert batch.schema.field("creation_time").type == pa.timestamp("ms", tz="UTC")
+    assert batch.schema.field("host_ip").type == pa.list_(pa.string())
+    assert batch.schema.field("events").type == pa.string()
+    # Missing fields are null, and scalars of list fields are wrapped
+    last = batch.slice(10).to_pylist()[0]
+    assert (last["severity"], last["port_number"]) == (None, [443])
+
+
+def test_ArrowBatchBuilder_infers_unknown_data_key():
+    builder = ArrowBatchBuilder("unknown")
+    batch = builder.batch([{"id": 1, "name": "a"}])
+
+    assert builder.schema == batch.schema
+    assert builder.table([batch, builder.batch([{"id": 2}])]).to_pylist() == [
+        {"id": 1, "name": "a"}, {"id": 2, "name": None},
+    ]
+    assert ArrowBatchBuilder().table([]).num_rows == 0
+
+
+def test_XpanseResultIterator_export_parquet(tmp_path, client_for):
+    path = tmp_path / "incidents.parquet"
+
+    result = client_for(_routes()).incidents.list().export(str(path), format="parquet")
+
+    table = pq.read_table(path)
+    assert table.to_pylist() == ArrowBatchBuilder("incidents").batch(INCIDENTS).to_pylist()
+    assert (result.records, result.pages) == (250, 3)
+    assert result.bytes_written == os.path.getsize(path)
+    assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == "ZSTD"
+    assert os.listdir(tmp_path) == ["incidents.parquet"]
+
+
+def test_ExportWriter_parquet_row_groups(tmp_path):
+    path = tmp_path / "incidents.parquet"
+
+    with ExportWriter(str(path), format="parquet", compression="gzip", data_key="incidents",
+                      row_group_size=120) as writer:
+        for start in range(0, 250, 50):
+            writer.write_page(INCIDENTS[start:start + 50])
+
+    metadata = pq.ParquetFile(path).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [150, 100]
+    assert metadata.row_group(0).column(0).compression == "GZIP"
+
+
+def test_ExportWriter_parquet_empty(tmp_path):
+    path = tmp_path / "incidents.parquet"
+
+    ExportWriter(str(path), format="parquet", data_key="incidents").close()
+
+    table = pq.read_table(path)
+    assert table.num_rows == 0
+    assert table.column_names == field_names("incidents")
+
+
+def test_XpanseResultIterator_to_pandas(client_for):
+    pytest.importorskip("pandas")
+
+    frame = client_for(_routes()).incidents.list().to_pandas()
+
+    assert len(frame) == 250
+    assert frame["severity"].dtype == "category"
+    assert set(frame["severity"].cat.categories) <= {"low", "medium", "high", "critical"}
+
+
+def test_ParquetBatchWriter_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        ParquetBatchWriter(str(tmp_path / "incidents.parquet"), ArrowBatchBuilder("incidents"), row_group_size=0)
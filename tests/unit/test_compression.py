@@ -0,0 +1,90 @@
+import gzip
+import io
+import json
+from unittest import mock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from xpanse.compression import CompressionConfig, CompressionStats, response_sizes
+
+BODY = json.dumps({"reply": {"assets": [{"name": f"host-{i}.example.com"} for i in range(500)]}}).encode("utf-8")
+
+
+def test_CompressionConfig_invalid():
+    with pytest.raises(ValueError):
+        CompressionConfig(request_threshold=0)
+    with pytest.raises(ValueError):
+        CompressionConfig(level=10)
+
+
+def test_CompressionConfig_accept_encoding_header():
+    with mock.patch("xpanse.compression.brotli", None):
+        assert CompressionConfig().accept_encoding_header() == "gzip, deflate"
+    with mock.patch("xpanse.compression.brotli", object()):
+        assert CompressionConfig().accept_encoding_header() == "gzip, deflate, br"
+    assert CompressionConfig(accept_encoding=False).accept_encoding_header() == "identity"
+
+
+def test_CompressionConfig_compress():
+    assert CompressionConfig().compress(BODY) is None
+    assert CompressionConfig(request_threshold=len(BODY) + 1).compress(BODY) is None
+
+    compressed = CompressionConfig(request_threshold=1024).compress(BODY)
+    assert gzip.decompress(compressed) == BODY
+
+    # Incompressible bodies are not worth a Content-Encoding
+    assert CompressionConfig(request_threshold=1).compress(b"{}") is None
+
+
+def test_CompressionStats():
+    stats = CompressionStats()
+    assert stats.response_ratio == 1.0
+    assert stats.request_ratio == 1.0
+
+    stats.record_response(100, 1000)
+    stats.record_response(100, 900)
+    stats.record_request(400, 100)
+
+    assert stats.response_ratio == 9.5
+    assert stats.request_ratio == 4.0
+    assert stats.snapshot() == {
+        "responses": 2,
+        "response_wire_bytes": 200,
+        "response_bytes": 1900,
+        "response_ratio": 9.5,
+        "compressed_requests": 1,
+        "request_wire_bytes": 100,
+        "request_bytes": 400,
+        "request_ratio": 4.0,
+    }
+
+
+def _gzip_response():
+    compressed = gzip.compress(BODY)
+    raw = HTTPResponse(
+        body=io.BytesIO(compressed),
+        headers={"Content-Encoding": "gzip", "Content-Length": str(len(compressed))},
+        status=200,
+        preload_content=False,
+    )
+    request = requests.Request("POST", "https://api-test.crtx.paloaltonetworks.com/").prepare()
+    return HTTPAdapter().build_response(request, raw), len(compressed)
+
+
+def test_response_sizes():
+    response, wire = _gzip_response()
+    assert response_sizes(response) is None  # not read yet
+
+    assert response.content == BODY
+    assert response_sizes(response) == (wire, len(BODY))
+
+
+def test_response_sizes_without_raw():
+    response = requests.Response()
+    response._content = b"{}"
+    response._content_consumed = True
+    assert response_sizes(response) == (2, 2)
+    assert response_sizes(object()) is None
@@ -0,0 +1,113 @@
+import csv
+import gc
+import gzip
+import io
+import json
+import os
+
+import pytest
+
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint
+from xpanse.export import ExportWriter, export_pages
+from xpanse.transport import PagedReplies
+
+ASSETS = [{"name": f"host-{i}.example.com", "asm_ids": [str(i)], "details": None} for i in range(250)]
+
+
+def _routes():
+    return {AssetsEndpoint.LIST_ENDPOINT: PagedReplies(AssetsEndpoint.LIST_DATA_KEY, ASSETS)}
+
+
+def _ndjson(data):
+    return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+
+def test_XpanseResultIterator_export_ndjson(tmp_path, client_for):
+    path = tmp_path / "assets.ndjson"
+
+    result = client_for(_routes()).assets.list().export(str(path), buffer_size=1_024)
+
+    assert _ndjson(path.read_bytes()) == ASSETS
+    assert (result.records, result.pages) == (250, 3)
+    assert result.bytes_written == result.uncompressed_bytes == os.path.getsize(path)
+    assert os.listdir(tmp_path) == ["assets.ndjson"]
+
+
+def test_XpanseResultIterator_export_gzip(tmp_path, client_for):
+    path = tmp_path / "assets.ndjson.gz"
+
+    result = client_for(_routes()).assets.list(stream=True).export(str(path), compression="gzip")
+
+    with gzip.open(path) as file:
+        assert _ndjson(file.read()) == ASSETS
+    assert result.bytes_written == os.path.getsize(path)
+    assert result.bytes_written < result.uncompressed_bytes
+
+
+def test_XpanseResultIterator_export_zstd(tmp_path, client_for):
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "assets.ndjson.zst"
+
+    result = client_for(_routes()).assets.list().export(str(path), compression="zstd")
+
+    with zstandard.ZstdDecompressor().stream_reader(open(path, "rb")) as file:
+        assert _ndjson(file.read()) == ASSETS
+    assert result.bytes_written == os.path.getsize(path)
+
+
+def test_XpanseResultIterator_export_csv(tmp_path, client_for):
+    path = tmp_path / "assets.csv"
+
+    result = client_for(_routes()).assets.list().export(str(path), format="csv")
+
+    rows = list(csv.DictReader(io.StringIO(path.read_text())))
+    assert result.records == len(rows) == 250
+    assert rows[1] == {"name": "host-1.example.com", "asm_ids": '["1"]', "details": ""}
+
+
+def test_ExportWriter_csv_fields(tmp_path):
+    path = tmp_path / "assets.csv"
+
+    with ExportWriter(str(path), format="csv", fields=["asm_ids", "missing"]) as writer:
+        writer.write_page(ASSETS[:2])
+
+    assert path.read_text() == 'asm_ids,missing\n"[""0""]",\n"[""1""]",\n'
+
+
+def test_export_pages_interrupted(tmp_path):
+    def pages():
+        yield ASSETS[:100]
+        raise ConnectionError("network down")
+
+    with pytest.raises(ConnectionError):
+        export_pages(pages(), tmp_path / "assets.ndjson")
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_export_pages_writer_error(tmp_path):
+    with pytest.raises(TypeError):
+        export_pages([[1, 2]], tmp_path / "numbers.csv", format="csv")
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_ExportWriter_dropped(tmp_path):
+    writer = ExportWriter(tmp_path / "assets.ndjson")
+    writer.write_page(ASSETS)
+    thread = writer._thread
+
+    # Dropped without calling close or abort
+    del writer
+    gc.collect()
+    thread.join(timeout=2)
+
+    assert not thread.is_alive()
+    assert os.listdir(tmp_path) == []
+
+
+def test_ExportWriter_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        ExportWriter(tmp_path / "assets.xml", format="xml")
+    with pytest.raises(ValueError):
+        ExportWriter(tmp_path / "assets.ndjson", buffer_size=0)
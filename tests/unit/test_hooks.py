@@ -0,0 +1,109 @@
+from unittest import mock
+
+import pytest
+
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.const import HookType
+from xpanse.hooks import Hooks
+from xpanse.retry import RetryPolicy
+from xpanse.transport import InMemoryTransport, PagedReplies, json_response
+
+INCIDENTS = [{"incident_id": str(i)} for i in range(350)]
+LIST_PATH = IncidentsEndpoint.LIST_ENDPOINT
+
+
+def _recording_hooks(hooks=None):
+    hooks = hooks or Hooks()
+    seen = []
+    for hook_type in HookType:
+        hooks.add(hook_type, lambda event, hook_type=hook_type: seen.append((hook_type, event)))
+    return hooks, seen
+
+
+def test_Hooks_request_and_retry(client_for):
+    replies = iter([json_response({}, status_code=503), json_response({"reply": {}})])
+    hooks, seen = _recording_hooks()
+    client = client_for({"fake/route": lambda request: next(replies)}, hooks=hooks,
+                        retry_policy=RetryPolicy(use_budget=False))
+
+    with mock.patch("xpanse.client.time.sleep"):
+        client.post("fake/route", json={"request_data": {}})
+
+    assert [hook_type for hook_type, _ in seen] == [
+        HookType.BEFORE_REQUEST, HookType.AFTER_RESPONSE, HookType.ON_RETRY,
+        HookType.BEFORE_REQUEST, HookType.AFTER_RESPONSE,
+    ]
+    before, first, retry, second = seen[0][1], seen[1][1], seen[2][1], seen[4][1]
+    assert (first.method, first.path, first.attempt, first.status) == ("POST", "fake/route", 1, 503)
+    assert first.payload_bytes == len(b'{"request_data":{}}')
+    assert first.delay is not None and first.elapsed >= 0
+    assert (second.attempt, second.status, second.delay, second.iterator) == (2, 200, None, None)
+    # Each stage has its own event, sharing the context of the attempt
+    assert (before.hook_type, before.status, before.delay) == (HookType.BEFORE_REQUEST, None, None)
+    assert first.hook_type == HookType.AFTER_RESPONSE and retry.hook_type == HookType.ON_RETRY
+    assert before.context is first.context is retry.context
+
+
+def test_Hooks_iterator_scope(client_for):
+    hooks, seen = _recording_hooks()
+    client = client_for({LIST_PATH: PagedReplies("incidents", INCIDENTS)}, hooks=hooks)
+
+    assert len(client.incidents.list(concurrency=2).dump()) == 350
+
+    types = [hook_type for hook_type, _ in seen]
+    assert types[0] == HookType.ITERATOR_START and types[-1] == HookType.ITERATOR_END
+    assert types.count(HookType.BEFORE_REQUEST) == 4
+    assert types.count(HookType.ON_PAGE) == 4
+    scope = seen[0][1]
+    # Pages requested by the worker threads belong to the iterator too
+    assert all(event.iterator is scope for _, event in seen[1:-1])
+    end = seen[-1][1]
+    assert end.context is scope.context and scope.hook_type == HookType.ITERATOR_START
+    assert (scope.pages, scope.results) == (None, None)
+    assert (end.pages, end.results) == (4, 350)
+    assert [event.results for hook_type, event in seen if hook_type == HookType.ON_PAGE] == [100, 100, 100, 50]
+
+
+def test_Hooks_failing_hook_does_not_fail_request(client_for):
+    hooks = Hooks()
+    hooks.add("before_request", mock.MagicMock(side_effect=RuntimeError("boom")))
+    after = hooks.add(HookType.AFTER_RESPONSE, mock.MagicMock())
+    client = client_for({}, hooks=hooks)
+
+    assert client.post("api_keys/validate/").status_code == 200
+    after.assert_called_once()
+
+    hooks.remove(HookType.AFTER_RESPONSE, after)
+    client.post("api_keys/validate/")
+    after.assert_called_once()
+
+
+def test_OpenTelemetryHooks_spans(client_for):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.trace import StatusCode
+
+    from xpanse.otel import OpenTelemetryHooks
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    transport = InMemoryTransport({LIST_PATH: PagedReplies("incidents", INCIDENTS)})
+    client = client_for(transport, hooks=OpenTelemetryHooks(tracer=provider.get_tracer("test")))
+
+    client.incidents.list().dump()
+    client.post("unknown/route")
+
+    spans = exporter.get_finished_spans()
+    iterator = next(span for span in spans if span.name.startswith("xpanse.iterate"))
+    requests = [span for span in spans if span.name == "POST"]
+    assert len(requests) == 5
+    assert all(span.parent.span_id == iterator.context.span_id for span in requests[:4])
+    assert requests[4].parent is None
+    assert requests[4].attributes["http.response.status_code"] == 404
+    assert requests[4].status.status_code == StatusCode.ERROR
+    assert iterator.attributes["xpanse.pages"] == 4
+    assert iterator.attributes["xpanse.results"] == 350
+    assert len(iterator.events) == 4
@@ -1,10 +1,17 @@
+import gc
+import threading
+import time
 from typing import Any, List
 from unittest.mock import MagicMock
 
 import pytest
 
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint
+from xpanse.endpoint import ListableEndpoint
 from xpanse.const import PublicApiFields, DEFAULT_SEARCH_TO, MAX_TOTAL_COUNT, DEFAULT_SEARCH_FROM
+from xpanse.error import UnexpectedResponseError
 from xpanse.iterator import XpanseResultIterator
+from xpanse.transport import PagedReplies
 
 
 @pytest.mark.vcr()
@@ -145,6 +152,169 @@ def test_XpanseResultIterator_invalid_search_from_search_to():
         assert ex.args == f"'{PublicApiFields.SEARCH_FROM}' must be less than '{PublicApiFields.SEARCH_TO}'. 5 < 5"
 
 
+def test_XpanseResultIterator_concurrency_in_order():
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    def post(path, **kwargs):
+        search_from = kwargs["json"][PublicApiFields.REQUEST_DATA][PublicApiFields.SEARCH_FROM]
+        with lock:
+            in_flight.append(search_from)
+            max_in_flight.append(len(in_flight))
+        # Later pages return sooner, pages must still come back in order
+        time.sleep(0.05 if search_from == 100 else 0.01)
+        with lock:
+            in_flight.remove(search_from)
+        return MockResponse("data", [search_from], total_count=950)
+
+    api = MagicMock()
+    api.post = MagicMock(side_effect=post)
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", use_page_token=False, concurrency=4)
+
+    assert i.dump() == [0, 100, 200, 300, 400, 500, 600, 700, 800, 900]
+    assert api.post.call_count == 10
+    assert max(max_in_flight) == 4
+    assert not i.has_next()
+
+
+def test_XpanseResultIterator_concurrency_over_9999():
+    def post(path, **kwargs):
+        search_from = kwargs["json"][PublicApiFields.REQUEST_DATA][PublicApiFields.SEARCH_FROM]
+        if search_from >= MAX_TOTAL_COUNT + 1:
+            return MockResponse("data", [], total_count=MAX_TOTAL_COUNT, results_count=0)
+        return MockResponse("data", [search_from], total_count=MAX_TOTAL_COUNT)
+
+    api = MagicMock()
+    api.post = MagicMock(side_effect=post)
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", use_page_token=False,
+                             search_to=1_000, concurrency=3)
+
+    assert i.dump() == list(range(0, 10_000, 1_000))
+    # 10 windows up to the cap, then one empty page to confirm the results are exhausted
+    assert api.post.call_count == 11
+
+
+def test_XpanseResultIterator_invalid_concurrency():
+    with pytest.raises(ValueError):
+        XpanseResultIterator(api=None, path="fake/route", data_key="data", use_page_token=False, concurrency=0)
+
+
+def _page_token_post(pages):
+    def post(path, **kwargs):
+        token = kwargs["json"][PublicApiFields.REQUEST_DATA].get(PublicApiFields.NEXT_PAGE_TOKEN)
+        page = 0 if token is None else int(token)
+        next_token = str(page + 1) if page + 1 < pages else None
+        return MockResponse("data", [page], next_token)
+
+    return post
+
+
+def test_XpanseResultIterator_prefetch_in_order():
+    api = MagicMock()
+    api.post = MagicMock(side_effect=_page_token_post(5))
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", prefetch=2)
+
+    assert i.next() == [0]
+    # The following pages are requested in the background while the caller holds page 0
+    deadline = time.time() + 2
+    while api.post.call_count < 4 and time.time() < deadline:
+        time.sleep(0.01)
+    # One page handed to the caller, two buffered, one blocked on the full queue
+    assert api.post.call_count == 4
+
+    assert i.dump() == [1, 2, 3, 4]
+    assert not i.has_next()
+    assert api.post.call_count == 5
+
+
+def test_XpanseResultIterator_prefetch_error():
+    api = MagicMock()
+    api.post = MagicMock(side_effect=[MockResponse("data", [0], "1"), MockResponse("other", [1])])
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", prefetch=1)
+
+    assert i.next() == [0]
+    with pytest.raises(UnexpectedResponseError):
+        i.next()
+
+
+def test_XpanseResultIterator_prefetch_close():
+    api = MagicMock()
+    api.post = MagicMock(side_effect=_page_token_post(1_000))
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", prefetch=1)
+
+    assert i.next() == [0]
+    worker = i._worker
+    i.close()
+    worker.join(timeout=2)
+    assert not worker.is_alive()
+
+
+def test_XpanseResultIterator_prefetch_dropped():
+    api = MagicMock()
+    api.post = MagicMock(side_effect=_page_token_post(1_000))
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", prefetch=1)
+
+    for item in i.iter_items():
+        break
+    worker = i._worker
+    # Dropped without calling close, while the worker is blocked on the full queue
+    del i
+    gc.collect()
+    worker.join(timeout=2)
+    assert not worker.is_alive()
+    assert api.post.call_count < 1_000
+
+
+def test_XpanseResultIterator_prefetch_error_dropped():
+    api = MagicMock()
+    api.post = MagicMock(side_effect=[MockResponse("data", [0], "1"), MockResponse("data", [1], "2"), ValueError()])
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", prefetch=1)
+
+    assert i.next() == [0]
+    worker = i._worker
+    deadline = time.time() + 2
+    while api.post.call_count < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    # The error waiting on the full queue does not keep the iterator alive
+    del i
+    gc.collect()
+    worker.join(timeout=2)
+    assert not worker.is_alive()
+
+
+def test_ListableEndpoint_iter_items(client_for):
+    client = client_for({AssetsEndpoint.LIST_ENDPOINT: PagedReplies(
+        "assets_internet_exposure", [{"name": str(i)} for i in range(150)])})
+
+    assert [item["name"] for item in client.assets.iter_items()] == [str(i) for i in range(150)]
+    assert isinstance(client.assets, ListableEndpoint)
+    assert not hasattr(client.tags, "iter_items")
+
+
+def test_XpanseResultIterator_iter_items():
+    api = MagicMock()
+    api.post = MagicMock(side_effect=[MockResponse("data", [1, 2], "_next_page_token"), MockResponse("data", [3])])
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data")
+
+    items = i.iter_items()
+    assert next(items) == 1
+    assert next(items) == 2
+    # The next page is only requested once the current page is exhausted
+    assert api.post.call_count == 1
+    assert list(items) == [3]
+    assert api.post.call_count == 2
+    assert not i.has_next()
+
+
+def test_XpanseResultIterator_iter_items_limit_offset():
+    api = MagicMock()
+    api.post = MagicMock(side_effect=lambda *args, **kwargs: MockResponse("data", [1, 2], total_count=150))
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", use_page_token=False)
+
+    assert list(i.iter_items()) == [1, 2, 1, 2]
+
+
 class MockResponse:
     def __init__(self,
                  key: str,
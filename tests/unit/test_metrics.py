@@ -0,0 +1,103 @@
+from unittest import mock
+
+import pytest
+
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint
+from xpanse.compression import CompressionConfig
+from xpanse.metrics import Histogram, MetricsRegistry
+from xpanse.retry import RetryPolicy
+from xpanse.transport import InMemoryTransport, PagedReplies, json_response
+
+ASSETS = [{"name": f"host-{i}.example.com"} for i in range(250)]
+LIST_PATH = AssetsEndpoint.LIST_ENDPOINT
+
+
+def test_Histogram_cumulative_and_quantile():
+    histogram = Histogram([0.1, 1.0])
+    for value in [0.05, 0.1, 0.5, 5.0]:
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.99) == 1.0
+    assert histogram.sum == pytest.approx(5.65)
+
+
+def test_MetricsRegistry_rejects_unsorted_buckets():
+    with pytest.raises(ValueError):
+        MetricsRegistry(buckets=[1.0, 0.5])
+
+
+def test_XpanseClient_metrics_pages_and_bytes(client_for):
+    client = client_for({LIST_PATH: PagedReplies("assets_internet_exposure", ASSETS)}, validate="eager")
+
+    client.assets.list().dump()
+    snapshot = client.metrics.snapshot()
+
+    assert set(snapshot) == {"api_keys/validate/", LIST_PATH}
+    assets = snapshot[LIST_PATH]
+    assert assets["requests"] == 3
+    assert assets["statuses"] == {"200": 3}
+    assert assets["latency"]["count"] == 3
+    assert assets["response_bytes"] > 0
+    assert (assets["iterators"], assets["pages"], assets["results"]) == (1, 3, 250)
+    assert assets["pages_per_iterator"] == 3.0
+
+
+def test_XpanseClient_metrics_compression(client_for):
+    transport = InMemoryTransport({LIST_PATH: PagedReplies("assets_internet_exposure", ASSETS)})
+    client = client_for(transport, validate="eager", compression=CompressionConfig(request_threshold=1_024))
+    request_data = {"filters": [{"field": "name", "operator": "in", "value": ["example.com"] * 200}]}
+
+    client.assets.list(request_data=request_data).dump()
+    assets = client.metrics.snapshot()[LIST_PATH]
+
+    # One compressed body per page request
+    assert assets["request_bytes"] > 10 * assets["request_wire_bytes"]
+    assert assets["request_ratio"] == assets["request_bytes"] / assets["request_wire_bytes"]
+    assert assets["decoded_bytes"] == assets["decoded_wire_bytes"] == assets["response_bytes"]
+    assert assets["response_ratio"] == 1.0
+
+
+def test_XpanseClient_metrics_retries(client_for):
+    replies = iter([json_response({}, status_code=429, headers={"Retry-After": "0"}),
+                    json_response({"reply": {}})])
+    client = client_for({"fake/route": lambda request: next(replies)}, retry_policy=RetryPolicy(use_budget=False))
+
+    with mock.patch("xpanse.client.time.sleep"):
+        client.post("fake/route")
+
+    route = client.metrics.snapshot()["fake/route/"]
+    assert route["statuses"] == {"429": 1, "200": 1}
+    assert route["retries"] == 1
+
+
+def test_XpanseClient_shared_metrics(client_for):
+    metrics = MetricsRegistry()
+    for _ in range(2):
+        client_for({}, validate="eager", metrics=metrics)
+
+    assert metrics.snapshot()["api_keys/validate/"]["requests"] == 2
+
+
+def test_MetricsRegistry_to_prometheus():
+    metrics = MetricsRegistry(buckets=[0.5])
+    metrics.record_request("public_api/v1/incidents/get_incidents/", 200, 0.2, response_bytes=512, decoded_bytes=2048)
+    metrics.record_request_body("public_api/v1/incidents/get_incidents/", 300, 100)
+    metrics.record_request('quote"path', None, 1.0)
+    metrics.record_page("public_api/v1/incidents/get_incidents/", 100, first=True)
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE xpanse_requests_total counter" in text
+    assert 'xpanse_requests_total{path="public_api/v1/incidents/get_incidents/",status="200"} 1' in text
+    assert 'xpanse_requests_total{path="quote\\"path/",status="error"} 1' in text
+    assert 'xpanse_request_duration_seconds_bucket{path="public_api/v1/incidents/get_incidents/",le="0.5"} 1' in text
+    assert 'xpanse_request_duration_seconds_bucket{path="quote\\"path/",le="+Inf"} 1' in text
+    assert 'xpanse_response_bytes_total{path="public_api/v1/incidents/get_incidents/"} 512' in text
+    assert 'xpanse_pages_total{path="public_api/v1/incidents/get_incidents/"} 1' in text
+    assert "# TYPE xpanse_response_compression_ratio gauge" in text
+    assert 'xpanse_response_compression_ratio{path="public_api/v1/incidents/get_incidents/"} 4.0' in text
+    assert 'xpanse_request_compression_ratio{path="public_api/v1/incidents/get_incidents/"} 3.0' in text
+    assert 'xpanse_request_compression_ratio{path="quote\\"path/"} 1.0' in text
+    assert text.endswith("\n")
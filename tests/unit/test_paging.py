@@ -0,0 +1,138 @@
+import time
+
+import pytest
+
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.const import MAX_TOTAL_COUNT, PublicApiFields
+from xpanse.iterator import XpanseResultIterator
+from xpanse.paging import AdaptivePageSize
+from xpanse.transport import PagedReplies
+
+INCIDENTS = [{"incident_id": str(i)} for i in range(1_000)]
+LIST_PATH = IncidentsEndpoint.LIST_ENDPOINT
+
+
+class RecordingReplies(PagedReplies):
+    """
+    Pages the incidents like the Public API, recording each requested window and optionally
+    returning at most `cap` results per page from the `cap_from` offset.
+    """
+
+    def __init__(self, results, cap=None, cap_from=0, **kwargs):
+        super().__init__("incidents", results, **kwargs)
+        self.windows = []
+        self.cap = cap
+        self.cap_from = cap_from
+
+    def __call__(self, request):
+        request_data = request.request_data
+        window = (request_data[PublicApiFields.SEARCH_FROM], request_data[PublicApiFields.SEARCH_TO])
+        self.windows.append(window)
+        if self.cap is not None and window[0] >= self.cap_from:
+            request_data[PublicApiFields.SEARCH_TO] = min(window[1], window[0] + self.cap)
+        return super().__call__(request)
+
+
+def test_AdaptivePageSize_next_size():
+    sizing = AdaptivePageSize(target_latency=1.0, target_bytes=1_000_000, min_size=10, max_size=1_000)
+
+    assert sizing.next_size(100, seconds=0.1, response_bytes=10_000) == 200
+    assert sizing.next_size(100, seconds=10.0, response_bytes=10_000) == 50
+    assert sizing.next_size(100, seconds=0.1, response_bytes=4_000_000) == 50
+    assert sizing.next_size(100, seconds=0.9, response_bytes=0) == 100
+    assert sizing.next_size(800, seconds=0.1, response_bytes=0) == 1_000
+    assert sizing.next_size(12, seconds=10.0, response_bytes=0) == 10
+    assert sizing.clamp(5_000) == 1_000
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"target_latency": 0}, {"target_bytes": 0}, {"min_size": 0}, {"min_size": 20, "max_size": 10},
+    {"growth": 1}, {"tolerance": 0.5},
+])
+def test_AdaptivePageSize_invalid(kwargs):
+    with pytest.raises(ValueError):
+        AdaptivePageSize(**kwargs)
+
+
+def test_XpanseResultIterator_page_sizing_grows_and_stops_on_short_page(client_for):
+    replies = RecordingReplies(INCIDENTS)
+    client = client_for({LIST_PATH: replies})
+
+    assert client.incidents.list(page_sizing=AdaptivePageSize()).dump() == INCIDENTS
+    # The 300 results of the last 500 window end pagination without another request
+    assert replies.windows == [(0, 100), (100, 300), (300, 700), (700, 1_200)]
+
+
+def test_XpanseResultIterator_page_sizing_shrinks_large_responses(client_for):
+    replies = RecordingReplies(INCIDENTS[:200])
+    client = client_for({LIST_PATH: replies})
+    sizing = AdaptivePageSize(target_bytes=1_000)
+
+    assert client.incidents.list(page_sizing=sizing).dump() == INCIDENTS[:200]
+    sizes = [search_to - search_from for search_from, search_to in replies.windows]
+    # Pages of 50 are within the tolerance of the target size
+    assert sizes[:2] == [100, 50] and set(sizes[1:]) == {50}
+
+
+def test_XpanseResultIterator_page_sizing_over_9999(client_for):
+    results = [{"incident_id": str(i)} for i in range(MAX_TOTAL_COUNT + 250)]
+    replies = RecordingReplies(results, max_total_count=MAX_TOTAL_COUNT)
+    client = client_for({LIST_PATH: replies})
+
+    assert len(client.incidents.list(page_sizing=AdaptivePageSize(max_size=1_000)).dump()) == len(results)
+    # At the cap the total is a lower bound, so only an empty page ends pagination
+    assert replies.windows[-1][0] == len(results)
+
+
+def test_XpanseResultIterator_page_sizing_api_page_cap_over_9999(client_for):
+    results = [{"incident_id": str(i)} for i in range(MAX_TOTAL_COUNT + 250)]
+    replies = RecordingReplies(results, cap=600, cap_from=9_000, max_total_count=MAX_TOTAL_COUNT)
+    client = client_for({LIST_PATH: replies})
+
+    # A page truncated by the API past the capped total does not end pagination
+    assert len(client.incidents.list(page_sizing=AdaptivePageSize(max_size=1_000)).dump()) == len(results)
+    # Once the API page size is known, the shorter last page ends pagination without an empty trailing request
+    assert replies.windows[-1][0] < len(results)
+    assert replies.windows[-1][1] - replies.windows[-1][0] == 600
+
+
+def test_XpanseResultIterator_page_sizing_excludes_caller_time(client_for):
+    replies = RecordingReplies(INCIDENTS)
+    iterator = client_for({LIST_PATH: replies}).incidents.list(page_sizing=AdaptivePageSize(target_latency=0.05))
+
+    for _ in range(3):
+        iterator.next()
+        time.sleep(0.1)
+
+    assert replies.windows == [(0, 100), (100, 300), (300, 700)]
+
+
+def test_XpanseResultIterator_page_sizing_api_page_cap(client_for):
+    replies = RecordingReplies(INCIDENTS, cap=150)
+    client = client_for({LIST_PATH: replies})
+
+    assert client.incidents.list(page_sizing=AdaptivePageSize()).dump() == INCIDENTS
+    search_from, search_to = replies.windows[-1]
+    assert search_to - search_from == 150
+    assert [search_from for search_from, _ in replies.windows] == [0, 100, 250, 400, 550, 700, 850]
+
+
+def test_XpanseResultIterator_page_sizing_checkpoint(client_for):
+    client = client_for({LIST_PATH: RecordingReplies(INCIDENTS)})
+    iterator = client.incidents.list(page_sizing=AdaptivePageSize())
+    first = iterator.next() + iterator.next()
+    state = iterator.checkpoint()
+
+    assert (state["search_from"], state["page_size"]) == (300, 400)
+    assert first + client.incidents.list(page_sizing=AdaptivePageSize()).resume(state).dump() == INCIDENTS
+
+
+def test_XpanseResultIterator_page_sizing_invalid():
+    with pytest.raises(ValueError):
+        XpanseResultIterator(api=None, path="fake/route", data_key="data", page_sizing=AdaptivePageSize())
+    with pytest.raises(ValueError):
+        XpanseResultIterator(api=None, path="fake/route", data_key="data", use_page_token=False, concurrency=2,
+                             page_sizing=AdaptivePageSize())
+    with pytest.raises(ValueError):
+        XpanseResultIterator(api=None, path="fake/route", data_key="data", use_page_token=False, stream=True,
+                             page_sizing=AdaptivePageSize())
@@ -0,0 +1,163 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.api.incident_management.v2.alerts import AsyncAlertsEndpoint
+from xpanse.const import PublicApiFields
+from xpanse.error import UnexpectedResponseError
+from xpanse.partition import TimeWindowScan, AsyncTimeWindowScan
+
+
+class FakeEndpoint:
+    """Filters a list of records on `creation_time` and caps each reply at `cap` results"""
+
+    def __init__(self, records: List[Dict[str, Any]], cap: int):
+        self.records = records
+        self.cap = cap
+        self.counted = []
+        self.listed = []
+
+    def _matching(self, request_data):
+        matching = self.records
+        for f in request_data[PublicApiFields.FILTERS]:
+            if f["operator"] == "gte":
+                matching = [r for r in matching if r[f["field"]] >= f["value"]]
+            elif f["operator"] == "lte":
+                matching = [r for r in matching if r[f["field"]] <= f["value"]]
+        return matching
+
+    def count(self, request_data, **kwargs):
+        self.counted.append(request_data)
+        return MagicMock(data=min(len(self._matching(request_data)), self.cap))
+
+    def list(self, request_data, **kwargs):
+        self.listed.append(request_data)
+        return MagicMock(dump=MagicMock(return_value=self._matching(request_data)[: self.cap]))
+
+
+class AsyncFakeEndpoint(FakeEndpoint):
+    async def count(self, request_data, **kwargs):
+        return super().count(request_data, **kwargs)
+
+    def list(self, request_data, **kwargs):
+        self.listed.append(request_data)
+        page = self._matching(request_data)[: self.cap]
+
+        async def dump():
+            return page
+
+        return MagicMock(dump=dump)
+
+
+def _records(n: int):
+    return [{"incident_id": str(i), "creation_time": i * 10} for i in range(n)]
+
+
+def test_TimeWindowScan_splits_until_below_cap():
+    endpoint = FakeEndpoint(_records(50), cap=10)
+    scan = TimeWindowScan(endpoint, id_field="incident_id", start=0, end=499, max_count=10)
+
+    windows = scan.windows()
+    assert windows[0][0] == 0 and windows[-1][1] == 499
+    # Windows are disjoint and contiguous
+    assert all(a[1] + 1 == b[0] for a, b in zip(windows, windows[1:]))
+    assert all(len(endpoint._matching(scan._window_request_data(w))) < 10 for w in windows)
+
+    results = scan.dump()
+    assert sorted(r["incident_id"] for r in results) == sorted(str(i) for i in range(50))
+
+
+def test_TimeWindowScan_keeps_request_data_filters():
+    endpoint = FakeEndpoint(_records(5), cap=10)
+    request_data = {"filters": [{"field": "status", "operator": "in", "value": ["new"]}]}
+    scan = TimeWindowScan(endpoint, id_field="incident_id", request_data=request_data, start=0, end=40)
+
+    scan.windows()
+    assert endpoint.counted[0]["filters"] == [
+        {"field": "status", "operator": "in", "value": ["new"]},
+        {"field": "creation_time", "operator": "gte", "value": 0},
+        {"field": "creation_time", "operator": "lte", "value": 40},
+    ]
+    # The caller's request data is not modified
+    assert len(request_data["filters"]) == 1
+
+
+def test_TimeWindowScan_dedupes_on_id():
+    records = _records(4) + [{"incident_id": "0", "creation_time": 35}]
+    scan = TimeWindowScan(FakeEndpoint(records, cap=3), id_field="incident_id", start=0, end=39, max_count=3)
+
+    assert sorted(r["incident_id"] for r in scan) == ["0", "1", "2", "3"]
+
+
+def test_TimeWindowScan_bounds_windows_in_flight():
+    endpoint = FakeEndpoint(_records(50), cap=10)
+    scan = TimeWindowScan(endpoint, id_field="incident_id", start=0, end=499, max_count=10, concurrency=2)
+    windows = len(scan.windows())
+    items = scan.iter_items()
+
+    next(items)
+    # The second window may still be queued on the pool
+    assert len(endpoint.listed) <= 2 < windows
+    assert len(list(items)) == 49
+    assert len(endpoint.listed) == windows
+
+
+def test_TimeWindowScan_unsplittable_window():
+    records = [{"incident_id": str(i), "creation_time": 5} for i in range(5)]
+    scan = TimeWindowScan(FakeEndpoint(records, cap=3), id_field="incident_id", start=0, end=10, max_count=3)
+
+    assert scan.windows() == [(5, 5)]
+    assert len(scan.dump()) == 3
+
+
+def test_TimeWindowScan_unexpected_count():
+    endpoint = MagicMock()
+    endpoint.count = MagicMock(return_value=MagicMock(data={"error": "bad"}))
+
+    with pytest.raises(UnexpectedResponseError):
+        TimeWindowScan(endpoint, id_field="incident_id", start=0, end=10).windows()
+
+
+def test_TimeWindowScan_invalid_arguments():
+    with pytest.raises(ValueError):
+        TimeWindowScan(MagicMock(), id_field="incident_id", start=10, end=0)
+
+    with pytest.raises(ValueError):
+        TimeWindowScan(MagicMock(), id_field="incident_id", concurrency=0)
+
+
+def test_AsyncTimeWindowScan():
+    endpoint = AsyncFakeEndpoint(_records(50), cap=10)
+    scan = AsyncTimeWindowScan(endpoint, id_field="incident_id", start=0, end=499, max_count=10)
+
+    results = asyncio.run(scan.dump())
+    assert sorted(r["incident_id"] for r in results) == sorted(str(i) for i in range(50))
+
+
+def test_AsyncTimeWindowScan_bounds_windows_in_flight():
+    endpoint = AsyncFakeEndpoint(_records(50), cap=10)
+    scan = AsyncTimeWindowScan(endpoint, id_field="incident_id", start=0, end=499, max_count=10, concurrency=2)
+
+    async def first():
+        items = scan.iter_items()
+        await items.__anext__()
+        await asyncio.sleep(0)
+        listed = len(endpoint.listed)
+        await items.aclose()
+        return listed
+
+    assert asyncio.run(first()) == 2
+
+
+def test_endpoint_scan():
+    scan = IncidentsEndpoint(MagicMock()).scan(start=0, end=10)
+    assert isinstance(scan, TimeWindowScan)
+    assert scan._id_field == "incident_id"
+
+    scan = AsyncAlertsEndpoint(MagicMock()).scan(time_field="server_creation_time")
+    assert isinstance(scan, AsyncTimeWindowScan)
+    assert scan._id_field == "alert_id"
+    assert scan._time_field == "server_creation_time"
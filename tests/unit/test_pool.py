@@ -0,0 +1,100 @@
+import pickle
+import socket
+import threading
+
+import pytest
+import requests
+
+from xpanse.pool import PoolAdapter, PoolConfig
+
+
+def test_PoolConfig_defaults_match_requests():
+    config = PoolConfig()
+    adapter = config.adapter()
+    assert adapter._pool_connections == 10
+    assert adapter._pool_maxsize == 10
+    assert adapter._pool_block is False
+
+
+def test_PoolConfig_socket_options():
+    options = PoolConfig(keep_alive_idle=15).socket_options()
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 15) in options
+
+    assert PoolConfig(keep_alive=False).socket_options() == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+
+def test_PoolAdapter_pool_settings():
+    config = PoolConfig(pool_connections=4, pool_maxsize=32, pool_block=True)
+    adapter = PoolAdapter(config)
+
+    pool_kw = adapter.poolmanager.connection_pool_kw
+    assert pool_kw["maxsize"] == 32
+    assert pool_kw["block"] is True
+    assert pool_kw["socket_options"] == config.socket_options()
+    assert adapter.poolmanager.pools._maxsize == 4
+
+    proxy_kw = adapter.proxy_manager_for("http://proxy:3128").connection_pool_kw
+    assert proxy_kw["socket_options"] == config.socket_options()
+
+    # Adapters are picklable with their settings, like the requests adapters
+    assert pickle.loads(pickle.dumps(adapter)).poolmanager.connection_pool_kw["maxsize"] == 32
+
+
+def test_PoolConfig_mount():
+    session = requests.Session()
+    PoolConfig(pool_maxsize=16).mount(session)
+    assert isinstance(session.get_adapter("https://api-test"), PoolAdapter)
+    assert isinstance(session.get_adapter("http://api-test"), PoolAdapter)
+
+
+def test_PoolConfig_warm_up():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    accepted = []
+
+    def accept():
+        for _ in range(3):
+            accepted.append(server.accept()[0])
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+
+    session = requests.Session()
+    config = PoolConfig(warm_up=3)
+    config.mount(session)
+    url = f"http://127.0.0.1:{server.getsockname()[1]}"
+    config.warm(session, url)
+    thread.join(timeout=5)
+
+    pool = session.get_adapter(url).get_connection(url)
+    assert len(accepted) == 3
+    assert pool.num_connections == 3
+    # The connected sockets are kept in the pool for the first requests
+    assert sum(conn is not None and conn.sock is not None for conn in list(pool.pool.queue)) == 3
+
+    for conn in accepted:
+        conn.close()
+    server.close()
+
+
+def test_PoolConfig_warm_up_failure_is_ignored():
+    session = requests.Session()
+    config = PoolConfig(warm_up=2)
+    config.mount(session)
+    # Nothing listens on port 9 locally, the client still works without warm connections
+    config.warm(session, "http://127.0.0.1:9")
+
+
+def test_PoolConfig_invalid():
+    with pytest.raises(ValueError):
+        PoolConfig(pool_maxsize=0)
+
+    with pytest.raises(ValueError):
+        PoolConfig(pool_connections=0)
+
+    with pytest.raises(ValueError):
+        PoolConfig(warm_up=-1)
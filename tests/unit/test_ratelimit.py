@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+from xpanse.ratelimit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_TokenBucket_burst_then_paced():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    # Each following request waits for its own token
+    assert [bucket.reserve() for _ in range(3)] == [0.5, 1.0, 1.5]
+
+
+def test_TokenBucket_refills_up_to_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now = 100
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 1.0]
+
+
+def test_TokenBucket_thread_safe():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=1, clock=clock)
+    delays = []
+
+    def reserve():
+        for _ in range(25):
+            delays.append(bucket.reserve())
+
+    threads = [threading.Thread(target=reserve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every request gets a distinct slot
+    assert sorted(delays) == pytest.approx([i / 10 for i in range(100)])
+
+
+def test_TokenBucket_invalid():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_RateLimiter_path_buckets():
+    clock = FakeClock()
+    scan_path = "public_api/v1/assets/get_assets_internet_exposure/"
+    limiter = RateLimiter(rate=1, burst=1, path_limits={"public_api/v1/assets/": (5, 1), scan_path: (1, 1)}, clock=clock)
+
+    assert limiter.bucket("public_api/v1/incidents/update_incident/") is limiter._default
+    assert limiter.bucket(f"{scan_path}") is limiter._paths[scan_path]
+    assert limiter.bucket("public_api/v1/assets/get_asset_internet_exposure/") is limiter._paths["public_api/v1/assets/"]
+
+    # A busy scan does not delay requests to other paths
+    assert [limiter.reserve(scan_path) for _ in range(3)] == [0, 1.0, 2.0]
+    assert limiter.reserve("public_api/v1/incidents/update_incident/") == 0
+
+
+def test_RateLimiter_acquire():
+    limiter = RateLimiter(rate=1, burst=1, clock=FakeClock())
+
+    with mock.patch("xpanse.ratelimit.time.sleep") as sleep:
+        limiter.acquire("path")
+        limiter.acquire("path")
+
+    sleep.assert_called_once_with(1.0)
+
+
+def test_RateLimiter_acquire_async():
+    limiter = RateLimiter(rate=1, burst=1, clock=FakeClock())
+
+    with mock.patch("xpanse.ratelimit.asyncio.sleep") as sleep:
+        asyncio.run(limiter.acquire_async("path"))
+        sleep.assert_not_called()
+        asyncio.run(limiter.acquire_async("path"))
+
+    sleep.assert_called_once_with(1.0)
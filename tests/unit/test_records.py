@@ -0,0 +1,172 @@
+import csv
+import io
+import json
+import pickle
+import tracemalloc
+
+import pytest
+
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.api.incident_management.v2.alerts import AlertsEndpoint
+from xpanse.iterator import XpanseResultIterator
+from xpanse.records import RECORD_TYPES, AlertRecord, AssetRecord, IncidentRecord, Record, record_type_of
+from xpanse.schemas import SCHEMAS, field_names
+from xpanse.testing.data import generate
+from xpanse.transport import PagedReplies
+
+ALERTS = generate("alerts", 250)
+INCIDENTS = generate("incidents", 250)
+
+
+@pytest.mark.parametrize("data_key", sorted(SCHEMAS))
+def test_Record_round_trip(data_key):
+    result = generate(data_key, 1)[0]
+    record = record_type_of(data_key)(result)
+
+    assert not hasattr(record, "__dict__")
+    assert list(record) == field_names(data_key)
+    assert record.to_dict() == dict(record) == result
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_Record_smaller_than_dict():
+    raw = [json.dumps(result) for result in generate("incidents", 2_000)]
+
+    tracemalloc.start()
+    results = [json.loads(result) for result in raw]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+
+    tracemalloc.start()
+    records = [IncidentRecord(json.loads(result)) for result in raw]
+    record_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(records) == 2_000
+    assert record_bytes < dict_bytes / 2
+
+
+def test_Record_lazy_fields():
+    # Decoded values are stored as they are
+    assert AlertRecord(ALERTS[0])._events is ALERTS[0]["events"]
+
+    record = AlertRecord(dict(ALERTS[0], events=json.dumps(ALERTS[0]["events"]).encode("utf-8")))
+
+    assert isinstance(record._events, bytes)
+    assert record.events == ALERTS[0]["events"]
+    assert record._events is record.events
+    assert record.to_dict() == ALERTS[0]
+    # Category values are interned, so repeated values share one string
+    assert AlertRecord(ALERTS[1]).source is record.source
+
+
+def test_Record_extra_and_missing_fields():
+    result = {"name": "example.com", "ips": None, "details": {"providerDetails": [{"name": "AWS"}]}}
+    record = AssetRecord(result)
+
+    assert record.details == {"providerDetails": [{"name": "AWS"}]}
+    assert record["details"] is record.details
+    assert "details" in record and "missing" not in record
+    # Missing fields read as None, but are not part of the mapping
+    assert record.asset_type is None and record.get("asset_type", "default") == "default"
+    assert "asset_type" not in record and "ips" in record
+    assert list(record) == ["name", "ips", "details"] and len(record) == 3
+    assert record.to_dict() == result
+    assert AlertRecord({"alert_id": "1"}).events is None
+    assert repr(record) == "AssetRecord(asm_ids=None)"
+    assert pickle.loads(pickle.dumps(record)) == record
+    with pytest.raises(AttributeError):
+        record.missing
+    with pytest.raises(KeyError):
+        record["missing"]
+    with pytest.raises(KeyError):
+        record["asset_type"]
+
+
+def test_record_type_of():
+    assert record_type_of("incidents") is IncidentRecord
+    assert set(RECORD_TYPES) == set(SCHEMAS)
+    with pytest.raises(ValueError):
+        record_type_of("unknown")
+
+
+def test_XpanseResultIterator_as_records(client_for):
+    client = client_for({IncidentsEndpoint.LIST_ENDPOINT: PagedReplies("incidents", INCIDENTS)})
+
+    records = client.incidents.list().as_records().dump()
+
+    assert all(isinstance(record, IncidentRecord) for record in records)
+    assert [record.incident_id for record in records] == [result["incident_id"] for result in INCIDENTS]
+
+
+def test_XpanseResultIterator_as_records_stream(client_for):
+    client = client_for({AlertsEndpoint.ENDPOINT: PagedReplies("alerts", ALERTS)})
+
+    records = list(client.alerts.list(stream=True).as_records().iter_items())
+
+    assert [record.to_dict() for record in records] == ALERTS
+
+
+def test_XpanseResultIterator_as_records_stream_lazy_fields(client_for):
+    client = client_for({AlertsEndpoint.ENDPOINT: PagedReplies("alerts", ALERTS)})
+
+    records = list(client.alerts.list(stream=True).as_records().iter_items())
+
+    # The events stay raw JSON until they are read
+    assert all(isinstance(record._events, bytes) for record in records)
+    assert records[0].events == ALERTS[0]["events"]
+    assert records[0]._events is records[0].events
+    assert isinstance(records[1]._events, bytes)
+
+
+def test_XpanseResultIterator_as_records_checkpoint(client_for):
+    request_data = {"sort": {"field": "creation_time", "keyword": "asc"}}
+    client = client_for({AlertsEndpoint.ENDPOINT: PagedReplies("alerts", ALERTS)})
+    iterator = client.alerts.list(request_data=request_data).as_records()
+    first = iterator.next()
+    state = iterator.checkpoint()
+
+    rest = client.alerts.list(request_data=request_data).as_records().resume(state).dump()
+
+    assert state["sort_value"] == first[-1].creation_time
+    assert [record.alert_id for record in first + rest] == [result["alert_id"] for result in ALERTS]
+
+
+def test_XpanseResultIterator_as_records_export(tmp_path, client_for):
+    client = client_for({IncidentsEndpoint.LIST_ENDPOINT: PagedReplies("incidents", INCIDENTS)})
+
+    client.incidents.list().as_records().export(str(tmp_path / "incidents.ndjson"))
+    client.incidents.list().as_records().export(str(tmp_path / "incidents.csv"), format="csv")
+
+    lines = (tmp_path / "incidents.ndjson").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == INCIDENTS
+    rows = list(csv.DictReader(io.StringIO((tmp_path / "incidents.csv").read_text())))
+    assert [row["incident_id"] for row in rows] == [result["incident_id"] for result in INCIDENTS]
+
+
+def test_XpanseResultIterator_as_records_unknown_data_key():
+    iterator = XpanseResultIterator(api=None, path="fake/route", data_key="data")
+
+    with pytest.raises(ValueError):
+        iterator.as_records()
+    assert iterator.as_records(IncidentRecord) is iterator
+
+
+def test_XpanseResponse_as_records(client_for):
+    details = [dict(ALERTS[0], alert_id="1"), {"alert_id": "2"}]
+    asset_details = {"reply": {"details": [{"name": "example.com", "certificate_details": {"issuer": "CA"}}]}}
+    client = client_for({
+        AlertsEndpoint.ENDPOINT: {"reply": {"alerts": details}},
+        AssetsEndpoint.GET_ENDPOINT: asset_details,
+    })
+
+    alerts = client.alerts.get(alert_ids=["1", "2"]).as_records()
+    assets = client.assets.get(asset_ids=["id"]).as_records()
+
+    assert [type(alert) for alert in alerts] == [AlertRecord, AlertRecord]
+    assert alerts[1].events is None and "events" not in alerts[1]
+    assert isinstance(assets[0], AssetRecord)
+    assert assets[0].certificate_details == {"issuer": "CA"}
+    assert isinstance(assets[0], Record)
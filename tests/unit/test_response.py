@@ -0,0 +1,98 @@
+import json
+from unittest.mock import MagicMock
+
+import requests
+
+from xpanse.codec import JsonCodec
+from xpanse.const import PublicApiFields
+from xpanse.response import XpanseResponse
+
+
+def _response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+REPLY = {
+    PublicApiFields.REPLY: {
+        PublicApiFields.TOTAL_COUNT: 250,
+        PublicApiFields.RESULTS_COUNT: 2,
+        PublicApiFields.NEXT_PAGE_TOKEN: "token",
+        "assets": [{"name": "a"}, {"name": "b"}],
+    }
+}
+
+
+def test_XpanseResponse_parses_once():
+    codec = JsonCodec()
+    codec.loads = MagicMock(wraps=codec.loads)
+    response = XpanseResponse(_response(REPLY), data_key="assets", codec=codec)
+
+    for _ in range(3):
+        assert response.data == [{"name": "a"}, {"name": "b"}]
+    assert response.total_count == 250
+
+    codec.loads.assert_called_once()
+
+
+def test_XpanseResponse_accessors():
+    response = XpanseResponse(_response(REPLY), data_key="assets")
+    assert response.total_count == 250
+    assert response.results_count == 2
+    assert response.next_page_token == "token"
+
+    response = XpanseResponse(_response({PublicApiFields.REPLY: {"assets": []}}))
+    assert response.total_count is None
+    assert response.results_count is None
+    assert response.next_page_token is None
+
+    response = XpanseResponse(_response(True))
+    assert response.data is True
+    assert response.total_count is None
+
+
+def test_XpanseResponse_null_body_parsed_once():
+    codec = JsonCodec()
+    codec.loads = MagicMock(return_value=None)
+    response = XpanseResponse(_response(None), codec=codec)
+
+    assert response.data is None
+    assert response.data is None
+    codec.loads.assert_called_once()
+
+
+def test_XpanseResponse_release_body_option():
+    raw = _response(REPLY)
+    response = XpanseResponse(raw, data_key="assets", release_body=True)
+    assert raw.content is not None
+
+    assert response.data == [{"name": "a"}, {"name": "b"}]
+    assert raw.content is None
+    # The decoded body is kept
+    assert response.total_count == 250
+
+
+def test_XpanseResponse_keeps_body_by_default():
+    raw = _response(REPLY)
+    response = XpanseResponse(raw, data_key="assets")
+
+    assert response.data == [{"name": "a"}, {"name": "b"}]
+    assert raw.json() == REPLY
+    assert raw.content
+
+
+def test_XpanseResponse_release_body():
+    raw = _response(REPLY)
+    response = XpanseResponse(raw, data_key="assets")
+    response.release_body()
+
+    assert raw.content is None
+    assert response.data == [{"name": "a"}, {"name": "b"}]
+
+    raw = _response(REPLY)
+    response = XpanseResponse(raw, data_key="assets")
+    assert response.total_count == 250
+    response.release_body()
+    assert raw.content is None
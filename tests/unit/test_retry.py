@@ -0,0 +1,94 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import pytest
+
+from xpanse.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def test_RetryPolicy_defaults():
+    policy = RetryPolicy()
+    assert policy.max_retries == 3
+    assert all(policy.is_retryable(status) for status in [429, 502, 503, 504])
+    assert not policy.is_retryable(500)
+    assert not policy.is_retryable(401)
+
+
+def test_RetryPolicy_allow_retry_max_retries():
+    policy = RetryPolicy(max_retries=2, use_budget=False)
+    assert policy.allow_retry(0)
+    assert policy.allow_retry(1)
+    assert not policy.allow_retry(2)
+
+
+def test_RetryPolicy_backoff_full_jitter():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    with mock.patch("xpanse.retry.random.uniform", side_effect=lambda low, high: high) as uniform:
+        assert [policy.backoff(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+    assert all(call.args[0] == 0 for call in uniform.call_args_list)
+
+
+def test_RetryPolicy_delay_retry_after():
+    policy = RetryPolicy(retry_after_max=60)
+    assert policy.delay(0, {"Retry-After": "7"}) == 7
+    assert policy.delay(0, {"Retry-After": "3600"}) == 60
+    assert 0 <= policy.delay(0, {"Retry-After": "soon"}) <= policy.backoff_base
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0
+    assert parse_retry_after("not a date") is None
+
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < parse_retry_after(retry_at) <= 30
+
+
+def test_RetryBudget():
+    budget = RetryBudget(ratio=0.5, capacity=2)
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+    for _ in range(10):
+        budget.deposit()
+    assert budget.balance == 2
+
+
+def test_RetryBudget_thread_safe():
+    budget = RetryBudget(ratio=0, capacity=100)
+    granted = []
+
+    def withdraw():
+        for _ in range(50):
+            granted.append(budget.withdraw())
+
+    threads = [threading.Thread(target=withdraw) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert granted.count(True) == 100
+
+
+def test_RetryPolicy_budget_limits_retries():
+    policy = RetryPolicy(budget=RetryBudget(ratio=0, capacity=1))
+    assert policy.allow_retry(0)
+    assert not policy.allow_retry(0)
+
+
+def test_RetryBudget_invalid():
+    with pytest.raises(ValueError):
+        RetryBudget(ratio=-1)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
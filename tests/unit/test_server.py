@@ -0,0 +1,147 @@
+import gzip
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.client import XpanseClient
+from xpanse.const import TaggableDataType
+from xpanse.error import InvalidApiCredentials
+from xpanse.retry import RetryPolicy
+from xpanse.testing.data import EPOCH_MS, generate
+from xpanse.testing.server import DEFAULT_API_KEY, DEFAULT_API_KEY_ID, FakeXpanse, XpanseServer, XpanseServerTransport
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def _serve(fake):
+        servers.append(XpanseServer(fake).start())
+        return servers[-1]
+
+    yield _serve
+    for server in servers:
+        server.stop()
+
+
+def test_XpanseServer_page_tokens(serve):
+    server = serve(FakeXpanse.generate({"assets_internet_exposure": 250}))
+    client = server.client()
+
+    assets = client.assets.list().dump()
+
+    assert assets == server.fake.datasets["assets_internet_exposure"]
+    assert server.fake.requests[("api_keys/validate/", 200)] == 1
+    assert server.fake.requests[("public_api/v1/assets/get_assets_internet_exposure/", 200)] == 3
+
+
+def test_XpanseServer_filters_and_sort(serve):
+    server = serve(FakeXpanse.generate({"incidents": 50}))
+    client = server.client(validate="never")
+    request_data = {
+        "filters": [{"field": "incident_id_list", "operator": "in", "value": ["3", "7", "9"]}],
+        "sort": {"field": "creation_time", "keyword": "desc"},
+    }
+
+    incidents = client.incidents.list(request_data=request_data).dump()
+
+    assert [incident["incident_id"] for incident in incidents] == ["9", "7", "3"]
+
+
+def test_XpanseServer_total_count_cap(serve):
+    server = serve(FakeXpanse.generate({"incidents": 60}, max_total_count=25))
+    client = server.client(validate="never")
+
+    reply = client.post(IncidentsEndpoint.LIST_ENDPOINT, json={"request_data": {"search_from": 20, "search_to": 40}})
+    incidents = client.incidents.scan(start=EPOCH_MS, end=EPOCH_MS + 60 * 60_000, max_count=25).dump()
+
+    assert reply.json()["reply"]["total_count"] == 25
+    assert reply.json()["reply"]["results_count"] == 5
+    assert sorted(int(incident["incident_id"]) for incident in incidents) == list(range(1, 61))
+
+
+def test_XpanseServer_tags(serve):
+    server = serve(FakeXpanse(datasets={"external_ip_address_ranges": generate("external_ip_address_ranges", 3)}))
+    client = server.client(validate="never")
+    range_id = server.fake.datasets["external_ip_address_ranges"][1]["range_id"]
+    filters = [{"field": "range_id_list", "operator": "in", "value": [range_id]}]
+
+    assigned = client.tags.assign(TaggableDataType.OWNED_IP_RANGES, ["Lab"], filters)
+    tags = [list(r["tags"]) for r in server.fake.datasets["external_ip_address_ranges"]]
+    client.tags.remove(TaggableDataType.OWNED_IP_RANGES, ["Lab"], filters)
+
+    assert assigned.data == "succeeded"
+    assert tags == [["IPR:Datacenter"], ["IPR:Datacenter", "IPR:Lab"], ["IPR:Datacenter"]]
+    assert server.fake.datasets["external_ip_address_ranges"][1]["tags"] == ["IPR:Datacenter"]
+
+
+def test_XpanseServer_rejects_invalid_auth(serve):
+    server = serve(FakeXpanse())
+
+    with pytest.raises(InvalidApiCredentials):
+        server.client(api_key="wrong")
+
+    assert server.fake.requests[("api_keys/validate/", 401)] == 1
+
+
+def test_XpanseServer_standard_auth(serve):
+    server = serve(FakeXpanse(use_advanced_auth=False))
+
+    client = server.client(use_advanced_auth=False)
+
+    assert client.post("api_keys/validate/").json() is True
+
+
+def test_XpanseServer_injected_errors_are_retried(serve):
+    fake = FakeXpanse.generate({"alerts": 10}, error_rates={429: 0.5}, retry_after=0, seed=3)
+    server = serve(fake)
+    client = server.client(retry_policy=RetryPolicy(max_retries=20, use_budget=False))
+
+    alerts = client.alerts.list().dump()
+
+    assert len(alerts) == 10
+    assert fake.requests[("public_api/v2/alerts/get_alerts_multi_events/", 429)] > 0
+
+
+def test_FakeXpanse_latency_and_gzip():
+    sleep = MagicMock()
+    fake = FakeXpanse.generate({"incidents": 100}, latency=0.2, use_advanced_auth=False, sleep=sleep)
+    headers = {"x-xdr-auth-id": DEFAULT_API_KEY_ID, "Authorization": DEFAULT_API_KEY, "Accept-Encoding": "gzip",
+               "Content-Encoding": "gzip"}
+
+    status, reply_headers, body = fake.handle("POST", "/" + IncidentsEndpoint.LIST_ENDPOINT, headers,
+                                              gzip.compress(b'{"request_data": {}}'))
+
+    assert status == 200
+    assert reply_headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body))["reply"]["results_count"] == 100
+    sleep.assert_called_once_with(0.2)
+
+
+def test_FakeXpanse_unknown_route():
+    fake = FakeXpanse(use_advanced_auth=False)
+    headers = {"x-xdr-auth-id": DEFAULT_API_KEY_ID, "Authorization": DEFAULT_API_KEY}
+
+    status, _, body = fake.handle("POST", "/public_api/v1/unknown/", headers, b"")
+
+    assert status == 404
+    assert json.loads(body)["reply"]["err_code"] == 404
+
+
+def test_XpanseServerTransport(serve):
+    server = serve(FakeXpanse.generate({"incidents": 10}))
+    client = XpanseClient(url="test.crtx.paloaltonetworks.com", api_key_id=DEFAULT_API_KEY_ID,
+                          api_key=DEFAULT_API_KEY, transport=XpanseServerTransport(server.url))
+
+    # The client URL is unchanged, and only its path is sent to the server
+    assert client._url == "https://api-test.crtx.paloaltonetworks.com"
+    assert len(client.incidents.list().dump()) == 10
+    assert server.fake.requests[("api_keys/validate/", 200)] == 1
+
+
+def test_XpanseClient_loopback_url_not_special():
+    client = XpanseClient(url="http://localhost:8080", api_key_id=1, api_key="key", validate="never")
+
+    assert client._url == "https://api-localhost:8080"
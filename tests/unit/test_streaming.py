@@ -0,0 +1,198 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from xpanse.codec import JsonCodec
+from xpanse.const import PublicApiFields
+from xpanse.error import UnexpectedResponseError
+from xpanse.iterator import AsyncXpanseResultIterator, XpanseResultIterator
+from xpanse.streaming import StreamingPageParser, iter_response_items
+
+RESULTS = [
+    {"name": "a", "tags": ["BU:x"], "nested": {"deep": [1, {"x": None}]}},
+    {"name": 'quote " and brace } and bracket ]', "path": "C:\\dir\\", "n": -1.5e3},
+    {"name": "unicode \u00e9 \\u00e9", "empty": {}, "list": [], "ok": True},
+]
+
+
+def _body(data_key="data", results=RESULTS, next_page_token="token", indent=None):
+    return json.dumps(
+        {
+            PublicApiFields.REPLY: {
+                PublicApiFields.TOTAL_COUNT: 250,
+                data_key: results,
+                PublicApiFields.RESULTS_COUNT: len(results),
+                PublicApiFields.NEXT_PAGE_TOKEN: next_page_token,
+            }
+        },
+        indent=indent,
+    ).encode("utf-8")
+
+
+def _feed(parser, body, chunk_size):
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items += parser.feed(body[i : i + chunk_size])
+    parser.close()
+    return items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_StreamingPageParser_chunks(chunk_size, indent):
+    parser = StreamingPageParser("data")
+    assert _feed(parser, _body(indent=indent), chunk_size) == RESULTS
+    assert parser.total_count == 250
+    assert parser.results_count == 3
+    assert parser.next_page_token == "token"
+    assert parser.results == 3
+    assert "data" not in parser.reply
+
+
+def test_StreamingPageParser_yields_results_as_they_arrive():
+    body = _body()
+    first_end = body.index(b"}}") + 2
+    parser = StreamingPageParser("data")
+    assert parser.feed(body[: first_end - 1]) == []
+    assert parser.feed(body[first_end - 1 : first_end]) == [RESULTS[0]]
+    # The reply fields read before the results are already available
+    assert parser.total_count == 250
+    assert parser.next_page_token is None
+
+
+def test_StreamingPageParser_codec():
+    codec = JsonCodec()
+    codec.loads = MagicMock(wraps=codec.loads)
+    parser = StreamingPageParser("data", codec=codec)
+    assert _feed(parser, _body(), 16) == RESULTS
+    # Each result and each reply field is decoded on its own
+    assert codec.loads.call_count == 6
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_StreamingPageParser_raw_fields(indent):
+    parser = StreamingPageParser("data", raw_fields={"nested", "empty", "name", "missing"})
+    items = _feed(parser, _body(indent=indent, results=RESULTS + [{"nested": None}]), 7)
+
+    # The raw fields are kept as bytes, and the other fields are decoded
+    assert isinstance(items[0]["nested"], bytes)
+    assert json.loads(items[0]["nested"]) == RESULTS[0]["nested"]
+    assert [json.loads(item["name"]) for item in items[:3]] == [result["name"] for result in RESULTS]
+    assert json.loads(items[2]["empty"]) == {} and items[2]["list"] == []
+    assert items[1]["path"] == RESULTS[1]["path"]
+    assert items[3] == {"nested": None}
+
+
+def test_StreamingPageParser_ignores_other_fields():
+    body = json.dumps(
+        {
+            "other": {"data": [1, 2]},
+            PublicApiFields.REPLY: {"extra": [{"data": []}], "data": [1, "2", None]},
+        }
+    ).encode("utf-8")
+    parser = StreamingPageParser("data")
+    assert _feed(parser, body, 3) == [1, "2", None]
+    assert parser.reply == {"extra": [{"data": []}]}
+    assert parser.next_page_token is None
+
+
+def test_StreamingPageParser_empty_page():
+    parser = StreamingPageParser("data")
+    assert _feed(parser, _body(results=[], next_page_token=None), 5) == []
+    assert parser.results_count == 0
+    assert parser.next_page_token is None
+
+
+def test_StreamingPageParser_missing_data_key():
+    parser = StreamingPageParser("missing")
+    with pytest.raises(UnexpectedResponseError):
+        _feed(parser, _body(), 64)
+
+
+def test_StreamingPageParser_incomplete():
+    body = _body()
+    parser = StreamingPageParser("data")
+    parser.feed(body[: len(body) // 2])
+    with pytest.raises(UnexpectedResponseError):
+        parser.close()
+
+
+def test_StreamingPageParser_invalid():
+    parser = StreamingPageParser("data")
+    with pytest.raises(UnexpectedResponseError):
+        parser.feed(b'{"reply" {}}')
+
+
+class StreamedResponse:
+    def __init__(self, body):
+        self.body = body
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), 10):
+            yield self.body[i : i + 10]
+
+    def close(self):
+        self.closed = True
+
+
+def test_iter_response_items_closes_response():
+    response = StreamedResponse(_body())
+    parser = StreamingPageParser("data")
+    items = iter_response_items(response, parser)
+    assert next(items) == RESULTS[0]
+    items.close()
+    assert response.closed
+
+
+def test_iter_response_items_no_response():
+    with pytest.raises(UnexpectedResponseError):
+        list(iter_response_items(None, StreamingPageParser("data")))
+
+
+def _stream_api():
+    api = MagicMock()
+    api.post = MagicMock(
+        side_effect=[
+            StreamedResponse(_body(results=RESULTS[:2], next_page_token="token")),
+            StreamedResponse(_body(results=RESULTS[2:], next_page_token=None)),
+        ]
+    )
+    return api
+
+
+def test_XpanseResultIterator_stream_iter_items():
+    api = _stream_api()
+    i = XpanseResultIterator(api=api, path="fake/route", data_key="data", stream=True)
+    assert list(i.iter_items()) == RESULTS
+    assert api.post.call_count == 2
+    assert all(call.kwargs["stream"] for call in api.post.call_args_list)
+    assert (
+        api.post.call_args_list[1].kwargs["json"][PublicApiFields.REQUEST_DATA][
+            PublicApiFields.NEXT_PAGE_TOKEN
+        ]
+        == "token"
+    )
+    assert i.total == 250
+
+
+def test_XpanseResultIterator_stream_pages():
+    i = XpanseResultIterator(
+        api=_stream_api(), path="fake/route", data_key="data", stream=True
+    )
+    assert i.next() == RESULTS[:2]
+    assert i.has_next()
+    assert i.next() == RESULTS[2:]
+    assert not i.has_next()
+
+
+def test_XpanseResultIterator_stream_invalid_options():
+    with pytest.raises(ValueError):
+        XpanseResultIterator(
+            api=MagicMock(), path="fake/route", data_key="data", stream=True, prefetch=2
+        )
+    with pytest.raises(ValueError):
+        AsyncXpanseResultIterator(
+            api=MagicMock(), path="fake/route", data_key="data", stream=True
+        )
@@ -0,0 +1,126 @@
+import gzip
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.compression import CompressionConfig
+from xpanse.const import PublicApiFields
+from xpanse.error import InvalidApiCredentials
+from xpanse.transport import InMemoryTransport, PagedReplies, Transport, json_response
+
+ASSETS = [{"name": f"host-{i}.example.com"} for i in range(250)]
+INCIDENTS = [{"incident_id": str(i)} for i in range(1_234)]
+
+
+def test_InMemoryTransport_page_token(client_for):
+    transport = InMemoryTransport({AssetsEndpoint.LIST_ENDPOINT: PagedReplies("assets_internet_exposure", ASSETS)})
+    client = client_for(transport, validate="eager")
+
+    assert client.assets.list().dump() == ASSETS
+    assert [r.path for r in transport.requests] == ["api_keys/validate/"] + [AssetsEndpoint.LIST_ENDPOINT] * 3
+    assert transport.requests[2].request_data[PublicApiFields.NEXT_PAGE_TOKEN] == "100"
+    assert "x-xdr-nonce" in transport.requests[1].headers
+
+
+def test_InMemoryTransport_limit_offset_concurrency(client_for):
+    transport = InMemoryTransport({IncidentsEndpoint.LIST_ENDPOINT: PagedReplies("incidents", INCIDENTS)})
+    client = client_for(transport)
+
+    assert client.incidents.list(concurrency=4).dump() == INCIDENTS
+    assert len(transport.requests) == 13
+
+
+def test_InMemoryTransport_latency(client_for):
+    sleep = MagicMock()
+    transport = InMemoryTransport({"fake/route": {"reply": {}}}, latency=0.1, jitter=0.05, seed=1, sleep=sleep)
+    client = client_for(transport)
+
+    client.post("fake/route")
+    client.post("fake/route")
+
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert len(delays) == 2
+    assert all(0.1 <= delay <= 0.15 for delay in delays)
+    # Seeded jitter is repeatable
+    other = InMemoryTransport(latency=0.1, jitter=0.05, seed=1, sleep=MagicMock())
+    client_for(other).post("fake/route")
+    client_for(other).post("fake/route")
+    assert [call.args[0] for call in other._sleep.call_args_list] == delays
+
+
+def test_InMemoryTransport_routes(client_for):
+    transport = InMemoryTransport({
+        "/custom/": lambda request: {"echo": request.body},
+        "error/": json_response({"reply": {"err_msg": "boom"}}, status_code=500),
+    })
+    client = client_for(transport, compression=CompressionConfig(request_threshold=16))
+
+    resp = client.post("custom", json={"request_data": {"filters": ["x" * 100]}})
+    assert resp.json() == {"echo": {"request_data": {"filters": ["x" * 100]}}}
+    # The compressed body is decoded for the route
+    assert transport.requests[0].headers["Content-Encoding"] == "gzip"
+
+    assert client.post("error/").status_code == 500
+    assert client.post("missing/").status_code == 404
+
+    transport.route("missing", [1])
+    assert client.post("missing/").json() == [1]
+
+
+def test_InMemoryTransport_validation(client_for):
+    transport = InMemoryTransport({"api_keys/validate/": json_response({}, status_code=401)})
+    with pytest.raises(InvalidApiCredentials):
+        client_for(transport, validate="eager")
+
+
+def test_InMemoryTransport_threads(client_for):
+    transport = InMemoryTransport({"fake/route": {"reply": {}}})
+    client = client_for(transport)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: client.post("fake/route"), range(100)))
+
+    assert len(transport.requests) == 100
+    assert client.compression_stats.responses == 100
+
+
+def test_InMemoryTransport_invalid():
+    with pytest.raises(ValueError):
+        InMemoryTransport(latency=-1)
+    with pytest.raises(ValueError):
+        PagedReplies("data", [], page_size=0)
+
+
+def test_PagedReplies_total_count_cap():
+    replies = PagedReplies("incidents", INCIDENTS, max_total_count=1_000)
+    request = MagicMock(request_data={PublicApiFields.SEARCH_FROM: 1_200, PublicApiFields.SEARCH_TO: 1_300})
+
+    reply = replies(request)[PublicApiFields.REPLY]
+    assert reply[PublicApiFields.TOTAL_COUNT] == 1_000
+    assert reply["incidents"] == INCIDENTS[1_200:]
+    assert reply[PublicApiFields.NEXT_PAGE_TOKEN] is None
+
+
+def test_Transport_custom(client_for):
+    class Recording(Transport):
+        def __init__(self):
+            super().__init__()
+            self.sent = []
+
+        def request(self, method, url, **kwargs):
+            self.sent.append((method, url, gzip.decompress(kwargs["data"]) if kwargs.get("headers", {}).get(
+                "Content-Encoding") else kwargs.get("data")))
+            return json_response(True)
+
+    transport = Recording()
+    client = client_for(transport, validate="eager")
+    client.post("fake/route", json={"a": 1})
+
+    assert transport.sent[0] == ("POST", "https://api-test.crtx.paloaltonetworks.com/api_keys/validate/", None)
+    assert json.loads(transport.sent[1][2]) == {"a": 1}
+    with pytest.raises(TypeError):
+        Transport()
@@ -0,0 +1,75 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from xpanse.validation import ValidationCache
+
+
+def test_ValidationCache_store_and_expire(tmp_path):
+    cache = ValidationCache(path=str(tmp_path / "validation.json"), ttl=60)
+    key = ValidationCache.key("https://api-test", "1", "key", True)
+    assert not cache.is_valid(key)
+
+    with mock.patch("xpanse.validation.time.time", return_value=1_000):
+        cache.store(key)
+        assert cache.is_valid(key)
+
+    with mock.patch("xpanse.validation.time.time", return_value=1_061):
+        assert not cache.is_valid(key)
+
+
+def test_ValidationCache_shared_across_instances(tmp_path):
+    path = str(tmp_path / "nested" / "validation.json")
+    key = ValidationCache.key("https://api-test", "1", "key", True)
+    ValidationCache(path=path).store(key)
+
+    assert ValidationCache(path=path).is_valid(key)
+    # The API Key is never written to the cache
+    with open(path) as f:
+        entries = json.load(f)
+    assert list(entries) == [key]
+    assert '"key"' not in json.dumps(entries)
+
+
+def test_ValidationCache_key():
+    key = ValidationCache.key("https://api-test", "1", "key", True)
+    assert key != ValidationCache.key("https://api-test", "1", "rotated", True)
+    assert key != ValidationCache.key("https://api-test", "2", "key", True)
+    assert key != ValidationCache.key("https://api-other", "1", "key", True)
+    assert key != ValidationCache.key("https://api-test", "1", "key", False)
+
+
+def test_ValidationCache_drops_expired_entries(tmp_path):
+    cache = ValidationCache(path=str(tmp_path / "validation.json"), ttl=10)
+    with mock.patch("xpanse.validation.time.time", return_value=0):
+        cache.store("old")
+    with mock.patch("xpanse.validation.time.time", return_value=100):
+        cache.store("new")
+
+    assert list(cache._read()) == ["new"]
+
+
+def test_ValidationCache_unreadable_file(tmp_path):
+    path = tmp_path / "validation.json"
+    path.write_text("not json")
+    cache = ValidationCache(path=str(path))
+    assert not cache.is_valid("key")
+
+    cache.store("key")
+    assert cache.is_valid("key")
+
+
+def test_ValidationCache_unwritable_path(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = ValidationCache(path=os.path.join(str(blocker), "validation.json"))
+    # Failing to write the cache never fails the client
+    cache.store("key")
+    assert not cache.is_valid("key")
+
+
+def test_ValidationCache_invalid_ttl():
+    with pytest.raises(ValueError):
+        ValidationCache(ttl=0)
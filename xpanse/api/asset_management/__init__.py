@@ -1,6 +1,12 @@
-from xpanse.api.asset_management.v1.assets import AssetsEndpoint
-from xpanse.api.asset_management.v1.owned_ip_ranges import OwnedIpRangesEndpoint
-from xpanse.api.asset_management.v1.services import ServicesEndpoint
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint, AsyncAssetsEndpoint
+from xpanse.api.asset_management.v1.owned_ip_ranges import (
+    OwnedIpRangesEndpoint,
+    AsyncOwnedIpRangesEndpoint,
+)
+from xpanse.api.asset_management.v1.services import (
+    ServicesEndpoint,
+    AsyncServicesEndpoint,
+)
 
 
 class AssetsApi(AssetsEndpoint):
@@ -40,3 +46,42 @@ class ServicesApi(ServicesEndpoint):
     @property
     def v1(self):
         return ServicesEndpoint(self._api)
+
+
+class AsyncAssetsApi(AsyncAssetsEndpoint):
+    def __init__(self, session):
+        super().__init__(session)
+
+    @property
+    def current_version(self):
+        return "v1"
+
+    @property
+    def v1(self):
+        return AsyncAssetsEndpoint(self._api)
+
+
+class AsyncOwnedIpRangesApi(AsyncOwnedIpRangesEndpoint):
+    def __init__(self, session):
+        super().__init__(session)
+
+    @property
+    def current_version(self):
+        return "v1"
+
+    @property
+    def v1(self):
+        return AsyncOwnedIpRangesEndpoint(self._api)
+
+
+class AsyncServicesApi(AsyncServicesEndpoint):
+    def __init__(self, session):
+        super().__init__(session)
+
+    @property
+    def current_version(self):
+        return "v1"
+
+    @property
+    def v1(self):
+        return AsyncServicesEndpoint(self._api)
@@ -52,12 +52,7 @@ class AssetsManagementBaseEndpoint(XpanseEndpoint):
         kwargs = build_request_payload(
             request_data=request_data, filters=filters, **kwargs
         )
-        return XpanseResultIterator(
-            api=self._api,
-            path=path,
-            data_key=self.LIST_DATA_KEY,
-            **kwargs,
-        )
+        return self._iterate(path, data_key=self.LIST_DATA_KEY, **kwargs)
 
     def _get(
         self,
@@ -91,5 +86,9 @@ class AssetsManagementBaseEndpoint(XpanseEndpoint):
         kwargs = build_request_payload(
             request_data=request_data, extra_request_data=extra_request_data, **kwargs
         )
-        response = self._api.post(path, **kwargs)
-        return XpanseResponse(response, data_key=self.GET_DATA_KEY)
+        return self._post(
+            path,
+            data_key=self.GET_DATA_KEY,
+            record_key=self.LIST_DATA_KEY,
+            **kwargs,
+        )
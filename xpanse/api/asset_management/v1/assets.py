@@ -4,13 +4,14 @@ from xpanse.api.asset_management.assets_management_base import (
     AssetsManagementBaseEndpoint,
 )
 from xpanse.const import AssetType, FilterOperator
+from xpanse.endpoint import AsyncListableEndpoint, ListableEndpoint
 from xpanse.iterator import XpanseResultIterator
 from xpanse.response import XpanseResponse
 from xpanse.types import RequestData, Filter
 from xpanse.utils import build_request_payload
 
 
-class AssetsEndpoint(AssetsManagementBaseEndpoint):
+class AssetsEndpoint(AssetsManagementBaseEndpoint, ListableEndpoint):
     """
     Part of the Public API for handling Assets.
     See: https://docs-cortex.paloaltonetworks.com/r/Cortex-XPANSE/Cortex-Xpanse-API-Reference/Get-All-Assets
@@ -30,6 +31,9 @@ class AssetsEndpoint(AssetsManagementBaseEndpoint):
         self,
         asset_types: Optional[Set[AssetType]] = None,
         request_data: Optional[RequestData] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint_path: Optional[str] = None,
         **kwargs: Any,
     ) -> XpanseResultIterator:
         """
@@ -41,6 +45,17 @@ class AssetsEndpoint(AssetsManagementBaseEndpoint):
             request_data (RequestData, Optional):
                 Any supplemental request_data to be included with your request. This is
                 needed to implement any additional filters, offsets, limits, or sort ordering.
+            prefetch (int, Optional):
+                The number of pages to fetch ahead of the caller on a background worker, so that
+                requests overlap with the processing of the current page. Defaults to 0 (disabled).
+            stream (bool, Optional):
+                Whether to parse each page as its body is read, so results are returned as they
+                arrive without holding the whole page body in memory. Cannot be combined with
+                `prefetch`. Defaults to False.
+            checkpoint_path (str, Optional):
+                A file the pagination state is saved to before each page and resumed from when it
+                exists, so that an interrupted listing continues where it stopped. The file is
+                removed once every page has been read. Defaults to None (disabled).
             **kwargs:
                 Any extraneous parameters you would like to include when executing your
                 request with the `requests` module. Note: By default, all payload data
@@ -60,6 +75,9 @@ class AssetsEndpoint(AssetsManagementBaseEndpoint):
             self.LIST_ENDPOINT,
             request_data=request_data,
             filters=filters,
+            prefetch=prefetch,
+            stream=stream,
+            checkpoint_path=checkpoint_path,
             **kwargs,
         )
 
@@ -170,3 +188,11 @@ class AssetsEndpoint(AssetsManagementBaseEndpoint):
             )
 
         return filters
+
+
+class AsyncAssetsEndpoint(AsyncListableEndpoint, AssetsEndpoint):
+    """
+    Asyncio variant of :class:`AssetsEndpoint` used by the :class:`AsyncXpanseClient`.
+    """
+
+    pass
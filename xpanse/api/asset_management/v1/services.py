@@ -3,12 +3,13 @@ from typing import Any, List, Optional
 from xpanse.api.asset_management.assets_management_base import (
     AssetsManagementBaseEndpoint,
 )
+from xpanse.endpoint import AsyncListableEndpoint, ListableEndpoint
 from xpanse.iterator import XpanseResultIterator
 from xpanse.response import XpanseResponse
 from xpanse.types import RequestData
 
 
-class ServicesEndpoint(AssetsManagementBaseEndpoint):
+class ServicesEndpoint(AssetsManagementBaseEndpoint, ListableEndpoint):
     """
     Part of the Public API for handling Services.
     See: https://docs-cortex.paloaltonetworks.com/r/Cortex-XPANSE/Cortex-Xpanse-API-Reference/Get-All-External-Services
@@ -21,7 +22,12 @@ class ServicesEndpoint(AssetsManagementBaseEndpoint):
     LIST_DATA_KEY = "external_services"
 
     def list(
-        self, request_data: Optional[RequestData] = None, **kwargs: Any
+        self,
+        request_data: Optional[RequestData] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint_path: Optional[str] = None,
+        **kwargs: Any,
     ) -> XpanseResultIterator:
         """
         This endpoint will return a paginated list of Services.
@@ -30,6 +36,17 @@ class ServicesEndpoint(AssetsManagementBaseEndpoint):
             request_data (RequestData, Optional):
                 Any supplemental request_data to be included with your request. This is needed to
                 implement any additional filters, offsets, limits, or sort ordering.
+            prefetch (int, Optional):
+                The number of pages to fetch ahead of the caller on a background worker, so that
+                requests overlap with the processing of the current page. Defaults to 0 (disabled).
+            stream (bool, Optional):
+                Whether to parse each page as its body is read, so results are returned as they
+                arrive without holding the whole page body in memory. Cannot be combined with
+                `prefetch`. Defaults to False.
+            checkpoint_path (str, Optional):
+                A file the pagination state is saved to before each page and resumed from when it
+                exists, so that an interrupted listing continues where it stopped. The file is
+                removed once every page has been read. Defaults to None (disabled).
             **kwargs:
                 Any extraneous parameters you would like to include when executing your
                 request with the `requests` module. Note: By default, all payload data
@@ -47,6 +64,9 @@ class ServicesEndpoint(AssetsManagementBaseEndpoint):
         return super(ServicesEndpoint, self)._list(
             self.LIST_ENDPOINT,
             request_data=request_data,
+            prefetch=prefetch,
+            stream=stream,
+            checkpoint_path=checkpoint_path,
             **kwargs,
         )
 
@@ -123,3 +143,11 @@ class ServicesEndpoint(AssetsManagementBaseEndpoint):
             request_data=request_data,
             **kwargs,
         )
+
+
+class AsyncServicesEndpoint(AsyncListableEndpoint, ServicesEndpoint):
+    """
+    Asyncio variant of :class:`ServicesEndpoint` used by the :class:`AsyncXpanseClient`.
+    """
+
+    pass
@@ -1,5 +1,6 @@
 from xpanse.api.attack_surface_rules.v1.attack_surface_rules import (
     AttackSurfaceRulesEndpoint,
+    AsyncAttackSurfaceRulesEndpoint,
 )
 
 
@@ -14,3 +15,16 @@ class AttackSurfaceRulesApi(AttackSurfaceRulesEndpoint):
     @property
     def v1(self):
         return AttackSurfaceRulesEndpoint(self._api)
+
+
+class AsyncAttackSurfaceRulesApi(AsyncAttackSurfaceRulesEndpoint):
+    def __init__(self, session):
+        super().__init__(session)
+
+    @property
+    def current_version(self):
+        return "v1"
+
+    @property
+    def v1(self):
+        return AsyncAttackSurfaceRulesEndpoint(self._api)
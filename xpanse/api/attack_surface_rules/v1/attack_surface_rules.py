@@ -7,15 +7,16 @@ from xpanse.const import (
     DEFAULT_SEARCH_FROM,
     DEFAULT_SEARCH_TO,
 )
-from xpanse.endpoint import XpanseEndpoint
+from xpanse.endpoint import AsyncListableEndpoint, ListableEndpoint
 from xpanse.iterator import XpanseResultIterator
+from xpanse.paging import AdaptivePageSize
 from xpanse.response import XpanseResponse
 from xpanse.types import RequestData, Filter
 from xpanse.utils import build_request_payload
 
 
 # TODO:// Add documentation link from https://jira-hq.paloaltonetworks.local/browse/EXPANDR-3062
-class AttackSurfaceRulesEndpoint(XpanseEndpoint):
+class AttackSurfaceRulesEndpoint(ListableEndpoint):
     """
     Part of the Public API for handling Attack Surface Rules.
     """
@@ -24,7 +25,13 @@ class AttackSurfaceRulesEndpoint(XpanseEndpoint):
     DATA_KEY = "attack_surface_rules"
 
     def list(
-        self, request_data: Optional[RequestData] = None, **kwargs: Any
+        self,
+        request_data: Optional[RequestData] = None,
+        concurrency: int = 1,
+        stream: bool = False,
+        checkpoint_path: Optional[str] = None,
+        page_sizing: Optional[AdaptivePageSize] = None,
+        **kwargs: Any,
     ) -> XpanseResultIterator:
         """
         This endpoint will return a paginated list of Attack Surface Rules.
@@ -33,6 +40,21 @@ class AttackSurfaceRulesEndpoint(XpanseEndpoint):
             request_data (RequestData, Optional):
                 Any supplemental request_data to be included with your request. This is needed to
                 implement any additional filters, offsets, limits, or sort ordering.
+            concurrency (int, Optional):
+                The number of pages to request in parallel once the first page has returned
+                the `total_count`. Pages are still returned in order. Defaults to 1 (sequential).
+            stream (bool, Optional):
+                Whether to parse each page as its body is read, so results are returned as they
+                arrive without holding the whole page body in memory. Cannot be combined with
+                `concurrency`. Defaults to False.
+            checkpoint_path (str, Optional):
+                A file the pagination state is saved to before each page and resumed from when it
+                exists, so that an interrupted listing continues where it stopped. The file is
+                removed once every page has been read. Defaults to None (disabled).
+            page_sizing (AdaptivePageSize, Optional):
+                Sizes each page from the latency and response size of the previous one, and stops
+                at the first page with fewer results than requested. Cannot be combined with
+                `concurrency` or `stream`. Defaults to None (fixed page size).
             **kwargs:
                 Any extraneous parameters you would like to include when executing your
                 request with the `requests` module. Note: By default, all payload data
@@ -54,13 +76,16 @@ class AttackSurfaceRulesEndpoint(XpanseEndpoint):
         search_to = (request_data or {}).get(
             PublicApiFields.SEARCH_TO, DEFAULT_SEARCH_TO
         )
-        return XpanseResultIterator(
-            api=self._api,
-            path=self.ENDPOINT,
+        return self._iterate(
+            self.ENDPOINT,
             data_key=self.DATA_KEY,
             use_page_token=False,
             search_from=cast(int, search_from),
             search_to=cast(int, search_to),
+            concurrency=concurrency,
+            stream=stream,
+            checkpoint_path=checkpoint_path,
+            page_sizing=page_sizing,
             **kwargs,
         )
 
@@ -107,8 +132,7 @@ class AttackSurfaceRulesEndpoint(XpanseEndpoint):
         kwargs = build_request_payload(
             request_data=request_data, filters=filters, **kwargs
         )
-        response = self._api.post(self.ENDPOINT, **kwargs)
-        return XpanseResponse(response, data_key=self.DATA_KEY)
+        return self._post(self.ENDPOINT, data_key=self.DATA_KEY, **kwargs)
 
     def count(
         self, request_data: Optional[RequestData] = None, **kwargs: Any
@@ -140,3 +164,13 @@ class AttackSurfaceRulesEndpoint(XpanseEndpoint):
         return super(AttackSurfaceRulesEndpoint, self)._count(
             self.ENDPOINT, request_data=request_data, **kwargs
         )
+
+
+class AsyncAttackSurfaceRulesEndpoint(
+    AsyncListableEndpoint, AttackSurfaceRulesEndpoint
+):
+    """
+    Asyncio variant of :class:`AttackSurfaceRulesEndpoint` used by the :class:`AsyncXpanseClient`.
+    """
+
+    pass
@@ -1,6 +1,12 @@
-from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
-from xpanse.api.incident_management.v2.alerts import AlertsEndpoint
-from xpanse.api.incident_management.v1.alerts import AlertsEndpointV1
+from xpanse.api.incident_management.v1.incidents import (
+    IncidentsEndpoint,
+    AsyncIncidentsEndpoint,
+)
+from xpanse.api.incident_management.v2.alerts import AlertsEndpoint, AsyncAlertsEndpoint
+from xpanse.api.incident_management.v1.alerts import (
+    AlertsEndpointV1,
+    AsyncAlertsEndpointV1,
+)
 
 
 class IncidentsApi(IncidentsEndpoint):
@@ -31,3 +37,33 @@ class AlertsApi(AlertsEndpoint):
     @property
     def v1(self):
         return AlertsEndpointV1(self._api)
+
+
+class AsyncIncidentsApi(AsyncIncidentsEndpoint):
+    def __init__(self, session):
+        super().__init__(session)
+
+    @property
+    def current_version(self):
+        return "v1"
+
+    @property
+    def v1(self):
+        return AsyncIncidentsEndpoint(self._api)
+
+
+class AsyncAlertsApi(AsyncAlertsEndpoint):
+    def __init__(self, session):
+        super().__init__(session)
+
+    @property
+    def current_version(self):
+        return "v2"
+
+    @property
+    def v2(self):
+        return AsyncAlertsEndpoint(self._api)
+
+    @property
+    def v1(self):
+        return AsyncAlertsEndpointV1(self._api)
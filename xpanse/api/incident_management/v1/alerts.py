@@ -1,7 +1,7 @@
 from typing import Any, List, Optional
 
 from xpanse.const import V1_PREFIX
-from xpanse.endpoint import XpanseEndpoint
+from xpanse.endpoint import XpanseEndpoint, AsyncXpanseEndpoint
 from xpanse.response import XpanseResponse
 from xpanse.utils import build_request_payload
 
@@ -50,5 +50,12 @@ class AlertsEndpointV1(XpanseEndpoint):
             "update_data": update_data,
         }
         kwargs = build_request_payload(extra_request_data=extra_request_data, **kwargs)
-        response = self._api.post(self.UPDATE_ENDPOINT, **kwargs)
-        return XpanseResponse(response, data_key=self.UPDATE_DATA_KEY)
+        return self._post(self.UPDATE_ENDPOINT, data_key=self.UPDATE_DATA_KEY, **kwargs)
+
+
+class AsyncAlertsEndpointV1(AsyncXpanseEndpoint, AlertsEndpointV1):
+    """
+    Asyncio variant of :class:`AlertsEndpointV1` used by the :class:`AsyncXpanseClient`.
+    """
+
+    pass
@@ -7,14 +7,16 @@ from xpanse.const import (
     DEFAULT_SEARCH_FROM,
     DEFAULT_SEARCH_TO,
 )
-from xpanse.endpoint import XpanseEndpoint
+from xpanse.endpoint import AsyncListableEndpoint, ListableEndpoint
 from xpanse.iterator import XpanseResultIterator
+from xpanse.paging import AdaptivePageSize
+from xpanse.partition import TimeWindowScan
 from xpanse.response import XpanseResponse
 from xpanse.types import RequestData, Filter
 from xpanse.utils import build_request_payload
 
 
-class IncidentsEndpoint(XpanseEndpoint):
+class IncidentsEndpoint(ListableEndpoint):
     """
     Part of the Public API for handling Incidents.
     See: https://docs-cortex.paloaltonetworks.com/r/Cortex-XPANSE/Cortex-Xpanse-API-Reference/Get-Incidents
@@ -26,7 +28,13 @@ class IncidentsEndpoint(XpanseEndpoint):
     DATA_KEY = "incidents"
 
     def list(
-        self, request_data: Optional[RequestData] = None, **kwargs: Any
+        self,
+        request_data: Optional[RequestData] = None,
+        concurrency: int = 1,
+        stream: bool = False,
+        checkpoint_path: Optional[str] = None,
+        page_sizing: Optional[AdaptivePageSize] = None,
+        **kwargs: Any,
     ) -> XpanseResultIterator:
         """
         This endpoint will return a paginated list of Incidents.
@@ -35,6 +43,21 @@ class IncidentsEndpoint(XpanseEndpoint):
             request_data (RequestData, Optional):
                 Any supplemental request_data to be included with your request. This is needed to
                 implement any additional filters, offsets, limits, or sort ordering.
+            concurrency (int, Optional):
+                The number of pages to request in parallel once the first page has returned
+                the `total_count`. Pages are still returned in order. Defaults to 1 (sequential).
+            stream (bool, Optional):
+                Whether to parse each page as its body is read, so results are returned as they
+                arrive without holding the whole page body in memory. Cannot be combined with
+                `concurrency`. Defaults to False.
+            checkpoint_path (str, Optional):
+                A file the pagination state is saved to before each page and resumed from when it
+                exists, so that an interrupted listing continues where it stopped. The file is
+                removed once every page has been read. Defaults to None (disabled).
+            page_sizing (AdaptivePageSize, Optional):
+                Sizes each page from the latency and response size of the previous one, and stops
+                at the first page with fewer results than requested. Cannot be combined with
+                `concurrency` or `stream`. Defaults to None (fixed page size).
             **kwargs:
                 Any extraneous parameters you would like to include when executing your
                 request with the `requests` module. Note: By default, all payload data
@@ -48,6 +71,8 @@ class IncidentsEndpoint(XpanseEndpoint):
         Examples:
             >>> # Return all Incidents dumped to a list:
             >>> incidents =  client.incidents.list().dump()
+            >>> # Fetch up to 8 pages of Incidents at once:
+            >>> incidents =  client.incidents.list(concurrency=8).dump()
         """
         kwargs = build_request_payload(request_data=request_data, **kwargs)
         search_from = (request_data or {}).get(
@@ -56,13 +81,66 @@ class IncidentsEndpoint(XpanseEndpoint):
         search_to = (request_data or {}).get(
             PublicApiFields.SEARCH_TO, DEFAULT_SEARCH_TO
         )
-        return XpanseResultIterator(
-            api=self._api,
-            path=self.LIST_ENDPOINT,
+        return self._iterate(
+            self.LIST_ENDPOINT,
             data_key=self.DATA_KEY,
             use_page_token=False,
             search_from=cast(int, search_from),
             search_to=cast(int, search_to),
+            concurrency=concurrency,
+            stream=stream,
+            checkpoint_path=checkpoint_path,
+            page_sizing=page_sizing,
+            **kwargs,
+        )
+
+    def scan(
+        self,
+        request_data: Optional[RequestData] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        time_field: str = "creation_time",
+        concurrency: int = 4,
+        **kwargs: Any,
+    ) -> TimeWindowScan:
+        """
+        This endpoint will return every Incident, even when the total exceeds the 9,999 `total_count`
+        cap of the list endpoint. The query is split into disjoint time windows on `time_field`
+        until each window is below the cap, the windows are listed in parallel, and the
+        results are de-duplicated on `incident_id`.
+
+        Args:
+            request_data (RequestData, Optional):
+                Any supplemental request_data to be included with your request. This is needed to
+                implement any additional filters or sort ordering.
+            start (int, Optional):
+                The inclusive epoch millisecond start of the scan. Defaults to 0.
+            end (int, Optional):
+                The inclusive epoch millisecond end of the scan. Defaults to the current time.
+            time_field (str, Optional):
+                The epoch millisecond field used to partition the scan. Defaults to `creation_time`.
+            concurrency (int, Optional):
+                The number of time windows counted or listed in parallel. Defaults to 4.
+            **kwargs:
+                Any extraneous parameters you would like to include when executing your
+                request with the `requests` module. Note: By default, all payload data
+                is sent under the "json" keyword for your request.
+
+        Returns:
+            :obj:`TimeWindowScan`:
+                An iterator yielding each unique Incident result.
+
+        Examples:
+            >>> # Return all Incidents created since 2023-01-01 dumped to a list:
+            >>> incidents =  client.incidents.scan(start=1672531200000).dump()
+        """
+        return self._scan(
+            id_field="incident_id",
+            time_field=time_field,
+            request_data=request_data,
+            start=start,
+            end=end,
+            concurrency=concurrency,
             **kwargs,
         )
 
@@ -109,8 +187,7 @@ class IncidentsEndpoint(XpanseEndpoint):
         kwargs = build_request_payload(
             request_data=request_data, filters=filters, **kwargs
         )
-        response = self._api.post(self.LIST_ENDPOINT, **kwargs)
-        return XpanseResponse(response, data_key=self.DATA_KEY)
+        return self._post(self.LIST_ENDPOINT, data_key=self.DATA_KEY, **kwargs)
 
     def count(
         self, request_data: Optional[RequestData] = None, **kwargs: Any
@@ -178,5 +255,12 @@ class IncidentsEndpoint(XpanseEndpoint):
             "update_data": update_data,
         }
         kwargs = build_request_payload(extra_request_data=extra_request_data, **kwargs)
-        response = self._api.post(self.UPDATE_ENDPOINT, **kwargs)
-        return XpanseResponse(response)
+        return self._post(self.UPDATE_ENDPOINT, **kwargs)
+
+
+class AsyncIncidentsEndpoint(AsyncListableEndpoint, IncidentsEndpoint):
+    """
+    Asyncio variant of :class:`IncidentsEndpoint` used by the :class:`AsyncXpanseClient`.
+    """
+
+    pass
@@ -1,14 +1,15 @@
 from typing import Any, List, Optional
 
 from xpanse.const import V2_PREFIX, PublicApiFields, FilterOperator
-from xpanse.endpoint import XpanseEndpoint
+from xpanse.endpoint import AsyncListableEndpoint, ListableEndpoint
 from xpanse.iterator import XpanseResultIterator
+from xpanse.partition import TimeWindowScan
 from xpanse.response import XpanseResponse
 from xpanse.types import RequestData, Filter
 from xpanse.utils import build_request_payload
 
 
-class AlertsEndpoint(XpanseEndpoint):
+class AlertsEndpoint(ListableEndpoint):
     """
     Part of the Public API for handling Alerts Multi-Events v2.
     See: https://docs-cortex.paloaltonetworks.com/r/Cortex-XPANSE/Cortex-Xpanse-API-Reference/Get-Alerts-Multi-Events
@@ -18,7 +19,12 @@ class AlertsEndpoint(XpanseEndpoint):
     DATA_KEY = "alerts"
 
     def list(
-        self, request_data: Optional[RequestData] = None, **kwargs: Any
+        self,
+        request_data: Optional[RequestData] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint_path: Optional[str] = None,
+        **kwargs: Any,
     ) -> XpanseResultIterator:
         """
         This endpoint will return a paginated list of Alerts.
@@ -27,6 +33,17 @@ class AlertsEndpoint(XpanseEndpoint):
             request_data (RequestData, Optional):
                 Any supplemental request_data to be included with your request. This is needed to
                 implement any additional filters, offsets, limits, or sort ordering.
+            prefetch (int, Optional):
+                The number of pages to fetch ahead of the caller on a background worker, so that
+                requests overlap with the processing of the current page. Defaults to 0 (disabled).
+            stream (bool, Optional):
+                Whether to parse each page as its body is read, so results are returned as they
+                arrive without holding the whole page body in memory. Cannot be combined with
+                `prefetch`. Defaults to False.
+            checkpoint_path (str, Optional):
+                A file the pagination state is saved to before each page and resumed from when it
+                exists, so that an interrupted listing continues where it stopped. The file is
+                removed once every page has been read. Defaults to None (disabled).
             **kwargs:
                 Any extraneous parameters you would like to include when executing your
                 request with the `requests` module. Note: By default, all payload data
@@ -42,8 +59,63 @@ class AlertsEndpoint(XpanseEndpoint):
             >>> alerts =  client.alerts.list().dump()
         """
         kwargs = build_request_payload(request_data=request_data, **kwargs)
-        return XpanseResultIterator(
-            api=self._api, path=self.ENDPOINT, data_key=self.DATA_KEY, **kwargs
+        return self._iterate(
+            self.ENDPOINT,
+            data_key=self.DATA_KEY,
+            prefetch=prefetch,
+            stream=stream,
+            checkpoint_path=checkpoint_path,
+            **kwargs,
+        )
+
+    def scan(
+        self,
+        request_data: Optional[RequestData] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        time_field: str = "creation_time",
+        concurrency: int = 4,
+        **kwargs: Any,
+    ) -> TimeWindowScan:
+        """
+        This endpoint will return every Alert, even when the total exceeds the 9,999 `total_count`
+        cap of the list endpoint. The query is split into disjoint time windows on `time_field`
+        until each window is below the cap, the windows are listed in parallel, and the
+        results are de-duplicated on `alert_id`.
+
+        Args:
+            request_data (RequestData, Optional):
+                Any supplemental request_data to be included with your request. This is needed to
+                implement any additional filters or sort ordering.
+            start (int, Optional):
+                The inclusive epoch millisecond start of the scan. Defaults to 0.
+            end (int, Optional):
+                The inclusive epoch millisecond end of the scan. Defaults to the current time.
+            time_field (str, Optional):
+                The epoch millisecond field used to partition the scan. Defaults to `creation_time`.
+            concurrency (int, Optional):
+                The number of time windows counted or listed in parallel. Defaults to 4.
+            **kwargs:
+                Any extraneous parameters you would like to include when executing your
+                request with the `requests` module. Note: By default, all payload data
+                is sent under the "json" keyword for your request.
+
+        Returns:
+            :obj:`TimeWindowScan`:
+                An iterator yielding each unique Alert result.
+
+        Examples:
+            >>> # Return all Alerts created since 2023-01-01 dumped to a list:
+            >>> alerts =  client.alerts.scan(start=1672531200000).dump()
+        """
+        return self._scan(
+            id_field="alert_id",
+            time_field=time_field,
+            request_data=request_data,
+            start=start,
+            end=end,
+            concurrency=concurrency,
+            **kwargs,
         )
 
     def get(
@@ -89,8 +161,7 @@ class AlertsEndpoint(XpanseEndpoint):
         kwargs = build_request_payload(
             request_data=request_data, filters=filters, **kwargs
         )
-        response = self._api.post(self.ENDPOINT, **kwargs)
-        return XpanseResponse(response, data_key=self.DATA_KEY)
+        return self._post(self.ENDPOINT, data_key=self.DATA_KEY, **kwargs)
 
     def count(
         self, request_data: Optional[RequestData] = None, **kwargs: Any
@@ -122,3 +193,11 @@ class AlertsEndpoint(XpanseEndpoint):
         return super(AlertsEndpoint, self)._count(
             self.ENDPOINT, request_data=request_data, **kwargs
         )
+
+
+class AsyncAlertsEndpoint(AsyncListableEndpoint, AlertsEndpoint):
+    """
+    Asyncio variant of :class:`AlertsEndpoint` used by the :class:`AsyncXpanseClient`.
+    """
+
+    pass
@@ -1,4 +1,4 @@
-from xpanse.api.tags.v1.tags import TagsEndpoint
+from xpanse.api.tags.v1.tags import TagsEndpoint, AsyncTagsEndpoint
 
 
 class TagsApi(TagsEndpoint):
@@ -12,3 +12,16 @@ class TagsApi(TagsEndpoint):
     @property
     def v1(self):
         return TagsEndpoint(self._api)
+
+
+class AsyncTagsApi(AsyncTagsEndpoint):
+    def __init__(self, session):
+        super().__init__(session)
+
+    @property
+    def current_version(self):
+        return "v1"
+
+    @property
+    def v1(self):
+        return AsyncTagsEndpoint(self._api)
@@ -1,7 +1,7 @@
 from typing import List
 
 from xpanse.const import V1_PREFIX, TaggableDataType, PublicApiFields
-from xpanse.endpoint import XpanseEndpoint
+from xpanse.endpoint import XpanseEndpoint, AsyncXpanseEndpoint
 
 
 from xpanse.response import XpanseResponse
@@ -157,5 +157,14 @@ class TagsEndpoint(XpanseEndpoint):
         kwargs = build_request_payload(
             filters=filters, extra_request_data=extra_request_data, **kwargs
         )
-        response = self._api.post(path.format(data_type=data_type.value), **kwargs)
-        return XpanseResponse(response, data_key=data_key)
+        return self._post(
+            path.format(data_type=data_type.value), data_key=data_key, **kwargs
+        )
+
+
+class AsyncTagsEndpoint(AsyncXpanseEndpoint, TagsEndpoint):
+    """
+    Asyncio variant of :class:`TagsEndpoint` used by the :class:`AsyncXpanseClient`.
+    """
+
+    pass
@@ -0,0 +1,410 @@
+import asyncio
+import time
+from typing import Any, Optional, Union, MutableMapping
+
+import requests
+
+from xpanse.client import BaseXpanseClient
+from xpanse.const import HTTPVerb, ValidationMode
+from xpanse.error import XpanseException
+from xpanse.codec import JsonCodec, decode_response
+from xpanse.compression import CompressionConfig
+from xpanse.hooks import Hooks
+from xpanse.httpx_compat import (
+    as_requests_response,
+    build_httpx_client,
+    httpx,
+    httpx_request_kwargs,
+    require_httpx,
+)
+from xpanse.metrics import MetricsRegistry
+from xpanse.pool import PoolConfig
+from xpanse.ratelimit import RateLimiter
+from xpanse.retry import RetryPolicy
+from xpanse.validation import ValidationCache
+from xpanse.api.asset_management import (
+    AsyncServicesApi,
+    AsyncOwnedIpRangesApi,
+    AsyncAssetsApi,
+)
+from xpanse.api.attack_surface_rules import AsyncAttackSurfaceRulesApi
+from xpanse.api.incident_management import AsyncAlertsApi, AsyncIncidentsApi
+from xpanse.api.tags import AsyncTagsApi
+
+
+class AsyncXpanseClient(BaseXpanseClient):
+    """
+    Asyncio interface for Cortex Xpanse APIs. Requires the optional `httpx` dependency,
+    which can be installed with `pip install xpanse[async]`.
+
+    The client exposes the same endpoints as the :class:`xpanse.client.XpanseClient`. The
+    `get`, `count`, `update`, `assign` and `remove` methods return coroutines, and the `list`
+    methods return an :class:`xpanse.iterator.AsyncXpanseResultIterator`. Responses are
+    returned as `requests.Response` objects, so :class:`xpanse.response.XpanseResponse`
+    behaves the same for both clients.
+
+    By default, the API Keys are validated when entering the client as an async context manager,
+    or by awaiting :meth:`validate`.
+
+    Args:
+        url (str, required):
+            The base URL that the paths will be appended onto. This field is required to be set either during
+            instantiation, or using the environment variable `CORTEX_FQDN`.
+        api_key_id (Union[str, int], required):
+            The API Key ID associated with the generated credentials. This field is required
+            to be set either during instantiation, or using the environment variable `CORTEX_API_KEY_ID`.
+        api_key (str, required):
+            The API Key generated when provisioning the credentials in your product. This field is required
+            to be set either during instantiation, or using the environment variable `CORTEX_API_KEY`.
+        use_advanced_auth (bool, optional):
+            A flag used to determine which type of API Key is being used. 'Advanced' is used when True,
+            'Standard' is used when False. The default is True.
+        custom_ua (str, optional):
+            A custom string can be provided that will be sent within the user-agent header on all
+            requests to Xpanse.
+        proxies (MutableMapping[str, str], optional):
+            A dictionary detailing what proxy should be used for what transport protocol, using the
+            same structure as the Requests library, i.e. `{"https": "http://proxy:3128"}`.
+        verify (bool, optional):
+            Whether or not SSL verification should occur. This is `True` by default. Disabling certificate
+            verification is strongly discouraged.
+        retry_policy (RetryPolicy, optional):
+            Controls which failed requests are retried and the backoff between retries. Backoff
+            delays are awaited with `asyncio.sleep`. See :class:`xpanse.retry.RetryPolicy`.
+        rate_limiter (RateLimiter, optional):
+            Paces outgoing requests, including retries. The same limiter can be shared with blocking
+            clients. See :class:`xpanse.ratelimit.RateLimiter`.
+        pool_config (PoolConfig, optional):
+            Connection pool size and TCP keep-alive settings, applied as `httpx` connection limits
+            and socket options. `warm_up` is not supported. See :class:`xpanse.pool.PoolConfig`.
+        validate (Union[str, ValidationMode], optional):
+            When the API Keys are validated. "eager" (the default) validates them when entering the
+            client. "lazy" raises :obj:`InvalidApiCredentials` if the first request returns a 401.
+            "never" does not validate the keys.
+        validation_cache (ValidationCache, optional):
+            Caches successful validations on disk for a TTL. See :class:`xpanse.validation.ValidationCache`.
+        json_codec (Union[str, JsonCodec], optional):
+            The JSON codec used to encode request bodies and decode responses. By default, the fastest
+            installed codec is used. See :func:`xpanse.codec.get_codec`.
+        compression (CompressionConfig, optional):
+            Response and request body compression settings. See :class:`xpanse.compression.CompressionConfig`.
+        http2 (bool, optional):
+            Whether to negotiate HTTP/2, so that concurrent requests share one connection. Requires
+            `pip install xpanse[http2]`. Defaults to False.
+        metrics (MetricsRegistry, optional):
+            Records the requests, latency, retries and pages of each endpoint path. See
+            :class:`xpanse.metrics.MetricsRegistry`.
+        hooks (Hooks, optional):
+            Request and iterator lifecycle callbacks, for tracing and profiling. See :class:`xpanse.hooks.Hooks`.
+
+    Examples:
+        >>> async with AsyncXpanseClient() as client:
+        >>>     async for page in client.assets.list():
+        >>>         print(len(page))
+        >>>     incidents = await client.incidents.get(incident_ids=["1"])
+    """
+
+    """Active Session"""
+    _session: Optional["httpx.AsyncClient"] = None
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key_id: Optional[Union[str, int]] = None,
+        api_key: Optional[str] = None,
+        use_advanced_auth: bool = True,
+        custom_ua: Optional[str] = None,
+        proxies: Optional[MutableMapping[str, str]] = None,
+        verify: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_config: Optional[PoolConfig] = None,
+        validate: Union[str, ValidationMode] = ValidationMode.EAGER,
+        validation_cache: Optional[ValidationCache] = None,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        compression: Optional[CompressionConfig] = None,
+        http2: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[Hooks] = None,
+    ):
+        require_httpx("AsyncXpanseClient")
+
+        super().__init__(
+            url=url,
+            api_key_id=api_key_id,
+            api_key=api_key,
+            use_advanced_auth=use_advanced_auth,
+            custom_ua=custom_ua,
+            proxies=proxies,
+            verify=verify,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            pool_config=pool_config,
+            validate=validate,
+            validation_cache=validation_cache,
+            json_codec=json_codec,
+            compression=compression,
+            http2=http2,
+            metrics=metrics,
+            hooks=hooks,
+        )
+
+    async def __aenter__(self) -> "AsyncXpanseClient":
+        if (
+            self._validation_mode == ValidationMode.EAGER
+            and not self._is_validation_cached()
+        ):
+            await self.validate()
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.close()
+
+    def _setup_auth(
+        self, api_key: Optional[str], api_key_id: Optional[Union[str, int]]
+    ):
+        """
+        Resolves the API Keys and creates the request session. Eager validation is deferred
+        to :meth:`validate`, since it cannot be awaited from the constructor.
+
+        Args:
+            api_key (str, Optional):
+                The api_key provided from the constructor
+            api_key_id (str, Optional):
+                The api_key_id provided from the constructor
+        """
+        super()._setup_auth(api_key=api_key, api_key_id=api_key_id)
+        self._create_session()
+
+        self._pending_validation = (
+            self._validation_mode == ValidationMode.LAZY
+            and not self._is_validation_cached()
+        )
+
+    async def validate(self):
+        """
+        Validates the provided API Keys.
+
+        Raises:
+            :obj:`InvalidApiCredentials`: When the keys are invalid or expired.
+        """
+        if not await self._validate_auth():
+            raise self._invalid_credentials()
+        self._record_validation()
+
+    async def _validate_auth(self) -> bool:
+        """
+        Validates the provided API Keys
+
+        Returns:
+            :bool: True when the keys are valid, False when the keys are invalid or expired.
+        """
+        res = await self.post("api_keys/validate/")
+
+        if res is None or res.status_code == 401:
+            return False
+
+        return decode_response(res, self._json_codec)
+
+    def _create_session(self):
+        """
+        Creates the `httpx.AsyncClient` used for all requests.
+        """
+        self._session = build_httpx_client(
+            httpx.AsyncClient,
+            httpx.AsyncHTTPTransport,
+            self._pool_config,
+            proxies=self._proxies,
+            verify=self._verify,
+            http2=self._http2,
+            headers={"Accept-Encoding": self._compression.accept_encoding_header()},
+        )
+
+    async def close(self):
+        """
+        Closes the underlying connection pool.
+        """
+        if self._session is not None:
+            await self._session.aclose()
+
+    async def _request(
+        self, method: str, path: str, **kwargs: Any
+    ) -> Optional[requests.Response]:
+        """
+        Request builder. Completes lazy validation with the response.
+        """
+        response = await self._send(method, path, **kwargs)
+        self._complete_lazy_validation(response)
+        return response
+
+    async def _send(
+        self, method: str, path: str, **kwargs: Any
+    ) -> Optional[requests.Response]:
+        """
+        Sends a request, retrying it according to the retry policy.
+        """
+        headers, kwargs = self._prepare_request(path, kwargs)
+        kwargs = httpx_request_kwargs(kwargs)
+
+        attempt = 0
+        self._retry_policy.on_request()
+        while True:
+            start = time.perf_counter()
+            event = None
+            try:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire_async(path)
+
+                event = self._before_attempt(method, path, kwargs, attempt)
+                start = time.perf_counter()
+                resp = await self._session.request(  # type: ignore
+                    method,
+                    f"{self._url}/{path}",
+                    headers={**headers, **self._get_auth_headers()},
+                    **kwargs,
+                )
+                # httpx counts the bytes read from the socket, before decoding
+                self._compression_stats.record_response(
+                    resp.num_bytes_downloaded, len(resp.content)
+                )
+                delay = self._on_response(
+                    method,
+                    path,
+                    attempt,
+                    event,
+                    resp,
+                    time.perf_counter() - start,
+                    resp.num_bytes_downloaded,
+                    len(resp.content),
+                )
+                if delay is None:
+                    return as_requests_response(resp)
+            except httpx.TransportError as err:
+                delay = self._on_transport_error(
+                    path, attempt, event, time.perf_counter() - start, err
+                )
+                if delay is None:
+                    break
+            except XpanseException as err:
+                self._on_client_error(event, time.perf_counter() - start, err)
+                break
+
+            attempt += 1
+            await asyncio.sleep(delay)
+        return None
+
+    async def get(self, path: str, **kwargs: Any) -> Optional[requests.Response]:
+        """
+        Initiates an HTTP GET request using the specified path. Keyword arguments are
+        passed to :obj:`httpx.AsyncClient.request`.
+
+        Args:
+            path (str):
+                The path to be appended onto the base URL for the request.
+            **kwargs (dict):
+                Keyword arguments to be passed to the httpx request method.
+
+        Returns:
+            :obj:`requests.Response`
+        """
+        return await self._request(HTTPVerb.HTTP_GET.value, path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> Optional[requests.Response]:
+        """
+        Initiates an HTTP POST request using the specified path. Keyword arguments are
+        passed to :obj:`httpx.AsyncClient.request`.
+
+        Args:
+            path (str):
+                The path to be appended onto the base URL for the request.
+            **kwargs (dict):
+                Keyword arguments to be passed to the httpx request method.
+
+        Returns:
+            :obj:`requests.Response`
+        """
+        return await self._request(HTTPVerb.HTTP_POST.value, path, **kwargs)
+
+    async def patch(self, path: str, **kwargs: Any) -> Optional[requests.Response]:
+        """
+        Initiates an HTTP PATCH request using the specified path. Keyword arguments are
+        passed to :obj:`httpx.AsyncClient.request`.
+
+        Args:
+            path (str):
+                The path to be appended onto the base URL for the request.
+            **kwargs (dict):
+                Keyword arguments to be passed to the httpx request method.
+
+        Returns:
+            :obj:`requests.Response`
+        """
+        return await self._request(HTTPVerb.HTTP_PATCH.value, path, **kwargs)
+
+    async def put(self, path: str, **kwargs: Any) -> Optional[requests.Response]:
+        """
+        Initiates an HTTP PUT request using the specified path. Keyword arguments are
+        passed to :obj:`httpx.AsyncClient.request`.
+
+        Args:
+            path (str):
+                The path to be appended onto the base URL for the request.
+            **kwargs (dict):
+                Keyword arguments to be passed to the httpx request method.
+
+        Returns:
+            :obj:`requests.Response`
+        """
+        return await self._request(HTTPVerb.HTTP_PUT.value, path, **kwargs)
+
+    async def delete(self, path: str) -> Optional[requests.Response]:
+        """
+        Initiates an HTTP DELETE request using the specified path.
+
+        Args:
+            path (str):
+                The path to be appended onto the base URL for the request.
+
+        Returns:
+            :obj:`requests.Response`
+        """
+        return await self._request(HTTPVerb.HTTP_DELETE.value, path)
+
+    ############################################
+    # API Definitions
+    ###########################################
+
+    @property
+    def assets(self):
+        """Assets API"""
+        return AsyncAssetsApi(self)
+
+    @property
+    def owned_ip_ranges(self):
+        """Owned IP Ranges API"""
+        return AsyncOwnedIpRangesApi(self)
+
+    @property
+    def services(self):
+        """Services API"""
+        return AsyncServicesApi(self)
+
+    @property
+    def attack_surface_rules(self):
+        """Attack Surface Rules API"""
+        return AsyncAttackSurfaceRulesApi(self)
+
+    @property
+    def incidents(self):
+        """Incidents API"""
+        return AsyncIncidentsApi(self)
+
+    @property
+    def alerts(self):
+        """Alerts V2 API"""
+        return AsyncAlertsApi(self)
+
+    @property
+    def tags(self):
+        """Tags API"""
+        return AsyncTagsApi(self)
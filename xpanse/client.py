@@ -5,8 +5,9 @@ import platform
 import secrets
 import string
 import sys
+import time
 from datetime import datetime, timezone
-from typing import Any, List, Optional, Union, MutableMapping
+from typing import Any, Dict, Optional, Tuple, Union, MutableMapping
 from urllib.parse import urlparse
 
 import requests
@@ -19,12 +20,25 @@ from xpanse.const import (
     CORTEX_FQDN,
     CORTEX_API_KEY,
     CORTEX_API_KEY_ID,
+    DEFAULT_REQUEST_PAYLOAD_FIELD,
+    HookType,
+    ValidationMode,
 )
 from xpanse.error import (
     XpanseException,
     InvalidApiCredentials,
 )
 
+from xpanse.codec import JsonCodec, decode_response, get_codec
+from xpanse.compression import CompressionConfig, CompressionStats, response_sizes
+from xpanse.hooks import CURRENT_ITERATOR, HookEvent, Hooks
+from xpanse.httpx_compat import HTTPX_TRANSPORT_ERRORS
+from xpanse.pool import PoolConfig
+from xpanse.ratelimit import RateLimiter
+from xpanse.metrics import MetricsRegistry, response_bytes
+from xpanse.retry import RetryPolicy
+from xpanse.transport import HttpxTransport, RequestsTransport, Transport
+from xpanse.validation import ValidationCache
 from xpanse.utils import normalize_param_names
 from xpanse.api.asset_management import ServicesApi, OwnedIpRangesApi, AssetsApi
 from xpanse.api.attack_surface_rules import AttackSurfaceRulesApi
@@ -32,39 +46,11 @@ from xpanse.api.incident_management import AlertsApi, IncidentsApi
 from xpanse.api.tags import TagsApi
 
 
-class XpanseClient:
+class BaseXpanseClient:
     """
-    Interface for Cortex Xpanse APIs.
-
-    Args:
-        url (str, required):
-            The base URL that the paths will be appended onto. This field is required to be set either during
-            instantiation, or using the environment variable `CORTEX_FQDN`.
-        api_key_id (Union[str, int], required):
-            The API Key ID associated with the generated credentials. This can be located after generating
-            the credentials in the API Keys table under the 'ID' column. i.e. 1, 2, 3, etc. This field is required
-            to be set either during instantiation, or using the environment variable `CORTEX_API_KEY_ID`.
-        api_key (str, required):
-            The API Key generated when provisioning the credentials in your product. It is recommended that
-            the API Key defaults are kept (i.e. using Advanced keys). This field is required to be set either during
-            instantiation, or using the environment variable `CORTEX_API_KEY`.
-        use_advanced_auth (bool, optional):
-            A flag used to determine which type of API Key is being used. 'Advanced' is used when True,
-            'Standard' is used when False. This is configured when generating your API Keys is in the product.
-            The default is True.
-            See: https://docs-cortex.paloaltonetworks.com/r/Cortex-XPANSE/Cortex-Xpanse-API-Reference/Get-Started-with-APIs
-        custom_ua (str, optional):
-            A custom string can be provided that will be sent within the user-agent header on all
-            requests to Xpanse. Final format will be `Xpanse SDK+<custom_ua>/__version__ ...`
-        proxies (MutableMapping[str, str], optional):
-            A dictionary detailing what proxy should be used for what transport protocol.
-            This value will be passed to the session object after it has been either attached or
-            created. For details on the structure of this dictionary, consult the
-            :requests:`proxies <user/advanced/#proxies>` section of the Requests documentation.
-        verify (bool, optional):
-            Whether or not SSL verification should occur. This is `True` by default. Disabling certificate
-            verification is strongly discouraged.
-            See: https://urllib3.readthedocs.io/en/latest/advanced-usage.html#ssl-warnings InsecureRequestWarning
+    Configuration and request signing shared by the :class:`XpanseClient` and the
+    :class:`xpanse.async_client.AsyncXpanseClient`.
+    See :class:`XpanseClient` for a description of the constructor arguments.
     """
 
     """Xpanse URL - Default is set by the CORTEX_FQDN_URL environment variable"""
@@ -87,11 +73,41 @@ class XpanseClient:
     """Verify SSL"""
     _verify = True
 
-    """Max Retry Count"""
-    _max_retries: int = 1
+    """Retry Policy"""
+    _retry_policy: RetryPolicy
+
+    """Optional Client-Side Rate Limiter"""
+    _rate_limiter: Optional[RateLimiter] = None
+
+    """Connection Pool Settings"""
+    _pool_config: PoolConfig
+
+    """When the API Keys are Validated"""
+    _validation_mode: ValidationMode = ValidationMode.EAGER
+
+    """Optional Cache of Successful Validations"""
+    _validation_cache: Optional[ValidationCache] = None
+
+    """True Until the First Response Validates the API Keys in Lazy Mode"""
+    _pending_validation: bool = False
+
+    """JSON Codec for Request and Response Bodies"""
+    _json_codec: JsonCodec
+
+    """Content Encoding Settings"""
+    _compression: CompressionConfig
 
-    """Error Codes to Retry"""
-    _retry_error_codes: List[int] = [503]
+    """Bytes Sent and Received Before and After Compression"""
+    _compression_stats: CompressionStats
+
+    """Negotiates HTTP/2 Through `httpx` When True"""
+    _http2: bool = False
+
+    """Request, Retry and Paging Metrics by Endpoint Path"""
+    _metrics: MetricsRegistry
+
+    """Optional Request and Iterator Lifecycle Hooks"""
+    _hooks: Optional[Hooks] = None
 
     """Vendor Name for UA"""
     _vendor: str = "Xpanse"
@@ -108,9 +124,6 @@ class XpanseClient:
     """OS for UA"""
     _os: str = "unknown"
 
-    """Active Session"""
-    _session: requests.Session = requests.Session()
-
     """Class Methods"""
 
     def __init__(
@@ -122,6 +135,16 @@ class XpanseClient:
         custom_ua: Optional[str] = None,
         proxies: Optional[MutableMapping[str, str]] = None,
         verify: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_config: Optional[PoolConfig] = None,
+        validate: Union[str, ValidationMode] = ValidationMode.EAGER,
+        validation_cache: Optional[ValidationCache] = None,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        compression: Optional[CompressionConfig] = None,
+        http2: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[Hooks] = None,
     ):
         # Format logger
         self._log = logging.getLogger(
@@ -163,6 +186,27 @@ class XpanseClient:
         if isinstance(verify, bool):
             self._verify = verify
 
+        # Each client gets its own retry budget unless a policy is shared explicitly
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._rate_limiter = rate_limiter
+        self._pool_config = pool_config if pool_config is not None else PoolConfig()
+
+        self._validation_mode = ValidationMode(validate)
+        self._validation_cache = validation_cache
+
+        self._json_codec = get_codec(json_codec)
+
+        self._compression = (
+            compression if compression is not None else CompressionConfig()
+        )
+        self._compression_stats = CompressionStats()
+
+        self._http2 = http2
+
+        # Each client records its own metrics unless a registry is shared explicitly
+        self._metrics = metrics if metrics is not None else MetricsRegistry()
+        self._hooks = hooks
+
         if isinstance(use_advanced_auth, bool):
             self._use_advanced_auth = use_advanced_auth
         if not self._use_advanced_auth:
@@ -208,28 +252,261 @@ class XpanseClient:
                 "'CORTEX_API_KEY_ID' environment variable."
             )
 
-        self._create_session()
+    def _invalid_credentials(self) -> InvalidApiCredentials:
+        """
+        Builds the error raised when the API Keys fail validation.
+        """
+        key_type = "Advanced" if self._use_advanced_auth else "Standard"
+        return InvalidApiCredentials(
+            "Failed to authenticate with the provided 'api_key' and 'api_key_id' using "
+            f"'{key_type}' authentication."
+        )
+
+    def _is_validation_cached(self) -> bool:
+        """
+        Whether the API Keys were successfully validated within the validation cache TTL.
+        """
+        return self._validation_cache is not None and self._validation_cache.is_valid(
+            self._validation_cache_key()
+        )
 
-        if not self._validate_auth():
-            key_type = "Advanced" if self._use_advanced_auth else "Standard"
-            raise InvalidApiCredentials(
-                "Failed to authenticate with the provided 'api_key' and 'api_key_id' using "
-                f"'{key_type}' authentication."
+    def _record_validation(self):
+        """
+        Records a successful validation in the validation cache, if any.
+        """
+        if self._validation_cache is not None:
+            self._validation_cache.store(self._validation_cache_key())
+
+    def _validation_cache_key(self) -> str:
+        """
+        Returns the validation cache key of the client's credentials.
+        """
+        return ValidationCache.key(
+            self._url, self._api_key_id, self._api_key, self._use_advanced_auth
+        )
+
+    def _complete_lazy_validation(self, response: Optional[requests.Response]):
+        """
+        In lazy mode, uses the first response as the validation result.
+
+        Raises:
+            :obj:`InvalidApiCredentials`: When the first response is a 401.
+        """
+        if not self._pending_validation or response is None:
+            return
+
+        if response.status_code == 401:
+            raise self._invalid_credentials()
+
+        if response.status_code < 400:
+            self._pending_validation = False
+            self._record_validation()
+
+    def _encode_json_body(
+        self, kwargs: Dict[str, Any], headers: Dict[str, str]
+    ) -> Dict[str, str]:
+        """
+        Encodes the `json` request kwarg with the client's JSON codec into the `data` kwarg.
+
+        Returns:
+            :dict: The request headers, with the JSON content type when a body was encoded.
+        """
+        if kwargs.get(DEFAULT_REQUEST_PAYLOAD_FIELD) is None:
+            kwargs.pop(DEFAULT_REQUEST_PAYLOAD_FIELD, None)
+            return headers
+
+        kwargs["data"] = self._json_codec.dumps(
+            kwargs.pop(DEFAULT_REQUEST_PAYLOAD_FIELD)
+        )
+        return {"Content-Type": "application/json", **headers}
+
+    def _compress_body(
+        self, kwargs: Dict[str, Any], headers: Dict[str, str]
+    ) -> Dict[str, str]:
+        """
+        Gzips a `bytes` request body above the compression threshold.
+
+        Returns:
+            :dict: The request headers, with the content encoding when the body was compressed.
+        """
+        body = kwargs.get("data")
+        if not isinstance(body, bytes) or "Content-Encoding" in headers:
+            return headers
+
+        compressed = self._compression.compress(body)
+        if compressed is None:
+            return headers
+
+        kwargs["data"] = compressed
+        self._compression_stats.record_request(len(body), len(compressed))
+        return {**headers, "Content-Encoding": "gzip"}
+
+    def _prepare_request(
+        self, path: str, kwargs: Dict[str, Any]
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Encodes and compresses the body of a request, once for all of its attempts, and records
+        its size before and after compression.
+
+        Returns:
+            :obj:`Tuple[Dict[str, str], Dict[str, Any]]`: The request headers, without the auth
+            headers of each attempt, and the request kwargs.
+        """
+        headers: Dict[str, str] = kwargs.pop("headers", None) or {}
+        headers = self._encode_json_body(kwargs, headers)
+        body = kwargs.get("data")
+        headers = self._compress_body(kwargs, headers)
+        if isinstance(body, bytes):
+            self._metrics.record_request_body(path, len(body), len(kwargs["data"]))
+        return headers, normalize_param_names(kwargs)
+
+    def _before_attempt(
+        self, method: str, path: str, kwargs: Dict[str, Any], attempt: int
+    ) -> Optional[HookEvent]:
+        """
+        Logs a request attempt and runs its `BEFORE_REQUEST` hooks.
+
+        Returns:
+            :obj:`HookEvent`: The event of the attempt, or None when the client has no hooks.
+        """
+        self._log.debug(
+            f"REQUEST TO: {method} {self._url}/{path} WITH PAYLOAD: {kwargs}"
+        )
+        if self._hooks is None:
+            return None
+
+        body = kwargs.get("data", kwargs.get("content"))
+        event = HookEvent(
+            HookType.BEFORE_REQUEST,
+            method,
+            path,
+            payload_bytes=len(body) if isinstance(body, (bytes, str)) else 0,
+            attempt=attempt + 1,
+            iterator=CURRENT_ITERATOR.get(),
+        )
+        self._hooks.emit(event)
+        return event
+
+    def _after_attempt(
+        self,
+        event: Optional[HookEvent],
+        elapsed: float,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        delay: Optional[float] = None,
+    ):
+        """
+        Runs the `AFTER_RESPONSE` hooks of a request attempt, then its `ON_RETRY` hooks when
+        the attempt is retried after `delay` seconds.
+        """
+        if event is None or self._hooks is None:
+            return
+
+        response = event.replace(
+            HookType.AFTER_RESPONSE,
+            elapsed=elapsed,
+            status=status,
+            error=error,
+            delay=delay,
+        )
+        self._hooks.emit(response)
+        if delay is not None:
+            self._hooks.emit(response.replace(HookType.ON_RETRY))
+
+    def _on_response(
+        self,
+        method: str,
+        path: str,
+        attempt: int,
+        event: Optional[HookEvent],
+        resp: Any,
+        elapsed: float,
+        body_bytes: int,
+        decoded_bytes: Optional[int],
+    ) -> Optional[float]:
+        """
+        Records the response of an attempt in the metrics and hooks, and decides whether it is retried.
+
+        Args:
+            resp (Any):
+                The `requests` or `httpx` response of the attempt.
+            body_bytes (int):
+                The size of the response body, as read from the network.
+            decoded_bytes (int, optional):
+                The size of the response body after decompression, or None when it is streamed.
+
+        Returns:
+            :obj:`float`: The seconds to wait before retrying, or None when the response is returned.
+        """
+        status = resp.status_code
+        self._metrics.record_request(path, status, elapsed, body_bytes, decoded_bytes)
+        if status < 400:
+            self._after_attempt(event, elapsed, status=status)
+            return None
+
+        if self._retry_policy.is_retryable(status) and self._retry_policy.allow_retry(
+            attempt
+        ):
+            self._metrics.record_retry(path)
+            delay = self._retry_policy.delay(attempt, resp.headers)
+            self._after_attempt(event, elapsed, status=status, delay=delay)
+            self._log.warning(
+                f"Retrying {method} {path} after {status} response in {delay:.2f}s"
             )
+            return delay
 
-    def _validate_auth(self) -> bool:
+        self._after_attempt(event, elapsed, status=status)
+        self._log.error(f"Error response: {resp.text}")
+        return None
+
+    def _on_transport_error(
+        self,
+        path: str,
+        attempt: int,
+        event: Optional[HookEvent],
+        elapsed: float,
+        err: BaseException,
+    ) -> Optional[float]:
         """
-        Validates the provided API Keys
+        Records a connection error of an attempt in the metrics and hooks, and decides whether it is
+        retried.
 
         Returns:
-            :bool: True when the keys are valid, False when the keys are invalid or expired.
+            :obj:`float`: The seconds to wait before retrying, or None when the request fails.
         """
-        res = self.post("api_keys/validate/")
+        self._log.error(err)
+        self._metrics.record_request(path, None, elapsed)
+        if not self._retry_policy.allow_retry(attempt):
+            self._after_attempt(event, elapsed, error=err)
+            return None
+
+        self._metrics.record_retry(path)
+        delay = self._retry_policy.delay(attempt)
+        self._after_attempt(event, elapsed, error=err, delay=delay)
+        return delay
+
+    def _on_client_error(
+        self, event: Optional[HookEvent], elapsed: float, err: XpanseException
+    ):
+        """
+        Records an attempt that failed before a response, such as a rate limiter timeout
+        """
+        self._log.error(err)
+        self._after_attempt(event, elapsed, error=err)
 
-        if res is None or res.status_code == 401:
-            return False
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """
+        Returns the bytes sent and received by the client, before and after compression.
+        """
+        return self._compression_stats
 
-        return res.json()
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """
+        Returns the request, retry and paging metrics of the client, by endpoint path.
+        """
+        return self._metrics
 
     def _get_auth_headers(self) -> dict:
         """
@@ -266,27 +543,6 @@ class XpanseClient:
                 "Authorization": self._api_key,
             }
 
-    def _refresh_auth(self):
-        """
-        Refresh auth in session.
-        """
-        self._session.headers.pop("x-xdr-timestamp", None)
-        self._session.headers.pop("x-xdr-nonce", None)
-        self._session.headers.update(self._get_auth_headers())
-
-    def _create_session(self):
-        """
-        Creates a request session with auth.
-        """
-        self._session = requests.Session()
-
-        if self._proxies is not None:
-            self._session.proxies.update(self._proxies)
-
-        self._session.verify = self._verify
-
-        self._session.headers.update(self._get_auth_headers())
-
     def _set_current_python_version(self):
         """
         Get current installed python version.
@@ -305,42 +561,279 @@ class XpanseClient:
         """
         return f"{self._product}/{__version__} ({self._os}) Python/{self._python_version} {self._vendor}"
 
+
+class XpanseClient(BaseXpanseClient):
+    """
+    Interface for Cortex Xpanse APIs.
+
+    The client is safe to share between threads, for example by the workers of a
+    `ThreadPoolExecutor`. Every request is signed with its own nonce and timestamp, and the
+    pooled session, retry budget and rate limiter are shared by all threads.
+
+    Args:
+        url (str, required):
+            The base URL that the paths will be appended onto. This field is required to be set either during
+            instantiation, or using the environment variable `CORTEX_FQDN`.
+        api_key_id (Union[str, int], required):
+            The API Key ID associated with the generated credentials. This can be located after generating
+            the credentials in the API Keys table under the 'ID' column. i.e. 1, 2, 3, etc. This field is required
+            to be set either during instantiation, or using the environment variable `CORTEX_API_KEY_ID`.
+        api_key (str, required):
+            The API Key generated when provisioning the credentials in your product. It is recommended that
+            the API Key defaults are kept (i.e. using Advanced keys). This field is required to be set either during
+            instantiation, or using the environment variable `CORTEX_API_KEY`.
+        use_advanced_auth (bool, optional):
+            A flag used to determine which type of API Key is being used. 'Advanced' is used when True,
+            'Standard' is used when False. This is configured when generating your API Keys is in the product.
+            The default is True.
+            See: https://docs-cortex.paloaltonetworks.com/r/Cortex-XPANSE/Cortex-Xpanse-API-Reference/Get-Started-with-APIs
+        custom_ua (str, optional):
+            A custom string can be provided that will be sent within the user-agent header on all
+            requests to Xpanse. Final format will be `Xpanse SDK+<custom_ua>/__version__ ...`
+        proxies (MutableMapping[str, str], optional):
+            A dictionary detailing what proxy should be used for what transport protocol.
+            This value will be passed to the session object after it has been either attached or
+            created. For details on the structure of this dictionary, consult the
+            :requests:`proxies <user/advanced/#proxies>` section of the Requests documentation.
+        verify (bool, optional):
+            Whether or not SSL verification should occur. This is `True` by default. Disabling certificate
+            verification is strongly discouraged.
+            See: https://urllib3.readthedocs.io/en/latest/advanced-usage.html#ssl-warnings InsecureRequestWarning
+        retry_policy (RetryPolicy, optional):
+            Controls which failed requests are retried and the backoff between retries. By default,
+            429, 502, 503 and 504 responses and connection errors are retried up to 3 times with
+            exponential backoff and full jitter, honoring `Retry-After`. See :class:`xpanse.retry.RetryPolicy`.
+        rate_limiter (RateLimiter, optional):
+            Paces outgoing requests, including retries, to stay under the tenant quota. The same limiter
+            can be shared by several clients and threads. No limit is applied by default.
+            See :class:`xpanse.ratelimit.RateLimiter`.
+        pool_config (PoolConfig, optional):
+            Connection pool size, blocking, TCP keep-alive and warm-up settings. Raise `pool_maxsize` when
+            sharing the client between more than 10 threads. See :class:`xpanse.pool.PoolConfig`.
+        validate (Union[str, ValidationMode], optional):
+            When the API Keys are validated. "eager" (the default) validates them when the client is
+            created. "lazy" raises :obj:`InvalidApiCredentials` if the first request returns a 401.
+            "never" does not validate the keys.
+        validation_cache (ValidationCache, optional):
+            Caches successful validations on disk for a TTL. See :class:`xpanse.validation.ValidationCache`.
+        json_codec (Union[str, JsonCodec], optional):
+            The JSON codec used to encode request bodies and decode responses. By default, the fastest
+            installed codec is used. See :func:`xpanse.codec.get_codec`.
+        compression (CompressionConfig, optional):
+            Response and request body compression settings. By default, gzip and deflate responses, and
+            brotli responses when `brotli` is installed, are accepted and request bodies are not compressed.
+            See :class:`xpanse.compression.CompressionConfig`.
+        http2 (bool, optional):
+            Whether to send requests through an `httpx` HTTP/2 session instead of `requests`, so that
+            concurrent requests from many threads are multiplexed over one connection. Responses are
+            still returned as `requests.Response` objects. `PoolConfig.warm_up` is not supported.
+            Requires `pip install xpanse[http2]`. Defaults to False.
+        metrics (MetricsRegistry, optional):
+            Records the request count, latency histogram, response bytes, status codes, retries and
+            iterator pages of each endpoint path, read with `client.metrics.snapshot()` or exported with
+            `client.metrics.to_prometheus()`. The same registry can be shared by several clients.
+            Each client has its own registry by default. See :class:`xpanse.metrics.MetricsRegistry`.
+        hooks (Hooks, optional):
+            Callbacks run before each request attempt, after each response, before each retry, and when
+            a result iterator starts, reads a page and ends, for tracing and profiling. See
+            :class:`xpanse.hooks.Hooks` and :class:`xpanse.otel.OpenTelemetryHooks`.
+        transport (Transport, optional):
+            Sends each request attempt. By default, a :class:`xpanse.transport.RequestsTransport` or,
+            with `http2`, an :class:`xpanse.transport.HttpxTransport` is created from the options above.
+            A given transport is used as is, so `proxies`, `verify`, `pool_config`, `http2` and the
+            `Accept-Encoding` are not applied to it. Use an :class:`xpanse.transport.InMemoryTransport`
+            to run without a network.
+    """
+
+    """Sends Each Request Attempt - Holds the connection pool, and never the per-request auth headers"""
+    _transport: Transport
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key_id: Optional[Union[str, int]] = None,
+        api_key: Optional[str] = None,
+        use_advanced_auth: bool = True,
+        custom_ua: Optional[str] = None,
+        proxies: Optional[MutableMapping[str, str]] = None,
+        verify: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_config: Optional[PoolConfig] = None,
+        validate: Union[str, ValidationMode] = ValidationMode.EAGER,
+        validation_cache: Optional[ValidationCache] = None,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        compression: Optional[CompressionConfig] = None,
+        http2: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[Hooks] = None,
+        transport: Optional[Transport] = None,
+    ):
+        # Set before the parent constructor, which creates the transport and validates the keys
+        self._custom_transport = transport
+
+        super().__init__(
+            url=url,
+            api_key_id=api_key_id,
+            api_key=api_key,
+            use_advanced_auth=use_advanced_auth,
+            custom_ua=custom_ua,
+            proxies=proxies,
+            verify=verify,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            pool_config=pool_config,
+            validate=validate,
+            validation_cache=validation_cache,
+            json_codec=json_codec,
+            compression=compression,
+            http2=http2,
+            metrics=metrics,
+            hooks=hooks,
+        )
+
+    def _setup_auth(
+        self, api_key: Optional[str], api_key_id: Optional[Union[str, int]]
+    ):
+        """
+        Resolves the API Keys, creates the transport and validates the keys, unless the
+        validation is lazy, disabled or cached.
+
+        Args:
+            api_key (str, Optional):
+                The api_key provided from the constructor
+            api_key_id (str, Optional):
+                The api_key_id provided from the constructor
+        """
+        super()._setup_auth(api_key=api_key, api_key_id=api_key_id)
+
+        self._create_transport()
+
+        if (
+            self._validation_mode == ValidationMode.NEVER
+            or self._is_validation_cached()
+        ):
+            return
+
+        if self._validation_mode == ValidationMode.LAZY:
+            self._pending_validation = True
+            return
+
+        if not self._validate_auth():
+            raise self._invalid_credentials()
+        self._record_validation()
+
+    def _validate_auth(self) -> bool:
+        """
+        Validates the provided API Keys
+
+        Returns:
+            :bool: True when the keys are valid, False when the keys are invalid or expired.
+        """
+        res = self.post("api_keys/validate/")
+
+        if res is None or res.status_code == 401:
+            return False
+
+        return decode_response(res, self._json_codec)
+
+    def _create_transport(self):
+        """
+        Creates the transport, unless one was given. Auth headers are signed per request in
+        :meth:`_send`, so the transport is never modified after it is created.
+        """
+        if self._custom_transport is not None:
+            self._transport = self._custom_transport
+        elif self._http2:
+            self._transport = HttpxTransport(
+                pool_config=self._pool_config,
+                proxies=self._proxies,
+                verify=self._verify,
+                compression=self._compression,
+            )
+        else:
+            self._transport = RequestsTransport(
+                pool_config=self._pool_config,
+                proxies=self._proxies,
+                verify=self._verify,
+                compression=self._compression,
+                warm_url=self._url,
+            )
+
+        # Response sizes are measured by the transport, on the wire
+        self._compression_stats = self._transport.stats
+
+    def close(self):
+        """
+        Closes the underlying connection pool.
+        """
+        self._transport.close()
+
     def _request(
         self, method: str, path: str, **kwargs: Any
     ) -> Optional[requests.Response]:
         """
-        Request builder.
+        Request builder. Completes lazy validation with the response.
         """
-        retries = 0
-        while retries <= self._max_retries:
-            try:
-                if self._use_advanced_auth:
-                    self._refresh_auth()
+        response = self._send(method, path, **kwargs)
+        self._complete_lazy_validation(response)
+        return response
+
+    def _send(
+        self, method: str, path: str, **kwargs: Any
+    ) -> Optional[requests.Response]:
+        """
+        Sends a request, retrying it according to the retry policy. Every attempt is signed with its
+        own auth headers, which are passed with the request rather than stored on the shared transport.
+        """
+        headers, kwargs = self._prepare_request(path, kwargs)
 
-                kwargs = normalize_param_names(kwargs)
-                self._log.debug(
-                    f"REQUEST TO: {method} {self._url}/{path} WITH PAYLOAD: {kwargs}"
+        attempt = 0
+        self._retry_policy.on_request()
+        while True:
+            start = time.perf_counter()
+            event = None
+            try:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire(path)
+
+                event = self._before_attempt(method, path, kwargs, attempt)
+                start = time.perf_counter()
+                resp = self._transport.request(
+                    method,
+                    f"{self._url}/{path}",
+                    headers={**headers, **self._get_auth_headers()},
+                    **kwargs,
                 )
-                resp = self._session.request(method, f"{self._url}/{path}", **kwargs)
-                if resp.status_code < 400:
+                elapsed = time.perf_counter() - start
+                sizes = response_sizes(resp)
+                delay = self._on_response(
+                    method,
+                    path,
+                    attempt,
+                    event,
+                    resp,
+                    elapsed,
+                    response_bytes(resp),
+                    sizes[1] if sizes is not None else None,
+                )
+                if delay is None:
                     return resp
-                else:
-                    if resp.status_code in self._retry_error_codes:
-                        retries += 1
-                        continue
-                    else:
-                        self._log.error(f"Error response: {resp.text}")
-                        return resp
             except (
                 ConnectionError,
                 NewConnectionError,
-            ) as err:
-                self._log.error(err)
-                retries += 1
-                continue
+            ) + HTTPX_TRANSPORT_ERRORS as err:
+                delay = self._on_transport_error(
+                    path, attempt, event, time.perf_counter() - start, err
+                )
+                if delay is None:
+                    break
             except XpanseException as err:
-                self._log.error(err)
+                self._on_client_error(event, time.perf_counter() - start, err)
                 break
+
+            attempt += 1
+            time.sleep(delay)
         return None
 
     def get(self, path: str, **kwargs: Any) -> Optional[requests.Response]:
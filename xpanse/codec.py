@@ -0,0 +1,171 @@
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+from requests import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import simdjson  # type: ignore
+except ImportError:  # pragma: no cover
+    simdjson = None  # type: ignore
+
+try:
+    import ujson  # type: ignore
+except ImportError:  # pragma: no cover
+    ujson = None  # type: ignore
+
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes response bodies. The base class uses the standard library
+    `json` module. Subclasses wrap faster parsers, which are picked automatically when installed,
+    see :func:`get_codec`.
+    """
+
+    """Codec Name Used by :func:`get_codec`"""
+    name: str = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes an object to UTF-8 JSON bytes.
+        """
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes JSON bytes or text.
+        """
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec using `orjson`, the fastest encoder and decoder. Install it with `pip install xpanse[fast-json]`.
+    """
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class SimdjsonCodec(JsonCodec):
+    """
+    Codec decoding with `pysimdjson`. It has no encoder, so request bodies use the standard library.
+    """
+
+    name = "simdjson"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return simdjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """
+    Codec using `ujson`.
+    """
+
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return ujson.loads(data)
+
+
+_CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    SimdjsonCodec.name: SimdjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    JsonCodec.name: JsonCodec,
+}
+"""Available Codecs by Name, in Order of Preference"""
+
+_MODULES: Dict[str, Any] = {
+    OrjsonCodec.name: orjson,
+    SimdjsonCodec.name: simdjson,
+    UjsonCodec.name: ujson,
+    JsonCodec.name: json,
+}
+"""Installed Parser Module for Each Codec Name"""
+
+_PACKAGES: Dict[str, str] = {
+    OrjsonCodec.name: "orjson",
+    SimdjsonCodec.name: "pysimdjson",
+    UjsonCodec.name: "ujson",
+}
+"""Package Providing Each Optional Codec"""
+
+
+def available_codecs() -> Dict[str, JsonCodec]:
+    """
+    Returns a codec for every installed parser, in order of preference.
+    """
+    return {
+        name: factory()
+        for name, factory in _CODECS.items()
+        if _MODULES[name] is not None
+    }
+
+
+def get_codec(codec: Optional[Union[str, JsonCodec]] = None) -> JsonCodec:
+    """
+    Resolves the codec of a client.
+
+    Args:
+        codec (Union[str, JsonCodec], optional):
+            A codec instance, the name of a codec ("orjson", "simdjson", "ujson" or "json"), or None
+            or "auto" to pick the fastest installed codec.
+
+    Returns:
+        :obj:`JsonCodec`: The resolved codec.
+
+    Raises:
+        :obj:`ValueError`: When the named codec is unknown or its parser is not installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    if codec is None or codec == "auto":
+        return next(iter(available_codecs().values()))
+
+    if codec not in _CODECS:
+        raise ValueError(
+            f"Unknown JSON codec '{codec}'. Use one of {', '.join(_CODECS)} or 'auto'."
+        )
+
+    if _MODULES[codec] is None:
+        raise ValueError(
+            f"The '{codec}' JSON codec is not installed. Install it with 'pip install {_PACKAGES[codec]}'."
+        )
+
+    return _CODECS[codec]()
+
+
+def codec_of(api: Any) -> Optional[JsonCodec]:
+    """
+    Returns the codec of a client, or None for objects that are not clients.
+    """
+    codec = getattr(api, "_json_codec", None)
+    return codec if isinstance(codec, JsonCodec) else None
+
+
+def decode_response(response: Response, codec: Optional[JsonCodec] = None) -> Any:
+    """
+    Decodes a JSON response body with the codec. Responses are decoded by `requests` when there
+    is no codec, or when the response is not a `requests.Response`.
+    """
+    if codec is None or not isinstance(response, Response):
+        return response.json()
+    return codec.loads(response.content)
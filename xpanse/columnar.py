@@ -0,0 +1,235 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+try:
+    import polars  # type: ignore
+except ImportError:  # pragma: no cover
+    polars = None
+
+from xpanse.codec import JsonCodec, get_codec
+from xpanse.const import FieldType
+from xpanse.schemas import SCHEMAS, SchemaField
+
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+"""Rows Buffered Before Each Parquet Row Group is Written"""
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "Columnar exports require 'pyarrow'. Install it with 'pip install xpanse[arrow]'."
+        )
+
+
+def arrow_type(field_type: FieldType) -> Any:
+    """
+    Returns the Arrow type of a field type. Categories are dictionary-encoded strings, and
+    timestamps are UTC timestamps in milliseconds, as returned by the API.
+    """
+    _require_pyarrow()
+    types: Dict[FieldType, Any] = {
+        FieldType.STRING: pa.string(),
+        FieldType.CATEGORY: pa.dictionary(pa.int32(), pa.string()),
+        FieldType.INTEGER: pa.int64(),
+        FieldType.FLOAT: pa.float64(),
+        FieldType.BOOLEAN: pa.bool_(),
+        FieldType.TIMESTAMP: pa.timestamp("ms", tz="UTC"),
+        FieldType.STRING_LIST: pa.list_(pa.string()),
+        FieldType.INTEGER_LIST: pa.list_(pa.int64()),
+        FieldType.JSON: pa.string(),
+    }
+    return types[field_type]
+
+
+def arrow_schema(fields: Sequence[SchemaField]) -> Any:
+    """
+    Returns the Arrow schema of the fields of a data type, see :mod:`xpanse.schemas`.
+    """
+    _require_pyarrow()
+    return pa.schema(
+        [pa.field(field.name, arrow_type(field.field_type)) for field in fields]
+    )
+
+
+class ArrowBatchBuilder:
+    """
+    Converts pages of results to Arrow record batches, one page at a time, so that a listing is
+    held in columnar memory rather than as a list of dicts. Requires `pip install xpanse[arrow]`.
+
+    Results of the data types in :data:`xpanse.schemas.SCHEMAS` are typed by their schema: fields
+    outside of it are left out and missing fields are null. Other data types are typed from their
+    first page.
+
+    Args:
+        data_key (str, optional):
+            The data key of the list endpoint, i.e. "incidents".
+        codec (JsonCodec, optional):
+            Encodes the values of `json` fields. Defaults to the fastest installed codec.
+
+    Examples:
+        >>> builder = ArrowBatchBuilder("incidents")
+        >>> table = builder.table([builder.batch(page) for page in client.incidents.list()])
+    """
+
+    def __init__(
+        self, data_key: Optional[str] = None, codec: Optional[JsonCodec] = None
+    ):
+        _require_pyarrow()
+        self._fields = SCHEMAS.get(data_key) if data_key is not None else None
+        self._codec = codec or get_codec()
+
+        """Arrow Schema of the Batches, Known Once the First Page is Converted Without a Schema"""
+        self.schema: Any = arrow_schema(self._fields) if self._fields else None
+
+    def batch(self, page: List[Any]) -> Any:
+        """
+        Converts a page of results.
+
+        Returns:
+            :obj:`pyarrow.RecordBatch`: The results, one row each.
+        """
+        if self._fields is None:
+            batch = pa.RecordBatch.from_pylist(page, schema=self.schema)
+            if self.schema is None:
+                self.schema = batch.schema
+            return batch
+
+        return pa.RecordBatch.from_arrays(
+            [
+                self._column(field, [result.get(field.name) for result in page])
+                for field in self._fields
+            ],
+            schema=self.schema,
+        )
+
+    def table(self, batches: List[Any]) -> Any:
+        """
+        Combines record batches into a table, without copying them.
+
+        Returns:
+            :obj:`pyarrow.Table`: The table of the batches.
+        """
+        if self.schema is None:
+            return pa.table({})
+        return pa.Table.from_batches(batches, schema=self.schema)
+
+    def _column(self, field: SchemaField, values: List[Any]) -> Any:
+        field_type = field.field_type
+        if field_type == FieldType.CATEGORY:
+            return pa.array(_strings(values), type=pa.string()).dictionary_encode()
+        if field_type == FieldType.STRING:
+            return pa.array(_strings(values), type=pa.string())
+        if field_type == FieldType.JSON:
+            values = [
+                self._codec.dumps(value).decode("utf-8") if value is not None else None
+                for value in values
+            ]
+        elif field_type == FieldType.STRING_LIST:
+            values = [
+                _strings(_list(value)) if value is not None else None
+                for value in values
+            ]
+        elif field_type == FieldType.INTEGER_LIST:
+            values = [_list(value) if value is not None else None for value in values]
+        return pa.array(values, type=arrow_type(field_type))
+
+
+def _strings(values: List[Any]) -> List[Optional[str]]:
+    return [
+        value if value is None or isinstance(value, str) else str(value)
+        for value in values
+    ]
+
+
+def _list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+class ParquetBatchWriter:
+    """
+    Writes Arrow record batches to a Parquet file, buffering them into row groups of at least
+    `row_group_size` rows so that downstream scans are not slowed down by tiny row groups.
+
+    Args:
+        path (str):
+            The file to write.
+        builder (ArrowBatchBuilder):
+            The builder of the batches, which holds their schema.
+        compression (str, optional):
+            The Parquet compression codec, i.e. "zstd", "gzip", "snappy" or "none". Defaults to "zstd".
+        compression_level (int, optional):
+            The level of the compression codec. Defaults to the codec default.
+        row_group_size (int, optional):
+            Rows buffered before each row group is written. Defaults to 65,536.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        builder: ArrowBatchBuilder,
+        compression: str = "zstd",
+        compression_level: Optional[int] = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ):
+        _require_pyarrow()
+        if row_group_size < 1:
+            raise ValueError(
+                f"'row_group_size' must be a positive integer. f{row_group_size} > 0."
+            )
+
+        self._path = path
+        self._builder = builder
+        self._compression = compression
+        self._compression_level = compression_level
+        self._row_group_size = row_group_size
+        self._writer: Any = None
+        self._pending: List[Any] = []
+        self._pending_rows = 0
+
+    def write(self, batch: Any):
+        """
+        Buffers a batch, writing a row group once `row_group_size` rows are buffered.
+        """
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        if self._pending_rows >= self._row_group_size:
+            self._flush()
+
+    def close(self):
+        """
+        Writes the buffered rows and closes the file.
+        """
+        if self._pending or self._writer is None:
+            self._flush()
+        self._writer.close()
+
+    def _flush(self):
+        table = self._builder.table(self._pending)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self._path,
+                table.schema,
+                compression=self._compression,
+                compression_level=self._compression_level,
+            )
+        if self._pending:
+            self._writer.write_table(table, row_group_size=max(1, table.num_rows))
+        self._pending = []
+        self._pending_rows = 0
+
+
+def to_polars(table: Any) -> Any:
+    """
+    Converts an Arrow table to a polars DataFrame, without copying its columns.
+    """
+    if polars is None:
+        raise ImportError(
+            "Converting results to a polars DataFrame requires 'polars'. Install it with 'pip install polars'."
+        )
+    return polars.from_arrow(table)
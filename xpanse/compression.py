@@ -0,0 +1,187 @@
+import gzip
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from requests import Response
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        import brotlicffi as brotli  # type: ignore
+    except ImportError:
+        brotli = None
+
+DEFAULT_REQUEST_COMPRESSION_LEVEL = 6
+"""Gzip Level Used for Request Bodies, Trading Speed for Size"""
+
+
+class CompressionConfig:
+    """
+    Content encoding settings of a client.
+
+    Responses are always negotiated with `Accept-Encoding: gzip, deflate`, plus `br` when the
+    `brotli` package is installed, and are decoded transparently. Request bodies are sent
+    uncompressed unless `request_threshold` is set, since large filter payloads, such as tag
+    lookups with thousands of `asm_id_list` values, are the only bodies worth compressing.
+
+    Args:
+        accept_encoding (bool, optional):
+            Whether to ask for compressed responses. Defaults to True.
+        request_threshold (int, optional):
+            Request bodies of at least this many bytes are gzipped and sent with
+            `Content-Encoding: gzip`. Disabled by default.
+        level (int, optional):
+            The gzip level of request bodies, from 1 (fastest) to 9 (smallest). Defaults to 6.
+
+    Examples:
+        >>> # Gzip request bodies over 16 KiB:
+        >>> client = XpanseClient(compression=CompressionConfig(request_threshold=16 * 1024))
+    """
+
+    def __init__(
+        self,
+        accept_encoding: bool = True,
+        request_threshold: Optional[int] = None,
+        level: int = DEFAULT_REQUEST_COMPRESSION_LEVEL,
+    ):
+        if request_threshold is not None and request_threshold <= 0:
+            raise ValueError(
+                f"'request_threshold' must be a positive integer. f{request_threshold} > 0."
+            )
+
+        if not 1 <= level <= 9:
+            raise ValueError(
+                f"'level' must be an integer from 1 to 9. 1 <= f{level} <= 9."
+            )
+
+        self.accept_encoding = accept_encoding
+        self.request_threshold = request_threshold
+        self.level = level
+
+    def accept_encoding_header(self) -> str:
+        """
+        Returns the `Accept-Encoding` header sent with every request.
+        """
+        if not self.accept_encoding:
+            return "identity"
+        return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """
+        Gzips a request body above the threshold.
+
+        Returns:
+            :obj:`bytes`: The compressed body, or None when the body is sent as is.
+        """
+        if self.request_threshold is None or len(body) < self.request_threshold:
+            return None
+
+        compressed = gzip.compress(body, compresslevel=self.level)
+        # Incompressible bodies are sent as is
+        return compressed if len(compressed) < len(body) else None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(accept_encoding={self.accept_encoding}, "
+            f"request_threshold={self.request_threshold}, level={self.level})"
+        )
+
+
+class CompressionStats:
+    """
+    Bytes sent and received by a client, before and after compression. Safe to update from
+    several threads.
+
+    Examples:
+        >>> client.compression_stats.response_ratio
+        9.7
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.response_wire_bytes = 0
+        self.response_bytes = 0
+        self.compressed_requests = 0
+        self.request_wire_bytes = 0
+        self.request_bytes = 0
+
+    def record_response(self, wire_bytes: int, decoded_bytes: int):
+        """
+        Records the size of a response body as received and once decoded.
+        """
+        with self._lock:
+            self.responses += 1
+            self.response_wire_bytes += wire_bytes
+            self.response_bytes += decoded_bytes
+
+    def record_request(self, body_bytes: int, wire_bytes: int):
+        """
+        Records the size of a compressed request body before and after compression.
+        """
+        with self._lock:
+            self.compressed_requests += 1
+            self.request_bytes += body_bytes
+            self.request_wire_bytes += wire_bytes
+
+    @property
+    def response_ratio(self) -> float:
+        """
+        Decoded response bytes per byte received. 1.0 until a response is recorded.
+        """
+        with self._lock:
+            return _ratio(self.response_bytes, self.response_wire_bytes)
+
+    @property
+    def request_ratio(self) -> float:
+        """
+        Compressed request body bytes per byte sent. 1.0 until a body is compressed.
+        """
+        with self._lock:
+            return _ratio(self.request_bytes, self.request_wire_bytes)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a consistent copy of the counters and ratios.
+        """
+        with self._lock:
+            return {
+                "responses": self.responses,
+                "response_wire_bytes": self.response_wire_bytes,
+                "response_bytes": self.response_bytes,
+                "response_ratio": _ratio(self.response_bytes, self.response_wire_bytes),
+                "compressed_requests": self.compressed_requests,
+                "request_wire_bytes": self.request_wire_bytes,
+                "request_bytes": self.request_bytes,
+                "request_ratio": _ratio(self.request_bytes, self.request_wire_bytes),
+            }
+
+
+def _ratio(decoded: int, wire: int) -> float:
+    return decoded / wire if wire else 1.0
+
+
+def response_sizes(response: Any) -> Optional[Tuple[int, int]]:
+    """
+    Returns the received and decoded sizes of a `requests.Response` body, or None when the body
+    has not been read, as with `stream=True`.
+    """
+    if not isinstance(response, Response) or not response._content_consumed:  # type: ignore
+        return None
+
+    decoded = len(response.content or b"")
+    wire = None
+    # urllib3 counts the bytes read from the socket, before decoding
+    tell = getattr(response.raw, "tell", None)
+    if callable(tell):
+        try:
+            wire = tell()
+        except (OSError, ValueError):
+            wire = None
+    if not isinstance(wire, int) or wire <= 0:
+        try:
+            wire = int(response.headers.get("Content-Length", decoded))
+        except ValueError:
+            wire = decoded
+    return wire, decoded
@@ -85,6 +85,98 @@ class SortOrder(Enum):
     """Descending"""
 
 
+class ValidationMode(Enum):
+    """Enum for API Key Validation Modes"""
+
+    EAGER = "eager"
+    """Validate When the Client is Created"""
+
+    LAZY = "lazy"
+    """Validate With the First Request - A 401 Response Raises InvalidApiCredentials"""
+
+    NEVER = "never"
+    """Never Validate"""
+
+
+class HookType(Enum):
+    """Enum for Request and Iterator Lifecycle Events"""
+
+    BEFORE_REQUEST = "before_request"
+    """Before Each Request Attempt is Sent"""
+
+    AFTER_RESPONSE = "after_response"
+    """After Each Request Attempt Receives a Response or Fails"""
+
+    ON_RETRY = "on_retry"
+    """Before Waiting to Retry a Request Attempt"""
+
+    ON_PAGE = "on_page"
+    """After a Result Iterator Reads a Page"""
+
+    ITERATOR_START = "iterator_start"
+    """Before a Result Iterator Requests its First Page"""
+
+    ITERATOR_END = "iterator_end"
+    """When a Result Iterator is Exhausted or Closed"""
+
+
+class ExportFormat(Enum):
+    """Enum for Export File Formats"""
+
+    NDJSON = "ndjson"
+    """Newline-Delimited JSON, One Record per Line"""
+
+    CSV = "csv"
+    """Comma-Separated Values With a Header Row, Nested Values Encoded as JSON"""
+
+    PARQUET = "parquet"
+    """Columnar Parquet, Typed by the Schema of the Data Type - Requires `pip install xpanse[arrow]`"""
+
+
+class ExportCompression(Enum):
+    """Enum for Export File Compression"""
+
+    NONE = "none"
+    """Uncompressed"""
+
+    GZIP = "gzip"
+    """Gzip"""
+
+    ZSTD = "zstd"
+    """Zstandard - Requires `pip install xpanse[zstd]`"""
+
+
+class FieldType(Enum):
+    """Enum for the Value Types of Result Fields"""
+
+    STRING = "string"
+    """Text"""
+
+    CATEGORY = "category"
+    """Text With Few Distinct Values, Dictionary-Encoded in Columnar Exports"""
+
+    INTEGER = "integer"
+    """64-Bit Integer"""
+
+    FLOAT = "float"
+    """64-Bit Floating Point Number"""
+
+    BOOLEAN = "boolean"
+    """True or False"""
+
+    TIMESTAMP = "timestamp"
+    """Epoch Milliseconds, Typed as a UTC Timestamp in Columnar Exports"""
+
+    STRING_LIST = "string_list"
+    """List of Text"""
+
+    INTEGER_LIST = "integer_list"
+    """List of 64-Bit Integers"""
+
+    JSON = "json"
+    """Nested Objects, Kept as JSON Text in Columnar Exports"""
+
+
 class PublicApiFields:
     """Keys for PAPI Requests and Responses"""
 
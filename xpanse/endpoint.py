@@ -1,6 +1,10 @@
-from typing import Optional
+import abc
+from typing import Any, AsyncIterator, Iterator, Optional
 
+from xpanse.codec import codec_of
 from xpanse.const import PublicApiFields
+from xpanse.iterator import XpanseResultIterator, AsyncXpanseResultIterator
+from xpanse.partition import TimeWindowScan, AsyncTimeWindowScan
 from xpanse.response import XpanseResponse
 from xpanse.types import RequestData
 from xpanse.utils import build_request_payload
@@ -16,6 +20,75 @@ class XpanseEndpoint:
     def __init__(self, session):
         self._api = session
 
+    def _post(
+        self,
+        path: str,
+        data_key: Optional[str] = None,
+        record_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> XpanseResponse:
+        """
+        Helper method used by all endpoints to send a POST request and wrap the reply.
+
+        Args:
+            path (str):
+                The endpoint used to make the request.
+            data_key (str, Optional):
+                The key under `reply` holding the parsed results.
+            record_key (str, Optional):
+                The data key of the record type of the results, when it differs from `data_key`.
+            **kwargs:
+                Any extraneous parameters you would like to include when executing your
+                request with the `requests` module.
+
+        Returns:
+            :obj:`XpanseResponse`:
+                An object containing the raw requests.Response and parsed data results.
+        """
+        response = self._api.post(path, **kwargs)
+        return XpanseResponse(
+            response,
+            data_key=data_key,
+            codec=codec_of(self._api),
+            record_key=record_key,
+        )
+
+    def _iterate(self, path: str, data_key: str, **kwargs: Any) -> XpanseResultIterator:
+        """
+        Helper method used by all list endpoints to build the result iterator.
+
+        Args:
+            path (str):
+                The endpoint used to make the request for each page.
+            data_key (str):
+                The key under `reply` holding each page of results.
+            **kwargs:
+                Pagination options and request kwargs passed to the iterator.
+
+        Returns:
+            :obj:`XpanseResultIterator`:
+                An iterator over the pages of results.
+        """
+        return XpanseResultIterator(
+            api=self._api, path=path, data_key=data_key, **kwargs
+        )
+
+    def _scan(self, id_field: str, **kwargs: Any) -> TimeWindowScan:
+        """
+        Helper method used by the time-partitioned scan endpoints to build the scan.
+
+        Args:
+            id_field (str):
+                The primary id field used to de-duplicate results.
+            **kwargs:
+                Scan options and request kwargs passed to the scan.
+
+        Returns:
+            :obj:`TimeWindowScan`:
+                An iterator over every unique result.
+        """
+        return TimeWindowScan(endpoint=self, id_field=id_field, **kwargs)
+
     def _count(self, path: str, request_data: Optional[RequestData] = None, **kwargs):
         """
         Helper method for all count endpoint calls.
@@ -45,5 +118,86 @@ class XpanseEndpoint:
         kwargs = build_request_payload(
             request_data=request_data, extra_request_data=extra_request_data, **kwargs
         )
-        response = self._api.post(path, **kwargs)
-        return XpanseResponse(response, data_key=PublicApiFields.TOTAL_COUNT)
+        return self._post(path, data_key=PublicApiFields.TOTAL_COUNT, **kwargs)
+
+
+class AsyncXpanseEndpoint(XpanseEndpoint):
+    """
+    Mixin used by the asyncio endpoints. Requests are awaited through the
+    :class:`xpanse.async_client.AsyncXpanseClient`, so every `get`, `count` and `update`
+    method returns a coroutine, and every `list` method returns an
+    :class:`AsyncXpanseResultIterator`.
+    """
+
+    async def _post(  # type: ignore[override]
+        self,
+        path: str,
+        data_key: Optional[str] = None,
+        record_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> XpanseResponse:
+        response = await self._api.post(path, **kwargs)
+        return XpanseResponse(
+            response,
+            data_key=data_key,
+            codec=codec_of(self._api),
+            record_key=record_key,
+        )
+
+    def _iterate(  # type: ignore[override]
+        self, path: str, data_key: str, **kwargs: Any
+    ) -> AsyncXpanseResultIterator:
+        return AsyncXpanseResultIterator(
+            api=self._api, path=path, data_key=data_key, **kwargs
+        )
+
+    def _scan(  # type: ignore[override]
+        self, id_field: str, **kwargs: Any
+    ) -> AsyncTimeWindowScan:
+        return AsyncTimeWindowScan(endpoint=self, id_field=id_field, **kwargs)
+
+
+class ListableEndpoint(XpanseEndpoint, abc.ABC):
+    """
+    Base class of the endpoints with a `list` method, which can also stream their results one at
+    a time with `iter_items`.
+    """
+
+    @abc.abstractmethod
+    def list(self, *args: Any, **kwargs: Any) -> XpanseResultIterator:
+        """
+        Returns an iterator over the pages of results of the endpoint.
+        """
+
+    def iter_items(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """
+        Streams the results of the `list` method of the endpoint one at a time. Only one page of
+        results is held in memory at once, regardless of the total number of results.
+
+        Args:
+            *args, **kwargs:
+                The arguments of the `list` method of the endpoint.
+
+        Returns:
+            :obj:`Iterator`:
+                A generator yielding each result.
+
+        Examples:
+            >>> # Stream all Incidents:
+            >>> for item in client.incidents.iter_items(concurrency=4):
+            >>>     print(item)
+        """
+        return self.list(*args, **kwargs).iter_items()
+
+
+class AsyncListableEndpoint(AsyncXpanseEndpoint, ListableEndpoint):
+    """
+    Mixin used by the asyncio endpoints with a `list` method, whose `iter_items` is an async
+    generator.
+    """
+
+    def iter_items(  # type: ignore[override]
+        self, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        iterator: Any = self.list(*args, **kwargs)
+        return iterator.iter_items()
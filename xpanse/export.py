@@ -0,0 +1,483 @@
+import csv
+import gzip
+import io
+import os
+import queue
+import threading
+import time
+import weakref
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+from xpanse.codec import JsonCodec, get_codec
+from xpanse.columnar import (
+    DEFAULT_ROW_GROUP_SIZE,
+    ArrowBatchBuilder,
+    ParquetBatchWriter,
+)
+from xpanse.const import ExportCompression, ExportFormat
+from xpanse.records import Record
+
+DEFAULT_EXPORT_BUFFER_SIZE = 1024 * 1024
+"""Encoded Bytes Buffered Before Each Write to the Compressor and File"""
+
+DEFAULT_EXPORT_QUEUE_PAGES = 4
+"""Pages Waiting for the Writer Thread Before the Iterator Blocks"""
+
+DEFAULT_COMPRESSION_LEVELS = {
+    ExportCompression.GZIP: 6,
+    ExportCompression.ZSTD: 3,
+}
+"""Default Level of Each Export Compression"""
+
+_END = object()
+"""Queued After the Last Page"""
+
+
+class ExportResult:
+    """
+    Counts of a finished export.
+
+    Args:
+        path (str):
+            The exported file.
+        records (int):
+            The number of records written.
+        pages (int):
+            The number of pages written.
+        bytes_written (int):
+            The size of the file, after compression.
+        uncompressed_bytes (int):
+            The size of the encoded records, before compression. For Parquet, the size of the
+            Arrow record batches.
+        elapsed (float):
+            Seconds from the first page to the closed file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        records: int,
+        pages: int,
+        bytes_written: int,
+        uncompressed_bytes: int,
+        elapsed: float,
+    ):
+        self.path = path
+        self.records = records
+        self.pages = pages
+        self.bytes_written = bytes_written
+        self.uncompressed_bytes = uncompressed_bytes
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(path={self.path!r}, records={self.records}, pages={self.pages}, "
+            f"bytes_written={self.bytes_written}, uncompressed_bytes={self.uncompressed_bytes})"
+        )
+
+
+class _CountingFile:
+    """
+    Counts the bytes written to a binary file
+    """
+
+    def __init__(self, file: Any):
+        self._file = file
+        self.bytes = 0
+
+    def write(self, data: bytes) -> int:
+        self.bytes += len(data)
+        return self._file.write(data)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        """
+        The file itself is closed by the writer thread.
+        """
+
+
+class ExportWriter:
+    """
+    Writes pages of records to a file on a background thread, so that the next pages are requested
+    while the previous ones are encoded, compressed and written. Encoded records are buffered and
+    written in chunks of `buffer_size` bytes. Memory is bounded by `queue_pages` pages plus the
+    buffer, regardless of the number of records.
+
+    Parquet files are typed by the schema of the data type, see :class:`xpanse.columnar.ArrowBatchBuilder`,
+    and their pages are buffered as Arrow record batches into row groups of `row_group_size` rows.
+
+    The file is written under a `.partial` name and renamed once closed, so an interrupted export
+    never leaves a truncated file at `path`.
+
+    Args:
+        path (str):
+            The file to write.
+        format (Union[str, ExportFormat], optional):
+            "ndjson" for one JSON record per line, "csv", or "parquet" (`pip install xpanse[arrow]`).
+            Defaults to "ndjson".
+        compression (Union[str, ExportCompression], optional):
+            "gzip", "zstd" (`pip install xpanse[zstd]`) or None. Defaults to None, except for
+            Parquet, whose column chunks are compressed with zstd by default.
+        fields (Sequence[str], optional):
+            The CSV columns. Defaults to the keys of the records of the first page, in order.
+            Other keys are left out. Lists and objects are written as JSON.
+        codec (JsonCodec, optional):
+            Encodes the JSON records. Defaults to the fastest installed codec.
+        data_key (str, optional):
+            The data key of the list endpoint, which selects the Parquet schema.
+        compression_level (int, optional):
+            Defaults to 6 for gzip and 3 for zstd.
+        buffer_size (int, optional):
+            Bytes buffered before each write. Defaults to 1 MiB.
+        queue_pages (int, optional):
+            Pages waiting for the writer thread before :meth:`write_page` blocks. Defaults to 4.
+        row_group_size (int, optional):
+            Rows of each Parquet row group. Defaults to 65,536.
+
+    Examples:
+        >>> writer = ExportWriter("assets.ndjson.gz", compression="gzip")
+        >>> for page in client.assets.list():
+        >>>     writer.write_page(page)
+        >>> result = writer.close()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        format: Union[str, ExportFormat] = ExportFormat.NDJSON,
+        compression: Optional[Union[str, ExportCompression]] = None,
+        fields: Optional[Sequence[str]] = None,
+        codec: Optional[JsonCodec] = None,
+        data_key: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        buffer_size: int = DEFAULT_EXPORT_BUFFER_SIZE,
+        queue_pages: int = DEFAULT_EXPORT_QUEUE_PAGES,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ):
+        format = ExportFormat(format)
+        if format == ExportFormat.PARQUET:
+            compression = ExportCompression(compression or ExportCompression.ZSTD)
+        else:
+            compression = ExportCompression(compression or ExportCompression.NONE)
+        if (
+            format != ExportFormat.PARQUET
+            and compression == ExportCompression.ZSTD
+            and zstandard is None
+        ):
+            raise ImportError(
+                "zstd exports require 'zstandard'. Install it with 'pip install xpanse[zstd]'."
+            )
+
+        if buffer_size < 1:
+            raise ValueError(
+                f"'buffer_size' must be a positive integer. f{buffer_size} > 0."
+            )
+
+        if queue_pages < 1:
+            raise ValueError(
+                f"'queue_pages' must be a positive integer. f{queue_pages} > 0."
+            )
+
+        self._path = os.fspath(path)
+        self._file = _ExportFile(
+            self._path,
+            format,
+            compression,
+            fields=fields,
+            codec=codec or get_codec(),
+            data_key=data_key,
+            compression_level=compression_level,
+            buffer_size=buffer_size,
+            row_group_size=row_group_size,
+        )
+        self._pages: queue.Queue = queue.Queue(maxsize=queue_pages)
+        self._started_at = time.perf_counter()
+        self._closed = False
+
+        self._stop = threading.Event()
+        # The writer thread only references the file, so a writer dropped without calling
+        # `close` or `abort` is still collected, which stops the thread and removes the partial file
+        weakref.finalize(self, self._stop.set)
+        self._thread = threading.Thread(
+            target=self._file.write,
+            args=(self._pages, self._stop),
+            name=f"{self.__class__.__name__}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def write_page(self, page: List[Any]):
+        """
+        Queues a page of records, blocking while `queue_pages` pages are waiting to be written.
+
+        Raises:
+            The error of the writer thread, if it failed.
+        """
+        self._put(page)
+
+    def close(self) -> ExportResult:
+        """
+        Writes the remaining pages and closes the file.
+
+        Returns:
+            :obj:`ExportResult`: The counts of the export.
+        """
+        if not self._closed:
+            self._closed = True
+            self._put(_END)
+            self._thread.join()
+        file = self._file
+        if file.error is not None:
+            file.remove_partial()
+            raise file.error
+        return ExportResult(
+            self._path,
+            file.records,
+            file.pages,
+            file.bytes_written,
+            file.uncompressed_bytes,
+            time.perf_counter() - self._started_at,
+        )
+
+    def abort(self):
+        """
+        Stops the writer thread and removes the partial file.
+        """
+        self._closed = True
+        self._stop.set()
+        self._thread.join()
+        self._file.remove_partial()
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def _put(self, item: Any):
+        """
+        Queues an item for the writer thread, giving up when it has failed or been aborted.
+        """
+        while not self._stop.is_set():
+            if self._file.error is not None:
+                raise self._file.error
+            try:
+                self._pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+class _ExportFile:
+    """
+    The file of an :class:`ExportWriter`, written by its writer thread. It holds no reference to
+    the writer, so that the writer can be collected while the thread waits for pages.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        format: ExportFormat,
+        compression: ExportCompression,
+        fields: Optional[Sequence[str]],
+        codec: JsonCodec,
+        data_key: Optional[str],
+        compression_level: Optional[int],
+        buffer_size: int,
+        row_group_size: int,
+    ):
+        self._path = path
+        self._partial_path = f"{path}.partial"
+        self._format = format
+        self._compression = compression
+        if format == ExportFormat.PARQUET:
+            # Fails early without pyarrow, rather than on the writer thread
+            self._builder = ArrowBatchBuilder(data_key, codec=codec)
+        self._fields = list(fields) if fields is not None else None
+        self._codec = codec
+        self._compression_level = compression_level
+        self._level = (
+            compression_level
+            if compression_level is not None
+            else DEFAULT_COMPRESSION_LEVELS.get(compression, 0)
+        )
+        self._buffer_size = buffer_size
+        self._row_group_size = row_group_size
+        self._header_written = False
+
+        self.records = 0
+        self.pages = 0
+        self.uncompressed_bytes = 0
+        self.bytes_written = 0
+        # Error raised by the writer thread, re-raised to the caller
+        self.error: Optional[BaseException] = None
+
+    def write(self, pages: queue.Queue, stop: threading.Event):
+        """
+        Runs on the writer thread. Writes the queued pages, then renames the file unless stopped.
+        """
+        try:
+            if self._format == ExportFormat.PARQUET:
+                self._write_parquet(pages, stop)
+            else:
+                self._write_encoded(pages, stop)
+            if stop.is_set():
+                self.remove_partial()
+            else:
+                os.replace(self._partial_path, self._path)
+        except BaseException as err:
+            self.error = err
+
+    def remove_partial(self):
+        """
+        Removes the partial file of an aborted or failed export.
+        """
+        if os.path.exists(self._partial_path):
+            os.remove(self._partial_path)
+
+    def _queued_pages(
+        self, pages: queue.Queue, stop: threading.Event
+    ) -> Iterator[List[Any]]:
+        """
+        Yields the queued pages until the last one, or until the export is stopped
+        """
+        while not stop.is_set():
+            try:
+                page = pages.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if page is _END:
+                return
+            self.records += len(page)
+            self.pages += 1
+            yield page
+
+    def _write_encoded(self, pages: queue.Queue, stop: threading.Event):
+        """
+        Encodes each page into the buffer, and writes the buffer through the compressor whenever
+        it is full
+        """
+        with open(self._partial_path, "wb") as file:
+            counting = _CountingFile(file)
+            stream = self._open_compressor(counting)
+            buffer = bytearray()
+            for page in self._queued_pages(pages, stop):
+                chunk = self._encode(page)
+                self.uncompressed_bytes += len(chunk)
+                buffer += chunk
+                if len(buffer) >= self._buffer_size:
+                    stream.write(bytes(buffer))
+                    buffer.clear()
+            if stop.is_set():
+                return
+            if buffer:
+                stream.write(bytes(buffer))
+            stream.close()
+            self.bytes_written = counting.bytes
+
+    def _write_parquet(self, pages: queue.Queue, stop: threading.Event):
+        """
+        Converts each page to an Arrow record batch, written in row groups of `row_group_size` rows
+        """
+        writer = ParquetBatchWriter(
+            self._partial_path,
+            self._builder,
+            compression=self._compression.value,
+            compression_level=self._compression_level,
+            row_group_size=self._row_group_size,
+        )
+        for page in self._queued_pages(pages, stop):
+            batch = self._builder.batch(page)
+            self.uncompressed_bytes += batch.nbytes
+            writer.write(batch)
+        writer.close()
+        self.bytes_written = os.path.getsize(self._partial_path)
+
+    def _open_compressor(self, file: _CountingFile) -> Any:
+        """
+        Wraps the file in the compressor of the export
+        """
+        if self._compression == ExportCompression.GZIP:
+            return gzip.GzipFile(
+                filename="", mode="wb", fileobj=file, compresslevel=self._level  # type: ignore
+            )
+        if self._compression == ExportCompression.ZSTD:
+            return zstandard.ZstdCompressor(level=self._level).stream_writer(
+                file, closefd=False  # type: ignore
+            )
+        return file
+
+    def _encode(self, page: List[Any]) -> bytes:
+        """
+        Encodes a page of records in the format of the export
+        """
+        if self._format == ExportFormat.CSV:
+            return self._encode_csv(page)
+        if not page:
+            return b""
+        return (
+            b"\n".join(
+                self._codec.dumps(
+                    record.to_dict() if isinstance(record, Record) else record
+                )
+                for record in page
+            )
+            + b"\n"
+        )
+
+    def _encode_csv(self, page: List[Any]) -> bytes:
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        if not self._header_written:
+            self._header_written = True
+            if self._fields is None:
+                self._fields = list(
+                    dict.fromkeys(key for record in page for key in record)
+                )
+            writer.writerow(self._fields)
+        fields = self._fields or []
+        writer.writerows(
+            [self._csv_value(record.get(field)) for field in fields] for record in page
+        )
+        return out.getvalue().encode("utf-8")
+
+    def _csv_value(self, value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list)):
+            return self._codec.dumps(value).decode("utf-8")
+        return value
+
+
+def export_pages(
+    pages: Iterable[List[Any]], path: Union[str, "os.PathLike[str]"], **kwargs: Any
+) -> ExportResult:
+    """
+    Writes pages of records to a file with an :class:`ExportWriter`, requesting the next pages while
+    the previous ones are written. See :meth:`xpanse.iterator.XpanseResultIterator.export`.
+
+    Args:
+        pages (Iterable[List[Any]]):
+            The pages of records, such as a result iterator.
+        path (str):
+            The file to write.
+        **kwargs:
+            Options of the :class:`ExportWriter`.
+
+    Returns:
+        :obj:`ExportResult`: The counts of the export.
+    """
+    with ExportWriter(path, **kwargs) as writer:
+        for page in pages:
+            writer.write_page(page)
+    return writer.close()
@@ -0,0 +1,174 @@
+import contextvars
+import copy
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from xpanse.const import HookType
+
+Hook = Callable[["HookEvent"], None]
+"""A Callback Receiving Each :class:`HookEvent` of its Type"""
+
+CURRENT_ITERATOR: contextvars.ContextVar[
+    Optional["HookEvent"]
+] = contextvars.ContextVar("xpanse_current_iterator", default=None)
+"""The `ITERATOR_START` Event of the Result Iterator Sending the Current Request, if Any"""
+
+
+class HookEvent:
+    """
+    A request or iterator lifecycle event, passed to each hook of its type.
+
+    Each stage gets its own event, so an event kept by a hook is never changed afterwards. The events
+    of the `BEFORE_REQUEST`, `AFTER_RESPONSE` and `ON_RETRY` hooks of a request attempt share one
+    :attr:`context`, as do the `ITERATOR_START` and `ITERATOR_END` events of a result iterator, so
+    hooks can keep state between them, such as a span.
+
+    Args:
+        hook_type (HookType):
+            The lifecycle event.
+        method (str):
+            The HTTP method of the request, or of the pages of the iterator.
+        path (str):
+            The endpoint path.
+        payload_bytes (int, optional):
+            The size of the request body as sent, after encoding and compression.
+        elapsed (float, optional):
+            Seconds taken by the attempt, by the page since the previous page, or by the whole
+            iterator. 0 for `BEFORE_REQUEST` and `ITERATOR_START`.
+        attempt (int, optional):
+            The attempt number of the request, starting from 1.
+        iterator (HookEvent, optional):
+            The `ITERATOR_START` event of the result iterator sending the request, if any.
+    """
+
+    def __init__(
+        self,
+        hook_type: HookType,
+        method: str,
+        path: str,
+        payload_bytes: int = 0,
+        elapsed: float = 0.0,
+        attempt: int = 1,
+        iterator: Optional["HookEvent"] = None,
+    ):
+        self.hook_type = hook_type
+        self.method = method
+        self.path = path
+        self.payload_bytes = payload_bytes
+        self.elapsed = elapsed
+        self.attempt = attempt
+        self.iterator = iterator
+
+        """Response Status Code, Once Received"""
+        self.status: Optional[int] = None
+
+        """Error Raised by the Attempt When no Response was Received"""
+        self.error: Optional[BaseException] = None
+
+        """Seconds Waited Before the Next Attempt, When the Attempt is Retried"""
+        self.delay: Optional[float] = None
+
+        """Results of the Page, or of the Iterator so Far"""
+        self.results: Optional[int] = None
+
+        """Pages Read by the Iterator so Far"""
+        self.pages: Optional[int] = None
+
+        """State Kept by Hooks Between the Events of an Attempt or Iterator"""
+        self.context: Dict[str, Any] = {}
+
+    def replace(self, hook_type: HookType, **changes: Any) -> "HookEvent":
+        """
+        Returns the event of a later stage of the same attempt or iterator, sharing its
+        :attr:`context`. This event is left unchanged.
+
+        Args:
+            hook_type (HookType):
+                The lifecycle event of the new stage.
+            **changes:
+                The fields of the new event that differ from this one, i.e. `status`.
+
+        Raises:
+            :obj:`TypeError`: When a field does not exist.
+        """
+        event = copy.copy(self)
+        event.hook_type = hook_type
+        for name, value in changes.items():
+            if not hasattr(self, name):
+                raise TypeError(
+                    f"'{name}' is not a field of {self.__class__.__name__}."
+                )
+            setattr(event, name, value)
+        return event
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.hook_type.value}, {self.method} {self.path}, "
+            f"attempt={self.attempt}, status={self.status}, elapsed={self.elapsed:.3f})"
+        )
+
+
+class Hooks:
+    """
+    Callbacks run at each stage of a request and of a result iterator, for tracing and profiling.
+    Hooks run on the thread sending the request, so they should be quick. An exception raised by a
+    hook is logged and does not fail the request. Safe to share between clients and threads.
+
+    Examples:
+        >>> hooks = Hooks()
+        >>> hooks.add(HookType.AFTER_RESPONSE, lambda event: print(event.path, event.elapsed))
+        >>> client = XpanseClient(hooks=hooks)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hooks: Dict[HookType, List[Hook]] = {}
+        self._log = logging.getLogger(
+            "{}.{}".format(self.__module__, self.__class__.__name__)
+        )
+
+    def add(self, hook_type: Union[str, HookType], hook: Hook) -> Hook:
+        """
+        Registers a hook for a lifecycle event.
+
+        Returns:
+            :obj:`Hook`: The hook, to remove it later.
+        """
+        hook_type = HookType(hook_type)
+        with self._lock:
+            # Copy on write, so that emitting never holds the lock
+            self._hooks = {
+                **self._hooks,
+                hook_type: self._hooks.get(hook_type, []) + [hook],
+            }
+        return hook
+
+    def remove(self, hook_type: Union[str, HookType], hook: Hook):
+        """
+        Unregisters a hook. Unknown hooks are ignored.
+        """
+        hook_type = HookType(hook_type)
+        with self._lock:
+            self._hooks = {
+                **self._hooks,
+                hook_type: [h for h in self._hooks.get(hook_type, []) if h is not hook],
+            }
+
+    def emit(self, event: HookEvent):
+        """
+        Runs the hooks of the event type, in the order they were added.
+        """
+        for hook in self._hooks.get(event.hook_type, ()):
+            try:
+                hook(event)
+            except Exception:
+                self._log.exception(f"Hook {hook!r} failed on {event!r}")
+
+
+def hooks_of(api: Any) -> Optional[Hooks]:
+    """
+    Returns the hooks of a client, or None for objects that are not clients or have no hooks.
+    """
+    hooks = getattr(api, "_hooks", None)
+    return hooks if isinstance(hooks, Hooks) else None
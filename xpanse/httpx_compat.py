@@ -0,0 +1,118 @@
+from typing import Any, Dict, MutableMapping, Optional, Tuple, Type
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+from xpanse.pool import PoolConfig
+
+HTTPX_TRANSPORT_ERRORS: Tuple[Type[BaseException], ...] = (
+    (httpx.TransportError,) if httpx is not None else ()
+)
+"""Connection Errors Raised by `httpx`, Retried Like `requests` Connection Errors"""
+
+
+def require_httpx(feature: str):
+    """
+    Raises an ImportError naming the extra to install when `httpx` is missing.
+    """
+    if httpx is None:
+        raise ImportError(
+            f"The {feature} requires 'httpx'. Install it with 'pip install xpanse[async]'."
+        )
+
+
+def build_httpx_client(
+    client_cls: Any,
+    transport_cls: Any,
+    pool_config: PoolConfig,
+    proxies: Optional[MutableMapping[str, str]] = None,
+    verify: bool = True,
+    http2: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+) -> Any:
+    """
+    Builds an `httpx.Client` or `httpx.AsyncClient` with the connection pool, keep-alive and
+    proxy settings of a client.
+
+    Args:
+        client_cls (type):
+            `httpx.Client` or `httpx.AsyncClient`.
+        transport_cls (type):
+            `httpx.HTTPTransport` or `httpx.AsyncHTTPTransport`.
+        pool_config (PoolConfig):
+            The connection pool size and TCP keep-alive settings. `warm_up` is not supported.
+        proxies (MutableMapping[str, str], optional):
+            Proxies by scheme, using the same structure as the Requests library.
+        verify (bool, optional):
+            Whether or not SSL verification should occur.
+        http2 (bool, optional):
+            Whether to negotiate HTTP/2. Requires the `h2` package, installed with
+            `pip install xpanse[http2]`.
+        headers (Dict[str, str], optional):
+            Headers sent with every request.
+    """
+    limits = httpx.Limits(
+        max_connections=pool_config.pool_maxsize if pool_config.pool_block else None,
+        max_keepalive_connections=pool_config.pool_maxsize,
+    )
+    transport_kwargs: Dict[str, Any] = {
+        "verify": verify,
+        "limits": limits,
+        "socket_options": pool_config.socket_options(),
+        "http2": http2,
+    }
+
+    try:
+        mounts = None
+        if proxies is not None:
+            mounts = {
+                f"{scheme}://": transport_cls(
+                    proxy=httpx.Proxy(proxy), **transport_kwargs
+                )
+                for scheme, proxy in proxies.items()
+            }
+
+        # Requests does not time out by default, keep the same behavior for large pages
+        return client_cls(
+            transport=transport_cls(**transport_kwargs),
+            mounts=mounts,
+            headers=headers,
+            timeout=None,
+        )
+    except ImportError as err:
+        raise ImportError(
+            "HTTP/2 requires the 'h2' package. Install it with 'pip install xpanse[http2]'."
+        ) from err
+
+
+def httpx_request_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Adapts `requests` keyword arguments to `httpx`. Raw bodies are passed as `content`, and
+    `stream` is dropped, since responses are always read before they are converted.
+    """
+    kwargs = {k: v for k, v in kwargs.items() if k != "stream"}
+    if isinstance(kwargs.get("data"), (bytes, str)):
+        kwargs["content"] = kwargs.pop("data")
+    return kwargs
+
+
+def as_requests_response(response: "httpx.Response") -> requests.Response:
+    """
+    Converts a fully read `httpx.Response` into a `requests.Response` so that the
+    parsing helpers are shared with the `requests` session.
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted._content = response.content
+    # The body is already read, so `iter_content` slices it instead of reading `raw`
+    converted._content_consumed = True  # type: ignore
+    converted.encoding = response.encoding
+    converted.reason = response.reason_phrase
+    converted.url = str(response.url)
+    return converted
@@ -1,21 +1,83 @@
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import queue
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from requests import Response
 
+from xpanse.codec import codec_of, decode_response
+from xpanse.columnar import ArrowBatchBuilder, to_polars
 from xpanse.const import (
+    ExportCompression,
+    ExportFormat,
+    FilterOperator,
+    HookType,
+    HTTPVerb,
     PublicApiFields,
+    DEFAULT_REQUEST_PAYLOAD_FIELD,
     DEFAULT_SEARCH_FROM,
     DEFAULT_SEARCH_TO,
     MAX_TOTAL_COUNT,
+    SortOrder,
 )
 from xpanse.error import UnexpectedResponseError
+from xpanse.export import ExportResult, ExportWriter, export_pages
+from xpanse.hooks import CURRENT_ITERATOR, HookEvent, hooks_of
+from xpanse.metrics import metrics_of, response_bytes
+from xpanse.paging import AdaptivePageSize
+from xpanse.records import Record, record_type_of
+from xpanse.streaming import StreamingPageParser, iter_response_items
 from xpanse.utils import build_request_payload
 
+CHECKPOINT_VERSION = 1
+"""Version of the State Returned by :meth:`BaseXpanseResultIterator.checkpoint`"""
+
+_PAGINATION_FIELDS = (
+    PublicApiFields.SEARCH_FROM,
+    PublicApiFields.SEARCH_TO,
+    PublicApiFields.USE_PAGE_TOKEN,
+    PublicApiFields.NEXT_PAGE_TOKEN,
+)
+"""Request Data Fields Left out of the Request Fingerprint"""
+
 
-class XpanseResultIterator:
+def _decoded(value: Any) -> Any:
     """
-    Iterator for paging though results.
+    Serializes the raw JSON fields of streamed records as their decoded value, so that a result
+    has the same key whether it was streamed or not
+    """
+    if isinstance(value, bytes):
+        return json.loads(value)
+    return str(value)
+
+
+class BaseXpanseResultIterator:
+    """
+    Pagination state shared by the blocking and asyncio result iterators.
     """
 
     # Total number of results - may not be available - limit is 9,999 results
@@ -30,6 +92,22 @@ class XpanseResultIterator:
     # Next page token, used when use_page_token is True
     _next_page_token: Optional[str] = None
 
+    # ITERATOR_START event, once the first page is requested with hooks
+    _scope: Optional[HookEvent] = None
+
+    # Whether the ITERATOR_END hooks have run
+    _scope_ended: bool = False
+
+    # Results read so far, reported to the hooks and saved in checkpoints
+    _results: int = 0
+
+    # When the first page was requested, and when the last page was read
+    _started_at: float = 0.0
+    _last_page_at: float = 0.0
+
+    # Whether an adaptively sized limit-offset page had fewer results than its window, ending pagination
+    _short_page: bool = False
+
     def __init__(
         self,
         api: Any,
@@ -38,6 +116,11 @@ class XpanseResultIterator:
         use_page_token: bool = True,
         search_from: int = DEFAULT_SEARCH_FROM,
         search_to: int = DEFAULT_SEARCH_TO,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint_path: Optional[str] = None,
+        page_sizing: Optional[AdaptivePageSize] = None,
         **kwargs,
     ):
         self._api = api
@@ -45,6 +128,9 @@ class XpanseResultIterator:
         self._data_key = data_key
         self._use_page_token = use_page_token
         self._kwargs = kwargs
+        self._codec = codec_of(api)
+        self._metrics = metrics_of(api)
+        self._hooks = hooks_of(api)
         self._log = logging.getLogger(
             "{}.{}".format(self.__module__, self.__class__.__name__)
         )
@@ -68,11 +154,84 @@ class XpanseResultIterator:
             self._search_from = search_from
             self._search_to = search_to
 
-    def __iter__(self):
-        return self
+        if concurrency < 1:
+            raise ValueError(
+                f"'concurrency' must be a positive integer. f{concurrency} > 0."
+            )
 
-    def __next__(self):
-        return self.next()
+        # Number of limit-offset pages requested at once, once the total is known
+        self._concurrency = concurrency
+
+        # In-flight page requests, in page order
+        self._pending: Deque[Any] = deque()
+
+        if prefetch < 0:
+            raise ValueError(
+                f"'prefetch' must be zero or a positive integer. f{prefetch} >= 0."
+            )
+
+        # Number of page-token pages fetched ahead of the caller on a background worker
+        self._prefetch = prefetch
+
+        # Error raised by the background worker, re-raised on every following page
+        self._prefetch_error: Optional[BaseException] = None
+
+        if stream and (concurrency > 1 or prefetch > 0):
+            raise ValueError(
+                "'stream' cannot be combined with 'concurrency' or 'prefetch'."
+            )
+
+        # Whether each page is parsed incrementally as its body is read
+        self._stream = stream
+
+        if page_sizing is not None and (use_page_token or concurrency > 1 or stream):
+            raise ValueError(
+                "'page_sizing' is only supported by limit-offset pagination without 'concurrency' or 'stream'."
+            )
+
+        # Sizes each limit-offset window from the latency and size of the previous page
+        self._page_sizing = page_sizing
+        if page_sizing is not None:
+            search_to = search_from + page_sizing.clamp(search_to - search_from)
+            self._search_to = search_to
+
+        # Largest page size the API returned while more results remained, when below the window
+        self._size_cap: Optional[int] = None
+
+        # When the current page was requested, and the latency and size of its response
+        self._requested_at = 0.0
+        self._page_seconds = 0.0
+        self._page_bytes = 0
+
+        # Record type results are converted to before they are returned, see `as_records`
+        self._record_type: Optional[Type[Record]] = None
+
+        # Offset of the next limit-offset page not returned to the caller yet. Ahead of it,
+        # `_search_from` also counts the windows requested by the `concurrency` workers.
+        self._cursor = search_from
+        self._limit = search_to - search_from
+
+        # Identifies the request, so that a checkpoint is only resumed by the same listing
+        self._fingerprint = self._request_fingerprint()
+
+        # Sort field and order of the request, to re-seek when a resumed page token has expired
+        self._sort = self._sort_of(self._request_data())
+
+        # Sort value of the last result returned, and the keys of the results sharing it
+        self._sort_value: Any = None
+        self._boundary_keys: List[str] = []
+
+        # Page token restored by `resume`, checked by the first request after resuming
+        self._resumed_token: Optional[str] = None
+
+        # Keys of results returned before a re-seek, skipped while the re-seek replays them
+        self._replayed: Set[str] = set()
+
+        # File the checkpoint is saved to before each page, removed once exhausted
+        self._checkpoint_path = checkpoint_path
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+                self.resume(json.load(checkpoint_file))
 
     @property
     def total(self) -> int:
@@ -81,24 +240,17 @@ class XpanseResultIterator:
         """
         return self._total
 
-    def next(self) -> Dict[str, Any]:
-        """
-        Fetches the result from pagination.next, if a value exists.
-        """
-        if not self.has_next():
-            raise StopIteration("Pagination exhausted")
-
-        return self._get_data()
-
     def has_next(self) -> bool:
         """
         True when there's another page of data, False when pagination is complete.
         """
-        if self._pages == 0:
+        if self._pages == 0 or self._pending:
             return True
 
         if self._use_page_token:
             return self._next_page_token is not None
+        elif self._short_page:
+            return False
         else:
             # Some APIs will limit the total to 9_999. Only use this logic if the total < 9_999.
             if self._total < MAX_TOTAL_COUNT:
@@ -107,24 +259,361 @@ class XpanseResultIterator:
             else:
                 return self._last_results_count is None or self._last_results_count > 0
 
-    def dump(self) -> List[Any]:
+    def checkpoint(self) -> Dict[str, Any]:
         """
-        Iterates until completion and returns a list of results.
+        Returns the pagination state after the last page returned to the caller, so that the same
+        listing can continue from there with :meth:`resume`, for example after a crash. The state
+        is JSON serializable and holds a fingerprint of the request payload.
+
+        Page tokens expire. When the token of a resumed page-token iterator is rejected, pagination
+        re-seeks from the last returned value of the `sort` field of the request, skipping the
+        results already returned. Without a `sort` in the request, the rejection is raised as an
+        :class:`UnexpectedResponseError`.
+
+        Examples:
+            >>> iterator = client.assets.list(request_data={"sort": {"field": "first_observed", "keyword": "asc"}})
+            >>> page = iterator.next()
+            >>> state = iterator.checkpoint()
+            >>> # Later, in another process
+            >>> iterator = client.assets.list(request_data={"sort": {"field": "first_observed", "keyword": "asc"}})
+            >>> iterator.resume(state).dump()
         """
-        return [j for i in self for j in i]
+        return {
+            "version": CHECKPOINT_VERSION,
+            "path": self._path,
+            "fingerprint": self._fingerprint,
+            "pages": self._pages,
+            "results": self._results,
+            "total": self._total,
+            "last_results_count": self._last_results_count,
+            "next_page_token": self._next_page_token,
+            "search_from": self._cursor,
+            "page_size": self._limit,
+            "short_page": self._short_page,
+            "sort_value": self._sort_value,
+            "boundary_keys": list(self._boundary_keys),
+            "saved_at": time.time(),
+        }
 
-    def _get_data(self) -> Dict[str, Any]:
+    def resume(self, state: Dict[str, Any]) -> "BaseXpanseResultIterator":
         """
-        Returns the next page of data
+        Continues pagination from a state returned by :meth:`checkpoint`. Must be called before the
+        first page is requested.
+
+        Args:
+            state (Dict[str, Any]):
+                The checkpoint of an iterator built with the same request.
+
+        Returns:
+            :obj:`BaseXpanseResultIterator`:
+                This iterator, to chain with `dump` or `iter_items`.
+
+        Raises:
+            ValueError: When the iterator has already started, or when the checkpoint was saved by
+                another version or by a different request.
         """
-        try:
-            if self._use_page_token:
-                resp = self._get_data_with_page_token()
-            else:
-                resp = self._get_data_with_limit_offset()
+        if self._pages > 0 or self._scope is not None:
+            raise ValueError(
+                "'resume' must be called before the first page is requested."
+            )
+
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version. f{state.get('version')} == f{CHECKPOINT_VERSION}."
+            )
+
+        if (
+            state.get("path") != self._path
+            or state.get("fingerprint") != self._fingerprint
+        ):
+            raise ValueError(
+                f"The checkpoint was saved by a different request than this '{self._path}' iterator."
+            )
+
+        self._pages = state["pages"]
+        self._results = state.get("results", 0)
+        self._total = state.get("total", 0)
+        self._last_results_count = state.get("last_results_count")
+        self._sort_value = state.get("sort_value")
+        self._boundary_keys = list(state.get("boundary_keys", []))
+        self._short_page = state.get("short_page", False)
+        if self._use_page_token:
+            self._next_page_token = self._resumed_token = state.get("next_page_token")
+        else:
+            self._limit = state.get("page_size", self._limit)
+            self._cursor = self._search_from = state["search_from"]
+            self._search_to = self._search_from + self._limit
+        return self
+
+    def as_records(
+        self, record_type: Optional[Type[Record]] = None
+    ) -> "BaseXpanseResultIterator":
+        """
+        Returns each result as a compact :class:`xpanse.records.Record` instead of a dict, which
+        holds its fields in `__slots__` and interns repeated category values. With `stream=True`,
+        nested blobs are kept as raw JSON until they are read.
+
+        Args:
+            record_type (Type[Record], optional):
+                The record type of the results. Defaults to the record type of the data key.
+
+        Returns:
+            :obj:`BaseXpanseResultIterator`:
+                This iterator, to chain with `dump` or `iter_items`.
 
-            resp_as_json = resp.json()  # type: ignore
+        Raises:
+            ValueError: When the data key has no record type.
 
+        Examples:
+            >>> for incident in client.incidents.list().as_records().iter_items():
+            >>>     print(incident.incident_id, incident.severity)
+        """
+        self._record_type = record_type or record_type_of(self._data_key)
+        return self
+
+    def _as_records(self, page: List[Any]) -> List[Any]:
+        """
+        Converts a page of results to records, when enabled by `as_records`
+        """
+        if self._record_type is None:
+            return page
+        record_type = self._record_type
+        return [record_type(result) for result in page]
+
+    def _exhausted(self) -> bool:
+        """
+        True once every page has been returned to the caller
+        """
+        if self._pages == 0:
+            return False
+        if self._use_page_token:
+            return self._next_page_token is None
+        if self._short_page:
+            return True
+        if self._total < MAX_TOTAL_COUNT:
+            return self._cursor >= self._total
+        return self._last_results_count == 0
+
+    def _save_checkpoint(self):
+        """
+        Writes the checkpoint file before the next page is requested, so that a crash while the
+        caller processes a page costs at most that page. The file is replaced atomically.
+        """
+        if self._checkpoint_path is None or self._pages == 0:
+            return
+
+        partial_path = f"{self._checkpoint_path}.partial"
+        with open(partial_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(self.checkpoint(), checkpoint_file)
+        os.replace(partial_path, self._checkpoint_path)
+
+    def _remove_checkpoint(self):
+        """
+        Removes the checkpoint file once pagination is complete. A closed iterator keeps it.
+        """
+        if (
+            self._checkpoint_path is not None
+            and self._exhausted()
+            and os.path.exists(self._checkpoint_path)
+        ):
+            os.remove(self._checkpoint_path)
+
+    def _request_data(self) -> Dict[str, Any]:
+        """
+        Returns the `request_data` of the request payload
+        """
+        payload = self._kwargs.get(DEFAULT_REQUEST_PAYLOAD_FIELD)
+        if not isinstance(payload, dict):
+            return {}
+        return payload.get(PublicApiFields.REQUEST_DATA) or {}
+
+    def _request_fingerprint(self) -> str:
+        """
+        Hashes the endpoint and request payload, without the pagination fields
+        """
+        payload = self._kwargs.get(DEFAULT_REQUEST_PAYLOAD_FIELD)
+        request = {
+            "path": self._path,
+            "data_key": self._data_key,
+            "use_page_token": self._use_page_token,
+            "payload": {
+                **(payload if isinstance(payload, dict) else {}),
+                PublicApiFields.REQUEST_DATA: {
+                    key: value
+                    for key, value in self._request_data().items()
+                    if key not in _PAGINATION_FIELDS
+                },
+            },
+        }
+        return hashlib.sha256(
+            json.dumps(request, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def _sort_of(request_data: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Returns the field and order of the `sort` of the request data, if there is one
+        """
+        sort = request_data.get(PublicApiFields.SORT)
+        if not isinstance(sort, dict) or not sort.get(PublicApiFields.FIELD):
+            return None
+        keyword = sort.get(PublicApiFields.KEYWORD, SortOrder.ASC.value)
+        return (
+            sort[PublicApiFields.FIELD],
+            str(getattr(keyword, "value", keyword)).lower(),
+        )
+
+    @staticmethod
+    def _result_key(result: Any) -> str:
+        """
+        Identifies a result by a hash of its content
+        """
+        return hashlib.sha256(
+            json.dumps(result, sort_keys=True, default=_decoded).encode("utf-8")
+        ).hexdigest()[:32]
+
+    def _sort_value_of(self, result: Any) -> Any:
+        return (
+            result.get(self._sort[0])
+            if self._sort and isinstance(result, dict)
+            else None
+        )
+
+    def _track_sort(self, tail: List[Any]):
+        """
+        Remembers the sort value of the last result returned, and the keys of the results sharing
+        it, given the results at the end of a page
+        """
+        if not self._use_page_token or self._sort is None or not tail:
+            return
+
+        value = self._sort_value_of(tail[-1])
+        keys = []
+        for result in reversed(tail):
+            if self._sort_value_of(result) != value:
+                break
+            keys.append(self._result_key(result))
+        if value == self._sort_value and len(keys) == len(tail):
+            # The whole page shares the sort value of the previous page
+            keys += self._boundary_keys
+        self._sort_value = value
+        self._boundary_keys = keys
+
+    def _is_replayed(self, result: Any) -> bool:
+        """
+        True for a result replayed by a re-seek that was already returned before the checkpoint
+        """
+        if not self._replayed:
+            return False
+        if self._sort_value_of(result) != self._sort_value:
+            # Past the re-seek boundary, nothing else can be replayed
+            self._replayed = set()
+            return False
+        return self._result_key(result) in self._replayed
+
+    def _reseek_request_kwargs(
+        self, resp: Optional[Response], kwargs: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Checks the first response after resuming a page-token iterator. When its page token was
+        rejected, returns the kwargs requesting a new first page filtered from the last returned
+        sort value. Returns None otherwise.
+        """
+        if self._resumed_token is None:
+            return None
+        self._resumed_token = None
+
+        if resp is not None and resp.status_code < 400:
+            return None
+        if self._sort is None or self._sort_value is None:
+            self._log.error(
+                f"The resumed page token of {self._path} was rejected and the request has no 'sort' to re-seek by."
+            )
+            return None
+
+        field, order = self._sort
+        operator = (
+            FilterOperator.LTE if order == SortOrder.DESC.value else FilterOperator.GTE
+        )
+        self._log.warning(
+            f"The resumed page token of {self._path} was rejected, re-seeking from {field} {operator.value} {self._sort_value!r}"
+        )
+        request_data = {
+            key: value
+            for key, value in self._request_data().items()
+            if key != PublicApiFields.NEXT_PAGE_TOKEN
+        }
+        request_data[PublicApiFields.USE_PAGE_TOKEN] = True
+        request_data[PublicApiFields.FILTERS] = list(
+            request_data.get(PublicApiFields.FILTERS, [])
+        ) + [
+            {
+                PublicApiFields.FIELD: field,
+                PublicApiFields.OPERATOR: operator.value,
+                PublicApiFields.VALUE: self._sort_value,
+            }
+        ]
+        payload = {
+            **self._kwargs[DEFAULT_REQUEST_PAYLOAD_FIELD],
+            PublicApiFields.REQUEST_DATA: request_data,
+        }
+        self._kwargs = {**self._kwargs, DEFAULT_REQUEST_PAYLOAD_FIELD: payload}
+        self._replayed = set(self._boundary_keys)
+        return {**kwargs, DEFAULT_REQUEST_PAYLOAD_FIELD: payload}
+
+    def _next_request_kwargs(self) -> Dict[str, Any]:
+        """
+        Returns the request kwargs for the next page and advances the pagination cursor.
+        """
+        if self._use_page_token:
+            return self._page_token_request_kwargs()
+        else:
+            return self._limit_offset_request_kwargs()
+
+    def _fill_pending(self, submit: Callable[[Dict[str, Any]], Any]):
+        """
+        When `concurrency` is greater than one, schedules the known limit-offset windows
+        so that up to `concurrency` pages are in flight. The first page is always fetched
+        on its own, since its `total_count` determines the remaining windows.
+
+        Args:
+            submit (Callable):
+                Schedules a request with the given kwargs and returns its future or task.
+        """
+        if self._use_page_token or self._concurrency <= 1 or self._pages == 0:
+            return
+
+        # Past the 9_999 cap the remaining windows are unknown, so they are paged sequentially
+        limit = min(self._total, MAX_TOTAL_COUNT)
+        while len(self._pending) < self._concurrency and self._search_from < limit:
+            kwargs = self._limit_offset_request_kwargs()
+            # Each window needs its own payload, the request data is rebuilt for every page
+            self._pending.append(
+                submit(
+                    {
+                        **kwargs,
+                        DEFAULT_REQUEST_PAYLOAD_FIELD: {
+                            **kwargs[DEFAULT_REQUEST_PAYLOAD_FIELD]
+                        },
+                    }
+                )
+            )
+
+    def _parse_page(self, resp: Optional[Response]) -> List[Any]:
+        """
+        Updates the pagination state from a page response and returns the page of data
+        """
+        if self._page_sizing is not None:
+            # Measured once the body is read, before the caller processes the page
+            self._page_seconds = time.perf_counter() - self._requested_at
+            self._page_bytes = response_bytes(resp)
+        return self._read_page(decode_response(resp, self._codec))  # type: ignore
+
+    def _read_page(self, resp_as_json: Any) -> List[Any]:
+        """
+        Updates the pagination state from a decoded page and returns the page of data
+        """
+        try:
             self._pages += 1
 
             self._next_page_token = resp_as_json.get(PublicApiFields.REPLY, {}).get(
@@ -140,32 +629,169 @@ class XpanseResultIterator:
                 PublicApiFields.TOTAL_COUNT, 0
             )
 
-            return resp_as_json[PublicApiFields.REPLY][self._data_key]
+            page = resp_as_json[PublicApiFields.REPLY][self._data_key]
+            if self._replayed:
+                page = [result for result in page if not self._is_replayed(result)]
+            self._track_sort(page)
+            if not self._use_page_token:
+                self._advance_cursor(len(page))
+            self._record_page(len(page))
+            return self._as_records(page)
         except (KeyError, TypeError) as err:
             raise UnexpectedResponseError(
                 f"XpanseResultIterator received unexpected response: {resp_as_json}"
             ) from err
 
-    def _get_data_with_page_token(self) -> Response:
+    def _read_parser(self, parser: StreamingPageParser, tail: List[Any]):
+        """
+        Updates the pagination state from a fully streamed page, given the results at its end
+        that share the last sort value
+        """
+        self._pages += 1
+        self._next_page_token = parser.next_page_token
+        self._last_results_count = (
+            parser.results_count if parser.results_count is not None else parser.results
+        )
+        self._total = parser.total_count or 0
+        self._track_sort(tail)
+        if not self._use_page_token:
+            self._advance_cursor(parser.results)
+        self._record_page(parser.results)
+
+    def _advance_cursor(self, results: int):
+        """
+        Moves the limit-offset cursor past a page returned to the caller. With `page_sizing`, also
+        sizes the window of the next page, and ends pagination on a short page.
+        """
+        if self._page_sizing is None:
+            self._cursor += self._limit
+            return
+
+        if results < self._limit:
+            # The total is exact below the 9,999 cap and a lower bound at it, so at the cap the first
+            # short page may only mean that the API capped the page size. Once that page size is
+            # known, a page shorter than it is the last one.
+            if (
+                results == 0
+                or (self._size_cap is not None and results < self._size_cap)
+                or (
+                    self._total < MAX_TOTAL_COUNT
+                    and self._cursor + results >= self._total
+                )
+            ):
+                self._short_page = True
+                self._cursor += results
+                return
+            self._size_cap = results
+
+        self._cursor += results
+        size = self._page_sizing.next_size(
+            results, self._page_seconds, self._page_bytes
+        )
+        self._limit = min(size, self._size_cap) if self._size_cap else size
+        self._search_from = self._cursor
+        self._search_to = self._cursor + self._limit
+
+    def _record_page(self, results: int):
+        """
+        Records a page read in the metrics of the client, and runs the `ON_PAGE` hooks
+        """
+        if self._metrics is not None:
+            self._metrics.record_page(self._path, results, first=self._pages == 1)
+
+        self._results += results
+        if self._hooks is not None and self._scope is not None:
+            now = time.perf_counter()
+            event = HookEvent(
+                HookType.ON_PAGE,
+                HTTPVerb.HTTP_POST.value,
+                self._path,
+                elapsed=now - self._last_page_at,
+                iterator=self._scope,
+            )
+            event.results = results
+            event.pages = self._pages
+            self._last_page_at = now
+            self._hooks.emit(event)
+
+    @contextmanager
+    def _hook_scope(self) -> Iterator[None]:
+        """
+        Marks the requests sent within as pages of this iterator, running the `ITERATOR_START`
+        hooks before the first page is requested
+        """
+        if self._hooks is None:
+            yield
+            return
+
+        if self._scope is None:
+            self._scope = HookEvent(
+                HookType.ITERATOR_START,
+                HTTPVerb.HTTP_POST.value,
+                self._path,
+                iterator=CURRENT_ITERATOR.get(),
+            )
+            self._started_at = self._last_page_at = time.perf_counter()
+            self._hooks.emit(self._scope)
+
+        token = CURRENT_ITERATOR.set(self._scope)
+        try:
+            yield
+        finally:
+            CURRENT_ITERATOR.reset(token)
+
+    def _end_scope(self):
+        """
+        Runs the `ITERATOR_END` hooks once, when the iterator is exhausted or closed
+        """
+        if self._hooks is None or self._scope is None or self._scope_ended:
+            return
+
+        self._scope_ended = True
+        self._hooks.emit(
+            self._scope.replace(
+                HookType.ITERATOR_END,
+                elapsed=time.perf_counter() - self._started_at,
+                pages=self._pages,
+                results=self._results,
+            )
+        )
+
+    def _page_token_request_kwargs(self) -> Dict[str, Any]:
         """
         When `use_page_token` is True, this method is used to paginate the responses using a page token
         """
-        if self._pages >= 1:
+        return self._page_token_payload(
+            self._next_page_token if self._pages >= 1 else None
+        )
+
+    def _page_token_payload(self, next_page_token: Optional[str]) -> Dict[str, Any]:
+        """
+        Builds the request kwargs for the first page, or for the page after `next_page_token`
+        """
+        if next_page_token is not None:
             extra_request_data: Dict[str, Any] = {
-                PublicApiFields.NEXT_PAGE_TOKEN: self._next_page_token
+                PublicApiFields.NEXT_PAGE_TOKEN: next_page_token
             }
-            self._kwargs = build_request_payload(
-                extra_request_data=extra_request_data, **self._kwargs
-            )
-            return self._api.post(self._path, **self._kwargs)
         else:
             extra_request_data = {PublicApiFields.USE_PAGE_TOKEN: True}
-            self._kwargs = build_request_payload(
-                extra_request_data=extra_request_data, **self._kwargs
-            )
-            return self._api.post(self._path, **self._kwargs)
+        self._kwargs = build_request_payload(
+            extra_request_data=extra_request_data, **self._kwargs
+        )
+        return self._kwargs
 
-    def _get_data_with_limit_offset(self) -> Response:
+    @staticmethod
+    def _page_token_of(resp_as_json: Any) -> Optional[str]:
+        """
+        Reads the `next_page_token` from a decoded page, if there is one
+        """
+        if not isinstance(resp_as_json, dict):
+            return None
+        return resp_as_json.get(PublicApiFields.REPLY, {}).get(
+            PublicApiFields.NEXT_PAGE_TOKEN, None
+        )
+
+    def _limit_offset_request_kwargs(self) -> Dict[str, Any]:
         """
         When `use_page_token` is False, this method is used to paginate the responses using
         the `search_from` and `search_to` fields in the `request` data. This behaves as
@@ -175,14 +801,497 @@ class XpanseResultIterator:
             PublicApiFields.SEARCH_FROM: self._search_from,
             PublicApiFields.SEARCH_TO: self._search_to,
         }
+        self._requested_at = time.perf_counter()
         self._kwargs = build_request_payload(
             extra_request_data=extra_request_data, **self._kwargs
         )
-        resp = self._api.post(self._path, **self._kwargs)
 
         # Increment offset and limit using search_from and search_to
         limit = self._search_to - self._search_from
         self._search_from = self._search_to
         self._search_to += limit
 
-        return resp
+        return self._kwargs
+
+
+class XpanseResultIterator(BaseXpanseResultIterator):
+    """
+    Iterator for paging though results.
+
+    When `concurrency` is greater than one, limit-offset pages are fetched by a pool of
+    `concurrency` threads once the first page has returned the `total_count`. Pages are
+    still returned in order.
+
+    When `prefetch` is greater than zero, page-token pages are fetched by a background
+    thread, which requests the next page as soon as the `next_page_token` of the current
+    one is known. At most `prefetch` pages are buffered ahead of the caller.
+
+    When `stream` is True, each page is requested with `stream=True` and parsed as its body
+    is read, see :class:`xpanse.streaming.StreamingPageParser`. `iter_items` then yields
+    each result as soon as it arrives, without holding the page body or decoded page.
+
+    When `checkpoint_path` is set, the state returned by :meth:`checkpoint` is written to that
+    file before each page is requested, and a new iterator finding the file resumes from it.
+    The file is removed once the iterator is exhausted.
+    """
+
+    # Worker pool used when concurrency > 1
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    # Background page producer used when prefetch > 0
+    _worker: Optional[threading.Thread] = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def next(self) -> List[Any]:
+        """
+        Fetches the result from pagination.next, if a value exists.
+        """
+        if not self.has_next():
+            self.close()
+            raise StopIteration("Pagination exhausted")
+
+        return self._get_data()
+
+    def dump(self) -> List[Any]:
+        """
+        Iterates until completion and returns a list of results.
+        """
+        return [j for i in self for j in i]
+
+    def export(
+        self,
+        path: str,
+        format: Union[str, ExportFormat] = ExportFormat.NDJSON,
+        compression: Optional[Union[str, ExportCompression]] = None,
+        fields: Optional[Sequence[str]] = None,
+        **kwargs: Any,
+    ) -> ExportResult:
+        """
+        Iterates until completion, writing each page to a file instead of building a list. Pages are
+        encoded, compressed and written by a background thread while the next pages are requested,
+        so memory stays bounded by a few pages. See :class:`xpanse.export.ExportWriter`.
+
+        Args:
+            path (str):
+                The file to write. It only appears once the export is complete.
+            format (Union[str, ExportFormat], optional):
+                "ndjson" for one JSON record per line, "csv", or "parquet" (`pip install xpanse[arrow]`).
+                Defaults to "ndjson".
+            compression (Union[str, ExportCompression], optional):
+                "gzip", "zstd" (`pip install xpanse[zstd]`) or None. Defaults to None, except for
+                Parquet, which defaults to "zstd".
+            fields (Sequence[str], optional):
+                The CSV columns. Defaults to the keys of the records of the first page.
+            **kwargs:
+                Other options of the :class:`xpanse.export.ExportWriter`.
+
+        Returns:
+            :obj:`ExportResult`: The number of records and pages, and the bytes written.
+
+        Examples:
+            >>> result = client.assets.list().export("assets.ndjson.gz", compression="gzip")
+            >>> print(result.records, result.bytes_written)
+            >>> client.incidents.list().export("incidents.parquet", format="parquet")
+        """
+        return export_pages(
+            self,
+            path,
+            format=format,
+            compression=compression,
+            fields=fields,
+            codec=self._codec,
+            data_key=self._data_key,
+            **kwargs,
+        )
+
+    def to_arrow(self) -> Any:
+        """
+        Iterates until completion, converting each page to an Arrow record batch as it arrives.
+        Requires `pip install xpanse[arrow]`. See :class:`xpanse.columnar.ArrowBatchBuilder`.
+
+        Returns:
+            :obj:`pyarrow.Table`: The results, typed by the schema of the data type.
+
+        Examples:
+            >>> table = client.assets.list().to_arrow()
+            >>> table.group_by("asset_type").aggregate([("name", "count")])
+        """
+        builder = ArrowBatchBuilder(self._data_key, codec=self._codec)
+        return builder.table([builder.batch(page) for page in self])
+
+    def to_pandas(self) -> Any:
+        """
+        Iterates until completion into a pandas DataFrame, converted from :meth:`to_arrow`.
+        Category fields become pandas categoricals.
+        """
+        return self.to_arrow().to_pandas()
+
+    def to_polars(self) -> Any:
+        """
+        Iterates until completion into a polars DataFrame, converted from :meth:`to_arrow`
+        without copying its columns. Requires `pip install polars`.
+        """
+        return to_polars(self.to_arrow())
+
+    def iter_items(self) -> Iterator[Any]:
+        """
+        Iterates until completion, yielding one result at a time. Each page is released
+        before the next one is requested, so memory is bounded by the page size.
+        """
+        while self.has_next():
+            if self._stream:
+                yield from self._stream_page()
+                continue
+            page = self._get_data()
+            # Pop from the end so yielded results are not kept alive by the page
+            page.reverse()
+            while page:
+                yield page.pop()
+        self.close()
+
+    def close(self):
+        """
+        Cancels any in-flight page requests and releases the worker pool.
+        """
+        while self._pending:
+            self._pending.popleft().cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._worker is not None:
+            self._stop_prefetch.set()
+            self._worker = None
+        self._remove_checkpoint()
+        self._end_scope()
+
+    def _post(self, kwargs: Dict[str, Any]) -> Optional[Response]:
+        """
+        Requests a page of this iterator.
+        """
+        with self._hook_scope():
+            resp = self._api.post(self._path, **kwargs)
+            reseek_kwargs = self._reseek_request_kwargs(resp, kwargs)
+            if reseek_kwargs is not None:
+                resp = self._api.post(self._path, **reseek_kwargs)
+            return resp
+
+    def _submit(self, kwargs: Dict[str, Any]) -> Any:
+        """
+        Schedules a page request on the worker pool.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        return self._executor.submit(self._post, kwargs)
+
+    def _get_data(self) -> List[Any]:
+        """
+        Returns the next page of data
+        """
+        if self._stream:
+            return list(self._stream_page())
+
+        self._save_checkpoint()
+        if self._use_page_token and self._prefetch > 0:
+            return self._read_page(self._next_prefetched())
+
+        self._fill_pending(self._submit)
+        if self._pending:
+            resp = self._pending.popleft().result()
+        else:
+            resp = self._post(self._next_request_kwargs())
+        return self._parse_page(resp)
+
+    def _stream_page(self) -> Iterator[Any]:
+        """
+        Requests the next page with `stream=True` and yields its results as they are read.
+        The pagination state is updated once the whole page has been read.
+        """
+        self._save_checkpoint()
+        resp = self._post({"stream": True, **self._next_request_kwargs()})
+        # Records keep their lazy fields as raw JSON until they are read
+        parser = StreamingPageParser(
+            self._data_key,
+            codec=self._codec,
+            raw_fields=(
+                self._record_type.LAZY_FIELDS if self._record_type is not None else None
+            ),
+        )
+        # Results at the end of the page sharing the last sort value, for checkpoints
+        tail: List[Any] = []
+        for result in iter_response_items(resp, parser):
+            if self._is_replayed(result):
+                continue
+            if self._sort is not None:
+                if tail and self._sort_value_of(result) != self._sort_value_of(
+                    tail[-1]
+                ):
+                    tail = []
+                tail.append(result)
+            if self._record_type is not None:
+                yield self._record_type(result)
+            else:
+                yield result
+        self._read_parser(parser, tail)
+
+    def _next_prefetched(self) -> Any:
+        """
+        Returns the next decoded page from the background worker, starting it on first use.
+        """
+        if self._prefetch_error is not None:
+            raise self._prefetch_error
+
+        if self._worker is None:
+            self._prefetched: queue.Queue = queue.Queue(maxsize=self._prefetch)
+            self._stop_prefetch = threading.Event()
+            # The worker only holds a weak reference, so an iterator dropped without calling
+            # `close` is still collected, which stops the worker
+            weakref.finalize(self, self._stop_prefetch.set)
+            self._worker = threading.Thread(
+                target=self._prefetch_pages,
+                args=(
+                    weakref.ref(self),
+                    self._next_page_token,
+                    self._prefetched,
+                    self._stop_prefetch,
+                ),
+                name=f"{self.__class__.__name__}-prefetch",
+                daemon=True,
+            )
+            self._worker.start()
+
+        item = self._prefetched.get()
+        if isinstance(item, BaseException):
+            self._prefetch_error = item
+            raise item
+        return item
+
+    @staticmethod
+    def _prefetch_pages(
+        ref: "weakref.ref[XpanseResultIterator]",
+        next_page_token: Optional[str],
+        prefetched: queue.Queue,
+        stop: threading.Event,
+    ):
+        """
+        Runs on the background worker. Requests pages back to back and queues each decoded
+        page, blocking while `prefetch` pages are waiting to be consumed. The iterator is only
+        referenced while a page is requested, so that it can be collected while the worker waits.
+        """
+        iterator = None
+        try:
+            while not stop.is_set():
+                iterator = ref()
+                if iterator is None:
+                    return
+                resp = iterator._post(iterator._page_token_payload(next_page_token))
+                resp_as_json = decode_response(resp, iterator._codec)  # type: ignore
+                next_page_token = iterator._page_token_of(resp_as_json)
+                iterator = None
+                XpanseResultIterator._put_prefetched(prefetched, stop, resp_as_json)
+                if next_page_token is None:
+                    return
+        except Exception as err:
+            iterator = None
+            # The frames of the traceback would otherwise keep the iterator alive
+            traceback.clear_frames(err.__traceback__)
+            XpanseResultIterator._put_prefetched(prefetched, stop, err)
+
+    @staticmethod
+    def _put_prefetched(prefetched: queue.Queue, stop: threading.Event, item: Any):
+        """
+        Queues an item for the caller, giving up once the iterator has been closed or collected.
+        """
+        while not stop.is_set():
+            try:
+                prefetched.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+class AsyncXpanseResultIterator(BaseXpanseResultIterator):
+    """
+    Asyncio iterator for paging though results. Returned by the list endpoints of the
+    :class:`xpanse.async_client.AsyncXpanseClient`. When `concurrency` is greater than one,
+    up to `concurrency` limit-offset pages are requested at once. When `prefetch` is greater
+    than zero, page-token pages are requested by a background task with up to `prefetch`
+    pages buffered ahead of the caller.
+
+    Streaming pages with `stream=True` is only supported by the blocking iterator.
+
+    Examples:
+        >>> async for page in client.assets.list():
+        >>>     print(len(page))
+    """
+
+    def __init__(self, *args: Any, stream: bool = False, **kwargs: Any):
+        if stream:
+            raise ValueError(
+                "'stream' is not supported by the AsyncXpanseResultIterator."
+            )
+        super().__init__(*args, **kwargs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.has_next():
+            self.close()
+            raise StopAsyncIteration
+        return await self._get_data()
+
+    async def next(self) -> List[Any]:
+        """
+        Fetches the result from pagination.next, if a value exists.
+        """
+        if not self.has_next():
+            self.close()
+            raise StopAsyncIteration("Pagination exhausted")
+
+        return await self._get_data()
+
+    async def dump(self) -> List[Any]:
+        """
+        Iterates until completion and returns a list of results.
+        """
+        return [j async for i in self for j in i]
+
+    async def export(
+        self,
+        path: str,
+        format: Union[str, ExportFormat] = ExportFormat.NDJSON,
+        compression: Optional[Union[str, ExportCompression]] = None,
+        fields: Optional[Sequence[str]] = None,
+        **kwargs: Any,
+    ) -> ExportResult:
+        """
+        Iterates until completion, writing each page to a file on a background thread. See
+        :meth:`XpanseResultIterator.export`.
+        """
+        loop = asyncio.get_running_loop()
+        writer = ExportWriter(
+            path,
+            format=format,
+            compression=compression,
+            fields=fields,
+            codec=self._codec,
+            data_key=self._data_key,
+            **kwargs,
+        )
+        try:
+            async for page in self:
+                # Blocks while the writer is behind, so wait for it off the event loop
+                await loop.run_in_executor(None, writer.write_page, page)
+        except BaseException:
+            writer.abort()
+            raise
+        return await loop.run_in_executor(None, writer.close)
+
+    async def to_arrow(self) -> Any:
+        """
+        Iterates until completion into an Arrow table. See :meth:`XpanseResultIterator.to_arrow`.
+        """
+        builder = ArrowBatchBuilder(self._data_key, codec=self._codec)
+        return builder.table([builder.batch(page) async for page in self])
+
+    async def iter_items(self) -> AsyncIterator[Any]:
+        """
+        Iterates until completion, yielding one result at a time. Each page is released
+        before the next one is requested, so memory is bounded by the page size.
+        """
+        while self.has_next():
+            page = await self._get_data()
+            # Pop from the end so yielded results are not kept alive by the page
+            page.reverse()
+            while page:
+                yield page.pop()
+        self.close()
+
+    # Background page producer used when prefetch > 0
+    _worker: Optional["asyncio.Future[Any]"] = None
+
+    def close(self):
+        """
+        Cancels any in-flight page requests.
+        """
+        while self._pending:
+            self._pending.popleft().cancel()
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._remove_checkpoint()
+        self._end_scope()
+
+    async def _post(self, kwargs: Dict[str, Any]) -> Optional[Response]:
+        """
+        Requests a page of this iterator.
+        """
+        with self._hook_scope():
+            resp = await self._api.post(self._path, **kwargs)
+            reseek_kwargs = self._reseek_request_kwargs(resp, kwargs)
+            if reseek_kwargs is not None:
+                resp = await self._api.post(self._path, **reseek_kwargs)
+            return resp
+
+    def _submit(self, kwargs: Dict[str, Any]) -> Any:
+        """
+        Schedules a page request as a task on the running event loop.
+        """
+        return asyncio.ensure_future(self._post(kwargs))
+
+    async def _get_data(self) -> List[Any]:
+        """
+        Returns the next page of data
+        """
+        self._save_checkpoint()
+        if self._use_page_token and self._prefetch > 0:
+            return self._read_page(await self._next_prefetched())
+
+        self._fill_pending(self._submit)
+        if self._pending:
+            resp = await self._pending.popleft()
+        else:
+            resp = await self._post(self._next_request_kwargs())
+        return self._parse_page(resp)
+
+    async def _next_prefetched(self) -> Any:
+        """
+        Returns the next decoded page from the background task, starting it on first use.
+        """
+        if self._prefetch_error is not None:
+            raise self._prefetch_error
+
+        if self._worker is None:
+            self._prefetched: asyncio.Queue = asyncio.Queue(maxsize=self._prefetch)
+            self._worker = asyncio.ensure_future(self._prefetch_pages())
+
+        item = await self._prefetched.get()
+        if isinstance(item, BaseException):
+            self._prefetch_error = item
+            raise item
+        return item
+
+    async def _prefetch_pages(self):
+        """
+        Runs as a background task. Requests pages back to back and queues each decoded
+        page, waiting while `prefetch` pages are waiting to be consumed.
+        """
+        # None for the first page, unless resumed
+        next_page_token = self._next_page_token
+        try:
+            while True:
+                resp = await self._post(self._page_token_payload(next_page_token))
+                resp_as_json = decode_response(resp, self._codec)
+                next_page_token = self._page_token_of(resp_as_json)
+                await self._prefetched.put(resp_as_json)
+                if next_page_token is None:
+                    return
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            await self._prefetched.put(err)
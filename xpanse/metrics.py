@@ -0,0 +1,444 @@
+import bisect
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from xpanse.compression import response_sizes
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Upper Bounds in Seconds of the Request Latency Histogram Buckets"""
+
+ERROR_STATUS = "error"
+"""Status Recorded for Attempts That Failed Without a Response, Such as Connection Errors"""
+
+
+class Histogram:
+    """
+    Cumulative histogram of observed values, in the Prometheus layout. Not thread-safe on its
+    own, it is updated under the lock of its :class:`MetricsRegistry`.
+
+    Args:
+        buckets (Sequence[float]):
+            The increasing upper bounds of the buckets. A `+Inf` bucket is always added.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """
+        Records a value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """
+        Returns the number of values at or below each bound, ending with `+Inf`.
+        """
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        total = 0
+        cumulative = []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the upper bound of the bucket holding the `q` quantile, or None when empty.
+        Values above the last bound are reported as the last bound.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        for bound, (_, total) in zip(self.buckets, self.cumulative()):
+            if total >= rank:
+                return bound
+        return self.buckets[-1] if self.buckets else None
+
+
+class EndpointMetrics:
+    """
+    Counters of a single endpoint path. Read them from :meth:`MetricsRegistry.snapshot`.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        """Request Attempts, Including Retries"""
+        self.requests = 0
+
+        """Attempts by Response Status Code, or `error` When no Response was Received"""
+        self.statuses: Dict[str, int] = {}
+
+        """Seconds From Sending an Attempt to Receiving its Response"""
+        self.latency = Histogram(buckets)
+
+        """Response Body Bytes Received, Before Decoding When Known"""
+        self.response_bytes = 0
+
+        """Response Body Bytes After Decompression, for Responses Read by the Client"""
+        self.decoded_bytes = 0
+
+        """Response Body Bytes Received for the Same Responses, Before Decompression"""
+        self.decoded_wire_bytes = 0
+
+        """Request Body Bytes Before Compression"""
+        self.request_bytes = 0
+
+        """Request Body Bytes Sent, After Compression"""
+        self.request_wire_bytes = 0
+
+        """Attempts Retried After a Retryable Status or Connection Error"""
+        self.retries = 0
+
+        """Result Iterators That Read at Least One Page"""
+        self.iterators = 0
+
+        """Pages Read by Result Iterators"""
+        self.pages = 0
+
+        """Results Read by Result Iterators"""
+        self.results = 0
+
+    @property
+    def response_ratio(self) -> float:
+        """
+        Decoded response bytes per byte received. 1.0 until a response is read.
+        """
+        if not self.decoded_wire_bytes:
+            return 1.0
+        return self.decoded_bytes / self.decoded_wire_bytes
+
+    @property
+    def request_ratio(self) -> float:
+        """
+        Request body bytes per byte sent. 1.0 until a request body is sent.
+        """
+        if not self.request_wire_bytes:
+            return 1.0
+        return self.request_bytes / self.request_wire_bytes
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "latency": {
+                "count": self.latency.count,
+                "sum": self.latency.sum,
+                "p50": self.latency.quantile(0.5),
+                "p99": self.latency.quantile(0.99),
+                "buckets": dict(self.latency.cumulative()),
+            },
+            "response_bytes": self.response_bytes,
+            "decoded_bytes": self.decoded_bytes,
+            "decoded_wire_bytes": self.decoded_wire_bytes,
+            "response_ratio": self.response_ratio,
+            "request_bytes": self.request_bytes,
+            "request_wire_bytes": self.request_wire_bytes,
+            "request_ratio": self.request_ratio,
+            "retries": self.retries,
+            "iterators": self.iterators,
+            "pages": self.pages,
+            "results": self.results,
+            "pages_per_iterator": (
+                self.pages / self.iterators if self.iterators else 0.0
+            ),
+        }
+
+
+class MetricsRegistry:
+    """
+    Request, retry and paging metrics of a client, by endpoint path. Every client records into its
+    own registry unless one is shared explicitly with the `metrics` client option. Safe to update
+    from several threads.
+
+    Latency is measured per attempt, from sending the request to receiving the response headers.
+    With `stream=True`, reading the body is not included.
+
+    Request bodies are recorded once per request, before and after compression. Response bodies
+    are recorded per attempt as received and, when read by the client rather than streamed, once
+    decompressed, so that the compression ratios of each path can be monitored.
+
+    Args:
+        buckets (Sequence[float], optional):
+            The upper bounds in seconds of the latency histogram buckets.
+            Defaults to :data:`DEFAULT_LATENCY_BUCKETS`.
+
+    Examples:
+        >>> client.assets.list().dump()
+        >>> client.metrics.snapshot()["public_api/v1/assets/get_assets_internet_exposure/"]["pages"]
+        12
+        >>> # Expose the metrics to a Prometheus scraper
+        >>> body = client.metrics.to_prometheus()
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError(
+                f"'buckets' must be strictly increasing. f{list(buckets)} is not."
+            )
+
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+
+    def _endpoint(self, path: str) -> EndpointMetrics:
+        """
+        Returns the metrics of a path. Called with the lock held.
+        """
+        path = path.strip("/") + "/"
+        endpoint = self._endpoints.get(path)
+        if endpoint is None:
+            endpoint = self._endpoints[path] = EndpointMetrics(self._buckets)
+        return endpoint
+
+    def record_request(
+        self,
+        path: str,
+        status: Optional[int],
+        seconds: float,
+        response_bytes: int = 0,
+        decoded_bytes: Optional[int] = None,
+    ):
+        """
+        Records a request attempt.
+
+        Args:
+            path (str):
+                The endpoint path.
+            status (int, optional):
+                The response status code, or None when no response was received.
+            seconds (float):
+                The time until the response was received, or until the attempt failed.
+            response_bytes (int, optional):
+                The size of the response body.
+            decoded_bytes (int, optional):
+                The size of the response body after decompression, or None when it was not read.
+        """
+        key = str(status) if status is not None else ERROR_STATUS
+        with self._lock:
+            endpoint = self._endpoint(path)
+            endpoint.requests += 1
+            endpoint.statuses[key] = endpoint.statuses.get(key, 0) + 1
+            endpoint.latency.observe(seconds)
+            endpoint.response_bytes += response_bytes
+            if decoded_bytes is not None:
+                endpoint.decoded_bytes += decoded_bytes
+                endpoint.decoded_wire_bytes += response_bytes
+
+    def record_request_body(self, path: str, body_bytes: int, wire_bytes: int):
+        """
+        Records the size of a request body before and after compression.
+
+        Args:
+            path (str):
+                The endpoint path.
+            body_bytes (int):
+                The size of the encoded body.
+            wire_bytes (int):
+                The size of the body as sent, the same as `body_bytes` when it was not compressed.
+        """
+        with self._lock:
+            endpoint = self._endpoint(path)
+            endpoint.request_bytes += body_bytes
+            endpoint.request_wire_bytes += wire_bytes
+
+    def record_retry(self, path: str):
+        """
+        Records that an attempt is retried.
+        """
+        with self._lock:
+            self._endpoint(path).retries += 1
+
+    def record_page(self, path: str, results: int, first: bool = False):
+        """
+        Records a page read by a result iterator.
+
+        Args:
+            path (str):
+                The endpoint path.
+            results (int):
+                The number of results of the page.
+            first (bool, optional):
+                Whether it is the first page of the iterator.
+        """
+        with self._lock:
+            endpoint = self._endpoint(path)
+            endpoint.pages += 1
+            endpoint.results += results
+            if first:
+                endpoint.iterators += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a consistent copy of the metrics of every path.
+        """
+        with self._lock:
+            return {
+                path: endpoint.snapshot()
+                for path, endpoint in sorted(self._endpoints.items())
+            }
+
+    def reset(self):
+        """
+        Drops every recorded metric.
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "xpanse") -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format, labelled by `path`, to serve
+        from a scrape endpoint or write to a node exporter textfile.
+
+        Args:
+            prefix (str, optional):
+                The prefix of every metric name. Defaults to "xpanse".
+        """
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines: List[str] = []
+
+            def family(name: str, kind: str, help_text: str) -> str:
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} {kind}")
+                return f"{prefix}_{name}"
+
+            name = family(
+                "requests_total", "counter", "Request attempts by path and status."
+            )
+            for path, endpoint in endpoints:
+                for status, count in sorted(endpoint.statuses.items()):
+                    lines.append(f"{name}{_labels(path=path, status=status)} {count}")
+
+            name = family(
+                "request_duration_seconds",
+                "histogram",
+                "Seconds until the response of each attempt.",
+            )
+            for path, endpoint in endpoints:
+                for bound, count in endpoint.latency.cumulative():
+                    lines.append(f"{name}_bucket{_labels(path=path, le=bound)} {count}")
+                lines.append(
+                    f"{name}_sum{_labels(path=path)} {endpoint.latency.sum:.6f}"
+                )
+                lines.append(
+                    f"{name}_count{_labels(path=path)} {endpoint.latency.count}"
+                )
+
+            for metric, kind, help_text, attribute in (*_COUNTERS, *_RATIOS):
+                name = family(metric, kind, help_text)
+                for path, endpoint in endpoints:
+                    lines.append(
+                        f"{name}{_labels(path=path)} {getattr(endpoint, attribute)}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+
+_COUNTERS: Iterable[Tuple[str, str, str, str]] = (
+    (
+        "response_bytes_total",
+        "counter",
+        "Response body bytes received.",
+        "response_bytes",
+    ),
+    (
+        "response_decoded_bytes_total",
+        "counter",
+        "Response body bytes after decompression, for responses that were not streamed.",
+        "decoded_bytes",
+    ),
+    (
+        "response_decoded_wire_bytes_total",
+        "counter",
+        "Response body bytes received, for responses that were not streamed.",
+        "decoded_wire_bytes",
+    ),
+    (
+        "request_body_bytes_total",
+        "counter",
+        "Request body bytes before compression.",
+        "request_bytes",
+    ),
+    (
+        "request_wire_bytes_total",
+        "counter",
+        "Request body bytes sent, after compression.",
+        "request_wire_bytes",
+    ),
+    ("retries_total", "counter", "Attempts retried.", "retries"),
+    (
+        "iterators_total",
+        "counter",
+        "Result iterators that read at least one page.",
+        "iterators",
+    ),
+    ("pages_total", "counter", "Pages read by result iterators.", "pages"),
+    ("results_total", "counter", "Results read by result iterators.", "results"),
+)
+"""Plain Counters Exported per Path: Metric Name, Type, Help and Attribute"""
+
+_RATIOS: Iterable[Tuple[str, str, str, str]] = (
+    (
+        "response_compression_ratio",
+        "gauge",
+        "Decoded response bytes per byte received.",
+        "response_ratio",
+    ),
+    (
+        "request_compression_ratio",
+        "gauge",
+        "Request body bytes per byte sent.",
+        "request_ratio",
+    ),
+)
+"""Compression Ratios Exported per Path, in the Layout of :data:`_COUNTERS`"""
+
+
+def _labels(**labels: str) -> str:
+    return (
+        "{"
+        + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+        + "}"
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def response_bytes(response: Any) -> int:
+    """
+    Returns the size of a response body as received, from the bytes read when the body was read,
+    or from its `Content-Length` when it is streamed.
+    """
+    sizes = response_sizes(response)
+    if sizes is not None:
+        return sizes[0]
+    try:
+        return int(response.headers.get("Content-Length", 0))
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def metrics_of(api: Any) -> Optional[MetricsRegistry]:
+    """
+    Returns the metrics registry of a client, or None for objects that are not clients.
+    """
+    metrics = getattr(api, "_metrics", None)
+    return metrics if isinstance(metrics, MetricsRegistry) else None
@@ -0,0 +1,119 @@
+from typing import Any, Optional
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore
+
+from xpanse import __version__
+from xpanse.const import HookType
+from xpanse.hooks import HookEvent, Hooks
+
+SPAN_KEY = "otel.span"
+"""Key of the Span in the :attr:`HookEvent.context` of an Attempt or Iterator"""
+
+
+class OpenTelemetryHooks(Hooks):
+    """
+    Hooks emitting an OpenTelemetry span per request attempt, and a parent span per result
+    iterator, so the time spent by long multi-endpoint jobs shows up in an existing tracing backend.
+    Requires `pip install xpanse[otel]`, plus an OpenTelemetry SDK and exporter configured by the
+    application.
+
+    Attempt spans are children of the span of their iterator, including the pages requested by
+    `concurrency` or `prefetch` workers. Outside of an iterator, they are children of the current
+    span. Iterator spans end when the iterator is exhausted or closed. More hooks can be added to
+    the same instance.
+
+    Args:
+        tracer (opentelemetry.trace.Tracer, optional):
+            The tracer creating the spans. Defaults to the `xpanse` tracer of the global
+            tracer provider.
+
+    Examples:
+        >>> client = XpanseClient(hooks=OpenTelemetryHooks())
+        >>> with tracer.start_as_current_span("nightly-export"):
+        >>>     assets = client.assets.list().dump()
+        >>>     incidents = client.incidents.list(concurrency=8).dump()
+    """
+
+    def __init__(self, tracer: Optional[Any] = None):
+        if trace is None:
+            raise ImportError(
+                "The OpenTelemetryHooks require 'opentelemetry-api'. Install it with 'pip install xpanse[otel]'."
+            )
+
+        super().__init__()
+        self._tracer = (
+            tracer if tracer is not None else trace.get_tracer("xpanse", __version__)
+        )
+        self.add(HookType.BEFORE_REQUEST, self._start_request)
+        self.add(HookType.AFTER_RESPONSE, self._end_request)
+        self.add(HookType.ITERATOR_START, self._start_iterator)
+        self.add(HookType.ON_PAGE, self._add_page)
+        self.add(HookType.ITERATOR_END, self._end_iterator)
+
+    @staticmethod
+    def _parent_context(event: HookEvent) -> Any:
+        """
+        Returns the context of the span of the enclosing iterator, or None for the current context.
+        """
+        parent = event.iterator.context.get(SPAN_KEY) if event.iterator else None
+        return trace.set_span_in_context(parent) if parent is not None else None
+
+    def _start_request(self, event: HookEvent):
+        event.context[SPAN_KEY] = self._tracer.start_span(
+            event.method,
+            context=self._parent_context(event),
+            kind=SpanKind.CLIENT,
+            attributes={
+                "http.request.method": event.method,
+                "url.path": f"/{event.path.strip('/')}/",
+                "http.request.body.size": event.payload_bytes,
+                "http.request.resend_count": event.attempt - 1,
+            },
+        )
+
+    def _end_request(self, event: HookEvent):
+        span = event.context.pop(SPAN_KEY, None)
+        if span is None:
+            return
+
+        if event.status is not None:
+            span.set_attribute("http.response.status_code", event.status)
+        if event.delay is not None:
+            span.set_attribute("xpanse.retry_delay", event.delay)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, type(event.error).__name__))
+        elif event.status is not None and event.status >= 400:
+            span.set_status(Status(StatusCode.ERROR, str(event.status)))
+        span.end()
+
+    def _start_iterator(self, event: HookEvent):
+        event.context[SPAN_KEY] = self._tracer.start_span(
+            f"xpanse.iterate {event.path.strip('/')}",
+            context=self._parent_context(event),
+            kind=SpanKind.INTERNAL,
+            attributes={"url.path": f"/{event.path.strip('/')}/"},
+        )
+
+    def _add_page(self, event: HookEvent):
+        span = event.iterator.context.get(SPAN_KEY) if event.iterator else None
+        if span is not None:
+            span.add_event(
+                "page",
+                {
+                    "xpanse.page": event.pages or 0,
+                    "xpanse.page.results": event.results or 0,
+                    "xpanse.page.elapsed": event.elapsed,
+                },
+            )
+
+    def _end_iterator(self, event: HookEvent):
+        span = event.context.pop(SPAN_KEY, None)
+        if span is not None:
+            span.set_attribute("xpanse.pages", event.pages or 0)
+            span.set_attribute("xpanse.results", event.results or 0)
+            span.end()
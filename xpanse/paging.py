@@ -0,0 +1,95 @@
+class AdaptivePageSize:
+    """
+    Sizes the `search_from`/`search_to` window of limit-offset pages from the latency and response
+    size of the previous page, so that fast tenants are listed in fewer, larger pages and slow
+    tenants in smaller pages that stay well within request timeouts. Stateless, so a single
+    instance can be shared by every iterator.
+
+    After each full page, the window is scaled by how far the page was from `target_latency` and
+    `target_bytes`, whichever is closest to being exceeded, by at most `growth` times per page. A
+    page within `tolerance` of the targets keeps its size.
+
+    Args:
+        target_latency (float, optional):
+            The target seconds to request and read a page. Defaults to 2.
+        target_bytes (int, optional):
+            The target size of a page response body. Defaults to 2 MiB.
+        min_size (int, optional):
+            The smallest window. Defaults to 10.
+        max_size (int, optional):
+            The largest window. If the API returns fewer results than requested while more remain,
+            the iterator also stops growing past that page size. Defaults to 500.
+        growth (float, optional):
+            The largest factor the window is grown or shrunk by after a page. Defaults to 2.
+        tolerance (float, optional):
+            How far from the targets a page can be, as a factor, without resizing. Defaults to 1.25.
+
+    Examples:
+        >>> # List incidents in pages of up to 1,000 results, aiming at one second per page:
+        >>> incidents = client.incidents.list(page_sizing=AdaptivePageSize(target_latency=1, max_size=1_000)).dump()
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 2.0,
+        target_bytes: int = 2 * 1024 * 1024,
+        min_size: int = 10,
+        max_size: int = 500,
+        growth: float = 2.0,
+        tolerance: float = 1.25,
+    ):
+        if target_latency <= 0:
+            raise ValueError(
+                f"'target_latency' must be a positive number. f{target_latency} > 0."
+            )
+        if target_bytes <= 0:
+            raise ValueError(
+                f"'target_bytes' must be a positive integer. f{target_bytes} > 0."
+            )
+        if min_size < 1:
+            raise ValueError(f"'min_size' must be a positive integer. f{min_size} > 0.")
+        if max_size < min_size:
+            raise ValueError(
+                f"'max_size' must be at least 'min_size'. f{max_size} >= f{min_size}."
+            )
+        if growth <= 1:
+            raise ValueError(f"'growth' must be greater than 1. f{growth} > 1.")
+        if tolerance < 1:
+            raise ValueError(f"'tolerance' must be at least 1. f{tolerance} >= 1.")
+
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.min_size = min_size
+        self.max_size = max_size
+        self.growth = growth
+        self.tolerance = tolerance
+
+    def clamp(self, size: int) -> int:
+        """
+        Returns the size within `min_size` and `max_size`.
+        """
+        return max(self.min_size, min(self.max_size, size))
+
+    def next_size(self, size: int, seconds: float, response_bytes: int) -> int:
+        """
+        Returns the window of the next page, given a full page of `size` results.
+
+        Args:
+            size (int):
+                The number of results of the page.
+            seconds (float):
+                The time taken to request and read the page.
+            response_bytes (int):
+                The size of the page response body, or 0 when unknown.
+        """
+        ratios = []
+        if seconds > 0:
+            ratios.append(self.target_latency / seconds)
+        if response_bytes > 0:
+            ratios.append(self.target_bytes / response_bytes)
+        ratio = min(ratios) if ratios else self.growth
+
+        if 1 / self.tolerance <= ratio <= self.tolerance:
+            return self.clamp(size)
+        ratio = max(1 / self.growth, min(self.growth, ratio))
+        return self.clamp(int(size * ratio))
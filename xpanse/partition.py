@@ -0,0 +1,327 @@
+import asyncio
+import copy
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from xpanse.const import FilterOperator, PublicApiFields, MAX_TOTAL_COUNT
+from xpanse.error import UnexpectedResponseError
+from xpanse.response import XpanseResponse
+from xpanse.types import Filter, RequestData
+
+Window = Tuple[int, int]
+"""Inclusive (start, end) Epoch Millisecond Bounds of a Time Window"""
+
+
+class BaseTimeWindowScan:
+    """
+    Scans a list endpoint past the `total_count` cap by splitting the query into disjoint time windows.
+
+    The initial window is counted with the endpoint's `count` method. Any window whose count reaches
+    the cap is split in half, and the halves are counted again, until every window is below the cap.
+    The windows are then listed in parallel and the results are de-duplicated on `id_field`, since a
+    record updated during the scan may be returned by more than one window.
+
+    At most `concurrency` windows of up to `max_count` results are held in memory at once: the next
+    window is only listed once the results of a previous one have been yielded. The id of every
+    result yielded is kept until the scan completes, since a duplicate may come from any window, so
+    a scan of millions of results also holds millions of ids.
+
+    Args:
+        endpoint (Any):
+            The endpoint to scan. It must provide `count` and `list` methods accepting `request_data`.
+        id_field (str):
+            The primary id field of each result, used to de-duplicate results.
+        time_field (str):
+            The epoch millisecond field used to filter each window. Defaults to `creation_time`.
+        request_data (RequestData, Optional):
+            Any supplemental request_data to be included with every request. Filters are kept and
+            combined with the time window filters.
+        start (int, Optional):
+            The inclusive epoch millisecond start of the scan. Defaults to 0.
+        end (int, Optional):
+            The inclusive epoch millisecond end of the scan. Defaults to the current time.
+        concurrency (int, Optional):
+            The number of windows counted or listed in parallel. Defaults to 4.
+        max_count (int, Optional):
+            The largest count a window may have before it is split. Defaults to `MAX_TOTAL_COUNT`.
+        **kwargs:
+            Any extraneous parameters passed to every `count` and `list` call.
+    """
+
+    def __init__(
+        self,
+        endpoint: Any,
+        id_field: str,
+        time_field: str = "creation_time",
+        request_data: Optional[RequestData] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        concurrency: int = 4,
+        max_count: int = MAX_TOTAL_COUNT,
+        **kwargs: Any,
+    ):
+        self._endpoint = endpoint
+        self._id_field = id_field
+        self._time_field = time_field
+        self._request_data = request_data
+        self._start = start if start is not None else 0
+        self._end = end if end is not None else int(time.time() * 1000)
+        self._max_count = max_count
+        self._kwargs = kwargs
+        self._log = logging.getLogger(
+            "{}.{}".format(self.__module__, self.__class__.__name__)
+        )
+
+        if self._end < self._start:
+            raise ValueError(
+                f"'start' must be less than or equal to 'end'. f{self._start} <= f{self._end}"
+            )
+
+        if concurrency < 1:
+            raise ValueError(
+                f"'concurrency' must be a positive integer. f{concurrency} > 0."
+            )
+
+        self._concurrency = concurrency
+
+    def _window_request_data(self, window: Window) -> RequestData:
+        """
+        Returns a copy of the request data with the window's time filters appended
+        """
+        request_data: Dict[str, Any] = copy.deepcopy(dict(self._request_data or {}))
+        filters: List[Filter] = [
+            {
+                "field": self._time_field,
+                "operator": FilterOperator.GTE.value,
+                "value": window[0],
+            },
+            {
+                "field": self._time_field,
+                "operator": FilterOperator.LTE.value,
+                "value": window[1],
+            },
+        ]
+        request_data[PublicApiFields.FILTERS] = (
+            request_data.get(PublicApiFields.FILTERS, []) + filters
+        )
+        return request_data  # type: ignore
+
+    def _window_kwargs(self, window: Window) -> dict:
+        """
+        Returns the request kwargs for a window. The kwargs are copied, since building the
+        payload updates them in place.
+        """
+        return {
+            "request_data": self._window_request_data(window),
+            **copy.deepcopy(self._kwargs),
+        }
+
+    def _read_count(self, window: Window, response: XpanseResponse) -> int:
+        """
+        Returns the count of a window from its count response
+        """
+        count = response.data
+        if not isinstance(count, int):
+            raise UnexpectedResponseError(
+                f"TimeWindowScan received unexpected count for window {window}: {count}"
+            )
+        return count
+
+    def _split(self, window: Window, count: int) -> List[Window]:
+        """
+        Returns the two disjoint halves of a window at or above the cap, or an empty list when
+        the window is kept as is
+        """
+        start, end = window
+        if count < self._max_count:
+            return []
+        if start == end:
+            self._log.warning(
+                f"Window {window} has {count} results in a single millisecond and cannot be split further. "
+                f"Results may be truncated at {self._max_count}."
+            )
+            return []
+
+        mid = start + (end - start) // 2
+        return [(start, mid), (mid + 1, end)]
+
+    def _dedupe(self, page: List[Any], seen: Set[Any]) -> Iterator[Any]:
+        """
+        Yields the results of a page whose id has not been seen yet
+        """
+        for item in page:
+            item_id = item.get(self._id_field) if isinstance(item, dict) else None
+            if item_id is None:
+                yield item
+            elif item_id not in seen:
+                seen.add(item_id)
+                yield item
+
+
+class TimeWindowScan(BaseTimeWindowScan):
+    """
+    Blocking time window scan used by the :class:`xpanse.client.XpanseClient`. Windows are counted
+    and listed on a thread pool, and results are yielded as each window completes.
+
+    Examples:
+        >>> for incident in client.incidents.scan(start=1672531200000):
+        >>>     print(incident["incident_id"])
+    """
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_items()
+
+    def windows(self) -> List[Window]:
+        """
+        Counts and splits the scan range until every window is below the cap.
+
+        Returns:
+            :obj:`List[Window]`:
+                The disjoint (start, end) windows, in time order.
+        """
+        windows: List[Window] = []
+        level = [(self._start, self._end)]
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            while level:
+                counts = executor.map(self._count, level)
+                next_level: List[Window] = []
+                for window, count in zip(level, counts):
+                    halves = self._split(window, count)
+                    if halves:
+                        next_level += halves
+                    elif count > 0:
+                        windows.append(window)
+                level = next_level
+        return sorted(windows)
+
+    def iter_items(self) -> Iterator[Any]:
+        """
+        Lists every window in parallel and yields each unique result. At most `concurrency`
+        windows are listed ahead of the caller.
+
+        Returns:
+            :obj:`Iterator`:
+                A generator yielding each result once.
+        """
+        seen: Set[Any] = set()
+        windows = iter(self.windows())
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            pending: Deque[Future] = deque(
+                executor.submit(self._dump, window)
+                for window in islice(windows, self._concurrency)
+            )
+            try:
+                while pending:
+                    yield from self._dedupe(pending.popleft().result(), seen)
+                    # Only list the next window once this one has been consumed
+                    for window in islice(windows, 1):
+                        pending.append(executor.submit(self._dump, window))
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def dump(self) -> List[Any]:
+        """
+        Returns every unique result as a list.
+        """
+        return list(self.iter_items())
+
+    def _count(self, window: Window) -> int:
+        response = self._endpoint.count(**self._window_kwargs(window))
+        return self._read_count(window, response)
+
+    def _dump(self, window: Window) -> List[Any]:
+        return self._endpoint.list(**self._window_kwargs(window)).dump()
+
+
+class AsyncTimeWindowScan(BaseTimeWindowScan):
+    """
+    Asyncio time window scan used by the :class:`xpanse.async_client.AsyncXpanseClient`. At most
+    `concurrency` windows are counted or listed at once.
+
+    Examples:
+        >>> async for incident in client.incidents.scan(start=1672531200000):
+        >>>     print(incident["incident_id"])
+    """
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.iter_items()
+
+    async def windows(self) -> List[Window]:
+        """
+        Counts and splits the scan range until every window is below the cap.
+
+        Returns:
+            :obj:`List[Window]`:
+                The disjoint (start, end) windows, in time order.
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+        windows: List[Window] = []
+        level = [(self._start, self._end)]
+        while level:
+            counts = await asyncio.gather(
+                *[self._count(window, semaphore) for window in level]
+            )
+            next_level: List[Window] = []
+            for window, count in zip(level, counts):
+                halves = self._split(window, count)
+                if halves:
+                    next_level += halves
+                elif count > 0:
+                    windows.append(window)
+            level = next_level
+        return sorted(windows)
+
+    async def iter_items(self) -> AsyncIterator[Any]:
+        """
+        Lists every window concurrently and yields each unique result. At most `concurrency`
+        windows are listed ahead of the caller.
+
+        Returns:
+            :obj:`AsyncIterator`:
+                An async generator yielding each result once.
+        """
+        seen: Set[Any] = set()
+        windows = iter(await self.windows())
+        pending: Deque[asyncio.Future] = deque(
+            asyncio.ensure_future(self._dump(window))
+            for window in islice(windows, self._concurrency)
+        )
+        try:
+            while pending:
+                for item in self._dedupe(await pending.popleft(), seen):
+                    yield item
+                # Only list the next window once this one has been consumed
+                for window in islice(windows, 1):
+                    pending.append(asyncio.ensure_future(self._dump(window)))
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def dump(self) -> List[Any]:
+        """
+        Returns every unique result as a list.
+        """
+        return [item async for item in self.iter_items()]
+
+    async def _count(self, window: Window, semaphore: asyncio.Semaphore) -> int:
+        async with semaphore:
+            response = await self._endpoint.count(**self._window_kwargs(window))
+        return self._read_count(window, response)
+
+    async def _dump(self, window: Window) -> List[Any]:
+        return await self._endpoint.list(**self._window_kwargs(window)).dump()
@@ -0,0 +1,172 @@
+import logging
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+
+SocketOption = Tuple[int, int, int]
+"""(level, option, value) Socket Option as Accepted by urllib3 and httpx"""
+
+_log = logging.getLogger(__name__)
+
+
+class PoolConfig:
+    """
+    Connection pool settings of a client. The defaults match the `requests` defaults, with TCP
+    keep-alive enabled so that idle pooled connections are not silently dropped by proxies or
+    load balancers between pages.
+
+    Args:
+        pool_connections (int, optional):
+            The number of hosts to keep connection pools for. Defaults to 10.
+        pool_maxsize (int, optional):
+            The number of connections kept open per host. Set it to at least the number of threads
+            or iterator `concurrency` sharing the client, otherwise the extra connections are closed
+            after each request and a new TLS handshake is paid for the next one. Defaults to 10.
+        pool_block (bool, optional):
+            When True, requests wait for a free connection once `pool_maxsize` connections are in
+            use, instead of opening connections that are discarded afterwards. Defaults to False.
+        keep_alive (bool, optional):
+            Whether TCP keep-alive probes are enabled on every connection. Defaults to True.
+        keep_alive_idle (int, optional):
+            Seconds a connection is idle before the first keep-alive probe. Defaults to 60.
+        keep_alive_interval (int, optional):
+            Seconds between keep-alive probes. Defaults to 30.
+        keep_alive_count (int, optional):
+            Unanswered probes before the connection is dropped. Defaults to 5.
+        warm_up (int, optional):
+            The number of connections opened in parallel when the client is created, so that the
+            first concurrent requests do not all pay for a TLS handshake. Defaults to 0.
+
+    Examples:
+        >>> # Keep up to 32 connections open for 32 parallel workers:
+        >>> client = XpanseClient(pool_config=PoolConfig(pool_maxsize=32, pool_block=True, warm_up=8))
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keep_alive_idle: int = 60,
+        keep_alive_interval: int = 30,
+        keep_alive_count: int = 5,
+        warm_up: int = 0,
+    ):
+        if pool_connections < 1:
+            raise ValueError(
+                f"'pool_connections' must be a positive integer. f{pool_connections} > 0."
+            )
+
+        if pool_maxsize < 1:
+            raise ValueError(
+                f"'pool_maxsize' must be a positive integer. f{pool_maxsize} > 0."
+            )
+
+        if warm_up < 0:
+            raise ValueError(
+                f"'warm_up' must be zero or a positive integer. f{warm_up} >= 0."
+            )
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.keep_alive_idle = keep_alive_idle
+        self.keep_alive_interval = keep_alive_interval
+        self.keep_alive_count = keep_alive_count
+        self.warm_up = warm_up
+
+    def socket_options(self) -> List[SocketOption]:
+        """
+        Returns the socket options of every connection, including the default `TCP_NODELAY`.
+        Keep-alive timing options are only set where the platform supports them.
+        """
+        options: List[SocketOption] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        if not self.keep_alive:
+            return options
+
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Linux names the idle option TCP_KEEPIDLE, macOS names it TCP_KEEPALIVE
+        idle = getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+        for option, value in [
+            (idle, self.keep_alive_idle),
+            (getattr(socket, "TCP_KEEPINTVL", None), self.keep_alive_interval),
+            (getattr(socket, "TCP_KEEPCNT", None), self.keep_alive_count),
+        ]:
+            if option is not None:
+                options.append((socket.IPPROTO_TCP, option, value))
+        return options
+
+    def adapter(self) -> "PoolAdapter":
+        """
+        Returns a new `requests` transport adapter using these settings.
+        """
+        return PoolAdapter(self)
+
+    def mount(self, session: requests.Session):
+        """
+        Replaces the default adapters of a session with adapters using these settings.
+        """
+        adapter = self.adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def warm(self, session: requests.Session, url: str):
+        """
+        Opens `warm_up` connections to the URL's host in parallel and returns them to the pool.
+        Warm-up is best effort: failures are logged and the connections are opened by the
+        first requests instead.
+
+        Args:
+            session (requests.Session):
+                A session the settings were mounted on.
+            url (str):
+                Any URL on the host to connect to.
+        """
+        if self.warm_up == 0:
+            return
+
+        adapter = session.get_adapter(url)
+        if not isinstance(adapter, HTTPAdapter):
+            return
+
+        try:
+            pool = adapter.get_connection(url, proxies=session.proxies)
+            # Never hold more connections than the pool keeps, or they would be discarded
+            count = min(self.warm_up, self.pool_maxsize)
+            connections: List[Any] = [pool._get_conn() for _ in range(count)]
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                list(executor.map(lambda conn: conn.connect(), connections))
+            for conn in connections:
+                pool._put_conn(conn)
+        except Exception as err:
+            _log.warning(f"Connection warm-up failed: {err}")
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    `requests` transport adapter applying a :class:`PoolConfig`, including its socket options.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["_config"]
+
+    def __init__(self, config: Optional[PoolConfig] = None, **kwargs: Any):
+        self._config = config or PoolConfig()
+        super().__init__(
+            pool_connections=self._config.pool_connections,
+            pool_maxsize=self._config.pool_maxsize,
+            pool_block=self._config.pool_block,
+            **kwargs,
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any):
+        kwargs["socket_options"] = self._config.socket_options()
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args: Any, **kwargs: Any):
+        kwargs["socket_options"] = self._config.socket_options()
+        return super().proxy_manager_for(*args, **kwargs)
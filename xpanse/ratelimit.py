@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Tokens are added at `rate` per second up to `burst` tokens, and
+    every request takes one token. Requests are never refused: a request made while the bucket
+    is empty reserves the next token and is told how long to wait for it, so concurrent callers
+    are paced in the order they arrive.
+
+    Args:
+        rate (float):
+            The number of requests per second.
+        burst (int, optional):
+            The number of requests that can be made at once after a quiet period. Defaults to
+            `max(1, rate)`.
+        clock (Callable[[], float], optional):
+            Monotonic clock in seconds. Defaults to `time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError(f"'rate' must be a positive number. f{rate} > 0.")
+
+        burst = burst if burst is not None else max(1, int(rate))
+        if burst < 1:
+            raise ValueError(f"'burst' must be a positive integer. f{burst} > 0.")
+
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the bucket.
+
+        Returns:
+            :float: The number of seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self._rate)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter consulted by the clients before every request, including retries.
+
+    Requests use the default bucket unless their path starts with one of the `path_limits`
+    prefixes, in which case they use that prefix's own bucket (the longest matching prefix wins).
+    Path buckets are separate from the default bucket, so a heavy scan limited by its own bucket
+    does not use up the requests available to the rest of the client.
+
+    A single limiter can be shared by several clients, in any number of threads, to keep all of
+    them under one tenant quota.
+
+    Args:
+        rate (float):
+            The number of requests per second of the default bucket.
+        burst (int, optional):
+            The burst size of the default bucket. Defaults to `max(1, rate)`.
+        path_limits (Mapping[str, Tuple[float, int]], optional):
+            The `(rate, burst)` of the bucket used for each path prefix.
+        clock (Callable[[], float], optional):
+            Monotonic clock in seconds. Defaults to `time.monotonic`.
+
+    Examples:
+        >>> # 10 requests per second, with asset scans limited to 2 requests per second:
+        >>> limiter = RateLimiter(
+        >>>     rate=10,
+        >>>     burst=20,
+        >>>     path_limits={"public_api/v1/assets/get_assets_internet_exposure/": (2, 2)},
+        >>> )
+        >>> client = XpanseClient(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        path_limits: Optional[Mapping[str, Tuple[float, int]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._default = TokenBucket(rate, burst, clock=clock)
+        self._paths: Dict[str, TokenBucket] = {
+            prefix: TokenBucket(path_rate, path_burst, clock=clock)
+            for prefix, (path_rate, path_burst) in (path_limits or {}).items()
+        }
+
+    def bucket(self, path: str) -> TokenBucket:
+        """
+        Returns the bucket used for a request path.
+        """
+        matches = [prefix for prefix in self._paths if path.startswith(prefix)]
+        if not matches:
+            return self._default
+        return self._paths[max(matches, key=len)]
+
+    def reserve(self, path: str) -> float:
+        """
+        Takes a token for a request path.
+
+        Returns:
+            :float: The number of seconds to wait before sending the request.
+        """
+        return self.bucket(path).reserve()
+
+    def acquire(self, path: str):
+        """
+        Blocks until a request to the path can be sent.
+        """
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, path: str):
+        """
+        Waits without blocking the event loop until a request to the path can be sent.
+        """
+        delay = self.reserve(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,284 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Tuple, Type
+
+from xpanse.codec import JsonCodec, get_codec
+from xpanse.const import FieldType
+from xpanse.schemas import schema_of
+
+_DEFAULT_CODEC: Optional[JsonCodec] = None
+"""Codec Decoding the Raw JSON of Lazy Fields, Resolved on First Use"""
+
+
+def _default_codec() -> JsonCodec:
+    global _DEFAULT_CODEC
+    if _DEFAULT_CODEC is None:
+        _DEFAULT_CODEC = get_codec()
+    return _DEFAULT_CODEC
+
+
+def _slots(data_key: str) -> Tuple[str, ...]:
+    """
+    Returns the slots of the record type of a data type. Lazy fields are stored under a private
+    slot, read through a :class:`_LazyField` of the field name.
+    """
+    return tuple(
+        f"_{field.name}" if field.field_type == FieldType.JSON else field.name
+        for field in schema_of(data_key)
+    )
+
+
+class _LazyField:
+    """
+    A nested field that may be given as raw JSON bytes, such as by a parser that kept the bytes of
+    the field, and is then decoded on first access and cached in its slot. Decoded values are
+    stored as they are. Reads None when the field is missing.
+    """
+
+    __slots__ = ("slot",)
+
+    def __init__(self, slot: str):
+        self.slot = slot
+
+    def __get__(self, record: Any, owner: Any = None) -> Any:
+        if record is None:
+            return self
+        try:
+            value = getattr(record, self.slot)
+        except AttributeError:
+            return None
+        if isinstance(value, bytes):
+            value = _default_codec().loads(value)
+            setattr(record, self.slot, value)
+        return value
+
+    def __set__(self, record: Any, value: Any):
+        setattr(record, self.slot, value)
+
+
+class Record(Mapping):
+    """
+    A compact, read-only result of a data type. Fields are stored in `__slots__` instead of a
+    dict per result, and category values are interned so that repeated values share one string.
+    Nested blobs given as raw JSON bytes, as streamed pages (`stream=True`) give them, are only
+    decoded when they are read.
+
+    Fields are read as attributes, and fields missing from the result read as None. Records are
+    also mappings of the fields the result has, so code written for the plain dict results keeps
+    working: missing fields are left out of iteration, `len`, `in` and `to_dict`, and `get` returns
+    its default for them. Fields outside of the schema of the data type, such as the details
+    returned by the `get` endpoints, are kept together in one dict. Records of the `get` endpoints
+    always have such fields, so each of them carries a dict again and saves less memory than the
+    records of the `list` endpoints.
+
+    Args:
+        result (Dict[str, Any]):
+            A decoded result of the data type. The values of `LAZY_FIELDS` may be raw JSON bytes.
+
+    Examples:
+        >>> for asset in client.assets.list().as_records().iter_items():
+        >>>     print(asset.name, asset.asset_type)
+    """
+
+    __slots__ = ("_extra",)
+
+    DATA_KEY: str = ""
+    """Data Key of the List Endpoint of the Record Type"""
+
+    FIELDS: Tuple[str, ...] = ()
+    """Names of the Fields, in Schema Order"""
+
+    LAZY_FIELDS: FrozenSet[str] = frozenset()
+    """Nested Fields, Decoded on First Access When Given as Raw JSON Bytes"""
+
+    CATEGORY_FIELDS: FrozenSet[str] = frozenset()
+    """Fields Whose String Values are Interned"""
+
+    _FIELD_SET: FrozenSet[str] = frozenset()
+
+    # Slot of each field, which is left unset when the result lacks the field
+    _SLOT_OF: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        fields = schema_of(cls.DATA_KEY)
+        cls.FIELDS = tuple(field.name for field in fields)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+        cls.LAZY_FIELDS = frozenset(
+            field.name for field in fields if field.field_type == FieldType.JSON
+        )
+        cls.CATEGORY_FIELDS = frozenset(
+            field.name for field in fields if field.field_type == FieldType.CATEGORY
+        )
+        for name in cls.LAZY_FIELDS:
+            setattr(cls, name, _LazyField(f"_{name}"))
+        cls._SLOT_OF = {
+            name: f"_{name}" if name in cls.LAZY_FIELDS else name for name in cls.FIELDS
+        }
+
+    def __init__(self, result: Dict[str, Any]):
+        for name in self.FIELDS:
+            if name not in result:
+                continue
+            value = result[name]
+            if name in self.CATEGORY_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(self, name, value)
+
+        extra = {key: val for key, val in result.items() if key not in self._FIELD_SET}
+        self._extra: Optional[Dict[str, Any]] = extra or None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for fields missing from the result, and for names that are not fields
+        if name in self._FIELD_SET:
+            return None
+        if not name.startswith("_") and name in self._extras():
+            return self._extras()[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            if not self._has(key):
+                raise KeyError(key)
+            return getattr(self, key)
+        return self._extras()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from (name for name in self.FIELDS if self._has(name))
+        yield from self._extras()
+
+    def __len__(self) -> int:
+        return sum(1 for name in self.FIELDS if self._has(name)) + len(self._extras())
+
+    def __contains__(self, key: Any) -> bool:
+        if key in self._FIELD_SET:
+            return self._has(key)
+        return key in self._extras()
+
+    def __repr__(self) -> str:
+        key = self.FIELDS[0]
+        return f"{self.__class__.__name__}({key}={getattr(self, key)!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the fields of the result as a plain dict, decoding every lazy field.
+        """
+        return {key: self[key] for key in self}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The default reads every slot through `__getattr__`, which would set the missing fields
+        result = {name: self._slot(name) for name in self.FIELDS if self._has(name)}
+        result.update(self._extras())
+        return self.__class__, (result,)
+
+    def _slot(self, name: str) -> Any:
+        """
+        Returns the stored value of a field, still raw for lazy fields given as bytes
+        """
+        return object.__getattribute__(self, self._SLOT_OF[name])
+
+    def _has(self, name: str) -> bool:
+        """
+        Whether the result has a field of the schema, as its slot is only set when it does
+        """
+        try:
+            self._slot(name)
+        except AttributeError:
+            return False
+        return True
+
+    def _extras(self) -> Dict[str, Any]:
+        """
+        Returns the fields outside of the schema
+        """
+        return self._extra or {}
+
+
+class AssetRecord(Record):
+    """
+    Record of an Asset, with the fields of :data:`xpanse.schemas.ASSET_FIELDS`.
+    """
+
+    __slots__ = _slots("assets_internet_exposure")
+    DATA_KEY = "assets_internet_exposure"
+
+
+class ServiceRecord(Record):
+    """
+    Record of a Service, with the fields of :data:`xpanse.schemas.SERVICE_FIELDS`.
+    """
+
+    __slots__ = _slots("external_services")
+    DATA_KEY = "external_services"
+
+
+class OwnedIpRangeRecord(Record):
+    """
+    Record of an Owned IP Range, with the fields of :data:`xpanse.schemas.OWNED_IP_RANGE_FIELDS`.
+    """
+
+    __slots__ = _slots("external_ip_address_ranges")
+    DATA_KEY = "external_ip_address_ranges"
+
+
+class IncidentRecord(Record):
+    """
+    Record of an Incident, with the fields of :data:`xpanse.schemas.INCIDENT_FIELDS`.
+    """
+
+    __slots__ = _slots("incidents")
+    DATA_KEY = "incidents"
+
+
+class AlertRecord(Record):
+    """
+    Record of an Alert, with the fields of :data:`xpanse.schemas.ALERT_FIELDS`. Its `events` are
+    decoded on first access.
+    """
+
+    __slots__ = _slots("alerts")
+    DATA_KEY = "alerts"
+
+
+class AttackSurfaceRuleRecord(Record):
+    """
+    Record of an Attack Surface Rule, with the fields of
+    :data:`xpanse.schemas.ATTACK_SURFACE_RULE_FIELDS`.
+    """
+
+    __slots__ = _slots("attack_surface_rules")
+    DATA_KEY = "attack_surface_rules"
+
+
+RECORD_TYPES: Dict[str, Type[Record]] = {
+    record_type.DATA_KEY: record_type
+    for record_type in (
+        AssetRecord,
+        ServiceRecord,
+        OwnedIpRangeRecord,
+        IncidentRecord,
+        AlertRecord,
+        AttackSurfaceRuleRecord,
+    )
+}
+"""Record Type of Each Data Type by the Data Key of its List Endpoint"""
+
+
+def record_type_of(data_key: str) -> Type[Record]:
+    """
+    Returns the record type of a data type.
+
+    Args:
+        data_key (str):
+            The data key of the list endpoint, i.e. "incidents". See :data:`RECORD_TYPES`.
+
+    Raises:
+        :obj:`ValueError`: When the data type has no record type.
+    """
+    if data_key not in RECORD_TYPES:
+        raise ValueError(
+            f"Unknown data key '{data_key}'. Use one of {', '.join(RECORD_TYPES)}."
+        )
+    return RECORD_TYPES[data_key]
@@ -1,8 +1,13 @@
-from typing import Optional, Any
+from typing import Optional, Any, List, Type
 
 from requests import Response
 
+from xpanse.codec import JsonCodec, decode_response
 from xpanse.const import PublicApiFields
+from xpanse.records import Record, record_type_of
+
+_UNPARSED = object()
+"""Marker for a Body That Was Not Parsed Yet, Since None is a Valid JSON Body"""
 
 
 class XpanseResponse:
@@ -10,9 +15,30 @@ class XpanseResponse:
     This class wraps the existing requests.Response class to enable ease of parsing while maintaining the
     raw response object and status code.
 
+    The body is parsed once, on first access, and the decoded body is cached for every later access.
+
     Usages:
         > To see the raw response from the request, access the "response" attribute: xpanse_response.response
         > To grab the parsed data from the response, access the "data" attribute: xpanse_response.data
+        > To read the pagination fields, access the "total_count", "results_count" and "next_page_token" attributes
+        > To free the raw body bytes once parsed, call xpanse_response.release_body(). The raw response then
+          has no body, so only read the parsed body afterwards
+        > To convert the parsed results to compact records, call xpanse_response.as_records()
+
+    Args:
+        response (Response):
+            The raw response.
+        data_key (str, Optional):
+            The key under `reply` holding the parsed results.
+        codec (JsonCodec, Optional):
+            The JSON codec used to parse the body. Defaults to `requests` parsing.
+        release_body (bool, Optional):
+            Opt-in. When True, the raw body bytes are dropped from the `requests.Response` after parsing,
+            which roughly halves the memory of each response held. `response.content` is then None, and
+            `response.text` and `response.json()` no longer return the body: read `body` or `data`
+            instead. Defaults to False, keeping the raw response intact.
+        record_key (str, Optional):
+            The data key of the record type of the results, when it differs from `data_key`.
 
     Examples:
         >>> assets = client.assets.get(asset_ids=["id1"])
@@ -20,23 +46,46 @@ class XpanseResponse:
         >>>     results = assets.data
     """
 
-    def __init__(self, response: Response, data_key: Optional[str] = None):
+    def __init__(
+        self,
+        response: Response,
+        data_key: Optional[str] = None,
+        codec: Optional[JsonCodec] = None,
+        release_body: bool = False,
+        record_key: Optional[str] = None,
+    ):
         self._response = response
         self._data_key = data_key
+        self._codec = codec
+        self._release_body = release_body
+        self._record_key = record_key or data_key
+        self._body: Any = _UNPARSED
 
     @property
     def response(self) -> Response:
         """
-        Defines the raw `requests.Response` property
+        Defines the raw `requests.Response` property. Its body is unavailable once released, see
+        :meth:`release_body`.
         """
         return self._response
 
+    @property
+    def body(self) -> Any:
+        """
+        The decoded response body. The body is parsed on first access only.
+        """
+        if self._body is _UNPARSED:
+            self._body = decode_response(self.response, self._codec)
+            if self._release_body:
+                self._drop_content()
+        return self._body
+
     @property
     def data(self) -> Any:
         """
         Parses the response body and returns it under the `data` property
         """
-        response_data = self.response.json()
+        response_data = self.body
 
         if not isinstance(response_data, dict):
             return response_data
@@ -47,3 +96,73 @@ class XpanseResponse:
             return response_data[PublicApiFields.REPLY][self._data_key]
 
         return response_data.get(PublicApiFields.REPLY, response_data)
+
+    @property
+    def total_count(self) -> Optional[int]:
+        """
+        The `total_count` of the reply, or None when the reply has none
+        """
+        return self._reply_field(PublicApiFields.TOTAL_COUNT)
+
+    @property
+    def results_count(self) -> Optional[int]:
+        """
+        The `results_count` of the reply, or None when the reply has none
+        """
+        return self._reply_field(PublicApiFields.RESULTS_COUNT)
+
+    @property
+    def next_page_token(self) -> Optional[str]:
+        """
+        The `next_page_token` of the reply, or None on the last page
+        """
+        return self._reply_field(PublicApiFields.NEXT_PAGE_TOKEN)
+
+    def as_records(self, record_type: Optional[Type[Record]] = None) -> List[Record]:
+        """
+        Converts the parsed results to compact records, see :class:`xpanse.records.Record`.
+
+        Args:
+            record_type (Type[Record], Optional):
+                The record type of the results. Defaults to the record type of the endpoint.
+
+        Raises:
+            ValueError: When the endpoint has no record type.
+
+        Examples:
+            >>> assets = client.assets.get(asset_ids=["id1"]).as_records()
+            >>> print(assets[0].name)
+        """
+        if record_type is None:
+            if self._record_key is None:
+                raise ValueError("A 'record_type' must be provided.")
+            record_type = record_type_of(self._record_key)
+        return [record_type(result) for result in self.data]
+
+    def release_body(self):
+        """
+        Parses the body, if it was not parsed yet, then drops the raw body bytes from the
+        `requests.Response`. The decoded body stays available through `body` and `data`, but
+        `response.content` is None afterwards, and `response.text` and `response.json()` no
+        longer return the body.
+        """
+        self._release_body = True
+        if self._body is _UNPARSED:
+            self.body
+        else:
+            self._drop_content()
+
+    def _reply_field(self, field: str) -> Any:
+        body = self.body
+        if not isinstance(body, dict) or not isinstance(
+            body.get(PublicApiFields.REPLY), dict
+        ):
+            return None
+        return body[PublicApiFields.REPLY].get(field)
+
+    def _drop_content(self):
+        """
+        Drops the raw body bytes. Streamed bodies, which are not held by the response, are kept.
+        """
+        if isinstance(self._response, Response) and self._response._content_consumed:  # type: ignore
+            self._response._content = None
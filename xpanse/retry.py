@@ -0,0 +1,198 @@
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Mapping, Optional
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of the requests sent by a client, so that a failing API
+    is not flooded with retries. Every request deposits `ratio` tokens and every retry
+    withdraws one, up to a balance of `capacity` tokens. The budget is thread-safe and is
+    shared by all requests of a client.
+
+    Args:
+        ratio (float, optional):
+            The number of retries earned by each request. Defaults to 0.2 (one retry per five requests).
+        capacity (float, optional):
+            The maximum number of retries that can be saved up. The budget starts full. Defaults to 10.
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10.0):
+        if ratio < 0:
+            raise ValueError(
+                f"'ratio' must be zero or a positive number. f{ratio} >= 0."
+            )
+        if capacity < 0:
+            raise ValueError(
+                f"'capacity' must be zero or a positive number. f{capacity} >= 0."
+            )
+
+        self._ratio = ratio
+        self._capacity = capacity
+        self._balance = capacity
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        """
+        The number of retries currently available.
+        """
+        return self._balance
+
+    def deposit(self):
+        """
+        Records a request.
+        """
+        with self._lock:
+            self._balance = min(self._capacity, self._balance + self._ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Takes a retry from the budget.
+
+        Returns:
+            :bool: True when a retry is available, False when the budget is exhausted.
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides which requests are retried and how long to wait before each retry.
+
+    Retries use exponential backoff with full jitter: the n-th retry waits a random time between
+    zero and `min(backoff_max, backoff_base * 2 ** n)` seconds. When the response has a
+    `Retry-After` header, its value is used instead, capped at `retry_after_max`.
+
+    Args:
+        max_retries (int, optional):
+            The maximum number of retries for a single request. Defaults to 3.
+        retry_statuses (Iterable[int], optional):
+            The response status codes that are retried. Defaults to 429, 502, 503 and 504.
+            Connection errors are always retried.
+        backoff_base (float, optional):
+            The backoff in seconds of the first retry, before jitter. Defaults to 0.5.
+        backoff_max (float, optional):
+            The maximum backoff in seconds, before jitter. Defaults to 30.
+        retry_after_max (float, optional):
+            The maximum wait in seconds honored from a `Retry-After` header. Defaults to 120.
+        budget (RetryBudget, optional):
+            The retry budget shared by all requests of the client. Defaults to a new :class:`RetryBudget`.
+        use_budget (bool, optional):
+            Whether retries are limited by a retry budget. Defaults to True.
+
+    Examples:
+        >>> # Retry up to 5 times, waiting at most 10 seconds between retries:
+        >>> client = XpanseClient(retry_policy=RetryPolicy(max_retries=5, backoff_max=10))
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_statuses: Iterable[int] = (429, 502, 503, 504),
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_after_max: float = 120.0,
+        budget: Optional[RetryBudget] = None,
+        use_budget: bool = True,
+    ):
+        if max_retries < 0:
+            raise ValueError(
+                f"'max_retries' must be zero or a positive integer. f{max_retries} >= 0."
+            )
+
+        self.max_retries = max_retries
+        self.retry_statuses = frozenset(retry_statuses)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.budget = (budget or RetryBudget()) if use_budget else None
+
+    def on_request(self):
+        """
+        Records a new request against the retry budget. Called once per request, not per attempt.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def is_retryable(self, status_code: int) -> bool:
+        """
+        Whether a response with the given status code should be retried.
+        """
+        return status_code in self.retry_statuses
+
+    def allow_retry(self, attempt: int) -> bool:
+        """
+        Whether another retry is allowed. Takes a retry from the budget when it is.
+
+        Args:
+            attempt (int):
+                The number of retries already made for the request.
+
+        Returns:
+            :bool: True when the request should be retried.
+        """
+        if attempt >= self.max_retries:
+            return False
+        return self.budget is None or self.budget.withdraw()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the jittered backoff in seconds before the given retry.
+
+        Args:
+            attempt (int):
+                The number of retries already made for the request.
+        """
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2**attempt)
+        )
+
+    def delay(self, attempt: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """
+        Returns the delay in seconds before the given retry, honoring a `Retry-After` header.
+
+        Args:
+            attempt (int):
+                The number of retries already made for the request.
+            headers (Mapping[str, str], optional):
+                The headers of the response being retried, if any.
+        """
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, self.retry_after_max)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a `Retry-After` header, given either in seconds or as an HTTP date.
+
+    Args:
+        value (str, optional):
+            The header value.
+
+    Returns:
+        :float: The number of seconds to wait, or None when the header is missing or invalid.
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,185 @@
+from typing import Dict, List, Tuple
+
+from xpanse.const import FieldType
+
+
+class SchemaField:
+    """
+    A named and typed field of the results of a data type.
+
+    Args:
+        name (str):
+            The key of the field in each result.
+        field_type (FieldType):
+            The type of its values. Any field may also be null.
+    """
+
+    def __init__(self, name: str, field_type: FieldType):
+        self.name = name
+        self.field_type = field_type
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, {self.field_type})"
+
+
+def _fields(*fields: Tuple[str, FieldType]) -> Tuple[SchemaField, ...]:
+    return tuple(SchemaField(name, field_type) for name, field_type in fields)
+
+
+ASSET_FIELDS = _fields(
+    ("asm_ids", FieldType.STRING_LIST),
+    ("name", FieldType.STRING),
+    ("asset_type", FieldType.CATEGORY),
+    ("cloud_provider", FieldType.CATEGORY),
+    ("domain_resolves", FieldType.BOOLEAN),
+    ("first_observed", FieldType.TIMESTAMP),
+    ("last_observed", FieldType.TIMESTAMP),
+    ("has_active_externally_services", FieldType.BOOLEAN),
+    ("has_xdr_agent", FieldType.CATEGORY),
+    ("ips", FieldType.STRING_LIST),
+    ("ipv6s", FieldType.STRING_LIST),
+    ("domains", FieldType.STRING_LIST),
+    ("certificate_issuer", FieldType.CATEGORY),
+    ("certificate_algorithm", FieldType.CATEGORY),
+    ("certificate_classifications", FieldType.STRING_LIST),
+    ("business_units", FieldType.STRING_LIST),
+    ("tags", FieldType.STRING_LIST),
+    ("active_service_ids", FieldType.STRING_LIST),
+    ("active_external_services_types", FieldType.STRING_LIST),
+    ("externally_detected_providers", FieldType.STRING_LIST),
+    ("externally_inferred_cves", FieldType.STRING_LIST),
+    ("externally_inferred_vulnerability_score", FieldType.FLOAT),
+    ("ips_v4_int", FieldType.INTEGER_LIST),
+    ("mac_addresses", FieldType.STRING_LIST),
+    ("sensor", FieldType.STRING_LIST),
+    ("management_status", FieldType.STRING_LIST),
+)
+"""Fields of the Assets Internet Exposure Results"""
+
+SERVICE_FIELDS = _fields(
+    ("service_id", FieldType.STRING),
+    ("service_name", FieldType.STRING),
+    ("service_type", FieldType.CATEGORY),
+    ("ip_address", FieldType.STRING_LIST),
+    ("domain", FieldType.STRING_LIST),
+    ("port", FieldType.INTEGER),
+    ("protocol", FieldType.CATEGORY),
+    ("business_units", FieldType.STRING_LIST),
+    ("tags", FieldType.STRING_LIST),
+    ("first_observed", FieldType.TIMESTAMP),
+    ("last_observed", FieldType.TIMESTAMP),
+    ("is_active", FieldType.CATEGORY),
+    ("discovery_type", FieldType.CATEGORY),
+    ("externally_detected_providers", FieldType.STRING_LIST),
+    ("externally_inferred_cves", FieldType.STRING_LIST),
+    ("externally_inferred_vulnerability_score", FieldType.FLOAT),
+)
+"""Fields of the External Services Results"""
+
+OWNED_IP_RANGE_FIELDS = _fields(
+    ("range_id", FieldType.STRING),
+    ("first_ip", FieldType.STRING),
+    ("last_ip", FieldType.STRING),
+    ("ips_count", FieldType.INTEGER),
+    ("active_responsive_ips_count", FieldType.INTEGER),
+    ("date_added", FieldType.TIMESTAMP),
+    ("business_units", FieldType.STRING_LIST),
+    ("organization_handles", FieldType.STRING_LIST),
+    ("tags", FieldType.STRING_LIST),
+)
+"""Fields of the External IP Address Ranges Results"""
+
+INCIDENT_FIELDS = _fields(
+    ("incident_id", FieldType.STRING),
+    ("incident_name", FieldType.STRING),
+    ("creation_time", FieldType.TIMESTAMP),
+    ("modification_time", FieldType.TIMESTAMP),
+    ("detection_time", FieldType.TIMESTAMP),
+    ("status", FieldType.CATEGORY),
+    ("severity", FieldType.CATEGORY),
+    ("description", FieldType.STRING),
+    ("assigned_user_mail", FieldType.CATEGORY),
+    ("alert_count", FieldType.INTEGER),
+    ("low_severity_alert_count", FieldType.INTEGER),
+    ("med_severity_alert_count", FieldType.INTEGER),
+    ("high_severity_alert_count", FieldType.INTEGER),
+    ("critical_severity_alert_count", FieldType.INTEGER),
+    ("hosts", FieldType.STRING_LIST),
+    ("tags", FieldType.STRING_LIST),
+    ("xpanse_risk_score", FieldType.INTEGER),
+)
+"""Fields of the Incidents Results"""
+
+ALERT_FIELDS = _fields(
+    ("alert_id", FieldType.STRING),
+    ("external_id", FieldType.STRING),
+    ("name", FieldType.STRING),
+    ("description", FieldType.STRING),
+    ("severity", FieldType.CATEGORY),
+    ("source", FieldType.CATEGORY),
+    ("category", FieldType.CATEGORY),
+    ("action_pretty", FieldType.CATEGORY),
+    ("creation_time", FieldType.TIMESTAMP),
+    ("detection_timestamp", FieldType.TIMESTAMP),
+    ("local_insert_ts", FieldType.TIMESTAMP),
+    ("host_name", FieldType.STRING),
+    ("host_ip", FieldType.STRING_LIST),
+    ("resolution_status", FieldType.CATEGORY),
+    ("tags", FieldType.STRING_LIST),
+    ("attack_surface_rule_id", FieldType.CATEGORY),
+    ("asset_ids", FieldType.STRING_LIST),
+    ("port_protocol", FieldType.CATEGORY),
+    ("port_number", FieldType.INTEGER_LIST),
+    ("remediation_guidance", FieldType.STRING),
+    ("events", FieldType.JSON),
+)
+"""Fields of the Alerts Results"""
+
+ATTACK_SURFACE_RULE_FIELDS = _fields(
+    ("attack_surface_rule_id", FieldType.STRING),
+    ("attack_surface_rule_name", FieldType.STRING),
+    ("category", FieldType.CATEGORY),
+    ("description", FieldType.STRING),
+    ("enabled_status", FieldType.CATEGORY),
+    ("priority", FieldType.CATEGORY),
+    ("created", FieldType.TIMESTAMP),
+    ("modified", FieldType.TIMESTAMP),
+    ("modified_by", FieldType.STRING),
+    ("remediation_guidance", FieldType.STRING),
+)
+"""Fields of the Attack Surface Rules Results"""
+
+SCHEMAS: Dict[str, Tuple[SchemaField, ...]] = {
+    "assets_internet_exposure": ASSET_FIELDS,
+    "external_services": SERVICE_FIELDS,
+    "external_ip_address_ranges": OWNED_IP_RANGE_FIELDS,
+    "incidents": INCIDENT_FIELDS,
+    "alerts": ALERT_FIELDS,
+    "attack_surface_rules": ATTACK_SURFACE_RULE_FIELDS,
+}
+"""Fields of Each Data Type by the Data Key of its List Endpoint"""
+
+
+def schema_of(data_key: str) -> Tuple[SchemaField, ...]:
+    """
+    Returns the fields of a data type.
+
+    Args:
+        data_key (str):
+            The data key of the list endpoint, i.e. "incidents". See :data:`SCHEMAS`.
+
+    Raises:
+        :obj:`ValueError`: When the data type has no schema.
+    """
+    if data_key not in SCHEMAS:
+        raise ValueError(
+            f"Unknown data key '{data_key}'. Use one of {', '.join(SCHEMAS)}."
+        )
+    return SCHEMAS[data_key]
+
+
+def field_names(data_key: str) -> List[str]:
+    """
+    Returns the names of the fields of a data type, in schema order.
+    """
+    return [field.name for field in schema_of(data_key)]
@@ -0,0 +1,431 @@
+import json
+import re
+from typing import AbstractSet, Any, Dict, Iterator, List, Optional, Tuple
+
+from requests import Response
+
+from xpanse.codec import JsonCodec
+from xpanse.const import PublicApiFields
+from xpanse.error import UnexpectedResponseError
+
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Number of Bytes Read From the Response at a Time When Streaming"""
+
+_COMPACT_SIZE = 256 * 1024
+"""Consumed Bytes Kept in the Buffer Before it is Compacted"""
+
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_MEMBER = re.compile(rb'["\[\]{}:,]')
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+_WHITESPACE = frozenset(b" \t\r\n")
+
+_OBJECT = "object"
+_ARRAY = "array"
+
+# Parser states of the open containers
+_KEY_OR_END = "key_or_end"
+_COLON = "colon"
+_VALUE = "value"
+_VALUE_OR_END = "value_or_end"
+_COMMA_OR_END = "comma_or_end"
+
+_ELEMENT = "*"
+"""Path Segment Used for the Elements of an Array"""
+
+
+class _Frame:
+    """
+    An open object or array on the path to the results.
+    """
+
+    __slots__ = ("kind", "path", "state", "key")
+
+    def __init__(self, kind: str, path: Tuple[str, ...]):
+        self.kind = kind
+        self.path = path
+        self.state = _KEY_OR_END if kind == _OBJECT else _VALUE_OR_END
+        self.key: Optional[str] = None
+
+
+class _Capture:
+    """
+    A value being buffered until it is complete. The scan position is kept between chunks, so
+    every byte of a large value is only scanned once.
+    """
+
+    __slots__ = ("path", "start", "scan", "depth", "in_string", "kind")
+
+    def __init__(self, path: Tuple[str, ...], start: int, kind: int):
+        self.path = path
+        self.start = start
+        self.scan = start + 1
+        self.depth = 1
+        self.in_string = kind == ord('"')
+        self.kind = kind
+
+
+class StreamingPageParser:
+    """
+    Incremental parser for a Public API page: `{"reply": {..., "<data_key>": [...], ...}}`.
+
+    Bytes are fed as they arrive, and each result of the `reply.<data_key>` array is decoded and
+    returned as soon as its last byte is read. Only the current result is buffered, never the whole
+    body, text or decoded page. The other `reply` fields, such as `total_count` and
+    `next_page_token`, are decoded along the way and available once they have been read.
+
+    Args:
+        data_key (str):
+            The key under `reply` holding the results.
+        codec (JsonCodec, Optional):
+            The JSON codec used to decode each result. Defaults to the standard library.
+        raw_fields (AbstractSet[str], Optional):
+            Top-level fields of each result kept as their raw JSON bytes instead of being decoded,
+            such as the :attr:`xpanse.records.Record.LAZY_FIELDS` of records. A null value is
+            still None.
+
+    Examples:
+        >>> parser = StreamingPageParser("alerts")
+        >>> for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        >>>     for alert in parser.feed(chunk):
+        >>>         print(alert["alert_id"])
+        >>> parser.close()
+        >>> next_page_token = parser.next_page_token
+    """
+
+    def __init__(
+        self,
+        data_key: str,
+        codec: Optional[JsonCodec] = None,
+        raw_fields: Optional[AbstractSet[str]] = None,
+    ):
+        self._data_key = data_key
+        self._codec = codec or JsonCodec()
+        self._raw_fields = raw_fields
+        self._buf = bytearray()
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._capture: Optional[_Capture] = None
+        self._started = False
+        self._data_seen = False
+
+        """Fields of the `reply` other than the results"""
+        self.reply: Dict[str, Any] = {}
+
+        """Number of results returned so far"""
+        self.results = 0
+
+    @property
+    def total_count(self) -> Optional[int]:
+        return self.reply.get(PublicApiFields.TOTAL_COUNT)
+
+    @property
+    def results_count(self) -> Optional[int]:
+        return self.reply.get(PublicApiFields.RESULTS_COUNT)
+
+    @property
+    def next_page_token(self) -> Optional[str]:
+        return self.reply.get(PublicApiFields.NEXT_PAGE_TOKEN)
+
+    @property
+    def done(self) -> bool:
+        """
+        True once the whole document has been read.
+        """
+        return self._started and not self._stack
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parses the next bytes of the body.
+
+        Returns:
+            :obj:`List[Any]`: The results completed by these bytes, in order.
+        """
+        self._buf += chunk
+        items: List[Any] = []
+        self._advance(items)
+        self._compact()
+        return items
+
+    def close(self):
+        """
+        Checks that the whole page was read.
+
+        Raises:
+            :obj:`UnexpectedResponseError`: When the body ended early, or had no results array.
+        """
+        if not self.done:
+            raise UnexpectedResponseError(
+                f"StreamingPageParser received an incomplete response after {self.results} results."
+            )
+        if not self._data_seen:
+            raise UnexpectedResponseError(
+                f"StreamingPageParser received unexpected response without "
+                f"'{PublicApiFields.REPLY}.{self._data_key}': {self.reply}"
+            )
+
+    def _advance(self, items: List[Any]):
+        buf = self._buf
+        while True:
+            if self._capture is not None:
+                end = self._scan(self._capture)
+                if end is None:
+                    return
+                self._complete(self._capture, end, items)
+                continue
+
+            pos = self._pos
+            size = len(buf)
+            while pos < size and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos >= size:
+                return
+
+            char = buf[pos]
+            if not self._stack:
+                if self._started:
+                    # Trailing bytes after the document are ignored
+                    self._pos = size
+                    return
+                if char != ord("{"):
+                    self._unexpected(pos)
+                self._started = True
+                self._stack.append(_Frame(_OBJECT, ()))
+                self._pos = pos + 1
+                continue
+
+            frame = self._stack[-1]
+            if frame.state == _COMMA_OR_END:
+                if char == ord(","):
+                    frame.state = _KEY_OR_END if frame.kind == _OBJECT else _VALUE
+                    self._pos = pos + 1
+                elif char == (ord("}") if frame.kind == _OBJECT else ord("]")):
+                    self._stack.pop()
+                    self._pos = pos + 1
+                else:
+                    self._unexpected(pos)
+            elif frame.state == _KEY_OR_END and char == ord("}"):
+                self._stack.pop()
+                self._pos = pos + 1
+            elif frame.state in (_KEY_OR_END, _VALUE) and frame.kind == _OBJECT:
+                if frame.state == _VALUE:
+                    self._start_value(frame, frame.path + (frame.key,), pos)  # type: ignore
+                    continue
+                if char != ord('"'):
+                    self._unexpected(pos)
+                end = _string_end(buf, pos + 1)
+                if end is None:
+                    return
+                frame.key = json.loads(bytes(buf[pos:end]))
+                frame.state = _COLON
+                self._pos = end
+            elif frame.state == _COLON:
+                if char != ord(":"):
+                    self._unexpected(pos)
+                frame.state = _VALUE
+                self._pos = pos + 1
+            elif frame.state == _VALUE_OR_END and char == ord("]"):
+                self._stack.pop()
+                self._pos = pos + 1
+            else:
+                self._start_value(frame, frame.path + (_ELEMENT,), pos)
+
+    def _start_value(self, parent: _Frame, path: Tuple[str, ...], pos: int):
+        """
+        Descends into the containers on the path to the results, and captures any other value
+        """
+        parent.state = _COMMA_OR_END
+        char = self._buf[pos]
+
+        if path == (PublicApiFields.REPLY,) and char == ord("{"):
+            self._stack.append(_Frame(_OBJECT, path))
+            self._pos = pos + 1
+        elif path == (PublicApiFields.REPLY, self._data_key) and char == ord("["):
+            self._data_seen = True
+            self._stack.append(_Frame(_ARRAY, path))
+            self._pos = pos + 1
+        else:
+            self._capture = _Capture(path, pos, char)
+
+    def _scan(self, capture: _Capture) -> Optional[int]:
+        """
+        Continues scanning a captured value. Returns the end of the value, or None when more
+        bytes are needed.
+        """
+        buf = self._buf
+        if capture.kind not in (ord("{"), ord("["), ord('"')):
+            match = _SCALAR_END.search(buf, capture.scan)
+            if match is None:
+                capture.scan = max(capture.start + 1, len(buf))
+                return None
+            return match.start()
+
+        while True:
+            if capture.in_string:
+                end = _string_end(buf, capture.scan)
+                if end is None:
+                    capture.scan = len(buf)
+                    return None
+                capture.in_string = False
+                capture.scan = end
+                if capture.kind == ord('"'):
+                    return end
+
+            match = _STRUCTURAL.search(buf, capture.scan)
+            if match is None:
+                capture.scan = len(buf)
+                return None
+
+            char = buf[match.start()]
+            capture.scan = match.end()
+            if char == ord('"'):
+                capture.in_string = True
+            elif char in (ord("{"), ord("[")):
+                capture.depth += 1
+            else:
+                capture.depth -= 1
+                if capture.depth == 0:
+                    return capture.scan
+
+    def _complete(self, capture: _Capture, end: int, items: List[Any]):
+        """
+        Decodes a captured value that is a result or a `reply` field
+        """
+        path = capture.path
+        if path == (PublicApiFields.REPLY, self._data_key, _ELEMENT):
+            result = bytes(self._buf[capture.start : end])
+            if self._raw_fields and capture.kind == ord("{"):
+                items.append(self._decode_raw_fields(result))
+            else:
+                items.append(self._codec.loads(result))
+            self.results += 1
+        elif len(path) == 2 and path[0] == PublicApiFields.REPLY:
+            self.reply[path[1]] = self._codec.loads(
+                bytes(self._buf[capture.start : end])
+            )
+        self._capture = None
+        self._pos = end
+
+    def _decode_raw_fields(self, result: bytes) -> Any:
+        """
+        Decodes a result object, keeping the values of `raw_fields` as raw JSON bytes. The raw
+        values are replaced by null before decoding, so they are never decoded.
+        """
+        raw: Dict[str, bytes] = {}
+        parts: List[bytes] = []
+        last = 0
+        for key, start, end in _member_spans(result):
+            if key not in self._raw_fields:  # type: ignore
+                continue
+            value = result[start:end].strip()
+            if value == b"null":
+                continue
+            raw[key] = value
+            parts += [result[last:start], b"null"]
+            last = end
+        if not raw:
+            return self._codec.loads(result)
+
+        parts.append(result[last:])
+        decoded = self._codec.loads(b"".join(parts))
+        decoded.update(raw)
+        return decoded
+
+    def _compact(self):
+        """
+        Drops the consumed bytes from the buffer once no value is being captured
+        """
+        if self._capture is None and self._pos > _COMPACT_SIZE:
+            del self._buf[: self._pos]
+            self._pos = 0
+
+    def _unexpected(self, pos: int):
+        raise UnexpectedResponseError(
+            f"StreamingPageParser received invalid JSON at byte {pos}: "
+            f"{bytes(self._buf[pos : pos + 40])!r}"
+        )
+
+
+def _string_end(buf: Any, pos: int) -> Optional[int]:
+    """
+    Returns the position after the closing quote of a string whose content starts at `pos`, or
+    None when the string is not complete
+    """
+    while True:
+        quote = buf.find(b'"', pos)
+        if quote < 0:
+            return None
+        backslashes = 0
+        while buf[quote - 1 - backslashes] == ord("\\"):
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return quote + 1
+        pos = quote + 1
+
+
+def _member_spans(data: bytes) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yields the key, and the start and end of the value, of each member of a complete JSON object.
+    The values are not decoded, and may include surrounding whitespace.
+    """
+    depth = 0
+    key: Optional[str] = None
+    start = 0
+    pos = 0
+    while True:
+        match = _MEMBER.search(data, pos)
+        if match is None:
+            return
+        char = data[match.start()]
+        pos = match.end()
+        if char == ord('"'):
+            end = _string_end(data, pos)
+            if end is None:
+                return
+            if depth == 1 and key is None:
+                key = json.loads(data[match.start() : end])
+            pos = end
+        elif char in (ord("{"), ord("[")):
+            depth += 1
+        elif depth == 1 and char == ord(":"):
+            start = pos
+        elif depth == 1 and char in (ord(","), ord("}")):
+            if key is not None:
+                yield key, start, match.start()
+            key = None
+            if char == ord("}"):
+                return
+        elif char in (ord("}"), ord("]")):
+            depth -= 1
+
+
+def iter_response_items(
+    response: Optional[Response],
+    parser: StreamingPageParser,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Yields the results of a streamed `requests.Response` as they are read, then closes it.
+
+    Args:
+        response (Response):
+            A response requested with `stream=True`.
+        parser (StreamingPageParser):
+            The parser of the page. Its `reply` fields are set once the generator is exhausted.
+        chunk_size (int, Optional):
+            The number of bytes read at a time. Defaults to 64 KiB.
+
+    Raises:
+        :obj:`UnexpectedResponseError`: When there is no response, or the page is incomplete.
+    """
+    if response is None:
+        raise UnexpectedResponseError(
+            "StreamingPageParser received no response for the page."
+        )
+
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            yield from parser.feed(chunk)
+        parser.close()
+    finally:
+        response.close()
@@ -0,0 +1,204 @@
+import random
+from typing import Any, Callable, Dict, List
+
+DAY_MS = 24 * 60 * 60 * 1000
+"""Milliseconds in a Day"""
+
+EPOCH_MS = 1_690_000_000_000
+"""Epoch Millisecond Timestamp the Generated Results Start From"""
+
+
+def _ip(rng: random.Random) -> str:
+    return ".".join(str(rng.randint(1, 254)) for _ in range(4))
+
+
+def _id(rng: random.Random) -> str:
+    return f"{rng.getrandbits(128):032x}"
+
+
+def asset(rng: random.Random, i: int) -> Dict[str, Any]:
+    domain = f"host-{i}.example-{rng.randint(0, 999)}.com"
+    return {
+        "asm_ids": [_id(rng)],
+        "name": domain,
+        "asset_type": rng.choice(
+            ["DOMAIN", "CERTIFICATE", "UNASSOCIATED_RESPONSIVE_IP"]
+        ),
+        "cloud_provider": rng.choice([None, "AWS", "Azure", "Google"]),
+        "domain_resolves": rng.random() > 0.2,
+        "first_observed": 1_600_000_000_000 + rng.randint(0, 10**11),
+        "last_observed": EPOCH_MS + rng.randint(0, 10**9),
+        "has_active_externally_services": rng.random() > 0.5,
+        "has_xdr_agent": rng.choice(["YES", "NO", "NA"]),
+        "ips": [_ip(rng) for _ in range(rng.randint(1, 4))],
+        "ipv6s": [],
+        "domains": [domain],
+        "certificate_issuer": "DigiCert Inc",
+        "certificate_algorithm": "SHA256withRSA",
+        "certificate_classifications": ["Wildcard", "Expired"][: rng.randint(0, 2)],
+        "business_units": [f"BU {rng.randint(0, 9)}"],
+        "tags": [f"BU:BU {rng.randint(0, 9)}", "AT:Production"],
+        "active_service_ids": [_id(rng) for _ in range(rng.randint(0, 5))],
+        "active_external_services_types": ["HTTP Server", "SSH Server"][
+            : rng.randint(0, 2)
+        ],
+        "externally_detected_providers": ["Akamai Technologies"],
+        "externally_inferred_cves": [
+            f"CVE-2023-{rng.randint(1000, 9999)}" for _ in range(rng.randint(0, 6))
+        ],
+        "externally_inferred_vulnerability_score": round(rng.uniform(0, 10), 1),
+        "ips_v4_int": [rng.getrandbits(32)],
+        "mac_addresses": None,
+        "sensor": ["XPANSE"],
+        "management_status": ["Managed"],
+    }
+
+
+def service(rng: random.Random, i: int) -> Dict[str, Any]:
+    port = rng.choice([22, 80, 443, 3389, 8080, 8443])
+    return {
+        "service_id": _id(rng),
+        "service_name": f"{rng.choice(['HTTP', 'SSH', 'RDP'])} Server at {_ip(rng)}:{port}",
+        "service_type": rng.choice(["HttpServer", "SshServer", "RdpServer"]),
+        "ip_address": [_ip(rng)],
+        "domain": [f"host-{i}.example.com"],
+        "port": port,
+        "protocol": "TCP",
+        "business_units": [f"BU {rng.randint(0, 9)}"],
+        "tags": ["AT:Production"],
+        "first_observed": 1_600_000_000_000 + rng.randint(0, 10**11),
+        "last_observed": EPOCH_MS + rng.randint(0, 10**9),
+        "is_active": rng.choice(["Active", "Inactive"]),
+        "discovery_type": rng.choice(["ColocatedOnIp", "DirectlyDiscovered"]),
+        "externally_detected_providers": ["Amazon Web Services"],
+        "externally_inferred_cves": [
+            f"CVE-2023-{rng.randint(1000, 9999)}" for _ in range(rng.randint(0, 4))
+        ],
+        "externally_inferred_vulnerability_score": round(rng.uniform(0, 10), 1),
+    }
+
+
+def ip_range(rng: random.Random, i: int) -> Dict[str, Any]:
+    first = (10 << 24) + i * 256
+    return {
+        "range_id": _id(rng),
+        "first_ip": ".".join(str((first >> shift) & 255) for shift in (24, 16, 8, 0)),
+        "last_ip": ".".join(
+            str(((first + 255) >> shift) & 255) for shift in (24, 16, 8, 0)
+        ),
+        "ips_count": 256,
+        "active_responsive_ips_count": rng.randint(0, 256),
+        "date_added": 1_600_000_000_000 + rng.randint(0, 10**11),
+        "business_units": [f"BU {rng.randint(0, 9)}"],
+        "organization_handles": [f"ORG-{rng.randint(100, 999)}"],
+        "tags": ["IPR:Datacenter"],
+    }
+
+
+def incident(rng: random.Random, i: int) -> Dict[str, Any]:
+    creation_time = EPOCH_MS + i * 60_000 + rng.randint(0, 59_999)
+    return {
+        "incident_id": str(i + 1),
+        "incident_name": None,
+        "creation_time": creation_time,
+        "modification_time": creation_time + rng.randint(0, DAY_MS),
+        "detection_time": None,
+        "status": rng.choice(["new", "under_investigation", "resolved"]),
+        "severity": rng.choice(["low", "medium", "high", "critical"]),
+        "description": f"'Insecure TLS' on {_ip(rng)}",
+        "assigned_user_mail": None,
+        "alert_count": rng.randint(1, 5),
+        "low_severity_alert_count": 0,
+        "med_severity_alert_count": rng.randint(0, 5),
+        "high_severity_alert_count": rng.randint(0, 5),
+        "critical_severity_alert_count": 0,
+        "hosts": [f"{_ip(rng)}:null"],
+        "tags": ["AT:Production"],
+        "xpanse_risk_score": rng.randint(0, 100),
+    }
+
+
+def alert(rng: random.Random, i: int) -> Dict[str, Any]:
+    creation_time = EPOCH_MS + i * 60_000 + rng.randint(0, 59_999)
+    return {
+        "alert_id": str(100_000 + i),
+        "external_id": _id(rng),
+        "name": f"Insecure TLS at {_ip(rng)}:443",
+        "description": "An insecure TLS version was observed on this service. " * 4,
+        "severity": rng.choice(["low", "medium", "high", "critical"]),
+        "source": "ASM",
+        "category": "Attack Surface Reduction",
+        "action_pretty": "Detected (Reported)",
+        "creation_time": creation_time,
+        "detection_timestamp": creation_time,
+        "local_insert_ts": creation_time + rng.randint(0, 60_000),
+        "host_name": None,
+        "host_ip": [_ip(rng)],
+        "resolution_status": rng.choice(
+            ["STATUS_010_NEW", "STATUS_020_UNDER_INVESTIGATION"]
+        ),
+        "tags": ["AT:Production"],
+        "attack_surface_rule_id": "InsecureTLS",
+        "asset_ids": [_id(rng)],
+        "port_protocol": "TCP",
+        "port_number": [443],
+        "remediation_guidance": "Disable TLS 1.0 and TLS 1.1 on the service. " * 3,
+        "events": [
+            {
+                "event_timestamp": EPOCH_MS + rng.randint(0, 10**9),
+                "event_type": "Network Connections",
+                "agent_os_type": "NO_HOST",
+                "action_remote_ip": _ip(rng),
+                "action_remote_port": 443,
+                "dns_query_name": None,
+            }
+            for _ in range(rng.randint(1, 3))
+        ],
+    }
+
+
+def attack_surface_rule(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "attack_surface_rule_id": f"Rule{i}",
+        "attack_surface_rule_name": f"Insecure Service {i}",
+        "category": rng.choice(["Attack Surface Reduction", "Certificates"]),
+        "description": "An insecure service was observed. " * 2,
+        "enabled_status": rng.choice(["On", "Off"]),
+        "priority": rng.choice(["Low", "Medium", "High", "Critical"]),
+        "created": 1_600_000_000_000 + rng.randint(0, 10**11),
+        "modified": EPOCH_MS + rng.randint(0, 10**9),
+        "modified_by": None,
+        "remediation_guidance": "Restrict access to the service. " * 2,
+    }
+
+
+GENERATORS: Dict[str, Callable[[random.Random, int], Dict[str, Any]]] = {
+    "assets_internet_exposure": asset,
+    "external_services": service,
+    "external_ip_address_ranges": ip_range,
+    "incidents": incident,
+    "alerts": alert,
+    "attack_surface_rules": attack_surface_rule,
+}
+"""Result Generators by the Data Key of Their List Endpoint"""
+
+
+def generate(data_key: str, count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Returns `count` results of a data type.
+
+    Args:
+        data_key (str):
+            The data key of the list endpoint, i.e. "incidents". See :data:`GENERATORS`.
+        count (int):
+            The number of results.
+        seed (int, optional):
+            Seeds the generator. Defaults to 0.
+    """
+    if data_key not in GENERATORS:
+        raise ValueError(
+            f"Unknown data key '{data_key}'. Use one of {', '.join(GENERATORS)}."
+        )
+    rng = random.Random(seed)
+    factory = GENERATORS[data_key]
+    return [factory(rng, i) for i in range(count)]
@@ -0,0 +1,709 @@
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse, urlsplit
+
+import requests
+
+from xpanse.api.asset_management.v1.assets import AssetsEndpoint
+from xpanse.api.asset_management.v1.owned_ip_ranges import OwnedIpRangesEndpoint
+from xpanse.api.asset_management.v1.services import ServicesEndpoint
+from xpanse.api.attack_surface_rules.v1.attack_surface_rules import (
+    AttackSurfaceRulesEndpoint,
+)
+from xpanse.api.incident_management.v1.incidents import IncidentsEndpoint
+from xpanse.api.incident_management.v2.alerts import AlertsEndpoint
+from xpanse.api.tags.v1.tags import TagsEndpoint
+from xpanse.const import (
+    DEFAULT_SEARCH_FROM,
+    DEFAULT_SEARCH_TO,
+    MAX_TOTAL_COUNT,
+    FilterOperator,
+    PublicApiFields,
+    TaggableDataType,
+)
+from xpanse.client import XpanseClient
+from xpanse.testing.data import GENERATORS, generate
+from xpanse.transport import RequestsTransport
+
+DEFAULT_API_KEY_ID = "1"
+"""API Key ID Accepted by Default"""
+
+DEFAULT_API_KEY = "local-xpanse-api-key"
+"""API Key Accepted by Default"""
+
+AUTH_MAX_SKEW_MS = 5 * 60 * 1000
+"""Maximum Age of an Advanced Auth Timestamp, in Milliseconds"""
+
+_GZIP_MIN_SIZE = 1024
+"""Response Bodies Smaller Than This are Never Compressed"""
+
+_NONCE_HISTORY = 100_000
+"""Number of Recent Nonces Remembered to Reject Replayed Requests"""
+
+Reply = Tuple[int, Dict[str, str], Any]
+"""(status, headers, JSON body) Reply of a Route"""
+
+_LIST_ROUTES: Dict[str, Tuple[str, bool]] = {
+    AssetsEndpoint.LIST_ENDPOINT: (AssetsEndpoint.LIST_DATA_KEY, True),
+    ServicesEndpoint.LIST_ENDPOINT: (ServicesEndpoint.LIST_DATA_KEY, True),
+    OwnedIpRangesEndpoint.LIST_ENDPOINT: (OwnedIpRangesEndpoint.LIST_DATA_KEY, True),
+    AlertsEndpoint.ENDPOINT: (AlertsEndpoint.DATA_KEY, True),
+    IncidentsEndpoint.LIST_ENDPOINT: (IncidentsEndpoint.DATA_KEY, False),
+    AttackSurfaceRulesEndpoint.ENDPOINT: (AttackSurfaceRulesEndpoint.DATA_KEY, False),
+}
+"""Data Key of Each List Route, and Whether it Supports Page Tokens"""
+
+_FILTER_FIELDS: Dict[str, str] = {
+    "asm_id_list": "asm_ids",
+    "service_id_list": "service_id",
+    "range_id_list": "range_id",
+    "incident_id_list": "incident_id",
+    "alert_id_list": "alert_id",
+    "attack_surface_rule_id": "attack_surface_rule_id",
+}
+"""Result Field Matched by Each Filter Field, When They Differ"""
+
+_TAG_ID_FILTERS: Dict[str, str] = {
+    TaggableDataType.ASSETS.value: "asm_id_list",
+    TaggableDataType.OWNED_IP_RANGES.value: "range_id_list",
+}
+"""Filter Field Selecting the Results of Each Taggable Data Type"""
+
+
+class FakeXpanse:
+    """
+    In-memory state and routing of the stand-in Public API served by :class:`XpanseServer`.
+    It implements the list, tag and API Key validation routes used by the SDK, with page tokens,
+    limit-offset windows capped at the 9,999 `total_count`, filters and sorting, and checks the
+    Standard or Advanced auth headers of every request. Throttling and unavailability can be
+    injected at random, and every reply can be delayed. Safe to share between threads.
+
+    Args:
+        datasets (Dict[str, List[Dict[str, Any]]], optional):
+            The results of each list route, by data key, i.e. "incidents". Missing data types are
+            served empty. See :func:`xpanse.testing.data.generate`.
+        api_key_id (str, optional):
+            The accepted API Key ID. Defaults to "1".
+        api_key (str, optional):
+            The accepted API Key. Defaults to "local-xpanse-api-key".
+        use_advanced_auth (bool, optional):
+            Whether requests must be signed as Advanced API Keys, with a nonce and timestamp.
+            Defaults to True.
+        latency (float, optional):
+            Seconds slept before each reply. Defaults to 0.
+        jitter (float, optional):
+            Extra seconds of uniformly random latency added to each reply. Defaults to 0.
+        error_rates (Dict[int, float], optional):
+            The probability of replying with each status instead of serving a request, i.e.
+            `{429: 0.05, 503: 0.01}`. API Key validation is never failed. Defaults to none.
+        retry_after (float, optional):
+            The `Retry-After` seconds of injected 429 replies. Defaults to 1.
+        max_total_count (int, optional):
+            The `total_count` cap, and the end of the last limit-offset window. Defaults to 9,999.
+        page_size (int, optional):
+            The number of results of a page-token page. Defaults to 100.
+        seed (int, optional):
+            Seeds the latency jitter and the error injection. Defaults to 0.
+        sleep (Callable[[float], None], optional):
+            Used to wait for the latency. Defaults to `time.sleep`.
+    """
+
+    def __init__(
+        self,
+        datasets: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        api_key_id: str = DEFAULT_API_KEY_ID,
+        api_key: str = DEFAULT_API_KEY,
+        use_advanced_auth: bool = True,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rates: Optional[Dict[int, float]] = None,
+        retry_after: float = 1.0,
+        max_total_count: int = MAX_TOTAL_COUNT,
+        page_size: int = DEFAULT_SEARCH_TO - DEFAULT_SEARCH_FROM,
+        seed: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if latency < 0 or jitter < 0:
+            raise ValueError(
+                f"'latency' and 'jitter' must be zero or positive numbers. f{latency} >= 0, f{jitter} >= 0."
+            )
+
+        if sum((error_rates or {}).values()) > 1:
+            raise ValueError(
+                f"'error_rates' must add up to at most 1. f{error_rates} <= 1."
+            )
+
+        if page_size < 1:
+            raise ValueError(
+                f"'page_size' must be a positive integer. f{page_size} > 0."
+            )
+
+        self.datasets: Dict[str, List[Dict[str, Any]]] = {
+            data_key: list((datasets or {}).get(data_key, []))
+            for data_key in GENERATORS
+        }
+        self._api_key_id = str(api_key_id)
+        self._api_key = api_key
+        self._use_advanced_auth = use_advanced_auth
+        self._latency = latency
+        self._jitter = jitter
+        self._error_rates = dict(error_rates or {})
+        self._retry_after = retry_after
+        self._max_total_count = max_total_count
+        self._page_size = page_size
+        self._random = random.Random(seed)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._nonces: Set[str] = set()
+        self._nonce_order: Deque[str] = deque()
+
+        """Replies Sent so Far, by Path and Status"""
+        self.requests: Counter = Counter()
+
+    @classmethod
+    def generate(cls, counts: Dict[str, int], seed: int = 0, **kwargs: Any):
+        """
+        Creates a stand-in API serving generated results.
+
+        Args:
+            counts (Dict[str, int]):
+                The number of results of each data type, by data key.
+            seed (int, optional):
+                Seeds the generated results, the latency jitter and the error injection.
+            **kwargs:
+                Any other :class:`FakeXpanse` arguments.
+
+        Examples:
+            >>> fake = FakeXpanse.generate({"incidents": 25_000, "alerts": 50_000})
+        """
+        datasets = {
+            data_key: generate(data_key, count, seed=seed)
+            for data_key, count in counts.items()
+        }
+        return cls(datasets=datasets, seed=seed, **kwargs)
+
+    def handle(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Serves one request.
+
+        Args:
+            method (str):
+                The HTTP method.
+            path (str):
+                The request path, i.e. `/public_api/v1/incidents/get_incidents/`.
+            headers (Dict[str, str]):
+                The request headers.
+            body (bytes):
+                The raw request body.
+
+        Returns:
+            :obj:`Tuple[int, Dict[str, str], bytes]`: The status, headers and body of the reply.
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        route = urlparse(path).path.strip("/") + "/"
+
+        with self._lock:
+            delay = self._latency + (
+                self._random.uniform(0, self._jitter) if self._jitter else 0.0
+            )
+            injected = (
+                self._injected_status() if route != "api_keys/validate/" else None
+            )
+        if delay > 0:
+            self._sleep(delay)
+
+        if not self._is_authorized(headers):
+            status, reply_headers, reply = self._error(
+                401, "Public API request unauthorized"
+            )
+        elif injected is not None:
+            status, reply_headers, reply = self._error(injected, "Injected error")
+            if injected == 429:
+                reply_headers["Retry-After"] = f"{self._retry_after:g}"
+        else:
+            try:
+                status, reply_headers, reply = self._route(
+                    method, route, self._decode_body(body, headers)
+                )
+            except (ValueError, TypeError, KeyError) as err:
+                status, reply_headers, reply = self._error(
+                    500, f"Invalid request: {err}"
+                )
+
+        with self._lock:
+            self.requests[(route, status)] += 1
+
+        payload = json.dumps(reply, separators=(",", ":")).encode("utf-8")
+        reply_headers["Content-Type"] = "application/json"
+        if len(payload) >= _GZIP_MIN_SIZE and "gzip" in headers.get(
+            "accept-encoding", ""
+        ):
+            payload = gzip.compress(payload, compresslevel=1)
+            reply_headers["Content-Encoding"] = "gzip"
+        return status, reply_headers, payload
+
+    def _injected_status(self) -> Optional[int]:
+        """
+        Draws the injected error status of a request, if any. Called with the lock held.
+        """
+        draw = self._random.random()
+        for status, rate in self._error_rates.items():
+            if draw < rate:
+                return status
+            draw -= rate
+        return None
+
+    def _is_authorized(self, headers: Dict[str, str]) -> bool:
+        """
+        Checks the Standard or Advanced auth headers, rejecting expired or replayed signatures.
+        """
+        if headers.get("x-xdr-auth-id") != self._api_key_id:
+            return False
+
+        if not self._use_advanced_auth:
+            return headers.get("authorization") == self._api_key
+
+        nonce = headers.get("x-xdr-nonce", "")
+        timestamp = headers.get("x-xdr-timestamp", "")
+        if len(nonce) != 64 or not timestamp.isdigit():
+            return False
+
+        if abs(time.time() * 1000 - int(timestamp)) > AUTH_MAX_SKEW_MS:
+            return False
+
+        expected = hashlib.sha256(
+            f"{self._api_key}{nonce}{timestamp}".encode("utf-8")
+        ).hexdigest()
+        if headers.get("authorization") != expected:
+            return False
+
+        with self._lock:
+            if nonce in self._nonces:
+                return False
+            self._nonces.add(nonce)
+            self._nonce_order.append(nonce)
+            if len(self._nonce_order) > _NONCE_HISTORY:
+                self._nonces.discard(self._nonce_order.popleft())
+        return True
+
+    @staticmethod
+    def _decode_body(body: bytes, headers: Dict[str, str]) -> Dict[str, Any]:
+        if not body:
+            return {}
+        if headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        decoded = json.loads(body)
+        return decoded if isinstance(decoded, dict) else {}
+
+    def _route(self, method: str, route: str, body: Dict[str, Any]) -> Reply:
+        if route == "api_keys/validate/":
+            return 200, {}, True
+
+        request_data = body.get(PublicApiFields.REQUEST_DATA, {})
+        if route in _LIST_ROUTES:
+            data_key, page_tokens = _LIST_ROUTES[route]
+            return 200, {}, self._list(data_key, page_tokens, request_data)
+
+        for data_type, id_filter in _TAG_ID_FILTERS.items():
+            if route == TagsEndpoint.ASSIGN_ENDPOINT.format(data_type=data_type) + "/":
+                return self._tag(
+                    data_type, TagsEndpoint.ASSIGN_DATA_KEY, request_data, True
+                )
+            if route == TagsEndpoint.REMOVE_ENDPOINT.format(data_type=data_type) + "/":
+                return self._tag(
+                    data_type, TagsEndpoint.REMOVE_DATA_KEY, request_data, False
+                )
+
+        return self._error(404, f"Unknown route {method} /{route}")
+
+    def _list(
+        self, data_key: str, page_tokens: bool, request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Serves a page of a list route
+        """
+        results = self._select(
+            self.datasets[data_key], request_data.get(PublicApiFields.FILTERS, [])
+        )
+
+        sort = request_data.get(PublicApiFields.SORT)
+        if isinstance(sort, dict) and sort.get(PublicApiFields.FIELD):
+            field = sort[PublicApiFields.FIELD]
+            results.sort(
+                key=lambda result: _sort_key(result.get(field)),
+                reverse=str(sort.get(PublicApiFields.KEYWORD, "asc")).lower() == "desc",
+            )
+
+        token = request_data.get(PublicApiFields.NEXT_PAGE_TOKEN)
+        use_page_token = page_tokens and (
+            token is not None or request_data.get(PublicApiFields.USE_PAGE_TOKEN)
+        )
+        if use_page_token:
+            start = _decode_page_token(token) if token is not None else 0
+            end = start + self._page_size
+        else:
+            start = int(request_data.get(PublicApiFields.SEARCH_FROM, 0))
+            end = int(
+                request_data.get(PublicApiFields.SEARCH_TO, start + self._page_size)
+            )
+            # Limit-offset windows end at the total_count cap
+            end = min(end, self._max_total_count)
+
+        page = results[start:end] if start < end else []
+        reply: Dict[str, Any] = {
+            PublicApiFields.TOTAL_COUNT: min(len(results), self._max_total_count),
+            PublicApiFields.RESULTS_COUNT: len(page),
+            data_key: page,
+        }
+        if use_page_token:
+            reply[PublicApiFields.NEXT_PAGE_TOKEN] = (
+                _encode_page_token(end) if end < len(results) else None
+            )
+        return {PublicApiFields.REPLY: reply}
+
+    def _tag(
+        self,
+        data_type: str,
+        data_key: str,
+        request_data: Dict[str, Any],
+        assign: bool,
+    ) -> Reply:
+        """
+        Assigns or removes tags on the results matching the filters
+        """
+        tags = request_data.get(PublicApiFields.TAGS) or []
+        filters = request_data.get(PublicApiFields.FILTERS) or []
+        if not tags or not filters:
+            return self._error(500, "Tags and filters are required")
+
+        prefix = "AT:" if data_type == TaggableDataType.ASSETS.value else "IPR:"
+        names = [tag if ":" in tag else f"{prefix}{tag}" for tag in tags]
+        with self._lock:
+            for result in self._select(self.datasets[data_type], filters):
+                current = result.setdefault("tags", [])
+                if assign:
+                    current.extend(name for name in names if name not in current)
+                else:
+                    current[:] = [tag for tag in current if tag not in names]
+        return 200, {}, {PublicApiFields.REPLY: {data_key: "succeeded"}}
+
+    @staticmethod
+    def _select(
+        results: List[Dict[str, Any]], filters: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the results matching every filter, in dataset order
+        """
+        if not filters:
+            return list(results)
+        return [
+            result
+            for result in results
+            if all(_matches(result, condition) for condition in filters)
+        ]
+
+    @staticmethod
+    def _error(status: int, message: str) -> Reply:
+        return (
+            status,
+            {},
+            {
+                PublicApiFields.REPLY: {
+                    "err_code": status,
+                    "err_msg": message,
+                    "err_extra": None,
+                }
+            },
+        )
+
+
+def _matches(result: Dict[str, Any], condition: Dict[str, Any]) -> bool:
+    """
+    Whether a result matches a Public API filter. List fields match when any value matches.
+    """
+    field = condition.get(PublicApiFields.FIELD, "")
+    operator = condition.get("operator")
+    expected: Any = condition.get("value")
+    value = result.get(_FILTER_FIELDS.get(field, field))
+    values = value if isinstance(value, list) else [value]
+
+    if operator == FilterOperator.EQ.value:
+        return expected in values
+    if operator == FilterOperator.NEQ.value:
+        return expected not in values
+    if operator == FilterOperator.GTE.value:
+        return any(v is not None and v >= expected for v in values)
+    if operator == FilterOperator.LTE.value:
+        return any(v is not None and v <= expected for v in values)
+    if operator == FilterOperator.IN.value:
+        return any(v in expected for v in values)
+    if operator == FilterOperator.NIN.value:
+        return not any(v in expected for v in values)
+    if operator == FilterOperator.CONTAINS.value:
+        return any(str(expected).lower() in str(v).lower() for v in values)
+    if operator == FilterOperator.NOT_CONTAINS.value:
+        return not any(str(expected).lower() in str(v).lower() for v in values)
+    raise ValueError(f"Unsupported filter operator '{operator}'")
+
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    # None sorts last, and values of mixed types are compared as text
+    return value is None, value if isinstance(value, (int, float)) else str(value)
+
+
+def _encode_page_token(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"o": offset}).encode("utf-8")).decode()
+
+
+def _decode_page_token(token: str) -> int:
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(token.encode("utf-8")))["o"])
+    except (ValueError, KeyError, TypeError) as err:
+        raise ValueError(f"Invalid page token '{token}'") from err
+
+
+class XpanseRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves each HTTP request with the :class:`FakeXpanse` of the server. Connections are kept
+    alive between requests, like the Public API.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: "XpanseServer"
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, payload = self.server.fake.handle(
+            method, self.path, dict(self.headers.items()), body
+        )
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any):
+        self.server.log.debug(format % args)
+
+
+class XpanseServerTransport(RequestsTransport):
+    """
+    Sends the requests of a client to a local stand-in server over plain HTTP. Only the path and
+    query of the URL built by the client are kept, so the client `url` can be any host.
+
+    Args:
+        base_url (str):
+            The base URL of the server, such as the :attr:`XpanseServer.url`.
+        **kwargs:
+            Options of the :class:`xpanse.transport.RequestsTransport`.
+
+    Examples:
+        >>> # Against `python -m xpanse.testing.server --port 8080`
+        >>> transport = XpanseServerTransport("http://127.0.0.1:8080")
+        >>> client = XpanseClient(url="stand-in.local", api_key_id=DEFAULT_API_KEY_ID,
+        >>>                       api_key=DEFAULT_API_KEY, transport=transport)
+    """
+
+    def __init__(self, base_url: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.base_url = base_url.rstrip("/")
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return super().request(method, f"{self.base_url}{parts.path}{query}", **kwargs)
+
+
+class XpanseServer(ThreadingHTTPServer):
+    """
+    Local HTTP stand-in for the Cortex Xpanse Public API, for load and integration tests of the
+    real clients. Each connection is served on its own thread. Clients reach it through an
+    :class:`XpanseServerTransport`, such as the clients returned by :meth:`client`.
+
+    Args:
+        fake (FakeXpanse, optional):
+            The state and routes served. Defaults to an empty :class:`FakeXpanse`.
+        host (str, optional):
+            The address to listen on. Defaults to "127.0.0.1".
+        port (int, optional):
+            The port to listen on. Defaults to 0, any free port.
+
+    Examples:
+        >>> fake = FakeXpanse.generate({"incidents": 25_000}, latency=0.05, error_rates={429: 0.01})
+        >>> with XpanseServer(fake) as server:
+        >>>     incidents = server.client().incidents.scan(start=0).dump()
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, fake: Optional[FakeXpanse] = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        super().__init__((host, port), XpanseRequestHandler)
+        self.fake = fake if fake is not None else FakeXpanse()
+        self.log = logging.getLogger(
+            "{}.{}".format(self.__module__, self.__class__.__name__)
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the base URL of the server, to use as the client `url`.
+        """
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def client(self, **kwargs: Any) -> XpanseClient:
+        """
+        Returns a client sending its requests to the server, with the default API Key unless
+        `api_key_id` and `api_key` are given.
+
+        Args:
+            **kwargs:
+                Options of the :class:`xpanse.client.XpanseClient`.
+        """
+        options: Dict[str, Any] = {
+            "url": self.url,
+            "api_key_id": DEFAULT_API_KEY_ID,
+            "api_key": DEFAULT_API_KEY,
+            "transport": XpanseServerTransport(self.url),
+            **kwargs,
+        }
+        return XpanseClient(**options)
+
+    def start(self) -> "XpanseServer":
+        """
+        Serves requests on a background thread until :meth:`stop` is called.
+        """
+        self._thread = threading.Thread(
+            target=self.serve_forever, name=self.__class__.__name__, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops serving and closes the listening socket.
+        """
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "XpanseServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any):
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Runs the stand-in server until interrupted:
+
+        python -m xpanse.testing.server --incidents 25000 --latency 0.05 --error-rate-429 0.01
+    """
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the Cortex Xpanse Public API."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    for data_key, default in [
+        ("assets_internet_exposure", 5_000),
+        ("external_services", 5_000),
+        ("external_ip_address_ranges", 500),
+        ("incidents", 5_000),
+        ("alerts", 5_000),
+        ("attack_surface_rules", 200),
+    ]:
+        parser.add_argument(
+            f"--{data_key.replace('_', '-')}",
+            dest=data_key,
+            type=int,
+            default=default,
+            help=f"number of generated {data_key} (default {default})",
+        )
+    parser.add_argument("--api-key-id", default=DEFAULT_API_KEY_ID)
+    parser.add_argument("--api-key", default=DEFAULT_API_KEY)
+    parser.add_argument(
+        "--standard-auth", action="store_true", help="accept Standard API Keys"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per reply")
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="extra random seconds"
+    )
+    parser.add_argument("--error-rate-429", type=float, default=0.0)
+    parser.add_argument("--error-rate-503", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--max-total-count", type=int, default=MAX_TOTAL_COUNT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="log every request"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    fake = FakeXpanse.generate(
+        {data_key: getattr(args, data_key) for data_key in GENERATORS},
+        seed=args.seed,
+        api_key_id=args.api_key_id,
+        api_key=args.api_key,
+        use_advanced_auth=not args.standard_auth,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rates={429: args.error_rate_429, 503: args.error_rate_503},
+        retry_after=args.retry_after,
+        max_total_count=args.max_total_count,
+    )
+
+    server = XpanseServer(fake, host=args.host, port=args.port)
+    print(f"Serving the Cortex Xpanse Public API stand-in at {server.url}")
+    print("Point a client at it with an XpanseServerTransport:")
+    print(
+        f'  XpanseClient(url="stand-in.local", api_key_id="{args.api_key_id}", api_key="{args.api_key}",'
+    )
+    print(f'               transport=XpanseServerTransport("{server.url}"))')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(dict(fake.requests))
+
+
+if __name__ == "__main__":
+    main()
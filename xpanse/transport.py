@@ -0,0 +1,416 @@
+import abc
+import gzip
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Sequence, Union
+from urllib.parse import urlparse
+
+import requests
+
+from xpanse.codec import JsonCodec
+from xpanse.compression import CompressionConfig, CompressionStats, response_sizes
+from xpanse.const import (
+    DEFAULT_REQUEST_PAYLOAD_FIELD,
+    DEFAULT_SEARCH_TO,
+    DEFAULT_SEARCH_FROM,
+    PublicApiFields,
+)
+from xpanse.httpx_compat import (
+    as_requests_response,
+    build_httpx_client,
+    httpx,
+    httpx_request_kwargs,
+    require_httpx,
+)
+from xpanse.pool import PoolConfig
+
+
+class Transport(abc.ABC):
+    """
+    Sends the requests of an :class:`xpanse.client.XpanseClient`. The client signs, encodes,
+    rate limits and retries every request, and hands each attempt to its transport, which
+    only has to send it and return a `requests.Response`.
+
+    Subclasses must implement `request`. Transports must be safe to share between threads. Connection errors should be raised as
+    `requests.exceptions.ConnectionError` or `httpx.TransportError` so that they are retried.
+    """
+
+    def __init__(self):
+        """Bytes Sent and Received Before and After Compression"""
+        self.stats = CompressionStats()
+
+    @abc.abstractmethod
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Sends one attempt of a request.
+
+        Args:
+            method (str):
+                The HTTP method.
+            url (str):
+                The full URL of the request.
+            **kwargs:
+                The `requests` keyword arguments of the request, including the signed `headers`
+                and the encoded `data`.
+
+        Returns:
+            :obj:`requests.Response`: The response, with its body read unless `stream=True`.
+        """
+
+    def close(self):
+        """
+        Releases the connections held by the transport.
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    The default transport, sending requests through a pooled `requests.Session`.
+
+    Args:
+        pool_config (PoolConfig, optional):
+            Connection pool size, blocking, TCP keep-alive and warm-up settings.
+        proxies (MutableMapping[str, str], optional):
+            Proxies by scheme, see the Requests documentation.
+        verify (bool, optional):
+            Whether or not SSL verification should occur. Defaults to True.
+        compression (CompressionConfig, optional):
+            Sets the `Accept-Encoding` of the session.
+        warm_url (str, optional):
+            A URL on the host whose connections are opened up front when `pool_config.warm_up` is set.
+    """
+
+    def __init__(
+        self,
+        pool_config: Optional[PoolConfig] = None,
+        proxies: Optional[MutableMapping[str, str]] = None,
+        verify: bool = True,
+        compression: Optional[CompressionConfig] = None,
+        warm_url: Optional[str] = None,
+    ):
+        super().__init__()
+        pool_config = pool_config if pool_config is not None else PoolConfig()
+        compression = compression if compression is not None else CompressionConfig()
+
+        """Pooled Session - Never holds per-request auth headers"""
+        self.session = requests.Session()
+
+        if proxies is not None:
+            self.session.proxies.update(proxies)
+
+        self.session.verify = verify
+        self.session.headers["Accept-Encoding"] = compression.accept_encoding_header()
+
+        pool_config.mount(self.session)
+        if warm_url is not None:
+            pool_config.warm(self.session, warm_url)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        resp = self.session.request(method, url, **kwargs)
+        sizes = response_sizes(resp)
+        if sizes is not None:
+            self.stats.record_response(*sizes)
+        return resp
+
+    def close(self):
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """
+    Transport sending requests through an `httpx.Client`, optionally over HTTP/2 so that
+    concurrent requests are multiplexed over one connection. Responses are read and converted
+    to `requests.Response` objects. Requires `pip install xpanse[http2]` for HTTP/2.
+
+    Args:
+        pool_config (PoolConfig, optional):
+            Connection pool size and TCP keep-alive settings. `warm_up` is not supported.
+        proxies (MutableMapping[str, str], optional):
+            Proxies by scheme, using the same structure as the Requests library.
+        verify (bool, optional):
+            Whether or not SSL verification should occur. Defaults to True.
+        compression (CompressionConfig, optional):
+            Sets the `Accept-Encoding` of the session.
+        http2 (bool, optional):
+            Whether to negotiate HTTP/2. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        pool_config: Optional[PoolConfig] = None,
+        proxies: Optional[MutableMapping[str, str]] = None,
+        verify: bool = True,
+        compression: Optional[CompressionConfig] = None,
+        http2: bool = True,
+    ):
+        require_httpx("HttpxTransport")
+        super().__init__()
+        compression = compression if compression is not None else CompressionConfig()
+
+        """Pooled Session - Never holds per-request auth headers"""
+        self.session = build_httpx_client(
+            httpx.Client,
+            httpx.HTTPTransport,
+            pool_config if pool_config is not None else PoolConfig(),
+            proxies=proxies,
+            verify=verify,
+            http2=http2,
+            headers={"Accept-Encoding": compression.accept_encoding_header()},
+        )
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        resp = self.session.request(method, url, **httpx_request_kwargs(kwargs))
+        # httpx counts the bytes read from the socket, before decoding
+        self.stats.record_response(resp.num_bytes_downloaded, len(resp.content))
+        return as_requests_response(resp)
+
+    def close(self):
+        self.session.close()
+
+
+class InMemoryRequest:
+    """
+    A request received by an :class:`InMemoryTransport`.
+    """
+
+    __slots__ = ("method", "path", "headers", "body")
+
+    def __init__(self, method: str, path: str, headers: Dict[str, str], body: Any):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+    @property
+    def request_data(self) -> Dict[str, Any]:
+        """
+        Returns the `request_data` of a Public API request body.
+        """
+        if not isinstance(self.body, dict):
+            return {}
+        return self.body.get(PublicApiFields.REQUEST_DATA, {})
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.method} {self.path})"
+
+
+Reply = Union[requests.Response, Any]
+"""A Canned Reply: a JSON Body, or a Complete `requests.Response`"""
+
+Route = Union[Reply, Callable[[InMemoryRequest], Reply]]
+"""A Canned Reply, or a Function Generating the Reply of Each Request"""
+
+
+class InMemoryTransport(Transport):
+    """
+    Transport serving canned or generated replies without a network, for deterministic tests and
+    benchmarks of the iterators, parsing and concurrency. `api_keys/validate/` succeeds unless it is
+    routed explicitly, so clients can be created with the default eager validation.
+
+    Args:
+        routes (Dict[str, Route], optional):
+            Replies by path, such as `public_api/v1/assets/get_assets_internet_exposure/`. A reply
+            is a JSON body, a `requests.Response`, or a function of the :class:`InMemoryRequest`
+            returning either. Unknown paths return a 404.
+        latency (float, optional):
+            Seconds slept before each reply, to model the round-trip. Defaults to 0.
+        jitter (float, optional):
+            Extra seconds of uniformly random latency added to each reply. Defaults to 0.
+        seed (int, optional):
+            Seeds the jitter, so that runs are repeatable.
+        codec (JsonCodec, optional):
+            Encodes the JSON replies. Defaults to the standard library.
+        sleep (Callable[[float], None], optional):
+            Used to wait for the latency. Defaults to `time.sleep`.
+
+    Examples:
+        >>> transport = InMemoryTransport(
+        >>>     {AssetsEndpoint.LIST_ENDPOINT: PagedReplies("assets_internet_exposure", assets)},
+        >>>     latency=0.2,
+        >>> )
+        >>> client = XpanseClient(url="test.crtx.paloaltonetworks.com", api_key_id=1, api_key="key",
+        >>>                       transport=transport)
+        >>> assets = client.assets.list().dump()
+    """
+
+    VALIDATE_PATH = "api_keys/validate/"
+
+    def __init__(
+        self,
+        routes: Optional[Dict[str, Route]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: Optional[int] = None,
+        codec: Optional[JsonCodec] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if latency < 0:
+            raise ValueError(
+                f"'latency' must be zero or a positive number. f{latency} >= 0."
+            )
+
+        if jitter < 0:
+            raise ValueError(
+                f"'jitter' must be zero or a positive number. f{jitter} >= 0."
+            )
+
+        super().__init__()
+        self._routes: Dict[str, Route] = {
+            self.VALIDATE_PATH: True,
+            **{path.strip("/") + "/": route for path, route in (routes or {}).items()},
+        }
+        self._latency = latency
+        self._jitter = jitter
+        self._random = random.Random(seed)
+        self._codec = codec or JsonCodec()
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        """Requests Received so Far, in Order"""
+        self.requests: List[InMemoryRequest] = []
+
+    def route(self, path: str, reply: Route):
+        """
+        Sets the reply of a path.
+        """
+        self._routes[path.strip("/") + "/"] = reply
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        path = urlparse(url).path.strip("/") + "/"
+        headers = dict(kwargs.get("headers") or {})
+        request = InMemoryRequest(
+            method, path, headers, self._decode_body(kwargs, headers)
+        )
+
+        with self._lock:
+            self.requests.append(request)
+            delay = self._latency + (
+                self._random.uniform(0, self._jitter) if self._jitter else 0.0
+            )
+
+        if delay > 0:
+            self._sleep(delay)
+
+        route = self._routes.get(path)
+        if route is None:
+            reply: Reply = self._response(url, 404, {"reply": {"err_msg": "Not Found"}})
+        else:
+            reply = route(request) if callable(route) else route
+
+        resp = (
+            reply
+            if isinstance(reply, requests.Response)
+            else self._response(url, 200, reply)
+        )
+        size = len(resp.content or b"")
+        self.stats.record_response(size, size)
+        return resp
+
+    def _decode_body(self, kwargs: Dict[str, Any], headers: Dict[str, str]) -> Any:
+        """
+        Decodes a JSON request body, as sent by the client.
+        """
+        if kwargs.get(DEFAULT_REQUEST_PAYLOAD_FIELD) is not None:
+            return kwargs[DEFAULT_REQUEST_PAYLOAD_FIELD]
+
+        body = kwargs.get("data")
+        if not body:
+            return None
+        if headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        try:
+            return self._codec.loads(body)
+        except ValueError:
+            return body
+
+    def _response(self, url: str, status_code: int, body: Any) -> requests.Response:
+        return json_response(body, status_code=status_code, url=url, codec=self._codec)
+
+
+def json_response(
+    body: Any,
+    status_code: int = 200,
+    url: str = "",
+    headers: Optional[Dict[str, str]] = None,
+    codec: Optional[JsonCodec] = None,
+) -> requests.Response:
+    """
+    Builds a read `requests.Response` with a JSON body, for use as a canned reply.
+    """
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.url = url
+    resp.headers.update({"Content-Type": "application/json", **(headers or {})})
+    resp._content = (codec or JsonCodec()).dumps(body)
+    resp._content_consumed = True  # type: ignore
+    resp.encoding = "utf-8"
+    return resp
+
+
+class PagedReplies:
+    """
+    Generates the pages of a list endpoint from a sequence of results, following the
+    `next_page_token` or the `search_from` and `search_to` of each request, like the Public API.
+
+    Args:
+        data_key (str):
+            The key under `reply` holding each page of results.
+        results (Sequence[Any]):
+            Every result of the list.
+        page_size (int, optional):
+            The number of results of a page-token page. Defaults to 100.
+        max_total_count (int, optional):
+            Caps the reported `total_count`, like the Public API does for most data types.
+
+    Examples:
+        >>> transport = InMemoryTransport({path: PagedReplies("incidents", incidents, page_size=500)})
+    """
+
+    def __init__(
+        self,
+        data_key: str,
+        results: Sequence[Any],
+        page_size: int = DEFAULT_SEARCH_TO - DEFAULT_SEARCH_FROM,
+        max_total_count: Optional[int] = None,
+    ):
+        if page_size < 1:
+            raise ValueError(
+                f"'page_size' must be a positive integer. f{page_size} > 0."
+            )
+
+        self._data_key = data_key
+        self._results = results
+        self._page_size = page_size
+        self._max_total_count = max_total_count
+
+    def __call__(self, request: InMemoryRequest) -> Any:
+        request_data = request.request_data
+        token = request_data.get(PublicApiFields.NEXT_PAGE_TOKEN)
+
+        if token is not None:
+            start, end = int(token), int(token) + self._page_size
+        elif PublicApiFields.SEARCH_FROM in request_data:
+            start = request_data[PublicApiFields.SEARCH_FROM]
+            end = request_data.get(PublicApiFields.SEARCH_TO, start + self._page_size)
+        else:
+            start, end = 0, self._page_size
+
+        page = list(self._results[start:end])
+        total = len(self._results)
+        if self._max_total_count is not None:
+            total = min(total, self._max_total_count)
+
+        use_page_token = token is not None or request_data.get(
+            PublicApiFields.USE_PAGE_TOKEN, False
+        )
+        return {
+            PublicApiFields.REPLY: {
+                PublicApiFields.TOTAL_COUNT: total,
+                PublicApiFields.RESULTS_COUNT: len(page),
+                self._data_key: page,
+                PublicApiFields.NEXT_PAGE_TOKEN: (
+                    str(end) if use_page_token and end < len(self._results) else None
+                ),
+            }
+        }
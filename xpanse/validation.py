@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_VALIDATION_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "xpanse", "validation.json"
+)
+"""Default File Used to Cache Successful API Key Validations"""
+
+
+class ValidationCache:
+    """
+    On-disk cache of successful API Key validations, so that repeated process startups can skip
+    the `api_keys/validate/` round-trip. Entries are keyed on a hash of the FQDN, the API Key ID,
+    the auth type and a hash of the API Key, so rotating a key invalidates its entry and the key
+    itself is never written to disk. Failed validations are never cached.
+
+    Args:
+        path (str, optional):
+            The cache file. Defaults to `~/.cache/xpanse/validation.json`.
+        ttl (float, optional):
+            The number of seconds a successful validation is trusted for. Defaults to 3600.
+
+    Examples:
+        >>> # Validate the API Key at most once an hour across process restarts:
+        >>> client = XpanseClient(validation_cache=ValidationCache(ttl=3600))
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 3600.0):
+        if ttl <= 0:
+            raise ValueError(f"'ttl' must be a positive number. f{ttl} > 0.")
+
+        self._path = path if path is not None else DEFAULT_VALIDATION_CACHE_PATH
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._log = logging.getLogger(
+            "{}.{}".format(self.__module__, self.__class__.__name__)
+        )
+
+    @staticmethod
+    def key(url: str, api_key_id: str, api_key: str, use_advanced_auth: bool) -> str:
+        """
+        Returns the cache key of a set of credentials.
+        """
+        api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        auth_type = "advanced" if use_advanced_auth else "standard"
+        return hashlib.sha256(
+            f"{url}\0{api_key_id}\0{auth_type}\0{api_key_hash}".encode("utf-8")
+        ).hexdigest()
+
+    def is_valid(self, key: str) -> bool:
+        """
+        Whether the credentials were successfully validated within the TTL.
+        """
+        with self._lock:
+            return self._read().get(key, 0) > time.time()
+
+    def store(self, key: str):
+        """
+        Records a successful validation. Expired entries are dropped at the same time.
+        """
+        with self._lock:
+            now = time.time()
+            entries = {k: v for k, v in self._read().items() if v > now}
+            entries[key] = now + self._ttl
+            self._write(entries)
+
+    def _read(self) -> Dict[str, float]:
+        try:
+            with open(self._path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: Dict[str, float]):
+        # Write to a temporary file and rename it, so concurrent processes never read a partial file
+        try:
+            directory = os.path.dirname(self._path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".validation-")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self._path)
+        except OSError as err:
+            self._log.warning(f"Failed to write the validation cache: {err}")